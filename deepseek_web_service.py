@@ -606,15 +606,17 @@ async def search_memories(request: SearchMemoryRequest):
 @app.get("/api/memories/{user_id}", 
          summary="获取用户所有记忆",
          description="根据用户ID获取该用户的所有记忆内容")
-async def get_all_memories(user_id: str):
+async def get_all_memories(user_id: str, cursor: Optional[str] = None, page_size: Optional[int] = None):
     """
     获取指定用户的所有记忆
     
     Args:
         user_id: 用户标识符
+        cursor: 上一页返回的 next_cursor，用于分页
+        page_size: 每页记忆数量，传入后按页返回
         
     Returns:
-        所有记忆的列表
+        所有记忆的列表；分页时附带 next_cursor 和记忆总数 total
     """
     print(f"🔍 [GET_ALL] 收到查询请求:")
     print(f"   用户ID: '{user_id}'")
@@ -625,6 +627,16 @@ async def get_all_memories(user_id: str):
         
     try:
         print("🔄 [GET_ALL] 开始调用 memory_system.get_all()...")
+        if cursor is not None or page_size is not None:
+            page = memory_system.get_all(user_id=user_id, cursor=cursor, page_size=page_size, include_count=True)
+            print(f"✅ [GET_ALL] 分页结果: {len(page['results'])} 条, 总数 {page['count']}")
+            return {
+                "success": True,
+                "memories": page["results"],
+                "count": len(page["results"]),
+                "total": page["count"],
+                "next_cursor": page["next_cursor"],
+            }
         results = memory_system.get_all(user_id=user_id)
         print(f"✅ [GET_ALL] memory_system.get_all() 返回结果:")
         print(f"   结果类型: {type(results)}")
@@ -0,0 +1,162 @@
+"""
+Latency and accuracy of the two `Memory.add` modes on LOCOMO.
+
+`two_step` extracts facts with one LLM call and reconciles them with the memories retrieved per fact with a second;
+`single_call` retrieves candidates with an embedding of the raw turn and does both in one structured call. Each mode
+ingests the same conversations into a fresh in-process store, then answers their questions from the retrieved
+memories and grades the answers with the LLM judge of `metrics/llm_judge.py`.
+
+Needs OPENAI_API_KEY. From the evaluation directory:
+
+    python benchmarks/add_mode_benchmark.py --data_path dataset/locomo10.json --conversations 2 --questions 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+from jinja2 import Template
+from openai import OpenAI
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics.llm_judge import evaluate_llm_judge  # noqa: E402
+from prompts import ANSWER_PROMPT  # noqa: E402
+
+from mem0 import Memory  # noqa: E402
+
+MODES = ("two_step", "single_call")
+
+
+def build_memory(mode, args):
+    return Memory.from_config(
+        {
+            "vector_store": {
+                "provider": "numpy",
+                "config": {"path": None, "collection_name": f"add_mode_{mode}", "embedding_model_dims": 1536},
+            },
+            "llm": {"provider": "openai", "config": {"model": args.model, "temperature": 0}},
+            "embedder": {"provider": "openai", "config": {"model": "text-embedding-3-small"}},
+            "history_db_path": ":memory:",
+            "add_mode": mode,
+        }
+    )
+
+
+def count_llm_calls(memory):
+    calls = {"count": 0}
+    generate_response = memory.llm.generate_response
+
+    def counted(*args, **kwargs):
+        calls["count"] += 1
+        return generate_response(*args, **kwargs)
+
+    memory.llm.generate_response = counted
+    return calls
+
+
+def speaker_turns(conversation):
+    """Yield `(user_id, messages, timestamp)` per session and speaker, as `src/memzero/add.py` sends them."""
+    speaker_a, speaker_b = conversation["speaker_a"], conversation["speaker_b"]
+    for key, chats in conversation.items():
+        if key in ["speaker_a", "speaker_b"] or "date" in key or "timestamp" in key:
+            continue
+        timestamp = conversation[key + "_date_time"]
+        messages, messages_reverse = [], []
+        for chat in chats:
+            own = chat["speaker"] == speaker_a
+            messages.append({"role": "user" if own else "assistant", "content": f"{chat['speaker']}: {chat['text']}"})
+            messages_reverse.append(
+                {"role": "assistant" if own else "user", "content": f"{chat['speaker']}: {chat['text']}"}
+            )
+        yield speaker_a, messages, timestamp
+        yield speaker_b, messages_reverse, timestamp
+
+
+def ingest(memory, data, batch_size):
+    latencies = []
+    for idx, item in enumerate(data):
+        for speaker, messages, timestamp in speaker_turns(item["conversation"]):
+            for start in range(0, len(messages), batch_size):
+                started = time.perf_counter()
+                memory.add(
+                    messages[start : start + batch_size], user_id=f"{speaker}_{idx}", metadata={"timestamp": timestamp}
+                )
+                latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def answer(memory, client, model, idx, conversation, question, top_k):
+    rendered = {}
+    for slot, speaker in (("1", conversation["speaker_a"]), ("2", conversation["speaker_b"])):
+        hits = memory.search(question, user_id=f"{speaker}_{idx}", limit=top_k)["results"]
+        rendered[f"speaker_{slot}_user_id"] = speaker
+        rendered[f"speaker_{slot}_memories"] = json.dumps(
+            [f"{(hit.get('metadata') or {}).get('timestamp')}: {hit['memory']}" for hit in hits], indent=4
+        )
+    prompt = Template(ANSWER_PROMPT).render(question=question, **rendered)
+    response = client.chat.completions.create(
+        model=model, messages=[{"role": "system", "content": prompt}], temperature=0.0
+    )
+    return response.choices[0].message.content
+
+
+def evaluate(memory, data, args):
+    client = OpenAI()
+    scores = []
+    for idx, item in enumerate(data):
+        questions = [qa for qa in item["qa"] if str(qa.get("category")) != "5"][: args.questions]
+        for qa in questions:
+            generated = answer(memory, client, args.model, idx, item["conversation"], qa["question"], args.top_k)
+            scores.append(evaluate_llm_judge(qa["question"], str(qa["answer"]), generated))
+    return float(np.mean(scores)) if scores else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the two-step and single-call add modes")
+    parser.add_argument("--data_path", default="dataset/locomo10.json", help="LOCOMO dataset file")
+    parser.add_argument("--conversations", type=int, default=2, help="Conversations ingested")
+    parser.add_argument("--questions", type=int, default=50, help="Questions graded per conversation")
+    parser.add_argument("--batch_size", type=int, default=2, help="Turns per add request")
+    parser.add_argument("--top_k", type=int, default=30, help="Memories retrieved per speaker to answer")
+    parser.add_argument("--model", default="gpt-4o-mini", help="LLM used to add memories and answer")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES), help="Add modes compared")
+    args = parser.parse_args()
+
+    with open(args.data_path) as f:
+        data = json.load(f)[: args.conversations]
+
+    rows = {}
+    for mode in args.modes:
+        memory = build_memory(mode, args)
+        calls = count_llm_calls(memory)
+        latencies = ingest(memory, data, args.batch_size)
+        llm_calls_per_add = calls["count"] / len(latencies) if latencies else 0.0
+        rows[mode] = {
+            "adds": len(latencies),
+            "llm_calls_per_add": llm_calls_per_add,
+            "p50_ms": float(np.percentile(latencies, 50) * 1000) if latencies else 0.0,
+            "p95_ms": float(np.percentile(latencies, 95) * 1000) if latencies else 0.0,
+            "memories": memory.vector_store.count(),
+            "accuracy": evaluate(memory, data, args),
+        }
+
+    print(f"{'mode':<14}{'adds':>8}{'llm/add':>10}{'p50 ms':>10}{'p95 ms':>10}{'memories':>10}{'accuracy':>10}")
+    for mode, row in rows.items():
+        print(
+            f"{mode:<14}{row['adds']:>8}{row['llm_calls_per_add']:>10.2f}{row['p50_ms']:>10.0f}{row['p95_ms']:>10.0f}"
+            f"{row['memories']:>10}{row['accuracy']:>10.2%}"
+        )
+    if set(MODES) <= set(rows):
+        base, single = rows["two_step"], rows["single_call"]
+        print(
+            f"single_call vs two_step: p50 {single['p50_ms'] / base['p50_ms'] - 1:+.1%}, "
+            f"accuracy {(single['accuracy'] - base['accuracy']) * 100:+.1f} points"
+        )
+
+
+if __name__ == "__main__":
+    main()
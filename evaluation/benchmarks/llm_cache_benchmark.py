@@ -0,0 +1,85 @@
+"""
+Replay of the LOCOMO fact-extraction requests through the LLM response cache.
+
+Every conversation turn batch is sent twice to a stub LLM that sleeps `--latency` seconds per call, each time through
+a fresh `CachedLLM` sharing one SQLite cache file, like two runs of the evaluation harness. The second run should
+make no provider call.
+
+    python benchmarks/llm_cache_benchmark.py --data_path dataset/locomo10.json --latency 0.01
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.base import LLMBase
+from mem0.llms.cache import CachedLLM, LlmResponseCache
+from mem0.memory.utils import get_fact_retrieval_messages, parse_messages
+
+
+class StubLLM(LLMBase):
+    def __init__(self, latency):
+        super().__init__(BaseLlmConfig(model="stub"))
+        self.latency = latency
+        self.calls = 0
+
+    def generate_response(self, messages, response_format=None, tools=None, tool_choice="auto", **kwargs):
+        self.calls += 1
+        time.sleep(self.latency)
+        return json.dumps({"facts": [messages[-1]["content"][-40:]]})
+
+
+def load_batches(data_path, batch_size, conversations):
+    if not os.path.exists(data_path):
+        print(f"{data_path} not found, replaying synthetic turns")
+        return [[{"role": "user", "content": f"Turn {i}: I went hiking on day {i}."}] for i in range(500)]
+
+    with open(data_path) as f:
+        data = json.load(f)[:conversations]
+    batches = []
+    for item in data:
+        conversation = item["conversation"]
+        for key, chats in conversation.items():
+            if key in ["speaker_a", "speaker_b"] or "date" in key or "timestamp" in key:
+                continue
+            messages = [{"role": "user", "content": f"{chat['speaker']}: {chat['text']}"} for chat in chats]
+            batches.extend(messages[i : i + batch_size] for i in range(0, len(messages), batch_size))
+    return batches
+
+
+def replay(batches, latency, db_path):
+    stub = StubLLM(latency)
+    llm = CachedLLM(stub, "stub", LlmResponseCache(db_path=db_path))
+    started = time.perf_counter()
+    for batch in batches:
+        system_prompt, user_prompt = get_fact_retrieval_messages(parse_messages(batch))
+        llm.generate_response(
+            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+            response_format={"type": "json_object"},
+        )
+    return stub.calls, time.perf_counter() - started, llm.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the LLM response cache on a dataset replay")
+    parser.add_argument("--data_path", default="dataset/locomo10.json", help="LOCOMO dataset file")
+    parser.add_argument("--batch_size", type=int, default=2, help="Turns per add request")
+    parser.add_argument("--conversations", type=int, default=10, help="Conversations replayed")
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds per stub LLM call")
+    args = parser.parse_args()
+
+    batches = load_batches(args.data_path, args.batch_size, args.conversations)
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "llm_cache.db")
+        print(f"{len(batches)} fact-extraction requests per run")
+        print(f"{'run':<8}{'llm calls':>12}{'seconds':>12}{'hit rate':>12}")
+        for run in (1, 2):
+            calls, seconds, stats = replay(batches, args.latency, db_path)
+            print(f"{run:<8}{calls:>12}{seconds:>12.2f}{stats['hit_rate']:>12.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Recall and latency of two-stage Matryoshka retrieval against an exact full-dimension search.
+
+Both sides use the embedded NumPy store so the numbers isolate the cost of scoring. Pass real
+`text-embedding-3-*` embeddings with `--embeddings` (an .npy matrix, one row per memory); without it, synthetic
+vectors whose variance decays along the dimensions stand in for Matryoshka embeddings.
+
+    python benchmarks/matryoshka_benchmark.py --memories 20000 --truncate_dims 256 --oversample 1 2 4 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from mem0.vector_stores.matryoshka import Matryoshka
+from mem0.vector_stores.numpy import NumpyDB
+
+
+def synthetic_embeddings(count, dims, seed=0):
+    rng = np.random.default_rng(seed)
+    scale = 1.0 / np.sqrt(np.arange(1, dims + 1))
+    return (rng.standard_normal((count, dims)) * scale).astype(np.float32)
+
+
+def make_queries(memories, count, noise, seed=1):
+    rng = np.random.default_rng(seed)
+    picks = memories[rng.choice(len(memories), size=count, replace=False)]
+    return picks + noise * rng.standard_normal(picks.shape).astype(np.float32) * picks.std(axis=0)
+
+
+def load(store, memories, batch_size=1000):
+    for start in range(0, len(memories), batch_size):
+        batch = memories[start : start + batch_size]
+        store.insert(
+            vectors=batch.tolist(),
+            payloads=[{"user_id": "bench"} for _ in batch],
+            ids=[str(start + i) for i in range(len(batch))],
+        )
+
+
+def run(store, queries, limit):
+    results, started = [], time.perf_counter()
+    for query in queries:
+        results.append([hit.id for hit in store.search("", query.tolist(), limit=limit, filters={"user_id": "bench"})])
+    return results, (time.perf_counter() - started) / len(queries) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark two-stage Matryoshka retrieval")
+    parser.add_argument("--embeddings", type=str, default=None, help="Optional .npy matrix of real embeddings")
+    parser.add_argument("--memories", type=int, default=20000, help="Number of synthetic memories")
+    parser.add_argument("--dims", type=int, default=1536, help="Dimensions of synthetic memories")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--noise", type=float, default=0.5, help="Noise added to the memories picked as queries")
+    parser.add_argument("--limit", type=int, default=10, help="Results per query")
+    parser.add_argument("--truncate_dims", type=int, default=256, help="Dimensions of the first stage")
+    parser.add_argument("--oversample", type=int, nargs="+", default=[1, 2, 4, 8], help="Oversampling factors")
+    args = parser.parse_args()
+
+    memories = np.load(args.embeddings).astype(np.float32) if args.embeddings else None
+    if memories is None:
+        memories = synthetic_embeddings(args.memories, args.dims)
+    dims = memories.shape[1]
+    queries = make_queries(memories, args.queries, args.noise)
+
+    exact = NumpyDB(collection_name="exact", path=None, embedding_model_dims=dims)
+    load(exact, memories)
+    truth, exact_ms = run(exact, queries, args.limit)
+    print(f"{len(memories)} memories, {dims} dims, recall@{args.limit} against the exact search")
+    print(f"{'mode':<28}{'recall':>8}{'ms/query':>10}")
+    print(f"{'exact ' + str(dims) + 'd':<28}{1.0:>8.3f}{exact_ms:>10.2f}")
+
+    for oversample in args.oversample:
+        store = Matryoshka(
+            provider="numpy",
+            config={"path": None},
+            collection_name="matryoshka",
+            embedding_model_dims=dims,
+            truncate_dims=args.truncate_dims,
+            oversample=oversample,
+        )
+        load(store, memories)
+        found, latency_ms = run(store, queries, args.limit)
+        recall = np.mean([len(set(hits) & set(expected)) / len(expected) for hits, expected in zip(found, truth)])
+        label = f"{args.truncate_dims}d x{oversample} + rerank"
+        print(f"{label:<28}{recall:>8.3f}{latency_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
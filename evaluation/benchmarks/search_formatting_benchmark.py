@@ -0,0 +1,96 @@
+"""
+Cost of turning vector store hits into `Memory.search` results.
+
+Compares the previous path (a validated `MemoryItem` per hit, `model_dump`, then the threshold filter) with
+`_format_search_result`, and shows the effect of pushing `threshold` into the store, which then returns only the
+hits above it.
+
+    python benchmarks/search_formatting_benchmark.py --limit 100 --above_threshold 0.2
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+from mem0.configs.base import MemoryItem
+from mem0.memory.main import CORE_AND_PROMOTED_KEYS, PROMOTED_PAYLOAD_KEYS, _format_search_result
+
+
+def format_with_model(memories, threshold):
+    results = []
+    for mem in memories:
+        item = MemoryItem(
+            id=mem.id,
+            memory=mem.payload["data"],
+            hash=mem.payload.get("hash"),
+            created_at=mem.payload.get("created_at"),
+            updated_at=mem.payload.get("updated_at"),
+            score=mem.score,
+        ).model_dump()
+        for key in PROMOTED_PAYLOAD_KEYS:
+            if key in mem.payload:
+                item[key] = mem.payload[key]
+        metadata = {k: v for k, v in mem.payload.items() if k not in CORE_AND_PROMOTED_KEYS}
+        if metadata:
+            item["metadata"] = metadata
+        if threshold is None or mem.score >= threshold:
+            results.append(item)
+    return results
+
+
+def format_plain(memories, threshold):
+    return [_format_search_result(mem) for mem in memories if threshold is None or mem.score >= threshold]
+
+
+def make_hits(count):
+    return [
+        SimpleNamespace(
+            id=f"mem-{i}",
+            score=1.0 - i / count,
+            payload={
+                "data": f"memory number {i}",
+                "hash": f"{i:032x}",
+                "created_at": "2025-01-01T00:00:00-08:00",
+                "updated_at": None,
+                "user_id": "alice",
+                "agent_id": "assistant",
+                "category": "preferences",
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def timed(function, hits, threshold, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        function(hits, threshold)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark search result formatting")
+    parser.add_argument("--limit", type=int, default=100, help="Hits returned by the store without a threshold")
+    parser.add_argument("--above_threshold", type=float, default=0.2, help="Share of hits above the threshold")
+    parser.add_argument("--rounds", type=int, default=2000, help="Searches formatted per measurement")
+    args = parser.parse_args()
+
+    hits = make_hits(args.limit)
+    threshold = 1.0 - args.above_threshold
+    pushed = [hit for hit in hits if hit.score >= threshold]
+    assert format_with_model(hits, threshold) == format_plain(pushed, None)
+
+    print(f"{args.limit} hits, {len(pushed)} above the threshold, microseconds per search")
+    print(f"{'path':<44}{'us':>10}")
+    rows = [
+        ("MemoryItem, threshold applied in Python", format_with_model, hits, threshold),
+        ("plain dicts, threshold applied in Python", format_plain, hits, threshold),
+        ("MemoryItem, threshold pushed to the store", format_with_model, pushed, None),
+        ("plain dicts, threshold pushed to the store", format_plain, pushed, None),
+    ]
+    for label, function, memories, applied_threshold in rows:
+        print(f"{label:<44}{timed(function, memories, applied_threshold, args.rounds):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
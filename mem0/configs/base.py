@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -26,6 +26,43 @@ class MemoryItem(BaseModel):
     updated_at: Optional[str] = Field(None, description="The timestamp when the memory was updated")
 
 
+class SearchCacheConfig(BaseModel):
+    enabled: bool = Field(description="Cache search results until a write touches their tenant", default=False)
+    backend: Literal["memory", "redis"] = Field(
+        description="Keep entries in process, or in Redis to share them between replicas", default="memory"
+    )
+    ttl: float = Field(description="Seconds a cached search result stays valid", default=300)
+    max_entries: int = Field(description="Maximum number of cached searches of the in-process backend", default=10000)
+    redis_url: str = Field(description="URL of the Redis server of the redis backend", default="redis://localhost:6379")
+    key_prefix: str = Field(description="Prefix of the keys written to Redis", default="mem0:search")
+
+
+class BackgroundAddConfig(BaseModel):
+    backend: Literal["sqlite", "memory"] = Field(
+        description="Queue of `add(mode=\"background\")` jobs: durable SQLite table, or in-process only",
+        default="sqlite",
+    )
+    db_path: Optional[str] = Field(
+        description="Path of the SQLite queue, defaults to <mem0_dir>/ingest_queue.db. Instances sharing it only run "
+        "the jobs enqueued for their own vector store",
+        default=None,
+    )
+    concurrency: int = Field(description="Number of worker threads running queued jobs", default=4)
+    max_retries: int = Field(description="Retries of a failed job before it is dead-lettered", default=3)
+    base_delay: float = Field(description="Seconds before the first retry, doubling on every retry", default=1.0)
+    max_delay: float = Field(description="Maximum seconds between two retries", default=60.0)
+    lease: float = Field(
+        description="Seconds a job stays leased to its worker without renewal; running jobs renew it every third",
+        default=600.0,
+    )
+    retention: Optional[float] = Field(
+        description="Seconds completed jobs are kept for `job_status`, None to keep them", default=7 * 24 * 3600
+    )
+    run_workers: bool = Field(
+        description="Run the workers in this process; disable it in processes that only enqueue jobs", default=True
+    )
+
+
 class MemoryConfig(BaseModel):
     vector_store: VectorStoreConfig = Field(
         description="Configuration for the vector store",
@@ -59,6 +96,28 @@ class MemoryConfig(BaseModel):
         description="Custom prompt for the update memory",
         default=None,
     )
+    add_mode: Literal["two_step", "single_call"] = Field(
+        description="Extract facts and reconcile them with existing memories in two LLM calls, or in a single call "
+        "against the memories retrieved for the raw conversation turn",
+        default="two_step",
+    )
+    stream_fact_extraction: bool = Field(
+        description="Stream the fact extraction response and search each fact as soon as it is generated, with LLMs "
+        "that support streaming",
+        default=False,
+    )
+    custom_extract_and_update_prompt: Optional[str] = Field(
+        description="Custom system prompt of the single-call add mode",
+        default=None,
+    )
+    search_cache: SearchCacheConfig = Field(
+        description="Configuration for the search result cache",
+        default_factory=SearchCacheConfig,
+    )
+    background_add: BackgroundAddConfig = Field(
+        description="Configuration for the queue and workers of background adds",
+        default_factory=BackgroundAddConfig,
+    )
 
 
 class AzureConfig(BaseModel):
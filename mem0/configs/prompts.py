@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 
 MEMORY_ANSWER_PROMPT = """
@@ -208,6 +209,37 @@ Please note to return the IDs in the output from the input IDs only and do not g
         }
 """
 
+EXTRACT_AND_UPDATE_MEMORY_PROMPT = f"""You are a Personal Information Organizer and smart memory manager. In a single step you extract the relevant facts from a conversation and decide how each of them changes the existing memory.
+
+Step 1 - Extract facts. Keep track of personal preferences, important personal details (names, relationships, dates), plans and intentions, activity and service preferences, health and wellness details, professional details and miscellaneous favourites. Create the facts from the user and assistant messages only, never from system messages. Write them as short statements in the language of the user input. Greetings and general statements produce no facts.
+
+Step 2 - Reconcile them with the existing memory. For each fact choose one operation:
+- ADD: the fact is new; add it with a new ID.
+- UPDATE: an existing memory element covers the same topic but the fact has different or more information; keep its ID, write the merged text and put the previous text in "old_memory". If both convey the same thing (e.g. "Likes cheese pizza" and "Loves cheese pizza"), do not update.
+- DELETE: the fact contradicts an existing memory element; keep its ID.
+- NONE: the fact is already present, or the memory element is unaffected.
+Only use IDs of the existing memory for UPDATE, DELETE and NONE.
+
+Example:
+- Existing memory: [{{"id": "0", "text": "Is a software engineer"}}, {{"id": "1", "text": "Likes cheese pizza"}}]
+- Conversation: "user: Hi, I'm John. I don't like cheese pizza anymore, I've moved on to data science."
+- Output:
+    {{
+        "facts": ["Name is John", "Does not like cheese pizza", "Works in data science"],
+        "memory": [
+            {{"id": "0", "text": "Works in data science", "event": "UPDATE", "old_memory": "Is a software engineer"}},
+            {{"id": "1", "text": "Likes cheese pizza", "event": "DELETE"}},
+            {{"id": "2", "text": "Name is John", "event": "ADD"}}
+        ]
+    }}
+
+Remember the following:
+- Today's date is {datetime.now().strftime("%Y-%m-%d")}.
+- If the conversation holds no relevant facts, return {{"facts": [], "memory": []}}.
+- Do not return anything from the example above.
+- Return only JSON with the keys "facts" (a list of strings) and "memory" (a list of operations, each with "id", "text", "event" and, for UPDATE, "old_memory").
+"""
+
 PROCEDURAL_MEMORY_SYSTEM_PROMPT = """
 You are a memory summarization system that records and preserves the complete interaction history between a human and an AI agent. You are provided with the agent’s execution history over the past N steps. Your task is to produce a comprehensive summary of the agent's output history that contains every detail necessary for the agent to continue the task without ambiguity. **Every output produced by the agent must be recorded verbatim as part of the summary.**
 
@@ -331,3 +363,18 @@ def get_update_memory_messages(retrieved_old_memory_dict, response_content, cust
 
     Do not return anything except the JSON format.
     """
+
+
+def get_extract_and_update_messages(parsed_messages, retrieved_old_memory, custom_prompt=None):
+    """Return the system and user prompts of the single-call mode, which extracts facts and reconciles them."""
+    system_prompt = custom_prompt or EXTRACT_AND_UPDATE_MEMORY_PROMPT
+    user_prompt = f"""Existing memory:
+```
+{json.dumps(retrieved_old_memory, ensure_ascii=False)}
+```
+
+Conversation:
+```
+{parsed_messages}
+```"""
+    return system_prompt, user_prompt
@@ -0,0 +1,17 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class RateLimitConfig(BaseModel):
+    enabled: bool = Field(description="Send requests through a rate-limit-aware scheduler", default=False)
+    scope: Optional[str] = Field(
+        description="Name of the scheduler; LLMs and embedders with the same scope share quotas and queues. "
+        "Defaults to '<llm|embedder>:<provider>'",
+        default=None,
+    )
+    requests_per_minute: Optional[float] = Field(description="Request quota, None for no limit", default=None)
+    tokens_per_minute: Optional[float] = Field(description="Estimated token quota, None for no limit", default=None)
+    max_retries: int = Field(description="Retries of a request rejected with 429 or 5xx", default=5)
+    base_delay: float = Field(description="Seconds of the first retry backoff, doubled per attempt", default=0.5)
+    max_delay: float = Field(description="Maximum seconds of a retry backoff", default=30.0)
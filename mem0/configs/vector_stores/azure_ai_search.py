@@ -21,6 +21,16 @@ class AzureAISearchConfig(BaseModel):
     vector_filter_mode: Optional[str] = Field(
         "preFilter", description="Mode for vector filtering. Options: 'preFilter', 'postFilter'"
     )
+    batch_size: int = Field(1000, description="Maximum documents per indexing request (service limit 1000)")
+    max_retries: int = Field(3, description="Retries for throttled (503) or conflicting documents and requests")
+    retry_backoff: float = Field(0.5, description="Base delay in seconds for exponential backoff between retries")
+    use_buffered_sender: bool = Field(
+        False,
+        description="Queue writes in a SearchIndexingBufferedSender that auto-flushes; writes are visible after flush",
+    )
+    flush_interval: Optional[int] = Field(
+        None, description="Auto-flush interval in seconds for the buffered sender (SDK default 60)"
+    )
 
     @model_validator(mode="before")
     @classmethod
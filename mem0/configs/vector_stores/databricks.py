@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -30,6 +30,10 @@ class DatabricksConfig(BaseModel):
     pipeline_type: PipelineType = Field("TRIGGERED", description="Sync pipeline type: TRIGGERED or CONTINUOUS")
     warehouse_name: Optional[str] = Field(None, description="Databricks SQL warehouse Name")
     query_type: str = Field("ANN", description="Query type: `ANN` and `HYBRID`")
+    insert_batch_size: int = Field(100, description="Rows per SQL statement or upsert_data request on insert")
+    write_mode: Literal["insert", "merge"] = Field(
+        "insert", description="Write Delta table rows with INSERT or MERGE on memory_id"
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -20,6 +20,12 @@ class ElasticsearchConfig(BaseModel):
         None, description="Custom search query function. Parameters: (query, limit, filters) -> Dict"
     )
     headers: Optional[Dict[str, str]] = Field(None, description="Custom headers to include in requests")
+    index_type: Optional[
+        Literal["hnsw", "int8_hnsw", "int4_hnsw", "bbq_hnsw", "flat", "int8_flat", "int4_flat", "bbq_flat"]
+    ] = Field(None, description="dense_vector index_options type, e.g. 'int8_hnsw' or 'bbq_hnsw'")
+    hnsw_m: Optional[int] = Field(None, description="HNSW graph connections per node (index_options.m)")
+    ef_construction: Optional[int] = Field(None, description="HNSW candidates considered while building the graph")
+    num_candidates_multiplier: int = Field(2, description="kNN num_candidates as a multiple of the search limit")
 
     @model_validator(mode="before")
     @classmethod
@@ -0,0 +1,46 @@
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class MatryoshkaConfig(BaseModel):
+    provider: str = Field(description="Provider of the wrapped vector store (e.g. 'qdrant', 'pgvector')")
+    config: Optional[Dict] = Field(None, description="Configuration of the wrapped vector store")
+    collection_name: Optional[str] = Field(None, description="Collection name, forwarded to the wrapped store")
+    embedding_model_dims: int = Field(1536, description="Dimension of the full embedding vector")
+    truncate_dims: int = Field(256, description="Leading dimensions indexed by the wrapped store")
+    oversample: int = Field(4, description="Candidates fetched on the truncated vector per requested result")
+    full_vector_dtype: Literal["float32", "float16"] = Field(
+        "float32", description="Encoding of the full vector stored in the payload"
+    )
+    score_mode: Literal["similarity", "distance"] = Field(
+        "similarity", description="Score reported for reranked results: cosine similarity or 1 - similarity"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        if values.get("provider") == "matryoshka":
+            raise ValueError("matryoshka cannot wrap itself")
+        return values
+
+    @model_validator(mode="after")
+    def validate_dims(self) -> "MatryoshkaConfig":
+        if not 0 < self.truncate_dims <= self.embedding_model_dims:
+            raise ValueError("truncate_dims must be between 1 and embedding_model_dims")
+        if self.oversample < 1:
+            raise ValueError("oversample must be at least 1")
+        if self.collection_name is None:
+            self.collection_name = (self.config or {}).get("collection_name", "mem0")
+        return self
+
+    model_config = {
+        "arbitrary_types_allowed": True,
+    }
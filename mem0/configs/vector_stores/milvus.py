@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -26,6 +26,20 @@ class MilvusDBConfig(BaseModel):
     embedding_model_dims: int = Field(1536, description="Dimensions of the embedding model")
     metric_type: str = Field("L2", description="Metric type for similarity search")
     db_name: str = Field("", description="Name of the database")
+    partition_key: bool = Field(
+        False, description="Store user_id in a partition key field so each user's vectors share partitions"
+    )
+    num_partitions: Optional[int] = Field(None, description="Number of partitions used by the partition key")
+    index_type: str = Field("AUTOINDEX", description="Vector index type, e.g. AUTOINDEX, HNSW or IVF_FLAT")
+    index_params: Optional[Dict[str, Any]] = Field(
+        None, description="Index build parameters, e.g. {'M': 16, 'efConstruction': 200} or {'nlist': 1024}"
+    )
+    search_params: Optional[Dict[str, Any]] = Field(
+        None, description="Default search parameters, e.g. {'ef': 64} or {'nprobe': 16}"
+    )
+    consistency_level: Optional[str] = Field(
+        None, description="Consistency level for the collection and reads: Strong, Bounded, Session or Eventually"
+    )
 
     @model_validator(mode="before")
     @classmethod
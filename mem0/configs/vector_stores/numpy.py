@@ -0,0 +1,32 @@
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class NumpyConfig(BaseModel):
+    collection_name: str = Field("mem0", description="Default name for the collection")
+    path: Optional[str] = Field(
+        None, description="Directory for memory-mapped shard files; None keeps everything in process memory"
+    )
+    embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    dtype: Literal["float32", "float16"] = Field("float32", description="Storage precision of the vector matrices")
+    initial_capacity: int = Field(64, description="Rows allocated for a new tenant shard; capacity doubles on growth")
+    compaction_threshold: float = Field(
+        0.25, description="Fraction of deleted rows in a shard that triggers compaction"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
+
+    model_config = {
+        "arbitrary_types_allowed": True,
+    }
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -18,6 +18,17 @@ class OpenSearchConfig(BaseModel):
         "RequestsHttpConnection", description="Connection class for OpenSearch"
     )
     pool_maxsize: int = Field(20, description="Maximum number of connections in the pool")
+    engine: Literal["nmslib", "faiss", "lucene"] = Field(
+        "nmslib", description="k-NN engine for new indices; faiss and lucene support efficient filtering"
+    )
+    hnsw_m: Optional[int] = Field(None, description="HNSW graph degree (m); engine default if not set")
+    ef_construction: Optional[int] = Field(None, description="HNSW ef_construction; engine default if not set")
+    ef_search: Optional[int] = Field(None, description="HNSW ef_search used at query time; engine default if not set")
+    encoder: Optional[Literal["fp16", "byte"]] = Field(
+        None,
+        description="Scalar quantization: 'fp16' (faiss sq encoder) or 'byte' (lucene sq encoder, 7-bit quantization)",
+    )
+    insert_batch_size: int = Field(500, description="Number of actions sent per bulk request")
 
     @model_validator(mode="before")
     @classmethod
@@ -26,6 +37,13 @@ class OpenSearchConfig(BaseModel):
         if not values.get("host"):
             raise ValueError("Host must be provided for OpenSearch")
 
+        encoder = values.get("encoder")
+        engine = values.get("engine", "nmslib")
+        if encoder == "fp16" and engine != "faiss":
+            raise ValueError("The 'fp16' encoder requires engine='faiss'")
+        if encoder == "byte" and engine != "lucene":
+            raise ValueError("The 'byte' encoder requires engine='lucene'")
+
         return values
 
     @model_validator(mode="before")
@@ -19,6 +19,8 @@ class PineconeConfig(BaseModel):
     batch_size: int = Field(100, description="Batch size for operations")
     extra_params: Optional[Dict[str, Any]] = Field(None, description="Additional parameters for Pinecone client")
     namespace: Optional[str] = Field(None, description="Namespace for the collection")
+    namespace_per_user: bool = Field(False, description="Store each user_id in its own namespace")
+    pool_threads: Optional[int] = Field(None, description="Threads used for parallel upserts during bulk inserts")
 
     @model_validator(mode="before")
     @classmethod
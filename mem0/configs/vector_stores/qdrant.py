@@ -4,9 +4,10 @@ from pydantic import BaseModel, Field, model_validator
 
 
 class QdrantConfig(BaseModel):
-    from qdrant_client import QdrantClient
+    from qdrant_client import AsyncQdrantClient, QdrantClient
 
     QdrantClient: ClassVar[type] = QdrantClient
+    AsyncQdrantClient: ClassVar[type] = AsyncQdrantClient
 
     collection_name: str = Field("mem0", description="Name of the collection")
     embedding_model_dims: Optional[int] = Field(1536, description="Dimensions of the embedding model")
@@ -17,6 +18,14 @@ class QdrantConfig(BaseModel):
     url: Optional[str] = Field(None, description="Full URL for Qdrant server")
     api_key: Optional[str] = Field(None, description="API key for Qdrant server")
     on_disk: Optional[bool] = Field(False, description="Enables persistent storage")
+    payload_m: Optional[int] = Field(None, description="HNSW payload_m for per-tenant graphs (server mode only)")
+    hnsw_m: Optional[int] = Field(None, description="HNSW m of the global graph, 0 disables it (server mode only)")
+    prefer_grpc: Optional[bool] = Field(False, description="Use gRPC instead of REST to talk to the Qdrant server")
+    grpc_port: Optional[int] = Field(None, description="gRPC port for Qdrant server")
+    async_client: Optional[AsyncQdrantClient] = Field(None, description="Existing async Qdrant client instance")
+    wait: Optional[bool] = Field(True, description="Wait for upserts to be applied, False for fire-and-forget")
+    upload_batch_size: Optional[int] = Field(256, description="Inserts above this size use batched upload_points")
+    upload_parallel: Optional[int] = Field(1, description="Number of parallel workers for batched uploads")
 
     @model_validator(mode="before")
     @classmethod
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -8,6 +8,12 @@ class RedisDBConfig(BaseModel):
     redis_url: str = Field(..., description="Redis URL")
     collection_name: str = Field("mem0", description="Collection name")
     embedding_model_dims: int = Field(1536, description="Embedding model dimensions")
+    index_algorithm: Literal["flat", "hnsw"] = Field("flat", description="Vector index algorithm")
+    datatype: Literal["float32", "float16"] = Field("float32", description="Data type of the stored vectors")
+    hnsw_m: Optional[int] = Field(None, description="HNSW M parameter (max outgoing edges per node)")
+    ef_construction: Optional[int] = Field(None, description="HNSW EF_CONSTRUCTION parameter")
+    ef_runtime: Optional[int] = Field(None, description="HNSW EF_RUNTIME parameter used at query time")
+    insert_batch_size: int = Field(500, description="Number of records written per pipeline on insert")
 
     @model_validator(mode="before")
     @classmethod
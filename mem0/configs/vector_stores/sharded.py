@@ -0,0 +1,53 @@
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class ShardedConfig(BaseModel):
+    shards: List[Dict] = Field(
+        ..., description="Backend stores, each a dict with 'provider', 'config' and an optional unique 'name'"
+    )
+    collection_name: str = Field("mem0", description="Collection name, forwarded to every shard")
+    embedding_model_dims: Optional[int] = Field(None, description="Dimension of the embedding vector")
+    virtual_nodes: int = Field(128, description="Points per shard on the consistent hash ring")
+    routing_fields: List[str] = Field(
+        ["user_id", "agent_id", "run_id"], description="Payload fields used for routing, in order of preference"
+    )
+    score_mode: Literal["similarity", "distance"] = Field(
+        "similarity",
+        description="Whether shard scores are similarities (higher is better) or distances (lower is better), "
+        "used to merge searches that fan out",
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
+
+    @model_validator(mode="after")
+    def validate_shards(self) -> "ShardedConfig":
+        if not self.shards:
+            raise ValueError("At least one shard is required")
+        names = []
+        for index, shard in enumerate(self.shards):
+            if "provider" not in shard:
+                raise ValueError(f"Shard {index} has no provider")
+            if shard["provider"] == "sharded":
+                raise ValueError("sharded cannot contain itself")
+            names.append(shard.get("name") or f"shard-{index}")
+        if len(set(names)) != len(names):
+            raise ValueError("Shard names must be unique")
+        if not self.routing_fields:
+            raise ValueError("At least one routing field is required")
+        return self
+
+    model_config = {
+        "arbitrary_types_allowed": True,
+    }
@@ -0,0 +1,29 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class SQLiteConfig(BaseModel):
+    collection_name: str = Field("mem0", description="Name of the table holding the vectors")
+    db_path: Optional[str] = Field(None, description="Path of the SQLite database file, defaults to <mem0_dir>/mem0.db")
+    embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    store_history: bool = Field(
+        True,
+        description="Keep the history table in this database so each memory write and its history row commit together",
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
+
+    model_config = {
+        "arbitrary_types_allowed": True,
+    }
@@ -0,0 +1,45 @@
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class TenantCacheConfig(BaseModel):
+    provider: str = Field(description="Provider of the wrapped vector store (e.g. 'pgvector', 'qdrant')")
+    config: Optional[Dict] = Field(None, description="Configuration of the wrapped vector store")
+    collection_name: Optional[str] = Field(None, description="Collection name, forwarded to the wrapped store")
+    embedding_model_dims: Optional[int] = Field(None, description="Dimension of the embedding vector")
+    memory_budget_mb: float = Field(256, description="Memory budget of the in-process tenant cache in megabytes")
+    tenant_field: str = Field("user_id", description="Payload field identifying a tenant")
+    max_tenant_size: int = Field(200000, description="Tenants with more memories than this are never cached")
+    score_mode: Literal["similarity", "distance"] = Field(
+        "similarity",
+        description="Score reported for cached results: cosine similarity, or cosine distance (1 - similarity) "
+        "to match stores such as pgvector that return distances",
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        if values.get("provider") == "tenant_cache":
+            raise ValueError("tenant_cache cannot wrap itself")
+        return values
+
+    @model_validator(mode="after")
+    def inherit_wrapped_settings(self) -> "TenantCacheConfig":
+        inner = self.config or {}
+        if self.collection_name is None:
+            self.collection_name = inner.get("collection_name", "mem0")
+        if self.embedding_model_dims is None:
+            self.embedding_model_dims = inner.get("embedding_model_dims")
+        return self
+
+    model_config = {
+        "arbitrary_types_allowed": True,
+    }
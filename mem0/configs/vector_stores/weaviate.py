@@ -13,6 +13,7 @@ class WeaviateConfig(BaseModel):
     cluster_url: Optional[str] = Field(None, description="URL for Weaviate server")
     auth_client_secret: Optional[str] = Field(None, description="API key for Weaviate authentication")
     additional_headers: Optional[Dict[str, str]] = Field(None, description="Additional headers for requests")
+    multi_tenancy: bool = Field(False, description="Store each user_id in its own Weaviate tenant")
 
     @model_validator(mode="before")
     @classmethod
@@ -2,6 +2,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from mem0.configs.rate_limit import RateLimitConfig
+
 
 class EmbedderConfig(BaseModel):
     provider: str = Field(
@@ -9,6 +11,9 @@ class EmbedderConfig(BaseModel):
         default="openai",
     )
     config: Optional[dict] = Field(description="Configuration for the specific embedding model", default={})
+    rate_limit: RateLimitConfig = Field(
+        description="Request scheduling of the embedding model", default_factory=RateLimitConfig
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 from mem0.configs.llms.base import BaseLlmConfig
 
@@ -10,6 +10,9 @@ class LLMBase(ABC):
     Handles common functionality and delegates provider-specific logic to subclasses.
     """
 
+    # Whether `generate_response_stream` yields the response while it is generated rather than in one piece
+    supports_streaming = False
+
     def __init__(self, config: Optional[Union[BaseLlmConfig, Dict]] = None):
         """Initialize a base LLM class
 
@@ -112,6 +115,31 @@ class LLMBase(ABC):
         """
         pass
 
+    def generate_response_stream(
+        self, messages: List[Dict[str, str]], response_format=None, **kwargs
+    ) -> Iterator[str]:
+        """
+        Generate a text response and yield it in chunks as it is generated.
+
+        Providers that do not stream yield the whole response of `generate_response` at once.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to None.
+            **kwargs: Additional provider-specific parameters.
+
+        Yields:
+            str: Successive pieces of the response text.
+        """
+        yield self.generate_response(messages=messages, response_format=response_format, **kwargs)
+
+    @staticmethod
+    def _iter_chat_completion_chunks(stream) -> Iterator[str]:
+        """Yield the text deltas of an OpenAI-compatible `chat.completions` stream."""
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
     def _get_common_params(self, **kwargs) -> Dict:
         """
         Get common parameters that most providers use.
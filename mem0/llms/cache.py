@@ -0,0 +1,266 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from mem0.configs.base import mem0_dir
+from mem0.llms.base import LLMBase
+
+logger = logging.getLogger(__name__)
+
+
+class LlmResponseCache:
+    """
+    Exact-match cache of LLM responses.
+
+    Entries are JSON-encoded responses keyed by a hash of the request. An in-process LRU tier answers repeated
+    requests within one process; an optional SQLite tier keeps responses across runs, so replaying a dataset or
+    retrying an ingestion job sends no request twice. Hits from the SQLite tier are promoted to the in-process tier.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: int = 10000, db_path: Optional[str] = None):
+        """
+        Args:
+            ttl (float, optional): Seconds a response stays valid. Defaults to None, responses never expire.
+            max_entries (int, optional): Maximum number of responses of the in-process tier. Defaults to 10000.
+            db_path (str, optional): Path of the SQLite tier. Defaults to None, in-process tier only.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, encoded response)
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "bypassed": 0, "writes": 0, "evictions": 0}
+
+        self.connection = None
+        if db_path:
+            if db_path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self.connection = sqlite3.connect(db_path, check_same_thread=False)
+            with self._lock, self.connection:
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                    "created_at REAL NOT NULL, expires_at REAL)"
+                )
+                self.connection.execute(
+                    "DELETE FROM llm_cache WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+                )
+
+    @staticmethod
+    def key(
+        provider: str,
+        model: Any,
+        sampling: Dict[str, Any],
+        messages: List[Dict],
+        response_format: Any = None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: Any = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Hash everything that determines the response of a request."""
+        material = {
+            "provider": provider,
+            "model": model,
+            "sampling": sampling,
+            "messages": messages,
+            "response_format": response_format,
+            "tools": tools,
+            "tool_choice": tool_choice if tools else None,
+            "extra": extra or {},
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._stats[name] += amount
+
+    def _expires_at(self, now: float) -> Optional[float]:
+        return now + self.ttl if self.ttl is not None else None
+
+    def _remember(self, key: str, expires_at: Optional[float], encoded: str) -> int:
+        """Store an entry in the in-process tier and return the number of entries evicted. Hold the lock."""
+        self._entries[key] = (expires_at, encoded)
+        self._entries.move_to_end(key)
+        evicted = 0
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] < now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return json.loads(entry[1])
+
+            if self.connection is not None:
+                row = self.connection.execute(
+                    "SELECT response, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and (row[1] is None or row[1] >= now):
+                    self._stats["evictions"] += self._remember(key, row[1], row[0])
+                    self._stats["hits"] += 1
+                    self._stats["disk_hits"] += 1
+                    return json.loads(row[0])
+
+            self._stats["misses"] += 1
+        return None
+
+    def set(self, key: str, response: Any):
+        try:
+            encoded = json.dumps(response)
+        except (TypeError, ValueError):
+            logger.debug(f"Not caching a response of type {type(response).__name__}, it is not JSON-serializable")
+            return
+        now = time.time()
+        expires_at = self._expires_at(now)
+        with self._lock:
+            self._stats["evictions"] += self._remember(key, expires_at, encoded)
+            self._stats["writes"] += 1
+            if self.connection is not None:
+                with self.connection:
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO llm_cache (key, response, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                        (key, encoded, now, expires_at),
+                    )
+
+    def clear(self):
+        """Drop every entry of both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self.connection is not None:
+                with self.connection:
+                    self.connection.execute("DELETE FROM llm_cache")
+
+    def size(self) -> int:
+        with self._lock:
+            if self.connection is not None:
+                return self.connection.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache counters.
+
+        Returns:
+            Dict: `hits` (of which `disk_hits` came from the SQLite tier), `misses`, `bypassed` requests that were
+                not cacheable, `writes`, `evictions` from the in-process tier, `hit_rate` and `size`.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        return {**stats, "hit_rate": stats["hits"] / lookups if lookups else 0.0, "size": self.size()}
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class CachedLLM(LLMBase):
+    """
+    LLM wrapper answering byte-identical requests from an `LlmResponseCache`.
+
+    Requests sampled above `max_temperature` bypass the cache, as their response is not meant to be reproducible.
+    Every other attribute is forwarded to the wrapped LLM.
+    """
+
+    def __init__(self, llm: LLMBase, provider: str, cache: LlmResponseCache, max_temperature: Optional[float] = 0.1):
+        self.llm = llm
+        self.config = llm.config
+        self.provider = provider
+        self.cache = cache
+        self.max_temperature = max_temperature
+
+    def __getattr__(self, name):
+        # Only reached for attributes CachedLLM does not define itself
+        llm = self.__dict__.get("llm")
+        if llm is None:
+            raise AttributeError(name)
+        return getattr(llm, name)
+
+    def _cacheable(self) -> bool:
+        if self.max_temperature is None:
+            return True
+        temperature = getattr(self.config, "temperature", None)
+        return temperature is None or temperature <= self.max_temperature
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """Return the cached response of an identical request, or generate and cache it."""
+        request = dict(messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice)
+        if not self._cacheable():
+            self.cache._count("bypassed")
+            return self.llm.generate_response(**request, **kwargs)
+
+        key = self._key(request, kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        response = self.llm.generate_response(**request, **kwargs)
+        if response is not None:
+            self.cache.set(key, response)
+        return response
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.llm.supports_streaming
+
+    def generate_response_stream(self, messages: List[Dict[str, str]], response_format=None, **kwargs):
+        """Yield a cached response whole, or stream it from the LLM and cache it once complete."""
+        if not self._cacheable():
+            self.cache._count("bypassed")
+            yield from self.llm.generate_response_stream(messages=messages, response_format=response_format, **kwargs)
+            return
+
+        # Same key as the non-streaming request, so both share entries
+        request = dict(messages=messages, response_format=response_format, tools=None, tool_choice="auto")
+        key = self._key(request, kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        pieces = []
+        for piece in self.llm.generate_response_stream(messages=messages, response_format=response_format, **kwargs):
+            pieces.append(piece)
+            yield piece
+        self.cache.set(key, "".join(pieces))
+
+    def _key(self, request: Dict[str, Any], kwargs: Dict[str, Any]) -> str:
+        return self.cache.key(
+            provider=self.provider,
+            model=getattr(self.config, "model", None),
+            sampling={name: getattr(self.config, name, None) for name in ("temperature", "top_p", "max_tokens")},
+            extra=kwargs,
+            **request,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+
+def create_llm_cache(config) -> Optional[LlmResponseCache]:
+    """Build the response cache described by an `LlmCacheConfig`, or return None when it is disabled."""
+    if config is None or not config.enabled:
+        return None
+    db_path = None
+    if config.backend == "sqlite":
+        db_path = config.db_path or os.path.join(mem0_dir, "llm_cache.db")
+    return LlmResponseCache(ttl=config.ttl, max_entries=config.max_entries, db_path=db_path)
@@ -1,11 +1,32 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from mem0.configs.rate_limit import RateLimitConfig
+
+
+class LlmCacheConfig(BaseModel):
+    enabled: bool = Field(description="Answer byte-identical LLM requests from a response cache", default=False)
+    backend: Literal["memory", "sqlite"] = Field(
+        description="Keep responses in process only, or also in a SQLite file that survives restarts",
+        default="memory",
+    )
+    ttl: Optional[float] = Field(description="Seconds a cached response stays valid, None to keep it", default=None)
+    max_entries: int = Field(description="Maximum number of responses kept in process", default=10000)
+    db_path: Optional[str] = Field(
+        description="Path of the SQLite cache, defaults to <mem0_dir>/llm_cache.db", default=None
+    )
+    max_temperature: Optional[float] = Field(
+        description="Requests sampled above this temperature bypass the cache, None caches every request",
+        default=0.1,
+    )
+
 
 class LlmConfig(BaseModel):
     provider: str = Field(description="Provider of the LLM (e.g., 'ollama', 'openai')", default="openai")
     config: Optional[dict] = Field(description="Configuration for the specific LLM", default={})
+    cache: LlmCacheConfig = Field(description="Response cache of the LLM", default_factory=LlmCacheConfig)
+    rate_limit: RateLimitConfig = Field(description="Request scheduling of the LLM", default_factory=RateLimitConfig)
 
     @field_validator("config")
     def validate_config(cls, v, values):
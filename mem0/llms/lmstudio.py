@@ -10,6 +10,8 @@ from mem0.memory.utils import extract_json
 
 
 class LMStudioLLM(LLMBase):
+    supports_streaming = True
+
     def __init__(self, config: Optional[Union[BaseLlmConfig, LMStudioConfig, Dict]] = None):
         # Convert to LMStudioConfig if needed
         if config is None:
@@ -112,3 +114,27 @@ class LMStudioLLM(LLMBase):
 
         response = self.client.chat.completions.create(**params)
         return self._parse_response(response, tools)
+
+    def generate_response_stream(self, messages: List[Dict[str, str]], response_format=None, **kwargs):
+        """
+        Generate a response and yield its text as it is streamed by LM Studio.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            **kwargs: Additional LM Studio-specific parameters.
+
+        Yields:
+            str: Successive pieces of the response text.
+        """
+        params = self._get_supported_params(messages=messages, **kwargs)
+        params.update(
+            {
+                "model": self.config.model,
+                "messages": messages,
+                "response_format": self.config.lmstudio_response_format
+                or response_format
+                or {"type": "json_object"},
+            }
+        )
+        yield from self._iter_chat_completion_chunks(self.client.chat.completions.create(**params, stream=True))
@@ -11,6 +11,8 @@ from mem0.llms.base import LLMBase
 
 
 class OllamaLLM(LLMBase):
+    supports_streaming = True
+
     def __init__(self, config: Optional[Union[BaseLlmConfig, OllamaConfig, Dict]] = None):
         # Convert to OllamaConfig if needed
         if config is None:
@@ -104,3 +106,30 @@ class OllamaLLM(LLMBase):
 
         response = self.client.chat(**params)
         return self._parse_response(response, tools)
+
+    def generate_response_stream(self, messages: List[Dict[str, str]], response_format=None, **kwargs):
+        """
+        Generate a response and yield its text as it is streamed by Ollama.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            **kwargs: Additional Ollama-specific parameters.
+
+        Yields:
+            str: Successive pieces of the response text.
+        """
+        params = {
+            "model": self.config.model,
+            "messages": messages,
+            "options": {
+                "temperature": self.config.temperature,
+                "num_predict": self.config.max_tokens,
+                "top_p": self.config.top_p,
+            },
+            "stream": True,
+        }
+        for chunk in self.client.chat(**params):
+            content = chunk["message"]["content"] if isinstance(chunk, dict) else chunk.message.content
+            if content:
+                yield content
@@ -12,6 +12,8 @@ from mem0.memory.utils import extract_json
 
 
 class OpenAILLM(LLMBase):
+    supports_streaming = True
+
     def __init__(self, config: Optional[Union[BaseLlmConfig, OpenAIConfig, Dict]] = None):
         # Convert to OpenAIConfig if needed
         if config is None:
@@ -80,27 +82,7 @@ class OpenAILLM(LLMBase):
         else:
             return response.choices[0].message.content
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-        **kwargs,
-    ):
-        """
-        Generate a JSON response based on the given messages using OpenAI.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-            **kwargs: Additional OpenAI-specific parameters.
-
-        Returns:
-            json: The generated response.
-        """
+    def _chat_params(self, messages, response_format=None, tools=None, tool_choice="auto", **kwargs) -> Dict:
         params = self._get_supported_params(messages=messages, **kwargs)
         
         params.update({
@@ -129,6 +111,30 @@ class OpenAILLM(LLMBase):
         if tools:  # TODO: Remove tools if no issues found with new memory addition logic
             params["tools"] = tools
             params["tool_choice"] = tool_choice
+        return params
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a JSON response based on the given messages using OpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional OpenAI-specific parameters.
+
+        Returns:
+            json: The generated response.
+        """
+        params = self._chat_params(messages, response_format, tools, tool_choice, **kwargs)
         response = self.client.chat.completions.create(**params)
         parsed_response = self._parse_response(response, tools)
         if self.config.response_callback:
@@ -139,3 +145,18 @@ class OpenAILLM(LLMBase):
                 logging.error(f"Error due to callback: {e}")
                 pass
         return parsed_response
+
+    def generate_response_stream(self, messages: List[Dict[str, str]], response_format=None, **kwargs):
+        """
+        Generate a response and yield its text as it is streamed by OpenAI. `response_callback` is not called.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            **kwargs: Additional OpenAI-specific parameters.
+
+        Yields:
+            str: Successive pieces of the response text.
+        """
+        params = self._chat_params(messages, response_format, **kwargs)
+        yield from self._iter_chat_completion_chunks(self.client.chat.completions.create(**params, stream=True))
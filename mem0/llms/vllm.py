@@ -11,6 +11,8 @@ from mem0.memory.utils import extract_json
 
 
 class VllmLLM(LLMBase):
+    supports_streaming = True
+
     def __init__(self, config: Optional[Union[BaseLlmConfig, VllmConfig, Dict]] = None):
         # Convert to VllmConfig if needed
         if config is None:
@@ -105,3 +107,24 @@ class VllmLLM(LLMBase):
 
         response = self.client.chat.completions.create(**params)
         return self._parse_response(response, tools)
+
+    def generate_response_stream(self, messages: List[Dict[str, str]], response_format=None, **kwargs):
+        """
+        Generate a response and yield its text as it is streamed by vLLM.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            **kwargs: Additional vLLM-specific parameters.
+
+        Yields:
+            str: Successive pieces of the response text.
+        """
+        params = self._get_supported_params(messages=messages, **kwargs)
+        params.update(
+            {
+                "model": self.config.model,
+                "messages": messages,
+            }
+        )
+        yield from self._iter_chat_completion_chunks(self.client.chat.completions.create(**params, stream=True))
@@ -0,0 +1,508 @@
+import hashlib
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from mem0.memory.setup import mem0_dir
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+DEAD = "dead"
+# Statuses a job never leaves on its own
+FINISHED = (COMPLETED, DEAD)
+# Vector store config fields left out of the queue owner fingerprint, so rotating a credential keeps the jobs
+SECRET_FIELD_MARKERS = ("key", "password", "secret", "token")
+
+
+class IngestQueueBase(ABC):
+    """
+    Queue of background `Memory.add` jobs.
+
+    Jobs sharing an ordering key (the user, agent or run they write to) run one at a time in enqueue order: a job can
+    be claimed once every earlier job of its key has finished, so a job waiting for a retry holds back the later ones.
+    A claimed job is leased to its worker, which renews the lease while the job runs; if the lease runs out, e.g.
+    because the process died, it is claimed again. Completing, failing or renewing a job only takes effect for the
+    claim identified by its `attempts`, so a worker whose lease was taken over cannot overwrite the new claim.
+    """
+
+    @abstractmethod
+    def enqueue(self, payload: Dict[str, Any], ordering_key: str) -> str:
+        """Store a job and return its id."""
+
+    @abstractmethod
+    def claim(self, lease: float) -> Optional[Dict[str, Any]]:
+        """Lease the next runnable job for `lease` seconds and return it, with its `payload`, or None."""
+
+    @abstractmethod
+    def renew(self, job_id: str, attempts: int, lease: float) -> bool:
+        """Extend the lease of a running job by `lease` seconds; returns False if the claim is no longer held."""
+
+    @abstractmethod
+    def complete(self, job_id: str, result: Any, attempts: int) -> bool:
+        """Record the result of a claimed job; returns False if the claim is no longer held."""
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str, retry_at: Optional[float], attempts: int) -> bool:
+        """
+        Record a failed attempt: run the job again at `retry_at`, or move it to the dead-letter queue when None.
+
+        Returns False if the claim is no longer held.
+        """
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a job, or None if it is unknown."""
+
+    @abstractmethod
+    def list(self, status: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return the oldest jobs with a status, e.g. `DEAD` for the dead-letter queue."""
+
+    @abstractmethod
+    def requeue(self, job_id: str) -> bool:
+        """Move a dead-lettered job back to the queue with a fresh retry budget; returns False if it is not dead."""
+
+    @abstractmethod
+    def counts(self) -> Dict[str, int]:
+        """Return the number of jobs per status."""
+
+    def close(self):
+        pass
+
+
+class InMemoryIngestQueue(IngestQueueBase):
+    """In-process queue; jobs are lost when the process exits."""
+
+    def __init__(self, retention: Optional[float] = None):
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}  # insertion ordered, i.e. by enqueue order
+
+    def enqueue(self, payload: Dict[str, Any], ordering_key: str) -> str:
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        with self._lock:
+            self._jobs[job_id] = {
+                "id": job_id,
+                "ordering_key": ordering_key,
+                "payload": payload,
+                "status": QUEUED,
+                "attempts": 0,
+                "result": None,
+                "error": None,
+                "created_at": now,
+                "updated_at": now,
+                "available_at": now,
+            }
+        return job_id
+
+    def claim(self, lease: float) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            blocked = set()
+            for job in self._jobs.values():
+                if job["status"] in FINISHED or job["ordering_key"] in blocked:
+                    continue
+                blocked.add(job["ordering_key"])
+                if job["available_at"] <= now:
+                    job.update(status=RUNNING, attempts=job["attempts"] + 1, updated_at=now, available_at=now + lease)
+                    return dict(job)
+        return None
+
+    def _held(self, job_id: str, attempts: int) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        return job if job is not None and job["status"] == RUNNING and job["attempts"] == attempts else None
+
+    def renew(self, job_id: str, attempts: int, lease: float) -> bool:
+        with self._lock:
+            job = self._held(job_id, attempts)
+            if job is not None:
+                job["available_at"] = time.time() + lease
+            return job is not None
+
+    def complete(self, job_id: str, result: Any, attempts: int) -> bool:
+        now = time.time()
+        with self._lock:
+            job = self._held(job_id, attempts)
+            if job is None:
+                return False
+            job.update(status=COMPLETED, result=result, error=None, updated_at=now)
+            if self.retention is not None:
+                for expired in [
+                    job["id"]
+                    for job in self._jobs.values()
+                    if job["status"] == COMPLETED and job["updated_at"] < now - self.retention
+                ]:
+                    del self._jobs[expired]
+            return True
+
+    def fail(self, job_id: str, error: str, retry_at: Optional[float], attempts: int) -> bool:
+        with self._lock:
+            job = self._held(job_id, attempts)
+            if job is None:
+                return False
+            job.update(
+                status=DEAD if retry_at is None else QUEUED,
+                error=error,
+                updated_at=time.time(),
+                available_at=retry_at or time.time(),
+            )
+            return True
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def list(self, status: str, limit: int = 100) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(job) for job in self._jobs.values() if job["status"] == status][:limit]
+
+    def requeue(self, job_id: str) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job["status"] != DEAD:
+                return False
+            job.update(status=QUEUED, attempts=0, error=None, updated_at=time.time(), available_at=time.time())
+            return True
+
+    def counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in (QUEUED, RUNNING, COMPLETED, DEAD)}
+        with self._lock:
+            for job in self._jobs.values():
+                counts[job["status"]] += 1
+        return counts
+
+
+class SQLiteIngestQueue(IngestQueueBase):
+    """
+    Queue stored in a SQLite table, so jobs survive restarts and can be shared by the processes using the same file.
+
+    Every job records the `owner` it was enqueued by, and a queue only claims, lists and counts the jobs of its own
+    owner: instances writing to different vector stores can share a file without running each other's jobs.
+    Claims run in an immediate transaction, so two workers never lease the same job.
+    """
+
+    _COLUMNS = "id, ordering_key, payload, status, attempts, result, error, created_at, updated_at, available_at"
+
+    def __init__(self, db_path: str, retention: Optional[float] = None, owner: str = ""):
+        """
+        Args:
+            db_path (str): Path of the SQLite database holding the `ingest_jobs` table.
+            retention (float, optional): Seconds completed jobs are kept. Defaults to None, they are never removed.
+            owner (str, optional): Owner of the jobs this queue enqueues and runs, see `ingest_queue_owner`.
+                Defaults to "".
+        """
+        self.db_path = db_path
+        self.retention = retention
+        self.owner = owner
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly
+        self.connection = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._lock = threading.Lock()
+        with self._lock:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS ingest_jobs (seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "id TEXT NOT NULL UNIQUE, owner TEXT NOT NULL DEFAULT '', ordering_key TEXT NOT NULL, "
+                "payload TEXT NOT NULL, status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, result TEXT, "
+                "error TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL, available_at REAL NOT NULL)"
+            )
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(ingest_jobs)")]
+            if "owner" not in columns:
+                # Queues created before jobs had owners; their jobs keep the default owner
+                self.connection.execute("ALTER TABLE ingest_jobs ADD COLUMN owner TEXT NOT NULL DEFAULT ''")
+                self.connection.execute("DROP INDEX IF EXISTS idx_ingest_jobs_key")
+                self.connection.execute("DROP INDEX IF EXISTS idx_ingest_jobs_status")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ingest_jobs_owner_key ON ingest_jobs (owner, ordering_key, status, seq)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ingest_jobs_owner_status ON ingest_jobs (owner, status, seq)"
+            )
+
+    def _row(self, row) -> Dict[str, Any]:
+        job = dict(zip([column.strip() for column in self._COLUMNS.split(",")], row))
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] is not None else None
+        return job
+
+    def enqueue(self, payload: Dict[str, Any], ordering_key: str) -> str:
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        with self._lock:
+            self.connection.execute(
+                "INSERT INTO ingest_jobs (id, owner, ordering_key, payload, status, attempts, created_at, updated_at, "
+                "available_at) VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?)",
+                (job_id, self.owner, ordering_key, json.dumps(payload), QUEUED, now, now, now),
+            )
+        return job_id
+
+    def claim(self, lease: float) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                # A running job whose lease ran out is claimable again
+                row = self.connection.execute(
+                    f"SELECT {self._COLUMNS} FROM ingest_jobs AS job WHERE owner = ? AND status IN (?, ?) "
+                    "AND available_at <= ? AND NOT EXISTS (SELECT 1 FROM ingest_jobs AS earlier "
+                    "WHERE earlier.owner = job.owner AND earlier.ordering_key = job.ordering_key "
+                    "AND earlier.seq < job.seq AND earlier.status IN (?, ?)) ORDER BY seq LIMIT 1",
+                    (self.owner, QUEUED, RUNNING, now, QUEUED, RUNNING),
+                ).fetchone()
+                if row is not None:
+                    self.connection.execute(
+                        "UPDATE ingest_jobs SET status = ?, attempts = attempts + 1, updated_at = ?, available_at = ? "
+                        "WHERE id = ?",
+                        (RUNNING, now, now + lease, row[0]),
+                    )
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        job = self._row(row)
+        job.update(status=RUNNING, attempts=job["attempts"] + 1, updated_at=now, available_at=now + lease)
+        return job
+
+    def renew(self, job_id: str, attempts: int, lease: float) -> bool:
+        with self._lock:
+            cursor = self.connection.execute(
+                "UPDATE ingest_jobs SET available_at = ? WHERE id = ? AND status = ? AND attempts = ?",
+                (time.time() + lease, job_id, RUNNING, attempts),
+            )
+        return cursor.rowcount > 0
+
+    def complete(self, job_id: str, result: Any, attempts: int) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self.connection.execute(
+                "UPDATE ingest_jobs SET status = ?, result = ?, error = NULL, updated_at = ? "
+                "WHERE id = ? AND status = ? AND attempts = ?",
+                (COMPLETED, json.dumps(result, default=str), now, job_id, RUNNING, attempts),
+            )
+            if self.retention is not None:
+                self.connection.execute(
+                    "DELETE FROM ingest_jobs WHERE status = ? AND updated_at < ?", (COMPLETED, now - self.retention)
+                )
+        return cursor.rowcount > 0
+
+    def fail(self, job_id: str, error: str, retry_at: Optional[float], attempts: int) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self.connection.execute(
+                "UPDATE ingest_jobs SET status = ?, error = ?, updated_at = ?, available_at = ? "
+                "WHERE id = ? AND status = ? AND attempts = ?",
+                (DEAD if retry_at is None else QUEUED, error, now, retry_at or now, job_id, RUNNING, attempts),
+            )
+        return cursor.rowcount > 0
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT {self._COLUMNS} FROM ingest_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row(row) if row is not None else None
+
+    def list(self, status: str, limit: int = 100) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT {self._COLUMNS} FROM ingest_jobs WHERE owner = ? AND status = ? ORDER BY seq LIMIT ?",
+                (self.owner, status, limit),
+            ).fetchall()
+        return [self._row(row) for row in rows]
+
+    def requeue(self, job_id: str) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self.connection.execute(
+                "UPDATE ingest_jobs SET status = ?, attempts = 0, error = NULL, updated_at = ?, available_at = ? "
+                "WHERE id = ? AND owner = ? AND status = ?",
+                (QUEUED, now, now, job_id, self.owner, DEAD),
+            )
+        return cursor.rowcount > 0
+
+    def counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in (QUEUED, RUNNING, COMPLETED, DEAD)}
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT status, COUNT(*) FROM ingest_jobs WHERE owner = ? GROUP BY status", (self.owner,)
+            ).fetchall()
+        counts.update(dict(rows))
+        return counts
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+
+class IngestWorkerPool:
+    """
+    Threads running the jobs of an `IngestQueueBase` through `handler(payload)`.
+
+    A failed job is retried with jittered exponential backoff; after `max_retries` retries it is dead-lettered.
+    While a job runs, its lease is renewed every third of `lease`, so only a worker that stopped renewing loses it.
+    """
+
+    def __init__(
+        self,
+        queue: IngestQueueBase,
+        handler: Callable[[Dict[str, Any]], Any],
+        concurrency: int = 4,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        lease: float = 600.0,
+        poll_interval: float = 1.0,
+    ):
+        self.queue = queue
+        self.handler = handler
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._stopped = False
+
+    @property
+    def stopped(self) -> bool:
+        """Whether `stop` was called since the workers were last started."""
+        return self._stopped
+
+    def start(self):
+        with self._cond:
+            if self._threads:
+                return
+            self._stopped = False
+            for index in range(self.concurrency):
+                thread = threading.Thread(target=self._run, name=f"mem0-ingest-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the workers once their current job is done."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout)
+
+    def notify(self):
+        """Wake the idle workers, e.g. after a job was enqueued."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+            try:
+                job = self.queue.claim(self.lease)
+            except Exception as e:
+                logger.error(f"Failed to claim a background add job: {e}")
+                job = None
+            if job is None:
+                with self._cond:
+                    if not self._stopped:
+                        self._cond.wait(self.poll_interval)
+                continue
+            self._execute(job)
+            with self._cond:
+                # Wake the waiters of this job and the workers held back by its ordering key
+                self._cond.notify_all()
+
+    def _heartbeat(self, job: Dict[str, Any], done: threading.Event):
+        """Renew the lease of a running job until `done` is set or the claim is lost."""
+        while not done.wait(self.lease / 3):
+            try:
+                if not self.queue.renew(job["id"], job["attempts"], self.lease):
+                    logger.warning(f"Background add {job['id']} was claimed again by another worker")
+                    return
+            except Exception as e:
+                logger.error(f"Failed to renew the lease of background add {job['id']}: {e}")
+
+    def _execute(self, job: Dict[str, Any]):
+        done = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job, done), name="mem0-ingest-lease", daemon=True)
+        heartbeat.start()
+        try:
+            try:
+                result = self.handler(job["payload"])
+            finally:
+                done.set()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if job["attempts"] > self.max_retries:
+                logger.error(f"Background add {job['id']} failed {job['attempts']} times, dead-lettering it: {error}")
+                held = self.queue.fail(job["id"], error, None, job["attempts"])
+            else:
+                ceiling = min(self.max_delay, self.base_delay * 2 ** (job["attempts"] - 1))
+                delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+                logger.warning(f"Background add {job['id']} failed, retrying in {delay:.2f}s: {error}")
+                held = self.queue.fail(job["id"], error, time.time() + delay, job["attempts"])
+        else:
+            held = self.queue.complete(job["id"], result, job["attempts"])
+        if not held:
+            logger.warning(f"Background add {job['id']} lost its lease, leaving it to the worker that claimed it")
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Block until a job is completed or dead-lettered and return it; raises `TimeoutError` after `timeout`."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.queue.get(job_id)
+            if job is None:
+                raise ValueError(f"Unknown background add job {job_id}")
+            if job["status"] in FINISHED:
+                return job
+            remaining = self.poll_interval if deadline is None else deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Background add job {job_id} is still {job['status']} after {timeout}s")
+            with self._cond:
+                self._cond.wait(min(self.poll_interval, remaining))
+
+
+def ingest_queue_path(config) -> str:
+    return config.db_path or os.path.join(mem0_dir, "ingest_queue.db")
+
+
+def ingest_queue_owner(memory_config) -> str:
+    """
+    Fingerprint of the vector store a `MemoryConfig` writes to: its provider and the plain, non-secret fields of its
+    config, such as the collection name, path, host or URL. Jobs are tagged with the fingerprint of the instance that
+    enqueued them, so only instances writing to the same store run them.
+    """
+    store_config = memory_config.vector_store.config
+    fields = store_config.model_dump() if isinstance(store_config, BaseModel) else dict(store_config or {})
+    location = {
+        key: value
+        for key, value in fields.items()
+        if isinstance(value, (str, int, float, bool))
+        and not any(marker in key.lower() for marker in SECRET_FIELD_MARKERS)
+    }
+    fingerprint = json.dumps([memory_config.vector_store.provider, location], sort_keys=True)
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32]
+
+
+def create_ingest_queue(config, owner: str = "") -> IngestQueueBase:
+    """Build the queue described by a `BackgroundAddConfig`, running the jobs of `owner`."""
+    if config.backend == "memory":
+        return InMemoryIngestQueue(retention=config.retention)
+    return SQLiteIngestQueue(ingest_queue_path(config), retention=config.retention, owner=owner)
@@ -2,13 +2,18 @@ import asyncio
 import concurrent
 import gc
 import hashlib
+import inspect
 import json
 import logging
 import os
+import threading
 import uuid
 import warnings
+from contextlib import nullcontext
 from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Dict, Optional
 
 import pytz
@@ -18,13 +23,22 @@ from mem0.configs.base import MemoryConfig, MemoryItem
 from mem0.configs.enums import MemoryType
 from mem0.configs.prompts import (
     PROCEDURAL_MEMORY_SYSTEM_PROMPT,
+    get_extract_and_update_messages,
     get_update_memory_messages,
 )
 from mem0.memory.base import MemoryBase
+from mem0.memory.ingest_queue import (
+    IngestWorkerPool,
+    create_ingest_queue,
+    ingest_queue_owner,
+    ingest_queue_path,
+)
+from mem0.memory.search_cache import create_search_cache
 from mem0.memory.setup import mem0_dir, setup_config
 from mem0.memory.storage import SQLiteManager
 from mem0.memory.telemetry import capture_event
 from mem0.memory.utils import (
+    FactStreamParser,
     get_fact_retrieval_messages,
     parse_messages,
     parse_vision_messages,
@@ -39,6 +53,10 @@ from mem0.utils.factory import (
 )
 
 
+def _job_status(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: job[name] for name in ("id", "status", "attempts", "result", "error", "created_at", "updated_at")}
+
+
 def _build_filters_and_metadata(
     *,  # Enforce keyword-only arguments
     user_id: Optional[str] = None,
@@ -115,6 +133,124 @@ def _build_filters_and_metadata(
     return base_metadata_template, effective_query_filters
 
 
+def _format_listed_memory(mem) -> Dict[str, Any]:
+    """Format a record returned by a vector store listing into the public memory dict (without a score)."""
+    promoted_payload_keys = [
+        "user_id",
+        "agent_id",
+        "run_id",
+        "actor_id",
+        "role",
+    ]
+    core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+
+    memory_item_dict = MemoryItem(
+        id=mem.id,
+        memory=mem.payload["data"],
+        hash=mem.payload.get("hash"),
+        created_at=mem.payload.get("created_at"),
+        updated_at=mem.payload.get("updated_at"),
+    ).model_dump(exclude={"score"})
+
+    for key in promoted_payload_keys:
+        if key in mem.payload:
+            memory_item_dict[key] = mem.payload[key]
+
+    additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
+    if additional_metadata:
+        memory_item_dict["metadata"] = additional_metadata
+
+    return memory_item_dict
+
+
+PROMOTED_PAYLOAD_KEYS = ("user_id", "agent_id", "run_id", "actor_id", "role")
+CORE_AND_PROMOTED_KEYS = frozenset({"data", "hash", "created_at", "updated_at", "id", *PROMOTED_PAYLOAD_KEYS})
+
+
+def _format_search_result(mem) -> Dict[str, Any]:
+    """
+    Format a search hit into the public memory dict.
+
+    Builds the same dict as `MemoryItem(...).model_dump()` plus the promoted keys and metadata, directly from the
+    payload: search returns up to `limit` hits per call and validating a model for each dominates at high QPS.
+    """
+    payload = mem.payload
+    memory_item_dict = {
+        "id": mem.id,
+        "memory": payload["data"],
+        "hash": payload.get("hash"),
+        "metadata": None,
+        "score": mem.score,
+        "created_at": payload.get("created_at"),
+        "updated_at": payload.get("updated_at"),
+    }
+    for key in PROMOTED_PAYLOAD_KEYS:
+        if key in payload:
+            memory_item_dict[key] = payload[key]
+
+    additional_metadata = {k: v for k, v in payload.items() if k not in CORE_AND_PROMOTED_KEYS}
+    if additional_metadata:
+        memory_item_dict["metadata"] = additional_metadata
+    return memory_item_dict
+
+
+def _passes_threshold(score: Optional[float], threshold: Optional[float], score_mode: str = "similarity") -> bool:
+    """Whether a hit clears `threshold`, a minimum similarity; stores scoring distances are compared as 1 - score."""
+    if threshold is None:
+        return True
+    if score is None:
+        return False
+    return (1.0 - score if score_mode == "distance" else score) >= threshold
+
+
+@lru_cache(maxsize=None)
+def _search_accepts_threshold(store_class: type, asynchronous: bool = False) -> bool:
+    """Whether a vector store's `search` (or `async_search`, used by AsyncMemory) applies `threshold` itself."""
+    search = (asynchronous and getattr(store_class, "async_search", None)) or getattr(store_class, "search", None)
+    try:
+        return search is not None and "threshold" in inspect.signature(search).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+# Memories retrieved with the embedding of the raw turn and shown to the LLM in the single-call add mode
+SINGLE_CALL_CANDIDATES = 10
+
+
+def _number_candidates(candidates):
+    """Number candidate memories from "0" to hide their UUIDs from the LLM; return them and the id mapping."""
+    unique = {}
+    for mem in candidates:
+        unique.setdefault(mem.id, mem.payload["data"])
+    retrieved_old_memory = [{"id": str(idx), "text": text} for idx, text in enumerate(unique.values())]
+    return retrieved_old_memory, {str(idx): memory_id for idx, memory_id in enumerate(unique)}
+
+
+def _parse_extract_and_update_response(response):
+    """Return the facts and the actions response of a single-call LLM response, or nothing when it is invalid."""
+    try:
+        parsed = json.loads(remove_code_blocks(response))
+    except Exception as e:
+        logger.error(f"Invalid JSON response: {e}")
+        return [], {}
+    if not isinstance(parsed, dict):
+        logger.error(f"Invalid extract and update response: {parsed}")
+        return [], {}
+    facts = parsed.get("facts") if isinstance(parsed.get("facts"), list) else []
+    return facts, {"memory": parsed.get("memory") or []}
+
+
+def _shares_history_db(config: MemoryConfig) -> bool:
+    """Whether the vector store keeps the history table in its own SQLite database."""
+    return config.vector_store.provider == "sqlite" and config.vector_store.config.store_history
+
+
+def _create_history_db(config: MemoryConfig, vector_store) -> SQLiteManager:
+    if _shares_history_db(config):
+        return vector_store.history_db()
+    return SQLiteManager(config.history_db_path)
+
+
 setup_config()
 logger = logging.getLogger(__name__)
 
@@ -129,15 +265,28 @@ class Memory(MemoryBase):
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            rate_limit=self.config.embedder.rate_limit,
         )
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
-        self.db = SQLiteManager(self.config.history_db_path)
+        self.llm = LlmFactory.create(
+            self.config.llm.provider,
+            self.config.llm.config,
+            cache=self.config.llm.cache,
+            rate_limit=self.config.llm.rate_limit,
+        )
+        self.db = _create_history_db(self.config, self.vector_store)
         self.collection_name = self.config.vector_store.config.collection_name
+        self.search_cache = create_search_cache(self.config.search_cache)
         self.api_version = self.config.version
 
+        self._ingest_lock = threading.Lock()
+        self._ingest_queue = None
+        self._ingest_workers = None
+        # Taken before the migrations store below rewrites the vector store config
+        self._ingest_owner = ingest_queue_owner(self.config)
+
         self.enable_graph = False
 
         if self.config.graph_store.config:
@@ -147,13 +296,21 @@ class Memory(MemoryBase):
         else:
             self.graph = None
         self.config.vector_store.config.collection_name = "mem0migrations"
-        if self.config.vector_store.provider in ["faiss", "qdrant"]:
+        if self.config.vector_store.provider in ["faiss", "numpy", "qdrant"]:
             provider_path = f"migrations_{self.config.vector_store.provider}"
             self.config.vector_store.config.path = os.path.join(mem0_dir, provider_path)
             os.makedirs(self.config.vector_store.config.path, exist_ok=True)
         self._telemetry_vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
+
+        background = self.config.background_add
+        if background.backend == "sqlite" and background.run_workers and os.path.exists(ingest_queue_path(background)):
+            # Resume the background adds a previous run left queued for this vector store
+            queue, workers = self._ingest(start_workers=False)
+            counts = queue.counts()
+            if counts["queued"] or counts["running"]:
+                workers.start()
         capture_event("mem0.init", self, {"sync_type": "sync"})
 
     @classmethod
@@ -192,6 +349,7 @@ class Memory(MemoryBase):
         infer: bool = True,
         memory_type: Optional[str] = None,
         prompt: Optional[str] = None,
+        mode: str = "sync",
     ):
         """
         Create a new memory.
@@ -214,6 +372,8 @@ class Memory(MemoryBase):
                 creating procedural memories (typically requires 'agent_id'). Otherwise, memories
                 are treated as general conversational/factual memories.memory_type (str, optional): Type of memory to create. Defaults to None. By default, it creates the short term memories and long term (semantic and episodic) memories. Pass "procedural_memory" to create procedural memories.
             prompt (str, optional): Prompt to use for the memory creation. Defaults to None.
+            mode (str, optional): "sync" (default) to add the memories before returning, or "background" to
+                enqueue the add to the durable background queue and return its job id right away.
 
 
         Returns:
@@ -221,7 +381,10 @@ class Memory(MemoryBase):
                   including a list of memory items affected (added, updated) under a "results" key,
                   and potentially "relations" if graph store is enabled.
                   Example for v1.1+: `{"results": [{"id": "...", "memory": "...", "event": "ADD"}]}`
+                  With `mode="background"`: `{"job_id": "...", "status": "queued"}`.
         """
+        if mode not in ("sync", "background"):
+            raise ValueError(f"Invalid 'mode' {mode!r}, expected 'sync' or 'background'.")
 
         processed_metadata, effective_filters = _build_filters_and_metadata(
             user_id=user_id,
@@ -244,6 +407,20 @@ class Memory(MemoryBase):
         elif not isinstance(messages, list):
             raise ValueError("messages must be str, dict, or list[dict]")
 
+        if mode == "background":
+            return self._enqueue_add(
+                dict(
+                    messages=messages,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    run_id=run_id,
+                    metadata=metadata,
+                    infer=infer,
+                    memory_type=memory_type,
+                    prompt=prompt,
+                )
+            )
+
         if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
             results = self._create_procedural_memory(messages, metadata=processed_metadata, prompt=prompt)
             return results
@@ -280,6 +457,79 @@ class Memory(MemoryBase):
 
         return {"results": vector_store_result}
 
+    def _ingest(self, start_workers: bool = True):
+        """Return the background add queue and its worker pool, creating them and starting the workers on first use."""
+        with self._ingest_lock:
+            config = self.config.background_add
+            if self._ingest_queue is None:
+                self._ingest_queue = create_ingest_queue(config, self._ingest_owner)
+                self._ingest_workers = IngestWorkerPool(
+                    self._ingest_queue,
+                    lambda payload: self.add(**payload),
+                    concurrency=config.concurrency,
+                    max_retries=config.max_retries,
+                    base_delay=config.base_delay,
+                    max_delay=config.max_delay,
+                    lease=config.lease,
+                )
+            if start_workers and config.run_workers and not self._ingest_workers.stopped:
+                self._ingest_workers.start()
+        return self._ingest_queue, self._ingest_workers
+
+    def _enqueue_add(self, payload):
+        try:
+            json.dumps(payload)
+        except TypeError as e:
+            raise ValueError(f"Background adds need JSON-serializable messages and metadata: {e}")
+        # Adds to the same user (or agent, or run) run in enqueue order
+        field = next(field for field in ("user_id", "agent_id", "run_id") if payload[field])
+        ordering_key = f"{field}:{payload[field]}"
+        queue, workers = self._ingest()
+        job_id = queue.enqueue(payload, ordering_key)
+        workers.notify()
+        return {"job_id": job_id, "status": "queued"}
+
+    def job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of a background add.
+
+        Returns:
+            dict: The job `id`, its `status` ("queued", "running", "completed", or "dead" once dead-lettered), the
+                number of `attempts`, the `result` of `add` once completed, the last `error`, and the `created_at`
+                and `updated_at` timestamps. None if the job is unknown.
+        """
+        job = self._ingest()[0].get(job_id)
+        return _job_status(job) if job is not None else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for a background add to complete or be dead-lettered.
+
+        Args:
+            job_id (str): ID of the job returned by `add(..., mode="background")`.
+            timeout (float, optional): Seconds to wait. Defaults to None, wait forever.
+
+        Returns:
+            dict: The status of the job, as returned by `job_status`. Raises `TimeoutError` after `timeout`.
+        """
+        return _job_status(self._ingest()[1].wait(job_id, timeout))
+
+    def dead_letters(self, limit: int = 100) -> list:
+        """List the background adds that failed every retry, with the arguments they were enqueued with."""
+        return [dict(_job_status(job), payload=job["payload"]) for job in self._ingest()[0].list("dead", limit)]
+
+    def retry_job(self, job_id: str) -> bool:
+        """Enqueue a dead-lettered background add again; returns False if the job is not dead-lettered."""
+        queue, workers = self._ingest()
+        requeued = queue.requeue(job_id)
+        workers.notify()
+        return requeued
+
+    def stop_background_workers(self, timeout: Optional[float] = None):
+        """Stop the background add workers once their current job is done; queued jobs stay in the queue."""
+        if self._ingest_workers is not None:
+            self._ingest_workers.stop(timeout)
+
     def _add_to_vector_store(self, messages, metadata, filters, infer):
         if not infer:
             returned_memories = []
@@ -318,83 +568,11 @@ class Memory(MemoryBase):
             return returned_memories
 
         parsed_messages = parse_messages(messages)
-
-        if self.config.custom_fact_extraction_prompt:
-            system_prompt = self.config.custom_fact_extraction_prompt
-            user_prompt = f"Input:\n{parsed_messages}"
-        else:
-            system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
-
-        response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
-
-        try:
-            response = remove_code_blocks(response)
-            print(f"🔍 [DEBUG] 事实提取响应: '{response}'")
-            new_retrieved_facts = json.loads(response)["facts"]
-            print(f"🔍 [DEBUG] 提取的事实: {new_retrieved_facts}")
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            print(f"🔍 [DEBUG] 事实提取失败: {e}")
-            new_retrieved_facts = []
-
-        if not new_retrieved_facts:
-            print("⚠️ [DEBUG] 没有提取到新事实，跳过记忆更新")
-            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
-
-        retrieved_old_memory = []
-        new_message_embeddings = {}
-        for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
-            new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=new_mem,
-                vectors=messages_embeddings,
-                limit=5,
-                filters=filters,
-            )
-            for mem in existing_memories:
-                retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
-
-        unique_data = {}
-        for item in retrieved_old_memory:
-            unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
-        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
-
-        # mapping UUIDs with integers for handling UUID hallucinations
-        temp_uuid_mapping = {}
-        for idx, item in enumerate(retrieved_old_memory):
-            temp_uuid_mapping[str(idx)] = item["id"]
-            retrieved_old_memory[idx]["id"] = str(idx)
-
-        if new_retrieved_facts:
-            function_calling_prompt = get_update_memory_messages(
-                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
-            )
-
-            try:
-                response: str = self.llm.generate_response(
-                    messages=[{"role": "user", "content": function_calling_prompt}],
-                    response_format={"type": "json_object"},
-                )
-            except Exception as e:
-                logger.error(f"Error in new memory actions response: {e}")
-                response = ""
-
-            try:
-                response = remove_code_blocks(response)
-                new_memories_with_actions = json.loads(response)
-            except Exception as e:
-                logger.error(f"Invalid JSON response: {e}")
-                new_memories_with_actions = {}
+        if self.config.add_mode == "single_call":
+            plan = self._plan_actions_single_call(parsed_messages, filters)
         else:
-            new_memories_with_actions = {}
+            plan = self._plan_actions_two_step(parsed_messages, filters)
+        new_retrieved_facts, new_memories_with_actions, temp_uuid_mapping, new_message_embeddings = plan
 
         returned_memories = []
         
@@ -496,6 +674,153 @@ class Memory(MemoryBase):
         )
         return returned_memories
 
+    def _plan_actions_two_step(self, parsed_messages, filters):
+        """
+        Extract facts with one LLM call, then reconcile them with the memories retrieved per fact with a second one.
+
+        Returns:
+            tuple: The extracted facts, the parsed actions response, the mapping of the integer ids shown to the LLM
+                to memory ids, and the embeddings computed per fact.
+        """
+        if self.config.custom_fact_extraction_prompt:
+            system_prompt = self.config.custom_fact_extraction_prompt
+            user_prompt = f"Input:\n{parsed_messages}"
+        else:
+            system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
+
+        def search_fact(fact):
+            embeddings = self.embedding_model.embed(fact, "add")
+            return embeddings, self.vector_store.search(query=fact, vectors=embeddings, limit=5, filters=filters)
+
+        def start_search(fact):
+            if fact not in searches:
+                searches[fact] = executor.submit(search_fact, fact)
+
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+        # Searches started while the facts stream in, keyed by fact
+        searches = {}
+        executor = None
+        if self.config.stream_fact_extraction is True and getattr(self.llm, "supports_streaming", False) is True:
+            # One worker per call overlaps this add's searches with generation without making concurrent calls to
+            # the vector store, while concurrent adds (e.g. background workers) keep searching in parallel.
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="mem0-fact-search")
+            try:
+                response = self._stream_fact_extraction(messages, start_search)
+            except Exception:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        else:
+            response = self.llm.generate_response(messages=messages, response_format={"type": "json_object"})
+
+        try:
+            response = remove_code_blocks(response)
+            print(f"🔍 [DEBUG] 事实提取响应: '{response}'")
+            new_retrieved_facts = json.loads(response)["facts"]
+            print(f"🔍 [DEBUG] 提取的事实: {new_retrieved_facts}")
+        except Exception as e:
+            logger.error(f"Error in new_retrieved_facts: {e}")
+            print(f"🔍 [DEBUG] 事实提取失败: {e}")
+            new_retrieved_facts = []
+
+        if not new_retrieved_facts:
+            print("⚠️ [DEBUG] 没有提取到新事实，跳过记忆更新")
+            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+
+        # Streamed facts missing from the final parse are not searched
+        for fact, future in searches.items():
+            if fact not in new_retrieved_facts:
+                future.cancel()
+
+        retrieved_old_memory = []
+        new_message_embeddings = {}
+        try:
+            for new_mem in new_retrieved_facts:
+                if new_mem in searches:
+                    messages_embeddings, existing_memories = searches[new_mem].result()
+                else:
+                    messages_embeddings, existing_memories = search_fact(new_mem)
+                new_message_embeddings[new_mem] = messages_embeddings
+                for mem in existing_memories:
+                    retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        unique_data = {}
+        for item in retrieved_old_memory:
+            unique_data[item["id"]] = item
+        retrieved_old_memory = list(unique_data.values())
+        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+
+        # mapping UUIDs with integers for handling UUID hallucinations
+        temp_uuid_mapping = {}
+        for idx, item in enumerate(retrieved_old_memory):
+            temp_uuid_mapping[str(idx)] = item["id"]
+            retrieved_old_memory[idx]["id"] = str(idx)
+
+        if new_retrieved_facts:
+            function_calling_prompt = get_update_memory_messages(
+                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+            )
+
+            try:
+                response: str = self.llm.generate_response(
+                    messages=[{"role": "user", "content": function_calling_prompt}],
+                    response_format={"type": "json_object"},
+                )
+            except Exception as e:
+                logger.error(f"Error in new memory actions response: {e}")
+                response = ""
+
+            try:
+                response = remove_code_blocks(response)
+                new_memories_with_actions = json.loads(response)
+            except Exception as e:
+                logger.error(f"Invalid JSON response: {e}")
+                new_memories_with_actions = {}
+        else:
+            new_memories_with_actions = {}
+        return new_retrieved_facts, new_memories_with_actions, temp_uuid_mapping, new_message_embeddings
+
+    def _stream_fact_extraction(self, messages, on_fact):
+        """Stream the fact extraction response, calling `on_fact` as soon as each fact is complete."""
+        parser = FactStreamParser()
+        for chunk in self.llm.generate_response_stream(messages=messages, response_format={"type": "json_object"}):
+            for fact in parser.feed(chunk):
+                on_fact(fact)
+        return parser.text
+
+    def _plan_actions_single_call(self, parsed_messages, filters):
+        """
+        Retrieve candidates with an embedding of the raw turn, then extract facts and reconcile them in one LLM call.
+
+        Returns:
+            tuple: Same as `_plan_actions_two_step`; no per-fact embeddings are computed.
+        """
+        turn_embeddings = self.embedding_model.embed(parsed_messages, "search")
+        candidates = self.vector_store.search(
+            query=parsed_messages, vectors=turn_embeddings, limit=SINGLE_CALL_CANDIDATES, filters=filters
+        )
+        retrieved_old_memory, temp_uuid_mapping = _number_candidates(candidates)
+        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+
+        system_prompt, user_prompt = get_extract_and_update_messages(
+            parsed_messages, retrieved_old_memory, self.config.custom_extract_and_update_prompt
+        )
+        try:
+            response = self.llm.generate_response(
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            logger.error(f"Error in extract and update response: {e}")
+            response = ""
+        new_retrieved_facts, new_memories_with_actions = _parse_extract_and_update_response(response)
+        return new_retrieved_facts, new_memories_with_actions, temp_uuid_mapping, {}
+
     def _add_to_graph(self, messages, filters):
         added_entities = []
         if self.enable_graph:
@@ -558,10 +883,17 @@ class Memory(MemoryBase):
         run_id: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        include_count: bool = False,
     ):
         """
         List all memories.
 
+        Passing `cursor` or `page_size` switches to paginated mode: memories are read one page at a time from the
+        vector store, ordered by `created_at` where the store supports it, and the response carries the cursor of
+        the next page.
+
         Args:
             user_id (str, optional): user id
             agent_id (str, optional): agent id
@@ -570,12 +902,18 @@ class Memory(MemoryBase):
                 These are merged with the ID-based scoping filters. For example,
                 `filters={"actor_id": "some_user"}`.
             limit (int, optional): The maximum number of memories to return. Defaults to 100.
+            cursor (str, optional): `next_cursor` of the previous page. Defaults to None.
+            page_size (int, optional): Memories per page in paginated mode. Defaults to `limit`.
+            include_count (bool, optional): Add the total number of matching memories as "count" in paginated
+                mode. Defaults to False.
 
         Returns:
             dict: A dictionary containing a list of memories under the "results" key,
                   and potentially "relations" if graph store is enabled. For API v1.0,
                   it might return a direct list (see deprecation warning).
                   Example for v1.1+: `{"results": [{"id": "...", "memory": "...", ...}]}`
+                  Paginated mode always returns a dict with "results" and "next_cursor" (None on the last page),
+                  plus "count" when requested and "relations" on the first page if graph store is enabled.
         """
 
         _, effective_filters = _build_filters_and_metadata(
@@ -590,10 +928,18 @@ class Memory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"}
         )
 
+        paginated = cursor is not None or page_size is not None
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
+            if paginated:
+                future_memories = executor.submit(
+                    self._get_page_from_vector_store, effective_filters, cursor, page_size or limit, include_count
+                )
+            else:
+                future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
             future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
+                executor.submit(self.graph.get_all, effective_filters, limit)
+                if self.enable_graph and cursor is None
+                else None
             )
 
             concurrent.futures.wait(
@@ -603,6 +949,11 @@ class Memory(MemoryBase):
             all_memories_result = future_memories.result()
             graph_entities_result = future_graph_entities.result() if future_graph_entities else None
 
+        if paginated:
+            if future_graph_entities:
+                all_memories_result["relations"] = graph_entities_result
+            return all_memories_result
+
         if self.enable_graph:
             return {"results": all_memories_result, "relations": graph_entities_result}
 
@@ -626,36 +977,48 @@ class Memory(MemoryBase):
             else memories_result
         )
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        return [_format_listed_memory(mem) for mem in actual_memories]
 
-        formatted_memories = []
-        for mem in actual_memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload["data"],
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-            ).model_dump(exclude={"score"})
+    def _get_page_from_vector_store(self, filters, cursor, page_size, include_count):
+        memories, next_cursor = self.vector_store.list_page(filters=filters, cursor=cursor, page_size=page_size)
+        page = {"results": [_format_listed_memory(mem) for mem in memories], "next_cursor": next_cursor}
+        if include_count:
+            page["count"] = self.vector_store.count(filters=filters)
+        return page
 
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
+    def iter_memories(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ):
+        """
+        Iterate over every memory in scope, streaming them from the vector store in batches.
 
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
+        Unlike `get_all`, this is not bounded by a limit and does not include graph relations.
 
-            formatted_memories.append(memory_item_dict)
+        Args:
+            user_id (str, optional): user id
+            agent_id (str, optional): agent id
+            run_id (str, optional): run id
+            filters (dict, optional): Additional custom key-value filters, merged with the ID-based scoping filters.
+            batch_size (int, optional): Number of memories fetched from the vector store per round-trip. Defaults to 100.
 
-        return formatted_memories
+        Yields:
+            dict: Memories in the same format as the items of `get_all`.
+        """
+        _, effective_filters = _build_filters_and_metadata(
+            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
+        )
+
+        keys, encoded_ids = process_telemetry_filters(effective_filters)
+        capture_event("mem0.iter_memories", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"})
+
+        for mem in self.vector_store.iter_all(filters=effective_filters, batch_size=batch_size):
+            yield _format_listed_memory(mem)
 
     def search(
         self,
@@ -706,7 +1069,9 @@ class Memory(MemoryBase):
         )
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._search_vector_store, query, effective_filters, limit, threshold)
+            future_memories = executor.submit(
+                self._cached_search_vector_store, query, effective_filters, limit, threshold
+            )
             future_graph_entities = (
                 executor.submit(self.graph.search, query, effective_filters, limit) if self.enable_graph else None
             )
@@ -733,43 +1098,26 @@ class Memory(MemoryBase):
         else:
             return {"results": original_memories}
 
+    def _cached_search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
+        if self.search_cache is None:
+            return self._search_vector_store(query, filters, limit, threshold)
+        key = self.search_cache.key(query, filters, limit, threshold)
+        memories = self.search_cache.get(key)
+        if memories is None:
+            memories = self._search_vector_store(query, filters, limit, threshold)
+            self.search_cache.set(key, memories)
+        return memories
+
     def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
         embeddings = self.embedding_model.embed(query, "search")
+        if threshold is not None and _search_accepts_threshold(type(self.vector_store)):
+            memories = self.vector_store.search(
+                query=query, vectors=embeddings, limit=limit, filters=filters, threshold=threshold
+            )
+            return [_format_search_result(mem) for mem in memories]
         memories = self.vector_store.search(query=query, vectors=embeddings, limit=limit, filters=filters)
-
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        original_memories = []
-        for mem in memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload["data"],
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-                score=mem.score,
-            ).model_dump()
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
-
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
-
-            if threshold is None or mem.score >= threshold:
-                original_memories.append(memory_item_dict)
-
-        return original_memories
+        score_mode = getattr(self.vector_store, "score_mode", "similarity")
+        return [_format_search_result(mem) for mem in memories if _passes_threshold(mem.score, threshold, score_mode)]
 
     def update(self, memory_id, data):
         """
@@ -828,9 +1176,17 @@ class Memory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"})
-        memories = self.vector_store.list(filters=filters)[0]
-        for memory in memories:
-            self._delete_memory(memory.id)
+        # Collect the ids first so deletions don't shift the pages of the underlying cursor
+        memories = list(self.vector_store.iter_all(filters=filters))
+        if hasattr(self.vector_store, "delete_many"):
+            # Stores with filtered bulk deletes remove everything in one request; history is written from the listing
+            with self._history_transaction():
+                self.vector_store.delete_many(filters=filters)
+                for memory in memories:
+                    self._record_deletion(memory.id, memory)
+        else:
+            for memory in memories:
+                self._delete_memory(memory.id)
 
         logger.info(f"Deleted {len(memories)} memories")
 
@@ -864,20 +1220,22 @@ class Memory(MemoryBase):
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        self.vector_store.insert(
-            vectors=[embeddings],
-            ids=[memory_id],
-            payloads=[metadata],
-        )
-        self.db.add_history(
-            memory_id,
-            None,
-            data,
-            "ADD",
-            created_at=metadata.get("created_at"),
-            actor_id=metadata.get("actor_id"),
-            role=metadata.get("role"),
-        )
+        with self._history_transaction():
+            self.vector_store.insert(
+                vectors=[embeddings],
+                ids=[memory_id],
+                payloads=[metadata],
+            )
+            self.db.add_history(
+                memory_id,
+                None,
+                data,
+                "ADD",
+                created_at=metadata.get("created_at"),
+                actor_id=metadata.get("actor_id"),
+                role=metadata.get("role"),
+            )
+        self._invalidate_search_cache(metadata)
         capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
         return memory_id
 
@@ -953,42 +1311,57 @@ class Memory(MemoryBase):
         else:
             embeddings = self.embedding_model.embed(data, "update")
 
-        self.vector_store.update(
-            vector_id=memory_id,
-            vector=embeddings,
-            payload=new_metadata,
-        )
-        logger.info(f"Updating memory with ID {memory_id=} with {data=}")
-
-        self.db.add_history(
-            memory_id,
-            prev_value,
-            data,
-            "UPDATE",
-            created_at=new_metadata["created_at"],
-            updated_at=new_metadata["updated_at"],
-            actor_id=new_metadata.get("actor_id"),
-            role=new_metadata.get("role"),
-        )
+        with self._history_transaction():
+            self.vector_store.update(
+                vector_id=memory_id,
+                vector=embeddings,
+                payload=new_metadata,
+            )
+            logger.info(f"Updating memory with ID {memory_id=} with {data=}")
+
+            self.db.add_history(
+                memory_id,
+                prev_value,
+                data,
+                "UPDATE",
+                created_at=new_metadata["created_at"],
+                updated_at=new_metadata["updated_at"],
+                actor_id=new_metadata.get("actor_id"),
+                role=new_metadata.get("role"),
+            )
+        self._invalidate_search_cache(existing_memory.payload, new_metadata)
         capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
         return memory_id
 
     def _delete_memory(self, memory_id):
         logger.info(f"Deleting memory with {memory_id=}")
         existing_memory = self.vector_store.get(vector_id=memory_id)
-        prev_value = existing_memory.payload["data"]
-        self.vector_store.delete(vector_id=memory_id)
+        with self._history_transaction():
+            self.vector_store.delete(vector_id=memory_id)
+            self._record_deletion(memory_id, existing_memory)
+        return memory_id
+
+    def _history_transaction(self):
+        """Commit a vector write and its history rows together when both live in the same SQLite database."""
+        return self.db.transaction() if _shares_history_db(self.config) else nullcontext()
+
+    def _record_deletion(self, memory_id, existing_memory):
         self.db.add_history(
             memory_id,
-            prev_value,
+            existing_memory.payload.get("data"),
             None,
             "DELETE",
             actor_id=existing_memory.payload.get("actor_id"),
             role=existing_memory.payload.get("role"),
             is_deleted=1,
         )
+        self._invalidate_search_cache(existing_memory.payload)
         capture_event("mem0._delete_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
-        return memory_id
+
+    def _invalidate_search_cache(self, *payloads):
+        """Invalidate cached searches of the tenants owning the written memories."""
+        if self.search_cache is not None:
+            self.search_cache.invalidate(payloads)
 
     def reset(self):
         """
@@ -999,11 +1372,18 @@ class Memory(MemoryBase):
         """
         logger.warning("Resetting all memories")
 
-        if hasattr(self.db, "connection") and self.db.connection:
-            self.db.connection.execute("DROP TABLE IF EXISTS history")
-            self.db.connection.close()
+        if self.search_cache is not None:
+            self.search_cache.clear()
+
+        if _shares_history_db(self.config):
+            # The history table lives in the vector store's database; keep the shared connection open.
+            self.db.reset()
+        else:
+            if hasattr(self.db, "connection") and self.db.connection:
+                self.db.connection.execute("DROP TABLE IF EXISTS history")
+                self.db.connection.close()
 
-        self.db = SQLiteManager(self.config.history_db_path)
+            self.db = SQLiteManager(self.config.history_db_path)
 
         if hasattr(self.vector_store, "reset"):
             self.vector_store = VectorStoreFactory.reset(self.vector_store)
@@ -1013,6 +1393,8 @@ class Memory(MemoryBase):
             self.vector_store = VectorStoreFactory.create(
                 self.config.vector_store.provider, self.config.vector_store.config
             )
+            if _shares_history_db(self.config):
+                self.db = _create_history_db(self.config, self.vector_store)
         capture_event("mem0.reset", self, {"sync_type": "sync"})
 
     def chat(self, query):
@@ -1027,13 +1409,20 @@ class AsyncMemory(MemoryBase):
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            rate_limit=self.config.embedder.rate_limit,
         )
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
-        self.db = SQLiteManager(self.config.history_db_path)
+        self.llm = LlmFactory.create(
+            self.config.llm.provider,
+            self.config.llm.config,
+            cache=self.config.llm.cache,
+            rate_limit=self.config.llm.rate_limit,
+        )
+        self.db = _create_history_db(self.config, self.vector_store)
         self.collection_name = self.config.vector_store.config.collection_name
+        self.search_cache = create_search_cache(self.config.search_cache)
         self.api_version = self.config.version
 
         self.enable_graph = False
@@ -1046,7 +1435,7 @@ class AsyncMemory(MemoryBase):
             self.graph = None
 
         self.config.vector_store.config.collection_name = "mem0migrations"
-        if self.config.vector_store.provider in ["faiss", "qdrant"]:
+        if self.config.vector_store.provider in ["faiss", "numpy", "qdrant"]:
             provider_path = f"migrations_{self.config.vector_store.provider}"
             self.config.vector_store.config.path = os.path.join(mem0_dir, provider_path)
             os.makedirs(self.config.vector_store.config.path, exist_ok=True)
@@ -1056,6 +1445,18 @@ class AsyncMemory(MemoryBase):
 
         capture_event("mem0.init", self, {"sync_type": "async"})
 
+    async def _vector_store_call(self, method: str, **kwargs):
+        """
+        Call a vector store method without blocking the event loop.
+
+        Providers that expose a native coroutine as `async_<method>` are awaited directly, all others
+        are run in a worker thread.
+        """
+        async_method = getattr(self.vector_store, f"async_{method}", None)
+        if asyncio.iscoroutinefunction(async_method):
+            return await async_method(**kwargs)
+        return await asyncio.to_thread(getattr(self.vector_store, method), **kwargs)
+
     @classmethod
     async def from_config(cls, config_dict: Dict[str, Any]):
         try:
@@ -1209,82 +1610,11 @@ class AsyncMemory(MemoryBase):
             return returned_memories
 
         parsed_messages = parse_messages(messages)
-        if self.config.custom_fact_extraction_prompt:
-            system_prompt = self.config.custom_fact_extraction_prompt
-            user_prompt = f"Input:\n{parsed_messages}"
-        else:
-            system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
-
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
-            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
-            response_format={"type": "json_object"},
-        )
-        try:
-            response = remove_code_blocks(response)
-            print(f"🔍 [DEBUG] 事实提取响应: '{response}'")
-            new_retrieved_facts = json.loads(response)["facts"]
-            print(f"🔍 [DEBUG] 提取的事实: {new_retrieved_facts}")
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            print(f"🔍 [DEBUG] 事实提取失败: {e}")
-            new_retrieved_facts = []
-
-        if not new_retrieved_facts:
-            print("⚠️ [DEBUG] 没有提取到新事实，跳过记忆更新")
-            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
-
-        retrieved_old_memory = []
-        new_message_embeddings = {}
-
-        async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
-            new_message_embeddings[new_mem_content] = embeddings
-            existing_mems = await asyncio.to_thread(
-                self.vector_store.search,
-                query=new_mem_content,
-                vectors=embeddings,
-                limit=5,
-                filters=effective_filters,  # 'filters' is query_filters_for_inference
-            )
-            return [{"id": mem.id, "text": mem.payload["data"]} for mem in existing_mems]
-
-        search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
-        search_results_list = await asyncio.gather(*search_tasks)
-        for result_group in search_results_list:
-            retrieved_old_memory.extend(result_group)
-
-        unique_data = {}
-        for item in retrieved_old_memory:
-            unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
-        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
-        temp_uuid_mapping = {}
-        for idx, item in enumerate(retrieved_old_memory):
-            temp_uuid_mapping[str(idx)] = item["id"]
-            retrieved_old_memory[idx]["id"] = str(idx)
-
-        if new_retrieved_facts:
-            function_calling_prompt = get_update_memory_messages(
-                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
-            )
-            try:
-                response = await asyncio.to_thread(
-                    self.llm.generate_response,
-                    messages=[{"role": "user", "content": function_calling_prompt}],
-                    response_format={"type": "json_object"},
-                )
-            except Exception as e:
-                logger.error(f"Error in new memory actions response: {e}")
-                response = ""
-            try:
-                response = remove_code_blocks(response)
-                new_memories_with_actions = json.loads(response)
-            except Exception as e:
-                logger.error(f"Invalid JSON response: {e}")
-                new_memories_with_actions = {}
+        if self.config.add_mode == "single_call":
+            plan = await self._plan_actions_single_call(parsed_messages, effective_filters)
         else:
-            new_memories_with_actions = {}
+            plan = await self._plan_actions_two_step(parsed_messages, effective_filters)
+        new_retrieved_facts, new_memories_with_actions, temp_uuid_mapping, new_message_embeddings = plan
 
         returned_memories = []
         try:
@@ -1353,6 +1683,137 @@ class AsyncMemory(MemoryBase):
         )
         return returned_memories
 
+    async def _stream_fact_extraction(self, messages, on_fact):
+        """Async version of `Memory._stream_fact_extraction`; `on_fact` runs on the event loop."""
+        loop = asyncio.get_running_loop()
+        parser = FactStreamParser()
+
+        def consume():
+            for chunk in self.llm.generate_response_stream(messages=messages, response_format={"type": "json_object"}):
+                for fact in parser.feed(chunk):
+                    loop.call_soon_threadsafe(on_fact, fact)
+            return parser.text
+
+        return await asyncio.to_thread(consume)
+
+    async def _plan_actions_two_step(self, parsed_messages, filters):
+        """Async version of `Memory._plan_actions_two_step`."""
+        if self.config.custom_fact_extraction_prompt:
+            system_prompt = self.config.custom_fact_extraction_prompt
+            user_prompt = f"Input:\n{parsed_messages}"
+        else:
+            system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
+
+        new_message_embeddings = {}
+
+        async def process_fact_for_search(new_mem_content):
+            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
+            new_message_embeddings[new_mem_content] = embeddings
+            existing_mems = await self._vector_store_call(
+                "search",
+                query=new_mem_content,
+                vectors=embeddings,
+                limit=5,
+                filters=filters,
+            )
+            return [{"id": mem.id, "text": mem.payload["data"]} for mem in existing_mems]
+
+        def start_search(fact):
+            if fact not in searches:
+                searches[fact] = asyncio.ensure_future(process_fact_for_search(fact))
+
+        messages = [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}]
+        searches = {}
+        if self.config.stream_fact_extraction is True and getattr(self.llm, "supports_streaming", False) is True:
+            try:
+                response = await self._stream_fact_extraction(messages, start_search)
+            except Exception:
+                for task in searches.values():
+                    task.cancel()
+                raise
+        else:
+            response = await asyncio.to_thread(
+                self.llm.generate_response, messages=messages, response_format={"type": "json_object"}
+            )
+        try:
+            response = remove_code_blocks(response)
+            print(f"🔍 [DEBUG] 事实提取响应: '{response}'")
+            new_retrieved_facts = json.loads(response)["facts"]
+            print(f"🔍 [DEBUG] 提取的事实: {new_retrieved_facts}")
+        except Exception as e:
+            logger.error(f"Error in new_retrieved_facts: {e}")
+            print(f"🔍 [DEBUG] 事实提取失败: {e}")
+            new_retrieved_facts = []
+
+        if not new_retrieved_facts:
+            print("⚠️ [DEBUG] 没有提取到新事实，跳过记忆更新")
+            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+
+        retrieved_old_memory = []
+        search_tasks = [searches.pop(fact, None) or process_fact_for_search(fact) for fact in new_retrieved_facts]
+        for task in searches.values():
+            task.cancel()
+        search_results_list = await asyncio.gather(*search_tasks)
+        for result_group in search_results_list:
+            retrieved_old_memory.extend(result_group)
+
+        unique_data = {}
+        for item in retrieved_old_memory:
+            unique_data[item["id"]] = item
+        retrieved_old_memory = list(unique_data.values())
+        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+        temp_uuid_mapping = {}
+        for idx, item in enumerate(retrieved_old_memory):
+            temp_uuid_mapping[str(idx)] = item["id"]
+            retrieved_old_memory[idx]["id"] = str(idx)
+
+        if new_retrieved_facts:
+            function_calling_prompt = get_update_memory_messages(
+                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+            )
+            try:
+                response = await asyncio.to_thread(
+                    self.llm.generate_response,
+                    messages=[{"role": "user", "content": function_calling_prompt}],
+                    response_format={"type": "json_object"},
+                )
+            except Exception as e:
+                logger.error(f"Error in new memory actions response: {e}")
+                response = ""
+            try:
+                response = remove_code_blocks(response)
+                new_memories_with_actions = json.loads(response)
+            except Exception as e:
+                logger.error(f"Invalid JSON response: {e}")
+                new_memories_with_actions = {}
+        else:
+            new_memories_with_actions = {}
+        return new_retrieved_facts, new_memories_with_actions, temp_uuid_mapping, new_message_embeddings
+
+    async def _plan_actions_single_call(self, parsed_messages, filters):
+        """Async version of `Memory._plan_actions_single_call`."""
+        turn_embeddings = await asyncio.to_thread(self.embedding_model.embed, parsed_messages, "search")
+        candidates = await self._vector_store_call(
+            "search", query=parsed_messages, vectors=turn_embeddings, limit=SINGLE_CALL_CANDIDATES, filters=filters
+        )
+        retrieved_old_memory, temp_uuid_mapping = _number_candidates(candidates)
+        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+
+        system_prompt, user_prompt = get_extract_and_update_messages(
+            parsed_messages, retrieved_old_memory, self.config.custom_extract_and_update_prompt
+        )
+        try:
+            response = await asyncio.to_thread(
+                self.llm.generate_response,
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            logger.error(f"Error in extract and update response: {e}")
+            response = ""
+        new_retrieved_facts, new_memories_with_actions = _parse_extract_and_update_response(response)
+        return new_retrieved_facts, new_memories_with_actions, temp_uuid_mapping, {}
+
     async def _add_to_graph(self, messages, filters):
         added_entities = []
         if self.enable_graph:
@@ -1375,7 +1836,7 @@ class AsyncMemory(MemoryBase):
             dict: Retrieved memory.
         """
         capture_event("mem0.get", self, {"memory_id": memory_id, "sync_type": "async"})
-        memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        memory = await self._vector_store_call("get", vector_id=memory_id)
         if not memory:
             return None
 
@@ -1415,6 +1876,9 @@ class AsyncMemory(MemoryBase):
         run_id: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        include_count: bool = False,
     ):
         """
         List all memories.
@@ -1427,12 +1891,17 @@ class AsyncMemory(MemoryBase):
                  These are merged with the ID-based scoping filters. For example,
                  `filters={"actor_id": "some_user"}`.
              limit (int, optional): The maximum number of memories to return. Defaults to 100.
+             cursor (str, optional): `next_cursor` of the previous page. Defaults to None.
+             page_size (int, optional): Memories per page in paginated mode. Defaults to `limit`.
+             include_count (bool, optional): Add the total number of matching memories as "count" in paginated
+                 mode. Defaults to False.
 
          Returns:
              dict: A dictionary containing a list of memories under the "results" key,
                    and potentially "relations" if graph store is enabled. For API v1.0,
                    it might return a direct list (see deprecation warning).
                    Example for v1.1+: `{"results": [{"id": "...", "memory": "...", ...}]}`
+                   Passing `cursor` or `page_size` returns one page, as `Memory.get_all` does.
         """
 
         _, effective_filters = _build_filters_and_metadata(
@@ -1450,10 +1919,16 @@ class AsyncMemory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"}
         )
 
-        vector_store_task = asyncio.create_task(self._get_all_from_vector_store(effective_filters, limit))
+        paginated = cursor is not None or page_size is not None
+        if paginated:
+            vector_store_task = asyncio.create_task(
+                self._get_page_from_vector_store(effective_filters, cursor, page_size or limit, include_count)
+            )
+        else:
+            vector_store_task = asyncio.create_task(self._get_all_from_vector_store(effective_filters, limit))
 
         graph_task = None
-        if self.enable_graph:
+        if self.enable_graph and cursor is None:
             graph_get_all = getattr(self.graph, "get_all", None)
             if callable(graph_get_all):
                 if asyncio.iscoroutinefunction(graph_get_all):
@@ -1468,6 +1943,10 @@ class AsyncMemory(MemoryBase):
         else:
             results_dict.update({"results": await vector_store_task})
 
+        if paginated:
+            page = results_dict.pop("results")
+            return {**page, **results_dict}
+
         if self.api_version == "v1.0":
             warnings.warn(
                 "The current get_all API output format is deprecated. "
@@ -1480,44 +1959,61 @@ class AsyncMemory(MemoryBase):
 
         return results_dict
 
+    async def _get_page_from_vector_store(self, filters, cursor, page_size, include_count):
+        memories, next_cursor = await self._vector_store_call(
+            "list_page", filters=filters, cursor=cursor, page_size=page_size
+        )
+        page = {"results": [_format_listed_memory(mem) for mem in memories], "next_cursor": next_cursor}
+        if include_count:
+            page["count"] = await self._vector_store_call("count", filters=filters)
+        return page
+
     async def _get_all_from_vector_store(self, filters, limit):
-        memories_result = await asyncio.to_thread(self.vector_store.list, filters=filters, limit=limit)
+        memories_result = await self._vector_store_call("list", filters=filters, limit=limit)
         actual_memories = (
             memories_result[0]
             if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0
             else memories_result
         )
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        return [_format_listed_memory(mem) for mem in actual_memories]
 
-        formatted_memories = []
-        for mem in actual_memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload["data"],
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-            ).model_dump(exclude={"score"})
+    async def iter_memories(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ):
+        """
+        Iterate over every memory in scope asynchronously, streaming them from the vector store in batches.
 
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
+        Args:
+            user_id (str, optional): user id
+            agent_id (str, optional): agent id
+            run_id (str, optional): run id
+            filters (dict, optional): Additional custom key-value filters, merged with the ID-based scoping filters.
+            batch_size (int, optional): Number of memories fetched from the vector store per round-trip. Defaults to 100.
 
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
+        Yields:
+            dict: Memories in the same format as the items of `get_all`.
+        """
+        _, effective_filters = _build_filters_and_metadata(
+            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
+        )
 
-            formatted_memories.append(memory_item_dict)
+        keys, encoded_ids = process_telemetry_filters(effective_filters)
+        capture_event("mem0.iter_memories", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"})
 
-        return formatted_memories
+        iterator = self.vector_store.iter_all(filters=effective_filters, batch_size=batch_size)
+        while True:
+            batch = await asyncio.to_thread(lambda: list(islice(iterator, batch_size)))
+            if not batch:
+                break
+            for mem in batch:
+                yield _format_listed_memory(mem)
 
     async def search(
         self,
@@ -1568,7 +2064,9 @@ class AsyncMemory(MemoryBase):
             },
         )
 
-        vector_store_task = asyncio.create_task(self._search_vector_store(query, effective_filters, limit, threshold))
+        vector_store_task = asyncio.create_task(
+            self._cached_search_vector_store(query, effective_filters, limit, threshold)
+        )
 
         graph_task = None
         if self.enable_graph:
@@ -1598,45 +2096,28 @@ class AsyncMemory(MemoryBase):
         else:
             return {"results": original_memories}
 
+    async def _cached_search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
+        if self.search_cache is None:
+            return await self._search_vector_store(query, filters, limit, threshold)
+        key = await asyncio.to_thread(self.search_cache.key, query, filters, limit, threshold)
+        memories = await asyncio.to_thread(self.search_cache.get, key)
+        if memories is None:
+            memories = await self._search_vector_store(query, filters, limit, threshold)
+            await asyncio.to_thread(self.search_cache.set, key, memories)
+        return memories
+
     async def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
         embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
-        memories = await asyncio.to_thread(
-            self.vector_store.search, query=query, vectors=embeddings, limit=limit, filters=filters
+        if threshold is not None and _search_accepts_threshold(type(self.vector_store), asynchronous=True):
+            memories = await self._vector_store_call(
+                "search", query=query, vectors=embeddings, limit=limit, filters=filters, threshold=threshold
+            )
+            return [_format_search_result(mem) for mem in memories]
+        memories = await self._vector_store_call(
+            "search", query=query, vectors=embeddings, limit=limit, filters=filters
         )
-
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        original_memories = []
-        for mem in memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload["data"],
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-                score=mem.score,
-            ).model_dump()
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
-
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
-
-            if threshold is None or mem.score >= threshold:
-                original_memories.append(memory_item_dict)
-
-        return original_memories
+        score_mode = getattr(self.vector_store, "score_mode", "similarity")
+        return [_format_search_result(mem) for mem in memories if _passes_threshold(mem.score, threshold, score_mode)]
 
     async def update(self, memory_id, data):
         """
@@ -1696,15 +2177,15 @@ class AsyncMemory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"})
-        memories = await asyncio.to_thread(self.vector_store.list, filters=filters)
-
-        delete_tasks = []
-        for memory in memories[0]:
-            delete_tasks.append(self._delete_memory(memory.id))
+        memories = await asyncio.to_thread(lambda: list(self.vector_store.iter_all(filters=filters)))
 
-        await asyncio.gather(*delete_tasks)
+        if hasattr(self.vector_store, "delete_many"):
+            await self._vector_store_call("delete_many", filters=filters)
+            await asyncio.gather(*[self._record_deletion(memory.id, memory) for memory in memories])
+        else:
+            await asyncio.gather(*[self._delete_memory(memory.id) for memory in memories])
 
-        logger.info(f"Deleted {len(memories[0])} memories")
+        logger.info(f"Deleted {len(memories)} memories")
 
         if self.enable_graph:
             await asyncio.to_thread(self.graph.delete_all, filters)
@@ -1737,8 +2218,8 @@ class AsyncMemory(MemoryBase):
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        await asyncio.to_thread(
-            self.vector_store.insert,
+        await self._vector_store_call(
+            "insert",
             vectors=[embeddings],
             ids=[memory_id],
             payloads=[metadata],
@@ -1755,6 +2236,7 @@ class AsyncMemory(MemoryBase):
             role=metadata.get("role"),
         )
 
+        await self._invalidate_search_cache(metadata)
         capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "async"})
         return memory_id
 
@@ -1813,7 +2295,7 @@ class AsyncMemory(MemoryBase):
         logger.info(f"Updating memory with {data=}")
 
         try:
-            existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+            existing_memory = await self._vector_store_call("get", vector_id=memory_id)
         except Exception:
             logger.error(f"Error getting memory with ID {memory_id} during update.")
             raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
@@ -1844,8 +2326,8 @@ class AsyncMemory(MemoryBase):
         else:
             embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
 
-        await asyncio.to_thread(
-            self.vector_store.update,
+        await self._vector_store_call(
+            "update",
             vector_id=memory_id,
             vector=embeddings,
             payload=new_metadata,
@@ -1863,28 +2345,36 @@ class AsyncMemory(MemoryBase):
             actor_id=new_metadata.get("actor_id"),
             role=new_metadata.get("role"),
         )
+        await self._invalidate_search_cache(existing_memory.payload, new_metadata)
         capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "async"})
         return memory_id
 
     async def _delete_memory(self, memory_id):
         logger.info(f"Deleting memory with {memory_id=}")
-        existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
-        prev_value = existing_memory.payload["data"]
+        existing_memory = await self._vector_store_call("get", vector_id=memory_id)
+        await self._vector_store_call("delete", vector_id=memory_id)
+        await self._record_deletion(memory_id, existing_memory)
+        return memory_id
 
-        await asyncio.to_thread(self.vector_store.delete, vector_id=memory_id)
+    async def _record_deletion(self, memory_id, existing_memory):
         await asyncio.to_thread(
             self.db.add_history,
             memory_id,
-            prev_value,
+            existing_memory.payload.get("data"),
             None,
             "DELETE",
             actor_id=existing_memory.payload.get("actor_id"),
             role=existing_memory.payload.get("role"),
             is_deleted=1,
         )
+        await self._invalidate_search_cache(existing_memory.payload)
 
         capture_event("mem0._delete_memory", self, {"memory_id": memory_id, "sync_type": "async"})
-        return memory_id
+
+    async def _invalidate_search_cache(self, *payloads):
+        """Invalidate cached searches of the tenants owning the written memories."""
+        if self.search_cache is not None:
+            await asyncio.to_thread(self.search_cache.invalidate, payloads)
 
     async def reset(self):
         """
@@ -1894,6 +2384,8 @@ class AsyncMemory(MemoryBase):
             Recreates the vector store with a new client
         """
         logger.warning("Resetting all memories")
+        if self.search_cache is not None:
+            await asyncio.to_thread(self.search_cache.clear)
         await asyncio.to_thread(self.vector_store.delete_col)
 
         gc.collect()
@@ -1901,15 +2393,16 @@ class AsyncMemory(MemoryBase):
         if hasattr(self.vector_store, "client") and hasattr(self.vector_store.client, "close"):
             await asyncio.to_thread(self.vector_store.client.close)
 
-        if hasattr(self.db, "connection") and self.db.connection:
+        if _shares_history_db(self.config):
+            await asyncio.to_thread(self.db.reset)
+        elif hasattr(self.db, "connection") and self.db.connection:
             await asyncio.to_thread(lambda: self.db.connection.execute("DROP TABLE IF EXISTS history"))
             await asyncio.to_thread(self.db.connection.close)
 
-        self.db = SQLiteManager(self.config.history_db_path)
-
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
+        self.db = _create_history_db(self.config, self.vector_store)
         capture_event("mem0.reset", self, {"sync_type": "async"})
 
     async def chat(self, query):
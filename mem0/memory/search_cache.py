@@ -0,0 +1,233 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TENANT_FIELDS = ("user_id", "agent_id", "run_id")
+
+
+def tenant_keys(values: Optional[Dict[str, Any]]) -> List[str]:
+    """Return the tenant keys (e.g. "user_id:alice") named by a filter or a memory payload."""
+    keys = []
+    for field in TENANT_FIELDS:
+        value = (values or {}).get(field)
+        if value is None:
+            continue
+        for item in value if isinstance(value, list) else [value]:
+            keys.append(f"{field}:{item}")
+    return keys
+
+
+class SearchCacheBase(ABC):
+    """
+    Cache of `Memory.search` results.
+
+    Entries are keyed by the normalized filters, a hash of the query text, the limit, the threshold and the current
+    generation of every tenant named in the filters. A write to a memory bumps the generation of each of its
+    tenants, so every cached search that could have returned it stops matching and ages out.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    @abstractmethod
+    def _generations(self, tenants: List[str]) -> List[int]:
+        """Return the current generation of each tenant."""
+
+    @abstractmethod
+    def _bump(self, tenants: List[str]):
+        """Advance the generation of each tenant."""
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[List[Dict]]:
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, value: List[Dict]):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Drop every entry and generation."""
+
+    @abstractmethod
+    def size(self) -> int:
+        pass
+
+    def key(self, query: str, filters: Dict[str, Any], limit: int, threshold: Optional[float]) -> str:
+        """
+        Build the cache key of a search.
+
+        Call this before reading the vector store: a write that lands while the search runs then invalidates the
+        entry the search is about to store.
+        """
+        tenants = sorted(set(tenant_keys(filters)))
+        material = {
+            "filters": filters,
+            "query": hashlib.sha256(query.encode("utf-8")).hexdigest(),
+            "limit": limit,
+            "threshold": threshold,
+            "generations": dict(zip(tenants, self._generations(tenants))),
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        value = self._get(key)
+        self._count("hits" if value is not None else "misses")
+        return value
+
+    def set(self, key: str, value: List[Dict]):
+        self._set(key, value)
+
+    def invalidate(self, payloads: Iterable[Optional[Dict[str, Any]]]):
+        """Invalidate every cached search of the tenants owning these memory payloads."""
+        tenants = sorted({key for payload in payloads for key in tenant_keys(payload)})
+        if tenants:
+            self._bump(tenants)
+            self._count("invalidations", len(tenants))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache counters.
+
+        Returns:
+            Dict: `hits`, `misses`, `invalidations`, `evictions`, `hit_rate` and `size`.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        return {**stats, "hit_rate": stats["hits"] / lookups if lookups else 0.0, "size": self.size()}
+
+
+class InMemorySearchCache(SearchCacheBase):
+    """Process-local cache with LRU eviction beyond `max_entries`."""
+
+    def __init__(self, ttl: float = 300, max_entries: int = 10000):
+        super().__init__(ttl=ttl, max_entries=max_entries)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, results)
+        self._tenant_generations: Dict[str, int] = {}
+
+    def _generations(self, tenants: List[str]) -> List[int]:
+        with self._lock:
+            return [self._tenant_generations.get(tenant, 0) for tenant in tenants]
+
+    def _bump(self, tenants: List[str]):
+        with self._lock:
+            for tenant in tenants:
+                self._tenant_generations[tenant] = self._tenant_generations.get(tenant, 0) + 1
+
+    def _get(self, key: str) -> Optional[List[Dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return deepcopy(value)
+
+    def _set(self, key: str, value: List[Dict]):
+        value = deepcopy(value)
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self._count("evictions", evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tenant_generations.clear()
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class RedisSearchCache(SearchCacheBase):
+    """
+    Cache shared by every replica through Redis.
+
+    Entries expire after `ttl`; tenant generations are Redis counters, so a write on one replica invalidates the
+    searches cached by all of them. Redis' own `maxmemory` policy bounds the size; `max_entries` is not enforced.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        ttl: float = 300,
+        max_entries: int = 10000,
+        key_prefix: str = "mem0:search",
+        client=None,
+    ):
+        super().__init__(ttl=ttl, max_entries=max_entries)
+        if client is None:
+            try:
+                import redis
+            except ImportError:
+                raise ImportError("The 'redis' library is required. Please install it using 'pip install redis'.")
+            client = redis.Redis.from_url(redis_url)
+        self.client = client
+        self.key_prefix = key_prefix
+
+    def _generation_key(self, tenant: str) -> str:
+        return f"{self.key_prefix}:gen:{tenant}"
+
+    def _generations(self, tenants: List[str]) -> List[int]:
+        if not tenants:
+            return []
+        values = self.client.mget([self._generation_key(tenant) for tenant in tenants])
+        return [int(value) if value is not None else 0 for value in values]
+
+    def _bump(self, tenants: List[str]):
+        pipeline = self.client.pipeline()
+        for tenant in tenants:
+            pipeline.incr(self._generation_key(tenant))
+        pipeline.execute()
+
+    def _get(self, key: str) -> Optional[List[Dict]]:
+        value = self.client.get(f"{self.key_prefix}:entry:{key}")
+        return json.loads(value) if value is not None else None
+
+    def _set(self, key: str, value: List[Dict]):
+        self.client.set(f"{self.key_prefix}:entry:{key}", json.dumps(value, default=str), ex=max(1, int(self.ttl)))
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=f"{self.key_prefix}:*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def size(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=f"{self.key_prefix}:entry:*"))
+
+
+def create_search_cache(config) -> Optional[SearchCacheBase]:
+    """Build the search cache described by a `SearchCacheConfig`, or return None when it is disabled."""
+    if config is None or not config.enabled:
+        return None
+    if config.backend == "redis":
+        return RedisSearchCache(
+            redis_url=config.redis_url, ttl=config.ttl, max_entries=config.max_entries, key_prefix=config.key_prefix
+        )
+    return InMemorySearchCache(ttl=config.ttl, max_entries=config.max_entries)
@@ -2,16 +2,30 @@ import logging
 import sqlite3
 import threading
 import uuid
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
 
 class SQLiteManager:
-    def __init__(self, db_path: str = ":memory:"):
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        connection: Optional[sqlite3.Connection] = None,
+        lock: Optional[threading.RLock] = None,
+    ):
+        """
+        Args:
+            db_path (str): Path of the SQLite database holding the history table.
+            connection (sqlite3.Connection, optional): Existing connection to share, e.g. the sqlite vector store's,
+                so memory writes and their history rows can commit in one transaction. It is not closed by `close`.
+            lock (threading.RLock, optional): Lock guarding the shared connection. Required with `connection`.
+        """
         self.db_path = db_path
-        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._lock = threading.Lock()
+        self._owns_connection = connection is None
+        self.connection = connection or sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = lock or threading.Lock()
         self._migrate_history_table()
         self._create_history_table()
 
@@ -123,6 +137,25 @@ class SQLiteManager:
                 logger.error(f"Failed to create history table: {e}")
                 raise
 
+    @contextmanager
+    def transaction(self):
+        """
+        Run the enclosed statements in one transaction.
+
+        Joins the transaction already open on a shared connection instead of starting a nested one.
+        """
+        with self._lock:
+            if self.connection.in_transaction:
+                yield
+                return
+            self.connection.execute("BEGIN")
+            try:
+                yield
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
     def add_history(
         self,
         memory_id: str,
@@ -136,9 +169,8 @@ class SQLiteManager:
         actor_id: Optional[str] = None,
         role: Optional[str] = None,
     ) -> None:
-        with self._lock:
-            try:
-                self.connection.execute("BEGIN")
+        try:
+            with self.transaction():
                 self.connection.execute(
                     """
                     INSERT INTO history (
@@ -160,11 +192,9 @@ class SQLiteManager:
                         role,
                     ),
                 )
-                self.connection.execute("COMMIT")
-            except Exception as e:
-                self.connection.execute("ROLLBACK")
-                logger.error(f"Failed to add history record: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Failed to add history record: {e}")
+            raise
 
     def get_history(self, memory_id: str) -> List[Dict[str, Any]]:
         with self._lock:
@@ -210,9 +240,9 @@ class SQLiteManager:
                 raise
 
     def close(self) -> None:
-        if self.connection:
+        if self.connection and self._owns_connection:
             self.connection.close()
-            self.connection = None
+        self.connection = None
 
     def __del__(self):
         self.close()
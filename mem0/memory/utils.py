@@ -1,4 +1,5 @@
 import hashlib
+import json
 import re
 
 from mem0.configs.prompts import FACT_RETRIEVAL_PROMPT
@@ -60,6 +61,68 @@ def extract_json(text):
     return json_str
 
 
+class FactStreamParser:
+    """
+    Incremental parser of a streamed `{"facts": [...]}` response.
+
+    `feed` returns each fact as soon as its closing quote arrives, so the caller can embed and search it while the
+    LLM is still generating the next ones. Text before the `"facts"` key, such as a code fence, is skipped. Facts
+    that are not plain strings are not streamed; the caller parses the accumulated `text` once the stream ends.
+    """
+
+    _ARRAY_START = re.compile(r'"facts"\s*:\s*\[')
+
+    def __init__(self):
+        self.text = ""
+        self._pos = None  # index in `text` of the next unread character of the array
+        self._closed = False
+        self._unsupported = False
+
+    def feed(self, chunk: str):
+        """Consume a chunk of the response and return the facts it completed."""
+        self.text += chunk or ""
+        if self._closed or self._unsupported:
+            return []
+        if self._pos is None:
+            match = self._ARRAY_START.search(self.text)
+            if match is None:
+                return []
+            self._pos = match.end()
+
+        completed = []
+        text = self.text
+        while self._pos < len(text):
+            char = text[self._pos]
+            if char in " \t\r\n,":
+                self._pos += 1
+            elif char == "]":
+                self._closed = True
+                break
+            elif char == '"':
+                end = self._string_end(text, self._pos + 1)
+                if end is None:
+                    break  # the string continues in a later chunk
+                completed.append(json.loads(text[self._pos : end + 1]))
+                self._pos = end + 1
+            else:
+                self._unsupported = True
+                break
+        return completed
+
+    @staticmethod
+    def _string_end(text: str, start: int):
+        """Return the index of the quote closing the JSON string starting at `start`, or None if not streamed yet."""
+        index = start
+        while index < len(text):
+            if text[index] == "\\":
+                index += 2
+            elif text[index] == '"':
+                return index
+            else:
+                index += 1
+        return None
+
+
 def get_image_description(image_obj, llm, vision_details):
     """
     Get the description of the image
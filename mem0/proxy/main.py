@@ -1,7 +1,6 @@
 import logging
 import subprocess
 import sys
-import threading
 from typing import List, Optional, Union
 
 import httpx
@@ -150,8 +149,19 @@ class Completions:
         return messages
 
     def _async_add_to_memory(self, messages, user_id, agent_id, run_id, metadata, filters):
-        def add_task():
-            logger.debug("Adding to memory asynchronously")
+        logger.debug("Adding to memory asynchronously")
+        if isinstance(self.mem0_client, Memory):
+            # Enqueued to the durable background queue, processed by its bounded worker pool
+            self.mem0_client.add(
+                messages=messages,
+                user_id=user_id,
+                agent_id=agent_id,
+                run_id=run_id,
+                metadata=metadata,
+                mode="background",
+            )
+        else:
+            # The platform processes the add after answering the request
             self.mem0_client.add(
                 messages=messages,
                 user_id=user_id,
@@ -159,10 +169,9 @@ class Completions:
                 run_id=run_id,
                 metadata=metadata,
                 filters=filters,
+                async_mode=True,
             )
 
-        threading.Thread(target=add_task, daemon=True).start()
-
     def _fetch_relevant_memories(self, messages, user_id, agent_id, run_id, filters, limit):
         # Currently, only pass the last 6 messages to the search API to prevent long query
         message_input = [f"{message['role']}: {message['content']}" for message in messages][-6:]
@@ -10,7 +10,11 @@ from mem0.configs.llms.lmstudio import LMStudioConfig
 from mem0.configs.llms.ollama import OllamaConfig
 from mem0.configs.llms.openai import OpenAIConfig
 from mem0.configs.llms.vllm import VllmConfig
+from mem0.configs.rate_limit import RateLimitConfig
 from mem0.embeddings.mock import MockEmbeddings
+from mem0.llms.cache import CachedLLM, create_llm_cache
+from mem0.llms.configs import LlmCacheConfig
+from mem0.utils.scheduler import ScheduledEmbedding, ScheduledLLM, get_scheduler
 
 
 def load_class(class_type):
@@ -47,13 +51,22 @@ class LlmFactory:
     }
 
     @classmethod
-    def create(cls, provider_name: str, config: Optional[Union[BaseLlmConfig, Dict]] = None, **kwargs):
+    def create(
+        cls,
+        provider_name: str,
+        config: Optional[Union[BaseLlmConfig, Dict]] = None,
+        cache: Optional[Union[LlmCacheConfig, Dict]] = None,
+        rate_limit: Optional[Union[RateLimitConfig, Dict]] = None,
+        **kwargs,
+    ):
         """
         Create an LLM instance with the appropriate configuration.
 
         Args:
             provider_name (str): The provider name (e.g., 'openai', 'anthropic')
             config: Configuration object or dict. If None, will create default config
+            cache: Response cache configuration. When enabled, the LLM is wrapped in a `CachedLLM`
+            rate_limit: Scheduler configuration. When enabled, requests go through a shared `RequestScheduler`
             **kwargs: Additional configuration parameters
 
         Returns:
@@ -100,7 +113,20 @@ class LlmFactory:
             # Assume it's already the correct config type
             pass
 
-        return llm_class(config)
+        llm = llm_class(config)
+
+        if isinstance(rate_limit, dict):
+            rate_limit = RateLimitConfig(**rate_limit)
+        if rate_limit is not None and rate_limit.enabled:
+            llm = ScheduledLLM(llm, get_scheduler(rate_limit.scope or f"llm:{provider_name}", rate_limit))
+
+        # The cache wraps the scheduler so that hits use no quota
+        if isinstance(cache, dict):
+            cache = LlmCacheConfig(**cache)
+        response_cache = create_llm_cache(cache)
+        if response_cache is not None:
+            return CachedLLM(llm, provider_name, response_cache, max_temperature=cache.max_temperature)
+        return llm
 
     @classmethod
     def register_provider(cls, name: str, class_path: str, config_class=None):
@@ -142,14 +168,26 @@ class EmbedderFactory:
     }
 
     @classmethod
-    def create(cls, provider_name, config, vector_config: Optional[dict]):
+    def create(
+        cls,
+        provider_name,
+        config,
+        vector_config: Optional[dict],
+        rate_limit: Optional[Union[RateLimitConfig, Dict]] = None,
+    ):
         if provider_name == "upstash_vector" and vector_config and vector_config.enable_embeddings:
             return MockEmbeddings()
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
             embedder_instance = load_class(class_type)
             base_config = BaseEmbedderConfig(**config)
-            return embedder_instance(base_config)
+            embedder = embedder_instance(base_config)
+            if isinstance(rate_limit, dict):
+                rate_limit = RateLimitConfig(**rate_limit)
+            if rate_limit is not None and rate_limit.enabled:
+                scheduler = get_scheduler(rate_limit.scope or f"embedder:{provider_name}", rate_limit)
+                embedder = ScheduledEmbedding(embedder, scheduler)
+            return embedder
         else:
             raise ValueError(f"Unsupported Embedder provider: {provider_name}")
 
@@ -172,6 +210,11 @@ class VectorStoreFactory:
         "supabase": "mem0.vector_stores.supabase.Supabase",
         "weaviate": "mem0.vector_stores.weaviate.Weaviate",
         "faiss": "mem0.vector_stores.faiss.FAISS",
+        "numpy": "mem0.vector_stores.numpy.NumpyDB",
+        "sqlite": "mem0.vector_stores.sqlite.SQLiteDB",
+        "tenant_cache": "mem0.vector_stores.tenant_cache.TenantCache",
+        "sharded": "mem0.vector_stores.sharded.ShardedVectorStore",
+        "matryoshka": "mem0.vector_stores.matryoshka.Matryoshka",
         "langchain": "mem0.vector_stores.langchain.Langchain",
     }
 
@@ -0,0 +1,314 @@
+import contextvars
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from mem0.embeddings.base import EmbeddingBase
+from mem0.llms.base import LLMBase
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+# Priority classes, most urgent first
+PRIORITIES = (INTERACTIVE, BACKGROUND)
+
+_priority: contextvars.ContextVar = contextvars.ContextVar("mem0_request_priority", default=None)
+
+
+@contextmanager
+def request_priority(priority: str):
+    """Run the LLM and embedding requests of the block with this priority class."""
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority!r}, expected one of {', '.join(PRIORITIES)}")
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority(default: str = BACKGROUND) -> str:
+    return _priority.get() or default
+
+
+def retry_status(error: Exception) -> Optional[int]:
+    """Return the HTTP status of a provider error (OpenAI, httpx, Ollama, ...), if it carries one."""
+    for candidate in (error, getattr(error, "response", None)):
+        status = getattr(candidate, "status_code", None) or getattr(candidate, "status", None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    try:
+        value = headers.get("retry-after") if headers is not None else None
+        return float(value) if value is not None else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def estimate_tokens(text: Any) -> int:
+    """Rough token count of a prompt, about four characters per token."""
+    if isinstance(text, list):
+        text = "".join(
+            str(message.get("content") or "") if isinstance(message, dict) else str(message) for message in text
+        )
+    return len(str(text)) // 4 + 1
+
+
+class TokenBucket:
+    """Quota refilled continuously at `per_minute` units per minute, holding at most one minute of quota."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until(self, amount: float, now: float) -> float:
+        """Seconds until `amount` units are available; requests above the capacity wait for a full bucket."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float):
+        self.level -= min(amount, self.capacity)
+
+
+class RequestScheduler:
+    """
+    Admission control for the requests sent to one provider quota.
+
+    Requests take one unit from the request bucket and their estimated tokens from the token bucket. Waiting requests
+    are admitted by priority class, then in arrival order, so interactive searches overtake queued background adds.
+    A request rejected with 429 or 5xx is retried with jittered exponential backoff (or after the `retry-after` the
+    provider sent); a 429 also pauses every other request of the scheduler for the same delay.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+
+        self._cond = threading.Condition()
+        self._waiting: List[tuple] = []  # heap of (priority rank, arrival number)
+        self._arrivals = itertools.count()
+        self._paused_until = 0.0
+        self._depth = {priority: 0 for priority in PRIORITIES}
+        self._stats = {
+            "requests": {priority: 0 for priority in PRIORITIES},
+            "wait_seconds": {priority: 0.0 for priority in PRIORITIES},
+            "max_wait_seconds": {priority: 0.0 for priority in PRIORITIES},
+            "throttled": 0,
+            "server_errors": 0,
+            "retries": 0,
+            "failures": 0,
+        }
+
+    def _delay(self, tokens: float, now: float) -> float:
+        delay = self._paused_until - now
+        if self.requests is not None:
+            delay = max(delay, self.requests.time_until(1, now))
+        if self.tokens is not None:
+            delay = max(delay, self.tokens.time_until(tokens, now))
+        return delay
+
+    def acquire(self, priority: str = BACKGROUND, tokens: float = 1) -> float:
+        """Block until the request may be sent and return the seconds it waited."""
+        ticket = (PRIORITIES.index(priority), next(self._arrivals))
+        started = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            self._depth[priority] += 1
+            try:
+                while True:
+                    if self._waiting[0] != ticket:
+                        self._cond.wait()
+                        continue
+                    delay = self._delay(tokens, time.monotonic())
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if self.requests is not None:
+                    self.requests.take(1)
+                if self.tokens is not None:
+                    self.tokens.take(tokens)
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._depth[priority] -= 1
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started
+            self._stats["requests"][priority] += 1
+            self._stats["wait_seconds"][priority] += waited
+            self._stats["max_wait_seconds"][priority] = max(self._stats["max_wait_seconds"][priority], waited)
+        return waited
+
+    def _backoff(self, attempt: int) -> float:
+        ceiling = min(self.max_delay, self.base_delay * 2**attempt)
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    def call(self, fn: Callable[[], Any], priority: str = BACKGROUND, tokens: float = 1) -> Any:
+        """Send `fn()` through the scheduler, retrying it on 429 and 5xx responses."""
+        for attempt in itertools.count():
+            self.acquire(priority, tokens)
+            try:
+                return fn()
+            except Exception as e:
+                status = retry_status(e)
+                if status is None or not (status == 429 or 500 <= status < 600):
+                    raise
+                delay = _retry_after(e) or self._backoff(attempt)
+                with self._cond:
+                    self._stats["throttled" if status == 429 else "server_errors"] += 1
+                    if attempt >= self.max_retries:
+                        self._stats["failures"] += 1
+                        raise
+                    self._stats["retries"] += 1
+                    if status == 429:
+                        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                logger.warning(f"Provider returned {status}, retrying in {delay:.2f}s (attempt {attempt + 1})")
+                self._sleep(delay)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Return scheduler metrics.
+
+        Returns:
+            Dict: `queue_depth` (requests waiting now) and `requests`, `avg_wait_seconds` and `max_wait_seconds`
+                per priority class, and the `throttled` (429), `server_errors` (5xx), `retries` and `failures`
+                counts.
+        """
+        with self._cond:
+            stats = {
+                "queue_depth": dict(self._depth),
+                "requests": dict(self._stats["requests"]),
+                "avg_wait_seconds": {
+                    priority: self._stats["wait_seconds"][priority] / count if count else 0.0
+                    for priority, count in self._stats["requests"].items()
+                },
+                "max_wait_seconds": dict(self._stats["max_wait_seconds"]),
+            }
+            for name in ("throttled", "server_errors", "retries", "failures"):
+                stats[name] = self._stats[name]
+        return stats
+
+
+_schedulers: Dict[str, RequestScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(scope: str, config) -> RequestScheduler:
+    """Return the process-wide scheduler of a scope, creating it from a `RateLimitConfig` on first use."""
+    with _schedulers_lock:
+        if scope not in _schedulers:
+            _schedulers[scope] = RequestScheduler(
+                requests_per_minute=config.requests_per_minute,
+                tokens_per_minute=config.tokens_per_minute,
+                max_retries=config.max_retries,
+                base_delay=config.base_delay,
+                max_delay=config.max_delay,
+            )
+        return _schedulers[scope]
+
+
+class ScheduledLLM(LLMBase):
+    """LLM wrapper sending every request through a `RequestScheduler`, as a background request by default."""
+
+    def __init__(self, llm: LLMBase, scheduler: RequestScheduler):
+        self.llm = llm
+        self.config = llm.config
+        self.scheduler = scheduler
+
+    def __getattr__(self, name):
+        llm = self.__dict__.get("llm")
+        if llm is None:
+            raise AttributeError(name)
+        return getattr(llm, name)
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        tokens = estimate_tokens(messages) + (getattr(self.config, "max_tokens", None) or 0)
+        return self.scheduler.call(
+            lambda: self.llm.generate_response(
+                messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice, **kwargs
+            ),
+            priority=current_priority(BACKGROUND),
+            tokens=tokens,
+        )
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.llm.supports_streaming
+
+    def generate_response_stream(self, messages: List[Dict[str, str]], response_format=None, **kwargs):
+        """Schedule the request and retry it until its first chunk arrives; later failures are not retried."""
+
+        def start():
+            stream = self.llm.generate_response_stream(messages=messages, response_format=response_format, **kwargs)
+            return next(stream, None), stream
+
+        tokens = estimate_tokens(messages) + (getattr(self.config, "max_tokens", None) or 0)
+        first, stream = self.scheduler.call(start, priority=current_priority(BACKGROUND), tokens=tokens)
+        if first is not None:
+            yield first
+            yield from stream
+
+    def metrics(self) -> Dict[str, Any]:
+        return self.scheduler.metrics()
+
+
+class ScheduledEmbedding(EmbeddingBase):
+    """Embedder wrapper sending every request through a `RequestScheduler`; search embeddings are interactive."""
+
+    def __init__(self, embedder: EmbeddingBase, scheduler: RequestScheduler):
+        self.embedder = embedder
+        self.config = embedder.config
+        self.scheduler = scheduler
+
+    def __getattr__(self, name):
+        embedder = self.__dict__.get("embedder")
+        if embedder is None:
+            raise AttributeError(name)
+        return getattr(embedder, name)
+
+    def embed(self, text, memory_action=None):
+        default = INTERACTIVE if memory_action == "search" else BACKGROUND
+        return self.scheduler.call(
+            lambda: self.embedder.embed(text, memory_action),
+            priority=current_priority(default),
+            tokens=estimate_tokens(text),
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        return self.scheduler.metrics()
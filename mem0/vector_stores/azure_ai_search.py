@@ -1,6 +1,9 @@
+import asyncio
 import json
 import logging
+import random
 import re
+import time
 from typing import List, Optional
 
 from pydantic import BaseModel
@@ -10,8 +13,9 @@ from mem0.vector_stores.base import VectorStoreBase
 
 try:
     from azure.core.credentials import AzureKeyCredential
-    from azure.core.exceptions import ResourceNotFoundError
-    from azure.search.documents import SearchClient
+    from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+    from azure.search.documents import SearchClient, SearchIndexingBufferedSender
+    from azure.search.documents.aio import SearchClient as AsyncSearchClient
     from azure.search.documents.indexes import SearchIndexClient
     from azure.search.documents.indexes.models import (
         BinaryQuantizationCompression,
@@ -32,6 +36,11 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Per-document status codes the service asks clients to retry (throttling and transient conflicts).
+RETRYABLE_STATUS_CODES = {409, 422, 503}
+MAX_DOCUMENTS_PER_REQUEST = 1000
+MAX_REQUEST_BYTES = 15 * 1024 * 1024  # stay below the 16 MB request limit
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -50,6 +59,11 @@ class AzureAISearch(VectorStoreBase):
         use_float16: bool = False,
         hybrid_search: bool = False,
         vector_filter_mode: Optional[str] = None,
+        batch_size: int = MAX_DOCUMENTS_PER_REQUEST,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        use_buffered_sender: bool = False,
+        flush_interval: Optional[int] = None,
     ):
         """
         Initialize the Azure AI Search vector store.
@@ -65,6 +79,13 @@ class AzureAISearch(VectorStoreBase):
                 (Note: This flag is preserved from the initial implementation per feedback.)
             hybrid_search (bool): Whether to use hybrid search. Default is False.
             vector_filter_mode (Optional[str]): Mode for vector filtering. Default is "preFilter".
+            batch_size (int): Maximum documents per indexing request (service limit 1000). Default is 1000.
+            max_retries (int): Retries for throttled (503) or conflicting documents. Default is 3.
+            retry_backoff (float): Base delay in seconds for exponential backoff between retries. Default is 0.5.
+            use_buffered_sender (bool): Queue writes in a SearchIndexingBufferedSender that flushes every
+                `batch_size` actions or `flush_interval` seconds. Writes are not visible until flushed. Default is False.
+            flush_interval (Optional[int]): Auto-flush interval in seconds for the buffered sender. Default is None
+                (the SDK default of 60 seconds).
         """
         self.service_name = service_name
         self.api_key = api_key
@@ -76,6 +97,13 @@ class AzureAISearch(VectorStoreBase):
         self.use_float16 = use_float16
         self.hybrid_search = hybrid_search
         self.vector_filter_mode = vector_filter_mode
+        self.batch_size = min(batch_size, MAX_DOCUMENTS_PER_REQUEST)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.use_buffered_sender = use_buffered_sender
+        self.flush_interval = flush_interval
+        self._async_search_client = None
+        self.buffered_sender = self._create_buffered_sender() if use_buffered_sender else None
 
         self.search_client = SearchClient(
             endpoint=f"https://{service_name}.search.windows.net",
@@ -94,6 +122,32 @@ class AzureAISearch(VectorStoreBase):
         if collection_name not in collections:
             self.create_col()
 
+    def _create_buffered_sender(self):
+        kwargs = {
+            "initial_batch_action_count": self.batch_size,
+            "max_retries_per_action": self.max_retries,
+            "on_error": lambda action: logger.error(f"Indexing action failed in index {self.index_name}: {action}"),
+        }
+        if self.flush_interval:
+            kwargs["auto_flush_interval"] = self.flush_interval
+        return SearchIndexingBufferedSender(
+            endpoint=f"https://{self.service_name}.search.windows.net",
+            index_name=self.index_name,
+            credential=AzureKeyCredential(self.api_key),
+            **kwargs,
+        )
+
+    @property
+    def async_search_client(self):
+        """Lazily created `azure.search.documents.aio` client used by the async_* methods."""
+        if self._async_search_client is None:
+            self._async_search_client = AsyncSearchClient(
+                endpoint=f"https://{self.service_name}.search.windows.net",
+                index_name=self.index_name,
+                credential=AzureKeyCredential(self.api_key),
+            )
+        return self._async_search_client
+
     def create_col(self):
         """Create a new index in Azure AI Search."""
         # Determine vector type based on use_float16 setting.
@@ -161,10 +215,85 @@ class AzureAISearch(VectorStoreBase):
                 document[field] = payload[field]
         return document
 
+    def _chunk_documents(self, documents):
+        """Split documents into requests under the service's document-count and size limits."""
+        chunk, chunk_bytes = [], 0
+        for document in documents:
+            document_bytes = len(json.dumps(document))
+            if chunk and (len(chunk) >= self.batch_size or chunk_bytes + document_bytes > MAX_REQUEST_BYTES):
+                yield chunk
+                chunk, chunk_bytes = [], 0
+            chunk.append(document)
+            chunk_bytes += document_bytes
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _result_field(result, name):
+        return getattr(result, name) if hasattr(result, name) else result.get(name)
+
+    @staticmethod
+    def _result_key(result):
+        return result.key if hasattr(result, "key") else result.get("id")
+
+    def _documents_to_retry(self, response, pending, attempt, action):
+        """Return the documents to send again, raising for failures that are not retryable."""
+        failed = [doc for doc in response if self._result_field(doc, "status_code") not in (200, 201)]
+        if not failed:
+            return []
+        for doc in failed:
+            if self._result_field(doc, "status_code") not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                raise Exception(f"{action} failed for document {self._result_key(doc)}: {doc}")
+        retry_keys = {self._result_key(doc) for doc in failed}
+        logger.warning(f"{action}: retrying {len(retry_keys)} throttled documents in index {self.index_name}")
+        return [document for document in pending if document["id"] in retry_keys]
+
+    def _retry_delay(self, attempt):
+        return self.retry_backoff * (2**attempt) * (1 + random.random())
+
+    def _index_documents(self, operation, documents, action):
+        """Send documents in chunks, retrying throttled (503) documents and requests with backoff."""
+        responses = []
+        for chunk in self._chunk_documents(documents):
+            pending = chunk
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = list(getattr(self.search_client, operation)(pending))
+                except HttpResponseError as e:
+                    if e.status_code != 503 or attempt >= self.max_retries:
+                        raise
+                    time.sleep(self._retry_delay(attempt))
+                    continue
+                responses.extend(response)
+                pending = self._documents_to_retry(response, pending, attempt, action)
+                if not pending:
+                    break
+                time.sleep(self._retry_delay(attempt))
+        return responses
+
+    async def _async_index_documents(self, operation, documents, action):
+        responses = []
+        for chunk in self._chunk_documents(documents):
+            pending = chunk
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = list(await getattr(self.async_search_client, operation)(pending))
+                except HttpResponseError as e:
+                    if e.status_code != 503 or attempt >= self.max_retries:
+                        raise
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+                responses.extend(response)
+                pending = self._documents_to_retry(response, pending, attempt, action)
+                if not pending:
+                    break
+                await asyncio.sleep(self._retry_delay(attempt))
+        return responses
+
     # Note: Explicit "insert" calls may later be decoupled from memory management decisions.
     def insert(self, vectors, payloads=None, ids=None):
         """
-        Insert vectors into the index.
+        Insert vectors into the index in chunks of at most `batch_size` documents.
 
         Args:
             vectors (List[List[float]]): List of vectors to insert.
@@ -175,11 +304,10 @@ class AzureAISearch(VectorStoreBase):
         documents = [
             self._generate_document(vector, payload, id) for id, vector, payload in zip(ids, vectors, payloads)
         ]
-        response = self.search_client.upload_documents(documents)
-        for doc in response:
-            if not hasattr(doc, "status_code") and doc.get("status_code") != 201:
-                raise Exception(f"Insert failed for document {doc.get('id')}: {doc}")
-        return response
+        if self.buffered_sender:
+            self.buffered_sender.upload_documents(documents)
+            return []
+        return self._index_documents("upload_documents", documents, "Insert")
 
     def _sanitize_key(self, key: str) -> str:
         return re.sub(r"[^\w]", "", key)
@@ -210,27 +338,7 @@ class AzureAISearch(VectorStoreBase):
         Returns:
             List[OutputData]: Search results.
         """
-        filter_expression = None
-        if filters:
-            filter_expression = self._build_filter_expression(filters)
-
-        vector_query = VectorizedQuery(vector=vectors, k_nearest_neighbors=limit, fields="vector")
-        if self.hybrid_search:
-            search_results = self.search_client.search(
-                search_text=query,
-                vector_queries=[vector_query],
-                filter=filter_expression,
-                top=limit,
-                vector_filter_mode=self.vector_filter_mode,
-                search_fields=["payload"],
-            )
-        else:
-            search_results = self.search_client.search(
-                vector_queries=[vector_query],
-                filter=filter_expression,
-                top=limit,
-                vector_filter_mode=self.vector_filter_mode,
-            )
+        search_results = self.search_client.search(**self._search_kwargs(query, vectors, limit, filters))
 
         results = []
         for result in search_results:
@@ -238,6 +346,18 @@ class AzureAISearch(VectorStoreBase):
             results.append(OutputData(id=result["id"], score=result["@search.score"], payload=payload))
         return results
 
+    def _search_kwargs(self, query, vectors, limit, filters):
+        kwargs = {
+            "vector_queries": [VectorizedQuery(vector=vectors, k_nearest_neighbors=limit, fields="vector")],
+            "filter": self._build_filter_expression(filters) if filters else None,
+            "top": limit,
+            "vector_filter_mode": self.vector_filter_mode,
+        }
+        if self.hybrid_search:
+            kwargs["search_text"] = query
+            kwargs["search_fields"] = ["payload"]
+        return kwargs
+
     def delete(self, vector_id):
         """
         Delete a vector by ID.
@@ -245,13 +365,34 @@ class AzureAISearch(VectorStoreBase):
         Args:
             vector_id (str): ID of the vector to delete.
         """
-        response = self.search_client.delete_documents(documents=[{"id": vector_id}])
-        for doc in response:
-            if not hasattr(doc, "status_code") and doc.get("status_code") != 200:
-                raise Exception(f"Delete failed for document {vector_id}: {doc}")
+        if self.buffered_sender:
+            self.buffered_sender.delete_documents([{"id": vector_id}])
+            return []
+        response = self._index_documents("delete_documents", [{"id": vector_id}], "Delete")
         logger.info(f"Deleted document with ID '{vector_id}' from index '{self.index_name}'.")
         return response
 
+    def delete_many(self, filters):
+        """
+        Delete every document matching the filters in batched delete requests.
+
+        Args:
+            filters (dict): Filters on user_id, agent_id and/or run_id.
+        """
+        filter_expression = self._build_filter_expression(filters or {})
+        if not filter_expression:
+            raise ValueError("delete_many requires at least one of user_id, agent_id or run_id")
+        results = self.search_client.search(search_text="*", filter=filter_expression, select=["id"])
+        documents = [{"id": result["id"]} for result in results]
+        if not documents:
+            return []
+        if self.buffered_sender:
+            self.buffered_sender.delete_documents(documents)
+            return []
+        response = self._index_documents("delete_documents", documents, "Delete")
+        logger.info(f"Deleted {len(documents)} documents from index '{self.index_name}'.")
+        return response
+
     def update(self, vector_id, vector=None, payload=None):
         """
         Update a vector and its payload.
@@ -261,6 +402,13 @@ class AzureAISearch(VectorStoreBase):
             vector (List[float], optional): Updated vector.
             payload (Dict, optional): Updated payload.
         """
+        document = self._update_document(vector_id, vector, payload)
+        if self.buffered_sender:
+            self.buffered_sender.merge_or_upload_documents([document])
+            return []
+        return self._index_documents("merge_or_upload_documents", [document], "Update")
+
+    def _update_document(self, vector_id, vector=None, payload=None):
         document = {"id": vector_id}
         if vector:
             document["vector"] = vector
@@ -269,11 +417,7 @@ class AzureAISearch(VectorStoreBase):
             document["payload"] = json_payload
             for field in ["user_id", "run_id", "agent_id"]:
                 document[field] = payload.get(field)
-        response = self.search_client.merge_or_upload_documents(documents=[document])
-        for doc in response:
-            if not hasattr(doc, "status_code") and doc.get("status_code") != 200:
-                raise Exception(f"Update failed for document {vector_id}: {doc}")
-        return response
+        return document
 
     def get(self, vector_id) -> OutputData:
         """
@@ -341,8 +485,94 @@ class AzureAISearch(VectorStoreBase):
             results.append(OutputData(id=result["id"], score=result["@search.score"], payload=payload))
         return [results]
 
+    def iter_all(self, filters=None, batch_size=100):
+        """
+        Iterate over every vector matching the filters, following the service's result pages.
+
+        Args:
+            filters (dict, optional): Filters to apply.
+            batch_size (int, optional): Not used; the service sets the page size. Defaults to 100.
+
+        Yields:
+            OutputData: Stored vectors with their payloads.
+        """
+        filter_expression = self._build_filter_expression(filters) if filters else None
+        for result in self.search_client.search(search_text="*", filter=filter_expression, select=["id", "payload"]):
+            yield OutputData(id=result["id"], score=None, payload=json.loads(extract_json(result["payload"])))
+
+    async def async_insert(self, vectors, payloads=None, ids=None):
+        """Insert vectors with the async client."""
+        if self.buffered_sender:
+            return await asyncio.to_thread(self.insert, vectors, payloads, ids)
+        documents = [
+            self._generate_document(vector, payload, id) for id, vector, payload in zip(ids, vectors, payloads)
+        ]
+        return await self._async_index_documents("upload_documents", documents, "Insert")
+
+    async def async_search(self, query, vectors, limit=5, filters=None):
+        """Search for similar vectors with the async client."""
+        search_results = await self.async_search_client.search(**self._search_kwargs(query, vectors, limit, filters))
+        results = []
+        async for result in search_results:
+            payload = json.loads(extract_json(result["payload"]))
+            results.append(OutputData(id=result["id"], score=result["@search.score"], payload=payload))
+        return results
+
+    async def async_delete(self, vector_id):
+        """Delete a vector by ID with the async client."""
+        if self.buffered_sender:
+            return await asyncio.to_thread(self.delete, vector_id)
+        return await self._async_index_documents("delete_documents", [{"id": vector_id}], "Delete")
+
+    async def async_update(self, vector_id, vector=None, payload=None):
+        """Update a vector and its payload with the async client."""
+        if self.buffered_sender:
+            return await asyncio.to_thread(self.update, vector_id, vector, payload)
+        document = self._update_document(vector_id, vector, payload)
+        return await self._async_index_documents("merge_or_upload_documents", [document], "Update")
+
+    async def async_get(self, vector_id) -> OutputData:
+        """Retrieve a vector by ID with the async client."""
+        try:
+            result = await self.async_search_client.get_document(key=vector_id)
+        except ResourceNotFoundError:
+            return None
+        payload = json.loads(extract_json(result["payload"]))
+        return OutputData(id=result["id"], score=None, payload=payload)
+
+    async def async_list(self, filters=None, limit=100):
+        """List vectors in the index with the async client."""
+        filter_expression = self._build_filter_expression(filters) if filters else None
+        search_results = await self.async_search_client.search(search_text="*", filter=filter_expression, top=limit)
+        results = []
+        async for result in search_results:
+            payload = json.loads(extract_json(result["payload"]))
+            results.append(OutputData(id=result["id"], score=result["@search.score"], payload=payload))
+        return [results]
+
+    async def async_close(self):
+        """Close the async client, if one was created."""
+        client, self._async_search_client = self._async_search_client, None
+        if client is not None:
+            await client.close()
+
+    def _discard_async_search_client(self):
+        """Close the async client from sync code, on the running loop when there is one."""
+        client, self._async_search_client = self._async_search_client, None
+        if client is None:
+            return
+        try:
+            asyncio.get_running_loop().create_task(client.close())
+        except RuntimeError:
+            try:
+                asyncio.run(client.close())
+            except Exception as e:
+                logger.debug(f"Failed to close the async search client: {e}")
+
     def __del__(self):
         """Close the search client when the object is deleted."""
+        if getattr(self, "buffered_sender", None):
+            self.buffered_sender.close()
         self.search_client.close()
         self.index_client.close()
 
@@ -352,8 +582,11 @@ class AzureAISearch(VectorStoreBase):
 
         try:
             # Close the existing clients
+            if self.buffered_sender:
+                self.buffered_sender.close()
             self.search_client.close()
             self.index_client.close()
+            self._discard_async_search_client()
 
             # Delete the collection
             self.delete_col()
@@ -374,6 +607,9 @@ class AzureAISearch(VectorStoreBase):
             self.search_client._client._config.user_agent_policy.add_user_agent("mem0")
             self.index_client._client._config.user_agent_policy.add_user_agent("mem0")
 
+            if self.use_buffered_sender:
+                self.buffered_sender = self._create_buffered_sender()
+
             # Create the collection
             self.create_col()
         except Exception as e:
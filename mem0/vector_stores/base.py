@@ -1,5 +1,31 @@
+import base64
+import json
+import logging
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
+# Upper bound for the single `list` call made by the default `iter_all` and `list_page`
+ITER_ALL_FALLBACK_LIMIT = 10000
+
+
+def encode_cursor(position: dict) -> str:
+    """Encode a store-specific page position as an opaque, URL-safe cursor."""
+    return base64.urlsafe_b64encode(json.dumps(position, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decode a cursor produced by `encode_cursor`."""
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def created_at_key(record) -> tuple:
+    """Sort key ordering records by `created_at`, then id."""
+    return ((record.payload or {}).get("created_at") or "", str(record.id))
+
 
 class VectorStoreBase(ABC):
     @abstractmethod
@@ -56,3 +82,87 @@ class VectorStoreBase(ABC):
     def reset(self):
         """Reset by delete the collection and recreate it."""
         pass
+
+    def iter_all(self, filters=None, batch_size=100):
+        """
+        Iterate over every vector matching the filters.
+
+        Providers with native cursors override this to fetch `batch_size` records per round-trip.
+        The default implementation issues a single `list` call bounded by `ITER_ALL_FALLBACK_LIMIT`
+        and warns when that bound is reached.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            batch_size (int, optional): Number of records fetched per round-trip. Defaults to 100.
+
+        Yields:
+            Records with `id` and `payload` attributes, as returned by `list`.
+        """
+        records = self._unwrap_list_result(self.list(filters=filters, limit=ITER_ALL_FALLBACK_LIMIT))
+        if len(records) >= ITER_ALL_FALLBACK_LIMIT:
+            logger.warning(
+                f"{type(self).__name__} has no native cursor, iteration stopped after {ITER_ALL_FALLBACK_LIMIT} records"
+            )
+        yield from records
+
+    def iter_vectors(self, filters=None, batch_size=100):
+        """
+        Iterate over `(id, vector, payload)` for every record matching the filters.
+
+        Caching layers use this to load a tenant's embeddings. Providers that can return stored vectors override it.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            batch_size (int, optional): Number of records fetched per round-trip. Defaults to 100.
+
+        Yields:
+            tuple: `(id, vector, payload)` for each record.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support reading stored vectors")
+
+    def list_page(self, filters=None, cursor=None, page_size=100):
+        """
+        Return one page of the records matching the filters, ordered by `created_at` then id, and the next cursor.
+
+        Providers with native paging override this. The default sorts every record yielded by `iter_all` and
+        resumes after the `(created_at, id)` key of the previous page, so it reads the whole match set per page and
+        is only as complete as `iter_all`, which warns when it falls back to a bounded `list` call.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            cursor (str, optional): `next_cursor` of the previous page, None for the first page. Defaults to None.
+            page_size (int, optional): Number of records per page. Defaults to 100.
+
+        Returns:
+            tuple: `(records, next_cursor)`, where `next_cursor` is None on the last page.
+        """
+        records = sorted(self.iter_all(filters=filters), key=created_at_key)
+        if cursor is not None:
+            after = tuple(decode_cursor(cursor)["after"])
+            records = [record for record in records if created_at_key(record) > after]
+        page = records[:page_size]
+        next_cursor = encode_cursor({"after": list(created_at_key(page[-1]))}) if len(records) > page_size else None
+        return page, next_cursor
+
+    def count(self, filters=None):
+        """
+        Count the records matching the filters.
+
+        Providers that can count natively override this; the default iterates with `iter_all`.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+
+        Returns:
+            int: Number of matching records.
+        """
+        return sum(1 for _ in self.iter_all(filters=filters))
+
+    @staticmethod
+    def _unwrap_list_result(result):
+        """Normalize the `(records, offset)`, `[records]` and `records` shapes returned by `list`."""
+        if isinstance(result, tuple):
+            return list(result[0]) if result else []
+        if isinstance(result, list) and result and isinstance(result[0], list):
+            return result[0]
+        return list(result or [])
@@ -224,6 +224,27 @@ class ChromaDB(VectorStoreBase):
         results = self.collection.get(where=where_clause, limit=limit)
         return [self._parse_output(results)]
 
+    def iter_all(self, filters: Optional[Dict] = None, batch_size: int = 100):
+        """
+        Iterate over every vector matching the filters using offset paging.
+
+        Args:
+            filters (Optional[Dict], optional): Filters to apply. Defaults to None.
+            batch_size (int, optional): Number of vectors fetched per page. Defaults to 100.
+
+        Yields:
+            OutputData: Stored vectors with their payloads.
+        """
+        where_clause = self._generate_where_clause(filters) if filters else None
+        offset = 0
+        while True:
+            results = self.collection.get(where=where_clause, limit=batch_size, offset=offset)
+            page = self._parse_output(results) if results.get("ids") else []
+            yield from page
+            if len(page) < batch_size:
+                break
+            offset += batch_size
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
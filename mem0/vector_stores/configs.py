@@ -28,6 +28,11 @@ class VectorStoreConfig(BaseModel):
         "supabase": "SupabaseConfig",
         "weaviate": "WeaviateConfig",
         "faiss": "FAISSConfig",
+        "numpy": "NumpyConfig",
+        "sqlite": "SQLiteConfig",
+        "tenant_cache": "TenantCacheConfig",
+        "sharded": "ShardedConfig",
+        "matryoshka": "MatryoshkaConfig",
         "langchain": "LangchainConfig",
     }
 
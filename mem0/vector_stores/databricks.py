@@ -1,11 +1,13 @@
 import json
 import logging
+import time
 import uuid
 from typing import Optional, List
 from datetime import datetime, date
 from databricks.sdk.service.catalog import ColumnInfo, ColumnTypeName, TableType, DataSourceFormat
 from databricks.sdk.service.catalog import TableConstraint, PrimaryKeyConstraint
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.sql import StatementParameterListItem
 from databricks.sdk.service.vectorsearch import (
     VectorIndexType,
     DeltaSyncVectorIndexSpecRequest,
@@ -50,6 +52,8 @@ class Databricks(VectorStoreBase):
         pipeline_type: str = "TRIGGERED",
         warehouse_name: Optional[str] = None,
         query_type: str = "ANN",
+        insert_batch_size: int = 100,
+        write_mode: str = "insert",
     ):
         """
         Initialize the Databricks Vector Search vector store.
@@ -73,6 +77,8 @@ class Databricks(VectorStoreBase):
             pipeline_type (str, optional): Sync pipeline type, either "TRIGGERED" or "CONTINUOUS" (default: "TRIGGERED").
             warehouse_name (str, optional): Databricks SQL warehouse Name (if using SQL warehouse).
             query_type (str, optional): Query type, either "ANN" or "HYBRID" (default: "ANN").
+            insert_batch_size (int, optional): Rows per SQL statement or upsert_data request (default: 100).
+            write_mode (str, optional): "insert" or "merge" on memory_id for Delta table writes (default: "insert").
         """
         # Basic identifiers
         self.workspace_url = workspace_url
@@ -91,6 +97,8 @@ class Databricks(VectorStoreBase):
         self.endpoint_type = endpoint_type
         self.pipeline_type = pipeline_type
         self.query_type = query_type
+        self.insert_batch_size = insert_batch_size
+        self.write_mode = write_mode
 
         # Schema
         self.columns = [
@@ -341,56 +349,12 @@ class Databricks(VectorStoreBase):
         except Exception as e:
             logger.error(f"Error making index_type: {self.index_type} for index {self.fully_qualified_index_name}: {e}")
 
-    def _format_sql_value(self, v):
-        """
-        Format a Python value into a safe SQL literal for Databricks.
-        """
-        if v is None:
-            return "NULL"
-        if isinstance(v, bool):
-            return "TRUE" if v else "FALSE"
-        if isinstance(v, (int, float)):
-            return str(v)
-        if isinstance(v, (datetime, date)):
-            return f"'{v.isoformat()}'"
-        if isinstance(v, list):
-            # Render arrays (assume numeric or string elements)
-            elems = []
-            for x in v:
-                if x is None:
-                    elems.append("NULL")
-                elif isinstance(x, (int, float)):
-                    elems.append(str(x))
-                else:
-                    s = str(x).replace("'", "''")
-                    elems.append(f"'{s}'")
-            return f"array({', '.join(elems)})"
-        if isinstance(v, dict):
-            try:
-                s = json.dumps(v)
-            except Exception:
-                s = str(v)
-            s = s.replace("'", "''")
-            return f"'{s}'"
-        # Fallback: treat as string
-        s = str(v).replace("'", "''")
-        return f"'{s}'"
-
-    def insert(self, vectors: list, payloads: list = None, ids: list = None):
-        """
-        Insert vectors into the index.
-
-        Args:
-            vectors (List[List[float]]): List of vectors to insert.
-            payloads (List[Dict], optional): List of payloads corresponding to vectors.
-            ids (List[str], optional): List of IDs corresponding to vectors.
-        """
-        # Determine the number of items to process
+    def _build_rows(self, vectors: list, payloads: list = None, ids: list = None) -> List[dict]:
+        """Map vectors and payloads onto the table columns."""
         num_items = len(payloads) if payloads else len(vectors) if vectors else 0
-
-        value_tuples = []
+        rows = []
         for i in range(num_items):
-            values = []
+            row = {}
             for col in self.columns:
                 if col.name == "memory_id":
                     val = ids[i] if ids and i < len(ids) else str(uuid.uuid4())
@@ -400,29 +364,104 @@ class Databricks(VectorStoreBase):
                     val = payloads[i].get("data") if payloads and i < len(payloads) else None
                 else:
                     val = payloads[i].get(col.name) if payloads and i < len(payloads) else None
-                values.append(val)
-            formatted = [self._format_sql_value(v) for v in values]
-            value_tuples.append(f"({', '.join(formatted)})")
+                row[col.name] = val
+            rows.append(row)
+        return rows
+
+    def _sql_parameter(self, name: str, column: ColumnInfo, value) -> StatementParameterListItem:
+        """Bind a row value as a typed statement parameter."""
+        if value is None:
+            return StatementParameterListItem(name=name, type=column.type_text.upper(), value=None)
+        if column.type_name == ColumnTypeName.ARRAY:
+            return StatementParameterListItem(name=name, type="STRING", value=json.dumps(value))
+        if isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        elif isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        return StatementParameterListItem(name=name, type=column.type_text.upper(), value=str(value))
+
+    def _build_write_statement(self, rows: List[dict]):
+        """Build one multi-row parameterized INSERT or MERGE statement."""
+        parameters = []
+        value_tuples = []
+        for row_idx, row in enumerate(rows):
+            placeholders = []
+            for col_idx, col in enumerate(self.columns):
+                name = f"p{row_idx}_{col_idx}"
+                parameters.append(self._sql_parameter(name, col, row[col.name]))
+                placeholder = f":{name}"
+                if col.type_name == ColumnTypeName.ARRAY:
+                    placeholder = f"from_json({placeholder}, '{col.type_text}')"
+                placeholders.append(placeholder)
+            value_tuples.append(f"({', '.join(placeholders)})")
+
+        columns = ", ".join(self.column_names)
+        values = ", ".join(value_tuples)
+        if self.write_mode == "merge":
+            statement = (
+                f"MERGE INTO {self.fully_qualified_table_name} AS target "
+                f"USING (SELECT * FROM VALUES {values} AS source({columns})) AS source "
+                "ON target.memory_id = source.memory_id "
+                "WHEN MATCHED THEN UPDATE SET * WHEN NOT MATCHED THEN INSERT *"
+            )
+        else:
+            statement = f"INSERT INTO {self.fully_qualified_table_name} ({columns}) VALUES {values}"
+        return statement, parameters
+
+    def _upsert_direct_access(self, rows: List[dict]) -> None:
+        """Write rows straight into a direct-access index through the upsert_data API."""
+        for row in rows:
+            for key in ("created_at", "updated_at"):
+                if isinstance(row.get(key), (datetime, date)):
+                    row[key] = row[key].isoformat()
+        response = self.client.vector_search_indexes.upsert_data_vector_index(
+            index_name=self.fully_qualified_index_name, inputs_json=json.dumps(rows)
+        )
+        failed = getattr(getattr(response, "result", None), "failed_primary_keys", None)
+        if failed:
+            raise Exception(f"Upsert failed for {len(failed)} rows: {failed[:10]}")
+
+    def insert(self, vectors: list, payloads: list = None, ids: list = None):
+        """
+        Insert vectors in batches of `insert_batch_size`.
+
+        Delta-sync tables receive one multi-row parameterized INSERT (or MERGE) per batch; direct-access indexes
+        receive one upsert_data request per batch.
 
-        insert_sql = f"INSERT INTO {self.fully_qualified_table_name} ({', '.join(self.column_names)}) VALUES {', '.join(value_tuples)}"
+        Args:
+            vectors (List[List[float]]): List of vectors to insert.
+            payloads (List[Dict], optional): List of payloads corresponding to vectors.
+            ids (List[str], optional): List of IDs corresponding to vectors.
+        """
+        rows = self._build_rows(vectors, payloads, ids)
+        direct_access = self.index_type == VectorIndexType.DIRECT_ACCESS
+        target = self.fully_qualified_index_name if direct_access else self.fully_qualified_table_name
+        start = time.perf_counter()
 
-        # Execute the insert
         try:
-            response = self.client.statement_execution.execute_statement(
-                statement=insert_sql, warehouse_id=self.warehouse_id, wait_timeout="30s"
-            )
-            if response.status.state.value == "SUCCEEDED":
-                logger.info(
-                    f"Successfully inserted {num_items} items into Delta table {self.fully_qualified_table_name}"
+            for offset in range(0, len(rows), self.insert_batch_size):
+                batch = rows[offset : offset + self.insert_batch_size]
+                if direct_access:
+                    self._upsert_direct_access(batch)
+                    continue
+
+                statement, parameters = self._build_write_statement(batch)
+                response = self.client.statement_execution.execute_statement(
+                    statement=statement, warehouse_id=self.warehouse_id, parameters=parameters, wait_timeout="30s"
                 )
-                return
-            else:
-                logger.error(f"Failed to insert items: {response.status.error}")
-                raise Exception(f"Insert operation failed: {response.status.error}")
+                if response.status.state.value != "SUCCEEDED":
+                    logger.error(f"Failed to insert items: {response.status.error}")
+                    raise Exception(f"Insert operation failed: {response.status.error}")
         except Exception as e:
             logger.error(f"Insert operation failed: {e}")
             raise
 
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Inserted {len(rows)} items into {target} in {elapsed:.2f}s "
+            f"({len(rows) / elapsed if elapsed > 0 else 0:.1f} rows/s)"
+        )
+
     def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> List[MemoryResult]:
         """
         Search for similar vectors or text using the Databricks Vector Search index.
@@ -486,11 +525,23 @@ class Databricks(VectorStoreBase):
 
     def delete(self, vector_id):
         """
-        Delete a vector by ID from the Delta table.
+        Delete a vector by ID from the Delta table, or from the index itself for direct-access indexes.
 
         Args:
             vector_id (str): ID of the vector to delete.
         """
+        if self.index_type == VectorIndexType.DIRECT_ACCESS:
+            try:
+                response = self.client.vector_search_indexes.delete_data_vector_index(
+                    index_name=self.fully_qualified_index_name, primary_keys=[str(vector_id)]
+                )
+            except Exception as e:
+                logger.error(f"Delete operation failed for vector ID {vector_id}: {e}")
+                raise
+            failed = getattr(getattr(response, "result", None), "failed_primary_keys", None)
+            if failed:
+                raise Exception(f"Delete failed for vector ID {vector_id}")
+            return
         try:
             logger.info(f"Deleting vector with ID {vector_id} from Delta table {self.fully_qualified_table_name}")
 
@@ -513,11 +564,28 @@ class Databricks(VectorStoreBase):
         """
         Update a vector and its payload in the Delta table.
 
+        Direct-access indexes have no source table to update, so the whole row is upserted into the index; the
+        vector is required there, and a missing payload is read back from the index.
+
         Args:
             vector_id (str): ID of the vector to update.
             vector (list, optional): New vector values.
             payload (dict, optional): New payload data.
         """
+        if self.index_type == VectorIndexType.DIRECT_ACCESS:
+            if not vector_id:
+                logger.error("vector_id is required for update operation")
+                return
+            if vector is None:
+                raise ValueError("Updating a DIRECT_ACCESS index requires the vector")
+            if payload is None:
+                payload = self.get(vector_id).payload
+            try:
+                self._upsert_direct_access(self._build_rows([vector], [payload], [vector_id]))
+            except Exception as e:
+                logger.error(f"Update operation failed for vector ID {vector_id}: {e}")
+                raise
+            return
 
         update_sql = f"UPDATE {self.fully_qualified_table_name} SET "
         set_clauses = []
@@ -10,7 +10,7 @@ except ImportError:
 from pydantic import BaseModel
 
 from mem0.configs.vector_stores.elasticsearch import ElasticsearchConfig
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import VectorStoreBase, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,15 @@ class OutputData(BaseModel):
 
 
 class ElasticsearchDB(VectorStoreBase):
+    # Payload keys used in the kNN pre-filter; mapped as keywords so `term` filters match exactly.
+    FILTER_FIELDS = ("user_id", "agent_id", "run_id", "actor_id")
+    MAX_NUM_CANDIDATES = 10000
+    # `list_page` order; `id` is a keyword copy of `_id`, which cannot be sorted on.
+    PAGE_SORT = [
+        {"metadata.created_at": {"order": "asc", "missing": "_first", "unmapped_type": "date"}},
+        {"id": {"order": "asc", "unmapped_type": "keyword"}},
+    ]
+
     def __init__(self, **kwargs):
         config = ElasticsearchConfig(**kwargs)
 
@@ -43,6 +52,10 @@ class ElasticsearchDB(VectorStoreBase):
 
         self.collection_name = config.collection_name
         self.embedding_model_dims = config.embedding_model_dims
+        self.index_type = config.index_type
+        self.hnsw_m = config.hnsw_m
+        self.ef_construction = config.ef_construction
+        self.num_candidates_multiplier = config.num_candidates_multiplier
 
         # Create index only if auto_create_index is True
         if config.auto_create_index:
@@ -53,6 +66,22 @@ class ElasticsearchDB(VectorStoreBase):
         else:
             self.custom_search_query = None
 
+    def _vector_mapping(self, dims: int) -> Dict[str, Any]:
+        """Build the dense_vector mapping, adding index_options when quantization or HNSW tuning is set."""
+        mapping: Dict[str, Any] = {"type": "dense_vector", "dims": dims, "index": True, "similarity": "cosine"}
+        index_options: Dict[str, Any] = {}
+        if self.hnsw_m is not None:
+            index_options["m"] = self.hnsw_m
+        if self.ef_construction is not None:
+            index_options["ef_construction"] = self.ef_construction
+        if self.index_type or index_options:
+            index_options["type"] = self.index_type or "hnsw"
+            mapping["index_options"] = index_options
+        return mapping
+
+    def _metadata_mapping(self) -> Dict[str, Any]:
+        return {"type": "object", "properties": {field: {"type": "keyword"} for field in self.FILTER_FIELDS}}
+
     def create_index(self) -> None:
         """Create Elasticsearch index with proper mappings if it doesn't exist"""
         index_settings = {
@@ -60,13 +89,9 @@ class ElasticsearchDB(VectorStoreBase):
             "mappings": {
                 "properties": {
                     "text": {"type": "text"},
-                    "vector": {
-                        "type": "dense_vector",
-                        "dims": self.embedding_model_dims,
-                        "index": True,
-                        "similarity": "cosine",
-                    },
-                    "metadata": {"type": "object", "properties": {"user_id": {"type": "keyword"}}},
+                    "vector": self._vector_mapping(self.embedding_model_dims),
+                    "metadata": self._metadata_mapping(),
+                    "id": {"type": "keyword"},
                 }
             },
         }
@@ -76,13 +101,21 @@ class ElasticsearchDB(VectorStoreBase):
             logger.info(f"Created index {self.collection_name}")
         else:
             logger.info(f"Index {self.collection_name} already exists")
+            try:
+                # Indexes created before `id` was stored would otherwise map it dynamically as unsortable text
+                self.client.indices.put_mapping(
+                    index=self.collection_name, body={"properties": {"id": {"type": "keyword"}}}
+                )
+            except Exception as e:
+                logger.warning(f"Could not add the keyword id mapping to index {self.collection_name}: {e}")
 
     def create_col(self, name: str, vector_size: int, distance: str = "cosine") -> None:
         """Create a new collection (index in Elasticsearch)."""
         index_settings = {
             "mappings": {
                 "properties": {
-                    "vector": {"type": "dense_vector", "dims": vector_size, "index": True, "similarity": "cosine"},
+                    "vector": self._vector_mapping(vector_size),
+                    "metadata": self._metadata_mapping(),
                     "payload": {"type": "object"},
                     "id": {"type": "keyword"},
                 }
@@ -111,6 +144,7 @@ class ElasticsearchDB(VectorStoreBase):
                 "_source": {
                     "vector": vec,
                     "metadata": payloads[i],  # Store all metadata in the metadata field
+                    "id": id_,
                 },
             }
             actions.append(action)
@@ -129,29 +163,42 @@ class ElasticsearchDB(VectorStoreBase):
         return results
 
     def search(
-        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
+        self,
+        query: str,
+        vectors: List[float],
+        limit: int = 5,
+        filters: Optional[Dict] = None,
+        threshold: Optional[float] = None,
     ) -> List[OutputData]:
         """
         Search with two options:
         1. Use custom search query if provided
         2. Use KNN search on vectors with pre-filtering if no custom search query is provided
+
+        `threshold` is a minimum `_score`. The KNN search passes it to Elasticsearch as the `similarity` cutoff
+        (`_score` is `(1 + cosine) / 2` for cosine vectors); results of a custom query are filtered here.
         """
         if self.custom_search_query:
             search_query = self.custom_search_query(vectors, limit, filters)
         else:
+            num_candidates = max(limit, min(limit * self.num_candidates_multiplier, self.MAX_NUM_CANDIDATES))
             search_query = {
-                "knn": {"field": "vector", "query_vector": vectors, "k": limit, "num_candidates": limit * 2}
+                "knn": {"field": "vector", "query_vector": vectors, "k": limit, "num_candidates": num_candidates}
             }
             if filters:
                 filter_conditions = []
                 for key, value in filters.items():
                     filter_conditions.append({"term": {f"metadata.{key}": value}})
                 search_query["knn"]["filter"] = {"bool": {"must": filter_conditions}}
+            if threshold is not None:
+                search_query["knn"]["similarity"] = 2 * threshold - 1
 
         response = self.client.search(index=self.collection_name, body=search_query)
 
         results = []
         for hit in response["hits"]["hits"]:
+            if threshold is not None and hit["_score"] < threshold:
+                continue
             results.append(
                 OutputData(id=hit["_id"], score=hit["_score"], payload=hit.get("_source", {}).get("metadata", {}))
             )
@@ -162,6 +209,17 @@ class ElasticsearchDB(VectorStoreBase):
         """Delete a vector by ID."""
         self.client.delete(index=self.collection_name, id=vector_id)
 
+    def delete_many(self, filters: Dict) -> None:
+        """Delete every memory matching the filters, deleting the ids found by `iter_all` in bulk."""
+        if not filters:
+            raise ValueError("delete_many requires at least one of user_id, agent_id or run_id")
+        actions = (
+            {"_op_type": "delete", "_index": self.collection_name, "_id": record.id}
+            for record in self.iter_all(filters=filters)
+        )
+        deleted, _ = bulk(self.client, actions)
+        logger.info(f"Deleted {deleted} documents from index {self.collection_name}")
+
     def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None) -> None:
         """Update a vector and its payload."""
         doc = {}
@@ -230,6 +288,67 @@ class ElasticsearchDB(VectorStoreBase):
 
         return [results]
 
+    @staticmethod
+    def _filter_query(filters: Optional[Dict]) -> Dict[str, Any]:
+        if not filters:
+            return {"match_all": {}}
+        return {"bool": {"must": [{"term": {f"metadata.{key}": value}} for key, value in filters.items()]}}
+
+    def iter_all(self, filters: Optional[Dict] = None, batch_size: int = 100):
+        """Iterate over every memory matching the filters with a point-in-time and `search_after`."""
+        query = self._filter_query(filters)
+
+        pit_id = self.client.open_point_in_time(index=self.collection_name, keep_alive="1m")["id"]
+        search_after = None
+        try:
+            while True:
+                body: Dict[str, Any] = {
+                    "query": query,
+                    "size": batch_size,
+                    "sort": [{"_shard_doc": "asc"}],
+                    "pit": {"id": pit_id, "keep_alive": "1m"},
+                }
+                if search_after is not None:
+                    body["search_after"] = search_after
+
+                response = self.client.search(body=body)
+                pit_id = response.get("pit_id", pit_id)
+                hits = response["hits"]["hits"]
+                for hit in hits:
+                    yield OutputData(id=hit["_id"], score=1.0, payload=hit.get("_source", {}).get("metadata", {}))
+                if len(hits) < batch_size:
+                    break
+                search_after = hits[-1]["sort"]
+        finally:
+            self.client.close_point_in_time(id=pit_id)
+
+    def list_page(self, filters: Optional[Dict] = None, cursor: Optional[str] = None, page_size: int = 100):
+        """
+        Return one page of memories ordered by `metadata.created_at` then id, paging with `search_after`.
+
+        Documents indexed before the keyword `id` field was stored have no tie-breaker, so among them only the
+        `created_at` order is stable.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            cursor (str, optional): `next_cursor` of the previous page. Defaults to None.
+            page_size (int, optional): Number of memories per page. Defaults to 100.
+
+        Returns:
+            tuple: `(records, next_cursor)`, where `next_cursor` is None on the last page.
+        """
+        body: Dict[str, Any] = {"query": self._filter_query(filters), "size": page_size + 1, "sort": self.PAGE_SORT}
+        if cursor is not None:
+            body["search_after"] = decode_cursor(cursor)["after"]
+
+        hits = self.client.search(index=self.collection_name, body=body)["hits"]["hits"]
+        records = [
+            OutputData(id=hit["_id"], score=1.0, payload=hit.get("_source", {}).get("metadata", {}))
+            for hit in hits[:page_size]
+        ]
+        next_cursor = encode_cursor({"after": hits[page_size - 1]["sort"]}) if len(hits) > page_size else None
+        return records, next_cursor
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -466,6 +466,26 @@ class FAISS(VectorStoreBase):
 
         return [results]
 
+    def iter_all(self, filters: Optional[Dict] = None, batch_size: int = 100):
+        """
+        Iterate over every vector matching the filters.
+
+        Args:
+            filters (Optional[Dict], optional): Filters to apply. Defaults to None.
+            batch_size (int, optional): Unused, the docstore is held in memory. Defaults to 100.
+
+        Yields:
+            OutputData: Stored vectors with their payloads.
+        """
+        if self.index is None:
+            return
+
+        # Snapshot the items so callers may delete while iterating
+        for vector_id, payload in list(self.docstore.items()):
+            if filters and not self._apply_filters(payload, filters):
+                continue
+            yield OutputData(id=vector_id, score=None, payload=payload.copy())
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -0,0 +1,197 @@
+import base64
+import logging
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+# Payload field holding the full-dimension vector next to the truncated one indexed by the wrapped store
+FULL_VECTOR_FIELD = "_full_vector"
+# Stores with a fixed payload schema that drop unknown fields such as FULL_VECTOR_FIELD
+FIXED_SCHEMA_PROVIDERS = ("weaviate", "redis", "milvus", "databricks")
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # full-dimension cosine similarity or distance, see `score_mode`
+    payload: Optional[Dict]  # metadata
+
+
+class Matryoshka(VectorStoreBase):
+    def __init__(
+        self,
+        provider: str,
+        config: Optional[Dict] = None,
+        collection_name: Optional[str] = None,
+        embedding_model_dims: int = 1536,
+        truncate_dims: int = 256,
+        oversample: int = 4,
+        full_vector_dtype: str = "float32",
+        score_mode: str = "similarity",
+    ):
+        """
+        Two-stage retrieval over Matryoshka embeddings, such as OpenAI `text-embedding-3-*`.
+
+        The wrapped store indexes the first `truncate_dims` dimensions of each vector, re-normalized, and keeps the
+        full vector in the payload, so it must be a store that preserves arbitrary payload fields. A search fetches
+        `limit * oversample` candidates on the short vector and reranks them exactly on the full one.
+
+        Args:
+            provider (str): Provider of the wrapped vector store.
+            config (Dict, optional): Configuration of the wrapped vector store. Defaults to None.
+            collection_name (str, optional): Collection name forwarded to the wrapped store. Defaults to None.
+            embedding_model_dims (int, optional): Dimension of the full embedding vector. Defaults to 1536.
+            truncate_dims (int, optional): Dimensions indexed by the wrapped store. Defaults to 256.
+            oversample (int, optional): Candidates fetched per requested result. Defaults to 4.
+            full_vector_dtype (str, optional): "float32" or "float16" encoding of the stored full vector.
+                Defaults to "float32".
+            score_mode (str, optional): "similarity" (cosine) or "distance" (1 - cosine) for reranked results.
+                Defaults to "similarity".
+        """
+        from mem0.utils.factory import VectorStoreFactory
+        from mem0.vector_stores.configs import VectorStoreConfig
+
+        if provider in FIXED_SCHEMA_PROVIDERS:
+            raise ValueError(
+                f"matryoshka cannot wrap {provider}: it does not keep the full vector stored in the payload"
+            )
+        inner_config = dict(config or {})
+        if collection_name:
+            inner_config["collection_name"] = collection_name
+        inner_config["embedding_model_dims"] = truncate_dims
+        inner_config = VectorStoreConfig(provider=provider, config=inner_config).config
+
+        self.provider = provider
+        self.inner = VectorStoreFactory.create(provider, inner_config)
+        self.collection_name = inner_config.collection_name
+        self.embedding_model_dims = embedding_model_dims
+        self.truncate_dims = truncate_dims
+        self.oversample = max(1, oversample)
+        self.full_vector_dtype = np.dtype(full_vector_dtype)
+        self.score_mode = score_mode
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def _truncate(self, vector) -> List[float]:
+        return self._normalize(np.asarray(vector, dtype=np.float32)[: self.truncate_dims]).tolist()
+
+    def _encode(self, vector) -> str:
+        return base64.b64encode(self._normalize(vector).astype(self.full_vector_dtype).tobytes()).decode("ascii")
+
+    def _decode(self, encoded: str) -> np.ndarray:
+        return np.frombuffer(base64.b64decode(encoded), dtype=self.full_vector_dtype).astype(np.float32)
+
+    def _with_full_vector(self, vector, payload: Optional[Dict]) -> Dict:
+        return {**(payload or {}), FULL_VECTOR_FIELD: self._encode(vector)}
+
+    @staticmethod
+    def _strip(payload: Optional[Dict]) -> Dict:
+        return {key: value for key, value in (payload or {}).items() if key != FULL_VECTOR_FIELD}
+
+    def _output(self, record, score=None) -> OutputData:
+        return OutputData(id=record.id, score=score, payload=self._strip(record.payload))
+
+    def create_col(self, name, vector_size=None, distance=None):
+        return self.inner.create_col(name, self.truncate_dims, distance)
+
+    def insert(self, vectors, payloads=None, ids=None):
+        """Index the truncated vectors and store the full ones in the payloads."""
+        payloads = payloads or [{} for _ in vectors]
+        return self.inner.insert(
+            vectors=[self._truncate(vector) for vector in vectors],
+            payloads=[self._with_full_vector(vector, payload) for vector, payload in zip(vectors, payloads)],
+            ids=ids,
+        )
+
+    def search(self, query, vectors, limit=5, filters=None):
+        """Fetch `limit * oversample` candidates on the truncated vector and rerank them on the full vector."""
+        candidates = self.inner.search(
+            query=query, vectors=self._truncate(vectors), limit=limit * self.oversample, filters=filters
+        )
+        if not candidates:
+            return []
+
+        full = [(candidate.payload or {}).get(FULL_VECTOR_FIELD) for candidate in candidates]
+        if any(encoded is None for encoded in full):
+            logger.warning(f"{self.provider} returned records without a full vector, skipping the rerank")
+            return [self._output(candidate, candidate.score) for candidate in candidates[:limit]]
+
+        matrix = np.stack([self._decode(encoded) for encoded in full])
+        scores = matrix @ self._normalize(vectors)
+        order = np.argsort(-scores)[:limit]
+        return [
+            self._output(
+                candidates[i], float(scores[i]) if self.score_mode == "similarity" else float(1.0 - scores[i])
+            )
+            for i in order
+        ]
+
+    def delete(self, vector_id):
+        return self.inner.delete(vector_id=vector_id)
+
+    def delete_many(self, filters):
+        if hasattr(self.inner, "delete_many"):
+            return self.inner.delete_many(filters=filters)
+        for record in list(self.inner.iter_all(filters=filters)):
+            self.inner.delete(vector_id=record.id)
+
+    def update(self, vector_id, vector=None, payload=None):
+        """Update both vectors; a payload-only update keeps the stored full vector."""
+        if vector is not None:
+            payload = self._with_full_vector(vector, payload if payload is not None else self._current(vector_id))
+            return self.inner.update(vector_id=vector_id, vector=self._truncate(vector), payload=payload)
+        if payload is not None:
+            existing = self.inner.get(vector_id=vector_id)
+            encoded = (existing.payload or {}).get(FULL_VECTOR_FIELD) if existing is not None else None
+            payload = {**payload, FULL_VECTOR_FIELD: encoded} if encoded is not None else payload
+        return self.inner.update(vector_id=vector_id, payload=payload)
+
+    def _current(self, vector_id) -> Dict:
+        existing = self.inner.get(vector_id=vector_id)
+        return self._strip(existing.payload) if existing is not None else {}
+
+    def get(self, vector_id):
+        record = self.inner.get(vector_id=vector_id)
+        return self._output(record) if record is not None else None
+
+    def list_cols(self):
+        return self.inner.list_cols()
+
+    def delete_col(self):
+        return self.inner.delete_col()
+
+    def col_info(self):
+        return self.inner.col_info()
+
+    def list(self, filters=None, limit=None):
+        records = self._unwrap_list_result(self.inner.list(filters=filters, limit=limit))
+        return [[self._output(record) for record in records]]
+
+    def list_page(self, filters=None, cursor=None, page_size=100):
+        records, next_cursor = self.inner.list_page(filters=filters, cursor=cursor, page_size=page_size)
+        return [self._output(record) for record in records], next_cursor
+
+    def count(self, filters=None):
+        return self.inner.count(filters=filters)
+
+    def iter_all(self, filters=None, batch_size=100):
+        for record in self.inner.iter_all(filters=filters, batch_size=batch_size):
+            yield self._output(record)
+
+    def iter_vectors(self, filters=None, batch_size=100) -> Iterator[Tuple[str, List[float], Dict]]:
+        """Yield the full-dimension vectors."""
+        for record in self.inner.iter_all(filters=filters, batch_size=batch_size):
+            encoded = (record.payload or {}).get(FULL_VECTOR_FIELD)
+            if encoded is not None:
+                yield record.id, self._decode(encoded).tolist(), self._strip(record.payload)
+
+    def reset(self):
+        return self.inner.reset()
@@ -15,6 +15,8 @@ from pymilvus import CollectionSchema, DataType, FieldSchema, MilvusClient
 
 logger = logging.getLogger(__name__)
 
+PARTITION_KEY_FIELD = "user_id"
+
 
 class OutputData(BaseModel):
     id: Optional[str]  # memory id
@@ -31,6 +33,12 @@ class MilvusDB(VectorStoreBase):
         embedding_model_dims: int,
         metric_type: MetricType,
         db_name: str,
+        partition_key: bool = False,
+        num_partitions: Optional[int] = None,
+        index_type: str = "AUTOINDEX",
+        index_params: Optional[Dict] = None,
+        search_params: Optional[Dict] = None,
+        consistency_level: Optional[str] = None,
     ) -> None:
         """Initialize the MilvusDB database.
 
@@ -41,10 +49,23 @@ class MilvusDB(VectorStoreBase):
             embedding_model_dims (int): Dimensions of the embedding model (defaults to 1536).
             metric_type (MetricType): Metric type for similarity search (defaults to L2).
             db_name (str): Name of the database (defaults to "").
+            partition_key (bool): Store user_id in a partition key field (defaults to False).
+            num_partitions (int, optional): Number of partitions used by the partition key.
+            index_type (str): Vector index type, e.g. AUTOINDEX, HNSW or IVF_FLAT (defaults to AUTOINDEX).
+            index_params (Dict, optional): Index build parameters, e.g. {"M": 16, "efConstruction": 200}.
+            search_params (Dict, optional): Default search parameters, e.g. {"ef": 64} or {"nprobe": 16}.
+            consistency_level (str, optional): Consistency level for the collection and reads.
         """
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.metric_type = metric_type
+        self.partition_key = partition_key
+        self.num_partitions = num_partitions
+        self.index_type = index_type
+        self.index_params = index_params
+        self.search_params = search_params
+        self.consistency_level = consistency_level
+        self._read_kwargs = {"consistency_level": consistency_level} if consistency_level else {}
         self.client = MilvusClient(uri=url, token=token, db_name=db_name)
         self.create_col(
             collection_name=self.collection_name,
@@ -58,7 +79,7 @@ class MilvusDB(VectorStoreBase):
         vector_size: str,
         metric_type: MetricType = MetricType.COSINE,
     ) -> None:
-        """Create a new collection with index_type AUTOINDEX.
+        """Create a new collection with the configured index type (AUTOINDEX by default).
 
         Args:
             collection_name (str): Name of the collection (defaults to mem0).
@@ -74,13 +95,36 @@ class MilvusDB(VectorStoreBase):
                 FieldSchema(name="vectors", dtype=DataType.FLOAT_VECTOR, dim=vector_size),
                 FieldSchema(name="metadata", dtype=DataType.JSON),
             ]
+            collection_kwargs = {}
+            if self.partition_key:
+                fields.append(
+                    FieldSchema(
+                        name=PARTITION_KEY_FIELD, dtype=DataType.VARCHAR, max_length=512, is_partition_key=True
+                    )
+                )
+                if self.num_partitions:
+                    collection_kwargs["num_partitions"] = self.num_partitions
+            if self.consistency_level:
+                collection_kwargs["consistency_level"] = self.consistency_level
 
             schema = CollectionSchema(fields, enable_dynamic_field=True)
 
             index = self.client.prepare_index_params(
-                field_name="vectors", metric_type=metric_type, index_type="AUTOINDEX", index_name="vector_index"
+                field_name="vectors",
+                metric_type=metric_type,
+                index_type=self.index_type,
+                index_name="vector_index",
+                params=self.index_params or {},
+            )
+            self.client.create_collection(
+                collection_name=collection_name, schema=schema, index_params=index, **collection_kwargs
             )
-            self.client.create_collection(collection_name=collection_name, schema=schema, index_params=index)
+
+    def _row(self, vector_id, vector, payload) -> dict:
+        row = {"id": vector_id, "vectors": vector, "metadata": payload}
+        if self.partition_key:
+            row[PARTITION_KEY_FIELD] = str((payload or {}).get(PARTITION_KEY_FIELD) or "")
+        return row
 
     def insert(self, ids, vectors, payloads, **kwargs: Optional[dict[str, any]]):
         """Insert vectors into a collection.
@@ -91,7 +135,7 @@ class MilvusDB(VectorStoreBase):
             ids (List[str], optional): List of IDs corresponding to vectors.
         """
         for idx, embedding, metadata in zip(ids, vectors, payloads):
-            data = {"id": idx, "vectors": embedding, "metadata": metadata}
+            data = self._row(idx, embedding, metadata)
             self.client.insert(collection_name=self.collection_name, data=data, **kwargs)
 
     def _create_filter(self, filters: dict):
@@ -105,7 +149,10 @@ class MilvusDB(VectorStoreBase):
         """
         operands = []
         for key, value in filters.items():
-            if isinstance(value, str):
+            if self.partition_key and key == PARTITION_KEY_FIELD:
+                # Filtering on the partition key lets Milvus search only the partitions holding this user
+                operands.append(f'({PARTITION_KEY_FIELD} == "{value}")')
+            elif isinstance(value, str):
                 operands.append(f'(metadata["{key}"] == "{value}")')
             else:
                 operands.append(f'(metadata["{key}"] == {value})')
@@ -136,7 +183,9 @@ class MilvusDB(VectorStoreBase):
 
         return memory
 
-    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> list:
+    def search(
+        self, query: str, vectors: list, limit: int = 5, filters: dict = None, search_params: dict = None
+    ) -> list:
         """
         Search for similar vectors.
 
@@ -145,17 +194,22 @@ class MilvusDB(VectorStoreBase):
             vectors (List[float]): Query vector.
             limit (int, optional): Number of results to return. Defaults to 5.
             filters (Dict, optional): Filters to apply to the search. Defaults to None.
+            search_params (Dict, optional): Index search parameters for this call, e.g. {"ef": 128}.
+                Defaults to the configured search_params.
 
         Returns:
             list: Search results.
         """
         query_filter = self._create_filter(filters) if filters else None
+        params = search_params if search_params is not None else self.search_params
         hits = self.client.search(
             collection_name=self.collection_name,
             data=[vectors],
             limit=limit,
             filter=query_filter,
             output_fields=["*"],
+            search_params={"metric_type": str(self.metric_type), "params": params} if params else None,
+            **self._read_kwargs,
         )
         result = self._parse_output(data=hits[0])
         return result
@@ -178,7 +232,7 @@ class MilvusDB(VectorStoreBase):
             vector (List[float], optional): Updated vector.
             payload (Dict, optional): Updated payload.
         """
-        schema = {"id": vector_id, "vectors": vector, "metadata": payload}
+        schema = self._row(vector_id, vector, payload)
         self.client.upsert(collection_name=self.collection_name, data=schema)
 
     def get(self, vector_id):
@@ -191,7 +245,7 @@ class MilvusDB(VectorStoreBase):
         Returns:
             OutputData: Retrieved vector.
         """
-        result = self.client.get(collection_name=self.collection_name, ids=vector_id)
+        result = self.client.get(collection_name=self.collection_name, ids=vector_id, **self._read_kwargs)
         output = OutputData(
             id=result[0].get("id", None),
             score=None,
@@ -233,7 +287,9 @@ class MilvusDB(VectorStoreBase):
             List[OutputData]: List of vectors.
         """
         query_filter = self._create_filter(filters) if filters else None
-        result = self.client.query(collection_name=self.collection_name, filter=query_filter, limit=limit)
+        result = self.client.query(
+            collection_name=self.collection_name, filter=query_filter, limit=limit, **self._read_kwargs
+        )
         memories = []
         for data in result:
             obj = OutputData(id=data.get("id"), score=None, payload=data.get("metadata"))
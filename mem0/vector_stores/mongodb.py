@@ -10,7 +10,7 @@ try:
 except ImportError:
     raise ImportError("The 'pymongo' library is required. Please install it using 'pip install pymongo'.")
 
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import VectorStoreBase, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -23,10 +23,20 @@ class OutputData(BaseModel):
 
 
 class MongoDB(VectorStoreBase):
-    VECTOR_TYPE = "knnVector"
+    VECTOR_TYPE = "vector"
     SIMILARITY_METRIC = "cosine"
-
-    def __init__(self, db_name: str, collection_name: str, embedding_model_dims: int, mongo_uri: str):
+    FILTER_FIELDS = ("user_id", "agent_id", "run_id")
+    MAX_NUM_CANDIDATES = 10000
+
+    def __init__(
+        self,
+        db_name: str,
+        collection_name: str,
+        embedding_model_dims: int,
+        mongo_uri: str,
+        num_candidates_multiplier: int = 10,
+        insert_batch_size: int = 1000,
+    ):
         """
         Initialize the MongoDB vector store with vector search capabilities.
 
@@ -35,15 +45,38 @@ class MongoDB(VectorStoreBase):
             collection_name (str): Collection name
             embedding_model_dims (int): Dimension of the embedding vector
             mongo_uri (str): MongoDB connection URI
+            num_candidates_multiplier (int): `numCandidates` considered by `$vectorSearch` per requested result
+            insert_batch_size (int): Maximum number of documents per `insert_many` call
         """
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.db_name = db_name
+        self.num_candidates_multiplier = num_candidates_multiplier
+        self.insert_batch_size = insert_batch_size
+        # Whether the search index declares FILTER_FIELDS, so they can be pushed into $vectorSearch.filter
+        self.filter_pushdown = True
 
         self.client = MongoClient(mongo_uri)
         self.db = self.client[db_name]
         self.collection = self.create_col()
 
+    def _index_definition(self) -> Dict[str, Any]:
+        fields = [
+            {
+                "type": self.VECTOR_TYPE,
+                "path": "embedding",
+                "numDimensions": self.embedding_model_dims,
+                "similarity": self.SIMILARITY_METRIC,
+            }
+        ]
+        fields.extend({"type": "filter", "path": f"payload.{field}"} for field in self.FILTER_FIELDS)
+        return {"fields": fields}
+
+    def _declares_filter_fields(self, index: Dict[str, Any]) -> bool:
+        definition = index.get("latestDefinition") or index.get("definition") or {}
+        paths = {field.get("path") for field in definition.get("fields", []) if field.get("type") == "filter"}
+        return all(f"payload.{field}" in paths for field in self.FILTER_FIELDS)
+
     def create_col(self):
         """Create new collection with vector search index."""
         try:
@@ -63,21 +96,17 @@ class MongoDB(VectorStoreBase):
             found_indexes = list(collection.list_search_indexes(name=self.index_name))
             if found_indexes:
                 logger.info(f"Search index '{self.index_name}' already exists in collection '{self.collection_name}'.")
+                if not self._declares_filter_fields(found_indexes[0]):
+                    self.filter_pushdown = False
+                    logger.warning(
+                        f"Search index '{self.index_name}' does not declare {', '.join(self.FILTER_FIELDS)} as filter "
+                        "fields. Filters will be applied after the vector search; recreate the index to push them down."
+                    )
             else:
                 search_index_model = SearchIndexModel(
                     name=self.index_name,
-                    definition={
-                        "mappings": {
-                            "dynamic": False,
-                            "fields": {
-                                "embedding": {
-                                    "type": self.VECTOR_TYPE,
-                                    "dimensions": self.embedding_model_dims,
-                                    "similarity": self.SIMILARITY_METRIC,
-                                }
-                            },
-                        }
-                    },
+                    type="vectorSearch",
+                    definition=self._index_definition(),
                 )
                 collection.create_search_index(search_index_model)
                 logger.info(
@@ -106,20 +135,22 @@ class MongoDB(VectorStoreBase):
             document = {"_id": _id, "embedding": vector, "payload": payload}
             data.append(document)
         try:
-            self.collection.insert_many(data)
+            for start in range(0, len(data), self.insert_batch_size):
+                self.collection.insert_many(data[start : start + self.insert_batch_size], ordered=False)
             logger.info(f"Inserted {len(data)} documents into '{self.collection_name}'.")
         except PyMongoError as e:
             logger.error(f"Error inserting data: {e}")
 
-    def search(
-        self, query: str, query_vector: List[float], limit=5, filters: Optional[Dict] = None
-    ) -> List[OutputData]:
+    def search(self, query: str, vectors: List[float], limit=5, filters: Optional[Dict] = None) -> List[OutputData]:
         """
         Search for similar vectors using the vector search index.
 
+        Filters on the indexed tenant fields are applied inside `$vectorSearch`, so the candidate pool is drawn
+        from the matching documents only. Any other filter is applied in a `$match` stage afterwards.
+
         Args:
             query (str): Query string
-            query_vector (List[float]): Query vector.
+            vectors (List[float]): Query vector.
             limit (int, optional): Number of results to return. Defaults to 5.
             filters (Dict, optional): Filters to apply to the search.
 
@@ -135,30 +166,34 @@ class MongoDB(VectorStoreBase):
         results = []
         try:
             collection = self.client[self.db_name][self.collection_name]
+            vector_search = {
+                "index": self.index_name,
+                "limit": limit,
+                "numCandidates": max(limit, min(limit * self.num_candidates_multiplier, self.MAX_NUM_CANDIDATES)),
+                "queryVector": vectors,
+                "path": "embedding",
+            }
             pipeline = [
-                {
-                    "$vectorSearch": {
-                        "index": self.index_name,
-                        "limit": limit,
-                        "numCandidates": limit,
-                        "queryVector": query_vector,
-                        "path": "embedding",
-                    }
-                },
+                {"$vectorSearch": vector_search},
                 {"$set": {"score": {"$meta": "vectorSearchScore"}}},
                 {"$project": {"embedding": 0}},
             ]
-            
-            # Add filter stage if filters are provided
+
             if filters:
-                filter_conditions = []
+                pre_filter_conditions = []
+                post_filter_conditions = []
                 for key, value in filters.items():
-                    filter_conditions.append({"payload." + key: value})
-                
-                if filter_conditions:
-                    # Add a $match stage after vector search to apply filters
-                    pipeline.insert(1, {"$match": {"$and": filter_conditions}})
-            
+                    if self.filter_pushdown and key in self.FILTER_FIELDS and not isinstance(value, dict):
+                        pre_filter_conditions.append({"payload." + key: {"$eq": value}})
+                    else:
+                        post_filter_conditions.append({"payload." + key: value})
+
+                if pre_filter_conditions:
+                    vector_search["filter"] = {"$and": pre_filter_conditions}
+                if post_filter_conditions:
+                    # Add a $match stage after vector search for fields the index cannot filter on
+                    pipeline.insert(1, {"$match": {"$and": post_filter_conditions}})
+
             results = list(collection.aggregate(pipeline))
             logger.info(f"Vector search completed. Found {len(results)} documents.")
         except Exception as e:
@@ -299,6 +334,77 @@ class MongoDB(VectorStoreBase):
             logger.error(f"Error listing documents: {e}")
             return []
 
+    def iter_all(self, filters: Optional[Dict] = None, batch_size: int = 100):
+        """
+        Iterate over every vector matching the filters with a server-side cursor.
+
+        Args:
+            filters (Dict, optional): Filters to apply.
+            batch_size (int, optional): Number of documents fetched per cursor batch. Defaults to 100.
+
+        Yields:
+            OutputData: Stored vectors with their payloads.
+        """
+        query = {}
+        if filters:
+            query = {"$and": [{"payload." + key: value} for key, value in filters.items()]}
+
+        cursor = self.collection.find(query, {"payload": 1}).batch_size(batch_size)
+        try:
+            for doc in cursor:
+                yield OutputData(id=str(doc["_id"]), score=None, payload=doc.get("payload"))
+        finally:
+            cursor.close()
+
+    def list_page(self, filters: Optional[Dict] = None, cursor: Optional[str] = None, page_size: int = 100):
+        """
+        Return one page of documents ordered by `payload.created_at` then `_id`, and the cursor of the next page.
+
+        Args:
+            filters (Dict, optional): Filters to apply.
+            cursor (str, optional): `next_cursor` of the previous page. Defaults to None.
+            page_size (int, optional): Number of documents per page. Defaults to 100.
+
+        Returns:
+            tuple: `(records, next_cursor)`, where `next_cursor` is None on the last page.
+        """
+        conditions = [{"payload." + key: value} for key, value in (filters or {}).items()]
+        if cursor is not None:
+            created_at, last_id = decode_cursor(cursor)["after"]
+            # Documents without created_at sort first, so after one of them every dated document follows.
+            later = {"$ne": None} if created_at is None else {"$gt": created_at}
+            conditions.append(
+                {"$or": [{"payload.created_at": later}, {"payload.created_at": created_at, "_id": {"$gt": last_id}}]}
+            )
+        query = {"$and": conditions} if conditions else {}
+
+        docs = list(
+            self.collection.find(query, {"payload": 1})
+            .sort([("payload.created_at", 1), ("_id", 1)])
+            .limit(page_size + 1)
+        )
+        records = [OutputData(id=str(doc["_id"]), score=None, payload=doc.get("payload")) for doc in docs[:page_size]]
+        next_cursor = None
+        if len(docs) > page_size:
+            last = docs[page_size - 1]
+            next_cursor = encode_cursor({"after": [(last.get("payload") or {}).get("created_at"), last["_id"]]})
+        return records, next_cursor
+
+    def count(self, filters: Optional[Dict] = None) -> int:
+        """
+        Count the documents matching the filters.
+
+        Args:
+            filters (Dict, optional): Filters to apply.
+
+        Returns:
+            int: Number of matching documents.
+        """
+        query = {}
+        if filters:
+            query = {"$and": [{"payload." + key: value} for key, value in filters.items()]}
+        return self.collection.count_documents(query)
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -0,0 +1,731 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from mem0.vector_stores.base import VectorStoreBase, created_at_key, decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+TENANT_FIELD = "user_id"
+# Shard holding memories that have no user_id
+SHARED_TENANT = "__shared__"
+# Payload fields mirrored into numpy columns so filters on them are vectorized
+COLUMN_FIELDS = ("agent_id", "run_id", "actor_id")
+# Rows converted to float32 at a time when scoring float16 shards
+FLOAT16_SCORE_BLOCK = 32768
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # cosine similarity
+    payload: Optional[Dict]  # metadata
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _matches(payload: Dict, key: str, value) -> bool:
+    if key not in payload:
+        return False
+    if isinstance(value, list):
+        return payload[key] in value
+    return payload[key] == value
+
+
+class _Shard:
+    """
+    One tenant's memories: a contiguous, pre-normalized vector matrix plus row bookkeeping.
+
+    With a directory the matrix is a raw memory-mapped file and payload changes are appended to a JSON-lines log
+    that is replayed on load. Deleted rows are tombstoned and reclaimed by `compact`, which writes the live rows to
+    a new matrix generation and commits it by atomically replacing the log.
+    """
+
+    def __init__(self, key: str, dims: int, dtype: str, capacity: int, directory: Optional[str] = None):
+        self.key = key
+        self.dims = dims
+        self.dtype = np.dtype(dtype)
+        self.directory = directory
+        self.stem = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        self.generation = 0
+        self.size = 0  # rows used, including tombstoned rows
+        self.ids: List[Optional[str]] = []  # row -> memory id, None once deleted
+        self.rows: Dict[str, int] = {}
+        self.payloads: Dict[str, Dict] = {}
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.columns = {field: np.full(capacity, None, dtype=object) for field in COLUMN_FIELDS}
+        self.matrix = self._open_matrix(capacity, create=True)
+        self._log = None
+        if directory:
+            self._write_log([])
+
+    @property
+    def capacity(self) -> int:
+        return self.matrix.shape[0]
+
+    @property
+    def live_count(self) -> int:
+        return len(self.rows)
+
+    @property
+    def log_path(self) -> str:
+        return os.path.join(self.directory, f"{self.stem}.log")
+
+    def _matrix_path(self, generation: int) -> str:
+        return os.path.join(self.directory, f"{self.stem}.{generation}.bin")
+
+    def _open_matrix(self, capacity: int, create: bool = False, generation: Optional[int] = None):
+        if not self.directory:
+            return np.zeros((capacity, self.dims), dtype=self.dtype)
+        path = self._matrix_path(self.generation if generation is None else generation)
+        nbytes = capacity * self.dims * self.dtype.itemsize
+        with open(path, "w+b" if create else "r+b") as f:
+            # Extending the file is how a memory-mapped shard grows without copying existing rows.
+            f.truncate(nbytes)
+        return np.memmap(path, dtype=self.dtype, mode="r+", shape=(capacity, self.dims))
+
+    def _header(self) -> Dict:
+        return {"op": "shard", "key": self.key, "generation": self.generation, "dims": self.dims}
+
+    def _write_log(self, entries: List[Dict]):
+        """Atomically replace the log with a header plus `entries`, then reopen it for appending."""
+        if self._log:
+            self._log.close()
+        tmp_path = f"{self.log_path}.tmp"
+        with open(tmp_path, "w") as f:
+            for entry in [self._header(), *entries]:
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_path, self.log_path)
+        self._log = open(self.log_path, "a")
+
+    def _append_log(self, entries: List[Dict]):
+        if not self._log:
+            return
+        self._log.write("".join(json.dumps(entry) + "\n" for entry in entries))
+        self._log.flush()
+
+    @staticmethod
+    def _read_log(log_path: str) -> List[Dict]:
+        """Parse the log, truncating a torn final line left by a crash mid-append."""
+        with open(log_path, "rb") as f:
+            lines = f.readlines()
+        entries = []
+        offset = 0
+        for index, line in enumerate(lines):
+            if line.strip():
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    if any(rest.strip() for rest in lines[index + 1 :]):
+                        raise
+                    # Only the last append can be partial; drop it so later appends start on a clean line.
+                    logger.warning("Truncating torn final entry in %s", log_path)
+                    with open(log_path, "r+b") as f:
+                        f.truncate(offset)
+                    break
+            offset += len(line)
+        return entries
+
+    @classmethod
+    def load(cls, log_path: str, dtype: str) -> "_Shard":
+        """Rebuild a shard from its log and memory-mapped matrix."""
+        entries = cls._read_log(log_path)
+        header = entries[0]
+        shard = cls.__new__(cls)
+        shard.key = header["key"]
+        shard.dims = header["dims"]
+        shard.dtype = np.dtype(dtype)
+        shard.directory = os.path.dirname(log_path)
+        shard.stem = Path(log_path).stem
+        shard.generation = header["generation"]
+        capacity = os.path.getsize(shard._matrix_path(shard.generation)) // (shard.dims * shard.dtype.itemsize)
+        shard.matrix = shard._open_matrix(capacity)
+        shard.size = 0
+        shard.ids = []
+        shard.rows = {}
+        shard.payloads = {}
+        shard.alive = np.zeros(capacity, dtype=bool)
+        shard.columns = {field: np.full(capacity, None, dtype=object) for field in COLUMN_FIELDS}
+        for entry in entries[1:]:
+            if entry["op"] == "put":
+                row = entry["row"]
+                while shard.size <= row:
+                    shard.ids.append(None)
+                    shard.size += 1
+                shard._set_row(entry["id"], row, entry["payload"])
+            elif entry["op"] == "del" and entry["id"] in shard.rows:
+                shard._clear_row(entry["id"])
+        shard._log = open(log_path, "a")
+        return shard
+
+    def _set_row(self, vector_id: str, row: int, payload: Dict):
+        self.ids[row] = vector_id
+        self.rows[vector_id] = row
+        self.payloads[vector_id] = payload
+        self.alive[row] = True
+        for field in COLUMN_FIELDS:
+            self.columns[field][row] = payload.get(field)
+
+    def _clear_row(self, vector_id: str) -> int:
+        row = self.rows.pop(vector_id)
+        self.payloads.pop(vector_id, None)
+        self.ids[row] = None
+        self.alive[row] = False
+        for field in COLUMN_FIELDS:
+            self.columns[field][row] = None
+        return row
+
+    def _grow(self, needed: int):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        if capacity == self.capacity:
+            return
+        if self.directory:
+            self.matrix.flush()
+            self.matrix = self._open_matrix(capacity)
+        else:
+            matrix = np.zeros((capacity, self.dims), dtype=self.dtype)
+            matrix[: self.size] = self.matrix[: self.size]
+            self.matrix = matrix
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self.size] = self.alive[: self.size]
+        self.alive = alive
+        for field in COLUMN_FIELDS:
+            column = np.full(capacity, None, dtype=object)
+            column[: self.size] = self.columns[field][: self.size]
+            self.columns[field] = column
+
+    def flush(self):
+        if isinstance(self.matrix, np.memmap):
+            self.matrix.flush()
+
+    def append(self, ids: List[str], vectors: np.ndarray, payloads: List[Dict]):
+        """Append normalized vectors as new rows at the end of the matrix."""
+        start = self.size
+        self._grow(start + len(ids))
+        self.matrix[start : start + len(ids)] = vectors
+        self.ids.extend([None] * len(ids))
+        self.size += len(ids)
+        entries = []
+        for offset, (vector_id, payload) in enumerate(zip(ids, payloads)):
+            self._set_row(vector_id, start + offset, payload)
+            entries.append({"op": "put", "id": vector_id, "row": start + offset, "payload": payload})
+        self.flush()
+        self._append_log(entries)
+
+    def set_vector(self, vector_id: str, vector: np.ndarray):
+        self.matrix[self.rows[vector_id]] = vector
+        self.flush()
+
+    def set_payload(self, vector_id: str, payload: Dict):
+        row = self.rows[vector_id]
+        self._set_row(vector_id, row, payload)
+        self._append_log([{"op": "put", "id": vector_id, "row": row, "payload": payload}])
+
+    def remove(self, vector_ids: List[str]):
+        for vector_id in vector_ids:
+            self._clear_row(vector_id)
+        self._append_log([{"op": "del", "id": vector_id} for vector_id in vector_ids])
+
+    def vector(self, vector_id: str) -> np.ndarray:
+        return np.asarray(self.matrix[self.rows[vector_id]], dtype=np.float32)
+
+    def compact(self, min_capacity: int):
+        """Rewrite the matrix with only live rows, dropping tombstones."""
+        keep = np.flatnonzero(self.alive[: self.size])
+        ids = [self.ids[row] for row in keep]
+        payloads = [self.payloads[vector_id] for vector_id in ids]
+        capacity = max(min_capacity, 2 * len(keep))
+        old_matrix, old_generation = self.matrix, self.generation
+        if self.directory:
+            self.generation += 1
+            self.matrix = self._open_matrix(capacity, create=True)
+        else:
+            self.matrix = np.zeros((capacity, self.dims), dtype=self.dtype)
+        self.matrix[: len(keep)] = old_matrix[keep]
+        self.flush()
+        self.size = len(keep)
+        self.ids = list(ids)
+        self.rows = {}
+        self.payloads = {}
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.columns = {field: np.full(capacity, None, dtype=object) for field in COLUMN_FIELDS}
+        for row, (vector_id, payload) in enumerate(zip(ids, payloads)):
+            self._set_row(vector_id, row, payload)
+        if self.directory:
+            # Replacing the log commits the new generation; the old matrix is only removed afterwards.
+            self._write_log(
+                [
+                    {"op": "put", "id": vector_id, "row": row, "payload": payload}
+                    for row, (vector_id, payload) in enumerate(zip(ids, payloads))
+                ]
+            )
+            del old_matrix
+            os.remove(self._matrix_path(old_generation))
+
+    def mask(self, filters: Optional[Dict]) -> np.ndarray:
+        """Boolean mask over used rows that are alive and match the filters."""
+        mask = self.alive[: self.size].copy()
+        for key, value in (filters or {}).items():
+            if key in COLUMN_FIELDS and not isinstance(value, list):
+                mask &= self.columns[key][: self.size] == value
+            else:
+                for row in np.flatnonzero(mask):
+                    if not _matches(self.payloads[self.ids[row]], key, value):
+                        mask[row] = False
+        return mask
+
+    def scores(self, queries: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every used row against each query, shape (size, n_queries)."""
+        if self.dtype == np.float32:
+            return self.matrix[: self.size] @ queries.T
+        scores = np.empty((self.size, queries.shape[0]), dtype=np.float32)
+        for start in range(0, self.size, FLOAT16_SCORE_BLOCK):
+            block = np.asarray(self.matrix[start : min(start + FLOAT16_SCORE_BLOCK, self.size)], dtype=np.float32)
+            scores[start : start + len(block)] = block @ queries.T
+        return scores
+
+    def close(self):
+        self.flush()
+        if self._log:
+            self._log.close()
+            self._log = None
+
+    def destroy(self):
+        self.close()
+        if self.directory:
+            for path in (self.log_path, self._matrix_path(self.generation)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+class NumpyDB(VectorStoreBase):
+    def __init__(
+        self,
+        collection_name: str,
+        path: Optional[str] = None,
+        embedding_model_dims: int = 1536,
+        dtype: str = "float32",
+        initial_capacity: int = 64,
+        compaction_threshold: float = 0.25,
+    ):
+        """
+        Initialize the NumPy vector store.
+
+        Args:
+            collection_name (str): Name of the collection.
+            path (str, optional): Directory for memory-mapped shard files. None keeps the store in memory.
+                Defaults to None.
+            embedding_model_dims (int, optional): Dimension of the embedding vector. Defaults to 1536.
+            dtype (str, optional): Storage precision, "float32" or "float16". Defaults to "float32".
+            initial_capacity (int, optional): Rows allocated for a new tenant shard. Defaults to 64.
+            compaction_threshold (float, optional): Fraction of deleted rows that triggers compaction of a shard.
+                Defaults to 0.25.
+        """
+        self.path = path
+        self.embedding_model_dims = embedding_model_dims
+        self.dtype = dtype
+        self.initial_capacity = initial_capacity
+        self.compaction_threshold = compaction_threshold
+        self._lock = threading.RLock()
+        self._shards: Dict[str, _Shard] = {}
+        self._locations: Dict[str, str] = {}  # memory id -> tenant key
+        self.create_col(collection_name)
+
+    @property
+    def directory(self) -> Optional[str]:
+        return os.path.join(self.path, self.collection_name) if self.path else None
+
+    def create_col(self, name: str, vector_size: Optional[int] = None, distance: Optional[str] = None):
+        """
+        Create or open a collection, loading any persisted tenant shards.
+
+        Args:
+            name (str): Name of the collection.
+            vector_size (int, optional): Dimension of the vectors. Defaults to `embedding_model_dims`.
+            distance (str, optional): Unused, the store always ranks by cosine similarity.
+        """
+        with self._lock:
+            for shard in self._shards.values():
+                shard.close()
+            self.collection_name = name
+            if vector_size:
+                self.embedding_model_dims = vector_size
+            self._shards = {}
+            self._locations = {}
+            if self.directory:
+                os.makedirs(self.directory, exist_ok=True)
+                for log_path in sorted(Path(self.directory).glob("*.log")):
+                    shard = _Shard.load(str(log_path), self.dtype)
+                    self._shards[shard.key] = shard
+                    for vector_id in shard.rows:
+                        self._locations[vector_id] = shard.key
+                if self._shards:
+                    logger.info(f"Loaded {len(self._locations)} vectors in {len(self._shards)} tenant shards")
+        return self
+
+    @staticmethod
+    def _tenant_key(payload: Optional[Dict]) -> str:
+        value = (payload or {}).get(TENANT_FIELD)
+        return str(value) if value is not None else SHARED_TENANT
+
+    def _shard_for(self, key: str) -> _Shard:
+        shard = self._shards.get(key)
+        if shard is None:
+            shard = _Shard(key, self.embedding_model_dims, self.dtype, self.initial_capacity, self.directory)
+            self._shards[key] = shard
+        return shard
+
+    def _route(self, filters: Optional[Dict]):
+        """Return the shards a query can touch and the filters left to evaluate inside them."""
+        filters = dict(filters or {})
+        if TENANT_FIELD not in filters:
+            return list(self._shards.values()), filters
+        tenants = filters.pop(TENANT_FIELD)
+        keys = [str(tenant) for tenant in tenants] if isinstance(tenants, list) else [str(tenants)]
+        return [self._shards[key] for key in keys if key in self._shards], filters
+
+    def _prepare(self, vectors) -> np.ndarray:
+        return _normalize(np.asarray(vectors, dtype=np.float32).reshape(-1, self.embedding_model_dims))
+
+    def _maybe_compact(self, shard: _Shard):
+        if shard.live_count == 0:
+            shard.destroy()
+            del self._shards[shard.key]
+        elif shard.size - shard.live_count > self.compaction_threshold * shard.size:
+            shard.compact(self.initial_capacity)
+
+    def insert(self, vectors: List[list], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None):
+        """
+        Insert vectors, appending each to its tenant's shard.
+
+        Args:
+            vectors (List[list]): List of vectors to insert.
+            payloads (List[Dict], optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (List[str], optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
+        if payloads is None:
+            payloads = [{} for _ in range(len(vectors))]
+        if len(vectors) != len(ids) or len(vectors) != len(payloads):
+            raise ValueError("Vectors, payloads, and IDs must have the same length")
+
+        normalized = self._prepare(vectors)
+        with self._lock:
+            existing = [vector_id for vector_id in ids if vector_id in self._locations]
+            for vector_id in existing:
+                self.delete(vector_id)
+
+            groups: Dict[str, List[int]] = {}
+            for i, payload in enumerate(payloads):
+                groups.setdefault(self._tenant_key(payload), []).append(i)
+            for key, positions in groups.items():
+                self._shard_for(key).append(
+                    [ids[i] for i in positions], normalized[positions], [dict(payloads[i]) for i in positions]
+                )
+                for i in positions:
+                    self._locations[ids[i]] = key
+        logger.info(f"Inserted {len(vectors)} vectors into collection {self.collection_name}")
+
+    def search(
+        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """
+        Search for similar vectors.
+
+        Args:
+            query (str): Query (not used, kept for API compatibility).
+            vectors (List[float]): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            List[OutputData]: Search results ordered by descending cosine similarity.
+        """
+        return self.search_batch([query], [vectors], limit=limit, filters=filters)[0]
+
+    def search_batch(
+        self, queries: List[str], vectors: List[List[float]], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """
+        Search several query vectors at once with one matrix product per shard.
+
+        Args:
+            queries (List[str]): Queries (not used, kept for API compatibility).
+            vectors (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters shared by all queries. Defaults to None.
+
+        Returns:
+            List[List[OutputData]]: Results for each query vector, in input order.
+        """
+        query_matrix = self._prepare(vectors)
+        candidates = [[] for _ in range(len(query_matrix))]
+        with self._lock:
+            shards, remaining = self._route(filters)
+            for shard in shards:
+                mask = shard.mask(remaining)
+                matched = int(mask.sum())
+                if not matched:
+                    continue
+                scores = shard.scores(query_matrix)
+                scores[~mask] = -np.inf
+                k = min(limit, matched)
+                top_rows = np.argpartition(-scores, k - 1, axis=0)[:k]
+                for column in range(len(query_matrix)):
+                    for row in top_rows[:, column]:
+                        candidates[column].append((float(scores[row, column]), shard, int(row)))
+
+            results = []
+            for hits in candidates:
+                hits.sort(key=lambda hit: hit[0], reverse=True)
+                results.append(
+                    [
+                        OutputData(id=shard.ids[row], score=score, payload=dict(shard.payloads[shard.ids[row]]))
+                        for score, shard, row in hits[:limit]
+                    ]
+                )
+        return results
+
+    def delete(self, vector_id: str):
+        """
+        Delete a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to delete.
+        """
+        with self._lock:
+            key = self._locations.pop(vector_id, None)
+            if key is None:
+                logger.warning(f"Vector {vector_id} not found in collection {self.collection_name}")
+                return
+            shard = self._shards[key]
+            shard.remove([vector_id])
+            self._maybe_compact(shard)
+
+    def delete_many(self, filters: Dict):
+        """
+        Delete every vector matching the filters; a filter on user_id alone drops whole tenant shards.
+
+        Args:
+            filters (Dict): Filters selecting the vectors to delete.
+        """
+        with self._lock:
+            shards, remaining = self._route(filters)
+            for shard in shards:
+                if remaining:
+                    vector_ids = [shard.ids[row] for row in np.flatnonzero(shard.mask(remaining))]
+                else:
+                    vector_ids = list(shard.rows)
+                for vector_id in vector_ids:
+                    self._locations.pop(vector_id, None)
+                if len(vector_ids) == shard.live_count:
+                    shard.destroy()
+                    del self._shards[shard.key]
+                elif vector_ids:
+                    shard.remove(vector_ids)
+                    self._maybe_compact(shard)
+
+    def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None):
+        """
+        Update a vector and its payload.
+
+        Args:
+            vector_id (str): ID of the vector to update.
+            vector (List[float], optional): Updated vector. Defaults to None.
+            payload (Dict, optional): Updated payload. Defaults to None.
+        """
+        with self._lock:
+            key = self._locations.get(vector_id)
+            if key is None:
+                raise ValueError(f"Vector {vector_id} not found")
+            shard = self._shards[key]
+            if payload is not None and self._tenant_key(payload) != key:
+                # The memory changed tenant: move it to the other shard.
+                new_vector = vector if vector is not None else shard.vector(vector_id)
+                self.delete(vector_id)
+                self.insert([new_vector], [payload], [vector_id])
+                return
+            if vector is not None:
+                shard.set_vector(vector_id, self._prepare(vector)[0])
+            if payload is not None:
+                shard.set_payload(vector_id, dict(payload))
+
+    def get(self, vector_id: str) -> Optional[OutputData]:
+        """
+        Retrieve a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to retrieve.
+
+        Returns:
+            OutputData: Retrieved vector, or None if it does not exist.
+        """
+        with self._lock:
+            key = self._locations.get(vector_id)
+            if key is None:
+                return None
+            return OutputData(id=vector_id, score=None, payload=dict(self._shards[key].payloads[vector_id]))
+
+    def list_cols(self) -> List[str]:
+        """
+        List all collections.
+
+        Returns:
+            List[str]: List of collection names.
+        """
+        if not self.path:
+            return [self.collection_name]
+        return sorted(entry.name for entry in Path(self.path).iterdir() if entry.is_dir())
+
+    def delete_col(self):
+        """Delete the collection and its shard files."""
+        with self._lock:
+            for shard in self._shards.values():
+                shard.close()
+            self._shards = {}
+            self._locations = {}
+            if self.directory and os.path.exists(self.directory):
+                shutil.rmtree(self.directory)
+            logger.info(f"Deleted collection {self.collection_name}")
+
+    def col_info(self) -> Dict:
+        """
+        Get information about the collection.
+
+        Returns:
+            Dict: Collection information.
+        """
+        with self._lock:
+            return {
+                "name": self.collection_name,
+                "count": len(self._locations),
+                "tenants": len(self._shards),
+                "dimension": self.embedding_model_dims,
+                "dtype": self.dtype,
+                "deleted_rows": sum(shard.size - shard.live_count for shard in self._shards.values()),
+            }
+
+    def _matching(self, filters: Optional[Dict]):
+        shards, remaining = self._route(filters)
+        for shard in shards:
+            for row in np.flatnonzero(shard.mask(remaining)):
+                vector_id = shard.ids[row]
+                yield OutputData(id=vector_id, score=None, payload=dict(shard.payloads[vector_id]))
+
+    def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[List[OutputData]]:
+        """
+        List vectors in the collection.
+
+        Args:
+            filters (Dict, optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            List[List[OutputData]]: List of vectors.
+        """
+        with self._lock:
+            results = []
+            for record in self._matching(filters):
+                if limit is not None and len(results) >= limit:
+                    break
+                results.append(record)
+        return [results]
+
+    def list_page(self, filters: Optional[Dict] = None, cursor: Optional[str] = None, page_size: int = 100):
+        """
+        Return one page of vectors ordered by `created_at`, then id.
+
+        Args:
+            filters (Dict, optional): Filters to apply. Defaults to None.
+            cursor (str, optional): `next_cursor` of the previous page. Defaults to None.
+            page_size (int, optional): Number of vectors per page. Defaults to 100.
+
+        Returns:
+            tuple: `(records, next_cursor)`, where `next_cursor` is None on the last page.
+        """
+        with self._lock:
+            records = sorted(self._matching(filters), key=created_at_key)
+        if cursor is not None:
+            after = tuple(decode_cursor(cursor)["after"])
+            records = [record for record in records if created_at_key(record) > after]
+        page = records[:page_size]
+        next_cursor = encode_cursor({"after": list(created_at_key(page[-1]))}) if len(records) > page_size else None
+        return page, next_cursor
+
+    def count(self, filters: Optional[Dict] = None) -> int:
+        """
+        Count the vectors matching the filters.
+
+        Args:
+            filters (Dict, optional): Filters to apply. Defaults to None.
+
+        Returns:
+            int: Number of matching vectors.
+        """
+        with self._lock:
+            shards, remaining = self._route(filters)
+            return sum(int(np.count_nonzero(shard.mask(remaining))) for shard in shards)
+
+    def iter_all(self, filters: Optional[Dict] = None, batch_size: int = 100):
+        """
+        Iterate over every vector matching the filters.
+
+        Args:
+            filters (Dict, optional): Filters to apply. Defaults to None.
+            batch_size (int, optional): Unused, payloads are held in memory. Defaults to 100.
+
+        Yields:
+            OutputData: Stored vectors with their payloads.
+        """
+        # Snapshot the records so callers may delete while iterating
+        with self._lock:
+            records = list(self._matching(filters))
+        yield from records
+
+    def iter_vectors(self, filters: Optional[Dict] = None, batch_size: int = 100):
+        """
+        Iterate over `(id, vector, payload)` for every vector matching the filters.
+
+        Args:
+            filters (Dict, optional): Filters to apply. Defaults to None.
+            batch_size (int, optional): Unused, vectors are read from the shard matrices. Defaults to 100.
+
+        Yields:
+            tuple: `(id, vector, payload)` with the stored (normalized) vector.
+        """
+        with self._lock:
+            records = []
+            shards, remaining = self._route(filters)
+            for shard in shards:
+                for row in np.flatnonzero(shard.mask(remaining)):
+                    vector_id = shard.ids[row]
+                    records.append((vector_id, shard.vector(vector_id).tolist(), dict(shard.payloads[vector_id])))
+        yield from records
+
+    def compact(self):
+        """Compact every shard that has deleted rows."""
+        with self._lock:
+            for shard in list(self._shards.values()):
+                if shard.size > shard.live_count:
+                    shard.compact(self.initial_capacity)
+
+    def reset(self):
+        """Reset the collection by deleting and recreating it."""
+        logger.warning(f"Resetting collection {self.collection_name}...")
+        self.delete_col()
+        self.create_col(self.collection_name)
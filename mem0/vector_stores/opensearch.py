@@ -4,13 +4,14 @@ from typing import Any, Dict, List, Optional
 
 try:
     from opensearchpy import OpenSearch, RequestsHttpConnection
+    from opensearchpy.helpers import bulk
 except ImportError:
     raise ImportError("OpenSearch requires extra dependencies. Install with `pip install opensearch-py`") from None
 
 from pydantic import BaseModel
 
 from mem0.configs.vector_stores.opensearch import OpenSearchConfig
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import VectorStoreBase, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,15 @@ class OutputData(BaseModel):
 
 
 class OpenSearchDB(VectorStoreBase):
+    FILTER_FIELDS = ("user_id", "run_id", "agent_id")
+    # Engines that apply a filter inside the k-NN query instead of post-filtering the top k.
+    EFFICIENT_FILTER_ENGINES = ("faiss", "lucene")
+    # `list_page` order: dynamically mapped `payload.created_at`, then the keyword `id`.
+    PAGE_SORT = [
+        {"payload.created_at": {"order": "asc", "missing": "_first", "unmapped_type": "date"}},
+        {"id": {"order": "asc"}},
+    ]
+
     def __init__(self, **kwargs):
         config = OpenSearchConfig(**kwargs)
 
@@ -39,22 +49,67 @@ class OpenSearchDB(VectorStoreBase):
 
         self.collection_name = config.collection_name
         self.embedding_model_dims = config.embedding_model_dims
+        self.engine = config.engine
+        self.hnsw_m = config.hnsw_m
+        self.ef_construction = config.ef_construction
+        self.ef_search = config.ef_search
+        self.encoder = config.encoder
+        self.insert_batch_size = config.insert_batch_size
         self.create_col(self.collection_name, self.embedding_model_dims)
 
+    def _vector_mapping(self, dims: int) -> Dict:
+        """Build the knn_vector mapping for the configured engine, HNSW parameters and encoder."""
+        parameters = {}
+        if self.hnsw_m:
+            parameters["m"] = self.hnsw_m
+        if self.ef_construction:
+            parameters["ef_construction"] = self.ef_construction
+        if self.encoder == "fp16":
+            parameters["encoder"] = {"name": "sq", "parameters": {"type": "fp16"}}
+        elif self.encoder == "byte":
+            parameters["encoder"] = {"name": "sq"}
+
+        method = {"engine": self.engine, "name": "hnsw", "space_type": "cosinesimil"}
+        if parameters:
+            method["parameters"] = parameters
+        return {"type": "knn_vector", "dimension": dims, "method": method}
+
+    def _knn_settings(self) -> Dict:
+        settings = {"knn": True}
+        # Lucene reads ef_search per query rather than from the index settings.
+        if self.ef_search and self.engine != "lucene":
+            settings["knn.algo_param.ef_search"] = self.ef_search
+        return settings
+
+    def _filter_clauses(self, filters: Optional[Dict]) -> List[Dict]:
+        clauses = []
+        if filters:
+            for key in self.FILTER_FIELDS:
+                value = filters.get(key)
+                if value:
+                    clauses.append({"term": {f"payload.{key}.keyword": value}})
+        return clauses
+
+    def _find_doc_ids(self, vector_id: str) -> List[str]:
+        """Resolve a memory id to the OpenSearch document ids that store it."""
+        response = self.client.search(index=self.collection_name, body={"query": {"term": {"id": vector_id}}})
+        return [hit["_id"] for hit in response.get("hits", {}).get("hits", [])]
+
     def create_index(self) -> None:
         """Create OpenSearch index with proper mappings if it doesn't exist."""
         index_settings = {
             "settings": {
-                "index": {"number_of_replicas": 1, "number_of_shards": 5, "refresh_interval": "10s", "knn": True}
+                "index": {
+                    "number_of_replicas": 1,
+                    "number_of_shards": 5,
+                    "refresh_interval": "10s",
+                    **self._knn_settings(),
+                }
             },
             "mappings": {
                 "properties": {
                     "text": {"type": "text"},
-                    "vector_field": {
-                        "type": "knn_vector",
-                        "dimension": self.embedding_model_dims,
-                        "method": {"engine": "nmslib", "name": "hnsw", "space_type": "cosinesimil"},
-                    },
+                    "vector_field": self._vector_mapping(self.embedding_model_dims),
                     "metadata": {"type": "object", "properties": {"user_id": {"type": "keyword"}}},
                 }
             },
@@ -69,14 +124,10 @@ class OpenSearchDB(VectorStoreBase):
     def create_col(self, name: str, vector_size: int) -> None:
         """Create a new collection (index in OpenSearch)."""
         index_settings = {
-            "settings": {"index.knn": True},
+            "settings": {f"index.{key}": value for key, value in self._knn_settings().items()},
             "mappings": {
                 "properties": {
-                    "vector_field": {
-                        "type": "knn_vector",
-                        "dimension": vector_size,
-                        "method": {"engine": "nmslib", "name": "hnsw", "space_type": "cosinesimil"},
-                    },
+                    "vector_field": self._vector_mapping(vector_size),
                     "payload": {"type": "object"},
                     "id": {"type": "keyword"},
                 }
@@ -106,20 +157,23 @@ class OpenSearchDB(VectorStoreBase):
     def insert(
         self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
     ) -> List[OutputData]:
-        """Insert vectors into the index."""
+        """Insert vectors into the index with bulk requests of `insert_batch_size` documents."""
         if not ids:
             ids = [str(i) for i in range(len(vectors))]
 
         if payloads is None:
             payloads = [{} for _ in range(len(vectors))]
 
-        for i, (vec, id_) in enumerate(zip(vectors, ids)):
-            body = {
-                "vector_field": vec,
-                "payload": payloads[i],
-                "id": id_,
+        # Document ids are left to OpenSearch: Serverless vector collections reject custom _id values.
+        actions = [
+            {
+                "_op_type": "index",
+                "_index": self.collection_name,
+                "_source": {"vector_field": vec, "payload": payloads[i], "id": id_},
             }
-            self.client.index(index=self.collection_name, body=body)
+            for i, (vec, id_) in enumerate(zip(vectors, ids))
+        ]
+        bulk(self.client, actions, chunk_size=self.insert_batch_size)
 
         results = []
 
@@ -131,28 +185,25 @@ class OpenSearchDB(VectorStoreBase):
         """Search for similar vectors using OpenSearch k-NN search with optional filters."""
 
         # Base KNN query
-        knn_query = {
-            "knn": {
-                "vector_field": {
-                    "vector": vectors,
-                    "k": limit * 2,
-                }
-            }
+        knn_params = {
+            "vector": vectors,
+            "k": limit * 2,
         }
+        if self.ef_search and self.engine == "lucene":
+            knn_params["method_parameters"] = {"ef_search": self.ef_search}
+        knn_query = {"knn": {"vector_field": knn_params}}
 
         # Start building the full query
         query_body = {"size": limit * 2, "query": None}
 
-        # Prepare filter conditions if applicable
-        filter_clauses = []
-        if filters:
-            for key in ["user_id", "run_id", "agent_id"]:
-                value = filters.get(key)
-                if value:
-                    filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+        filter_clauses = self._filter_clauses(filters)
 
         # Combine knn with filters if needed
-        if filter_clauses:
+        if filter_clauses and self.engine in self.EFFICIENT_FILTER_ENGINES:
+            # Efficient k-NN filtering: the engine searches only documents matching the tenant filter.
+            knn_params["filter"] = {"bool": {"filter": filter_clauses}}
+            query_body["query"] = knn_query
+        elif filter_clauses:
             query_body["query"] = {"bool": {"must": knn_query, "filter": filter_clauses}}
         else:
             query_body["query"] = knn_query
@@ -170,32 +221,54 @@ class OpenSearchDB(VectorStoreBase):
     def delete(self, vector_id: str) -> None:
         """Delete a vector by custom ID."""
         # First, find the document by custom ID
-        search_query = {"query": {"term": {"id": vector_id}}}
-
-        response = self.client.search(index=self.collection_name, body=search_query)
-        hits = response.get("hits", {}).get("hits", [])
-
-        if not hits:
+        doc_ids = self._find_doc_ids(vector_id)
+        if not doc_ids:
             return
 
-        opensearch_id = hits[0]["_id"]
+        # Delete using the actual document IDs
+        bulk(
+            self.client,
+            [{"_op_type": "delete", "_index": self.collection_name, "_id": doc_id} for doc_id in doc_ids],
+        )
 
-        # Delete using the actual document ID
-        self.client.delete(index=self.collection_name, id=opensearch_id)
+    def _scan(self, filter_clauses: List[Dict], batch_size: int, source: bool = True):
+        """Yield every hit matching the filter clauses, paging with search_after on the keyword `id`."""
+        query = {"bool": {"filter": filter_clauses}} if filter_clauses else {"match_all": {}}
+        search_after = None
+        while True:
+            body = {"query": query, "size": batch_size, "sort": [{"id": "asc"}], "_source": source}
+            if search_after:
+                body["search_after"] = search_after
+            hits = self.client.search(index=self.collection_name, body=body)["hits"]["hits"]
+            if not hits:
+                break
+            yield from hits
+            search_after = hits[-1]["sort"]
+
+    def delete_many(self, filters: Dict) -> None:
+        """Delete every document matching the filters, paging with search_after and deleting in bulk."""
+        filter_clauses = self._filter_clauses(filters)
+        if not filter_clauses:
+            raise ValueError("delete_many requires at least one of user_id, agent_id or run_id")
+        doc_ids = [hit["_id"] for hit in self._scan(filter_clauses, self.insert_batch_size, source=False)]
+
+        if doc_ids:
+            bulk(
+                self.client,
+                [{"_op_type": "delete", "_index": self.collection_name, "_id": doc_id} for doc_id in doc_ids],
+                chunk_size=self.insert_batch_size,
+            )
+        logger.info(f"Deleted {len(doc_ids)} documents from index {self.collection_name}")
 
     def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None) -> None:
         """Update a vector and its payload using the custom 'id' field."""
 
         # First, find the document by custom ID
-        search_query = {"query": {"term": {"id": vector_id}}}
-
-        response = self.client.search(index=self.collection_name, body=search_query)
-        hits = response.get("hits", {}).get("hits", [])
-
-        if not hits:
+        doc_ids = self._find_doc_ids(vector_id)
+        if not doc_ids:
             return
 
-        opensearch_id = hits[0]["_id"]  # The actual document ID in OpenSearch
+        opensearch_id = doc_ids[0]  # The actual document ID in OpenSearch
 
         # Prepare updated fields
         doc = {}
@@ -206,7 +279,10 @@ class OpenSearchDB(VectorStoreBase):
 
         if doc:
             try:
-                response = self.client.update(index=self.collection_name, id=opensearch_id, body={"doc": doc})
+                bulk(
+                    self.client,
+                    [{"_op_type": "update", "_index": self.collection_name, "_id": opensearch_id, "doc": doc}],
+                )
             except Exception:
                 pass
 
@@ -249,12 +325,7 @@ class OpenSearchDB(VectorStoreBase):
             """List all memories with optional filters."""
             query: Dict = {"query": {"match_all": {}}}
 
-            filter_clauses = []
-            if filters:
-                for key in ["user_id", "run_id", "agent_id"]:
-                    value = filters.get(key)
-                    if value:
-                        filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+            filter_clauses = self._filter_clauses(filters)
 
             if filter_clauses:
                 query["query"] = {"bool": {"filter": filter_clauses}}
@@ -274,6 +345,37 @@ class OpenSearchDB(VectorStoreBase):
         except Exception:
             return []
 
+    def iter_all(self, filters: Optional[Dict] = None, batch_size: int = 100):
+        """Iterate over every memory matching the filters, paging with search_after."""
+        for hit in self._scan(self._filter_clauses(filters), batch_size):
+            yield OutputData(id=hit["_source"].get("id"), score=1.0, payload=hit["_source"].get("payload", {}))
+
+    def list_page(self, filters: Optional[Dict] = None, cursor: Optional[str] = None, page_size: int = 100):
+        """
+        Return one page of memories ordered by `payload.created_at` then id, paging with `search_after`.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            cursor (str, optional): `next_cursor` of the previous page. Defaults to None.
+            page_size (int, optional): Number of memories per page. Defaults to 100.
+
+        Returns:
+            tuple: `(records, next_cursor)`, where `next_cursor` is None on the last page.
+        """
+        filter_clauses = self._filter_clauses(filters)
+        query = {"bool": {"filter": filter_clauses}} if filter_clauses else {"match_all": {}}
+        body: Dict[str, Any] = {"query": query, "size": page_size + 1, "sort": self.PAGE_SORT}
+        if cursor is not None:
+            body["search_after"] = decode_cursor(cursor)["after"]
+
+        hits = self.client.search(index=self.collection_name, body=body)["hits"]["hits"]
+        records = [
+            OutputData(id=hit["_source"].get("id"), score=1.0, payload=hit["_source"].get("payload", {}))
+            for hit in hits[:page_size]
+        ]
+        next_cursor = encode_cursor({"after": hits[page_size - 1]["sort"]}) if len(hits) > page_size else None
+        return records, next_cursor
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -25,7 +25,7 @@ except ImportError:
             "Please install one of them using 'pip install psycopg' or 'pip install psycopg2'."
         )
 
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import VectorStoreBase, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +37,9 @@ class OutputData(BaseModel):
 
 
 class PGVector(VectorStoreBase):
+    # Search scores are cosine distances; Memory compares them to similarity thresholds as 1 - score
+    score_mode = "distance"
+
     def __init__(
         self,
         dbname,
@@ -182,7 +185,7 @@ class PGVector(VectorStoreBase):
         )
         self.conn.commit()
 
-    def search(self, query, vectors, limit=5, filters=None):
+    def search(self, query, vectors, limit=5, filters=None, threshold=None):
         """
         Search for similar vectors.
 
@@ -191,6 +194,8 @@ class PGVector(VectorStoreBase):
             vectors (List[float]): Query vector.
             limit (int, optional): Number of results to return. Defaults to 5.
             filters (Dict, optional): Filters to apply to the search. Defaults to None.
+            threshold (float, optional): Minimum cosine similarity, applied in SQL as a maximum cosine distance of
+                `1 - threshold`. Scores of the results remain distances. Defaults to None.
 
         Returns:
             list: Search results.
@@ -203,6 +208,10 @@ class PGVector(VectorStoreBase):
                 filter_conditions.append("payload->>%s = %s")
                 filter_params.extend([k, str(v)])
 
+        if threshold is not None:
+            filter_conditions.append("vector <=> %s::vector <= %s")
+            filter_params.extend([vectors, 1.0 - threshold])
+
         filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
 
         self.cur.execute(
@@ -347,6 +356,134 @@ class PGVector(VectorStoreBase):
         results = self.cur.fetchall()
         return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
 
+    def list_page(self, filters=None, cursor=None, page_size=100):
+        """
+        Return one page of vectors ordered by `created_at`, then id, with keyset pagination.
+
+        Args:
+            filters (Dict, optional): Filters to apply.
+            cursor (str, optional): `next_cursor` of the previous page. Defaults to None.
+            page_size (int, optional): Number of vectors per page. Defaults to 100.
+
+        Returns:
+            tuple: `(records, next_cursor)`, where `next_cursor` is None on the last page.
+        """
+        filter_conditions = []
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                filter_conditions.append("payload->>%s = %s")
+                filter_params.extend([k, str(v)])
+
+        if cursor is not None:
+            filter_conditions.append("(COALESCE(payload->>'created_at', ''), id) > (%s, %s::uuid)")
+            filter_params.extend(decode_cursor(cursor)["after"])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+
+        self.cur.execute(
+            f"""
+            SELECT id, payload, COALESCE(payload->>'created_at', '') AS created_at
+            FROM {self.collection_name}
+            {filter_clause}
+            ORDER BY created_at, id
+            LIMIT %s
+        """,
+            (*filter_params, page_size + 1),
+        )
+        rows = self.cur.fetchall()
+        page = rows[:page_size]
+        next_cursor = encode_cursor({"after": [page[-1][2], str(page[-1][0])]}) if len(rows) > page_size else None
+        return [OutputData(id=str(r[0]), score=None, payload=r[1]) for r in page], next_cursor
+
+    def count(self, filters=None):
+        """
+        Count the vectors matching the filters.
+
+        Args:
+            filters (Dict, optional): Filters to apply.
+
+        Returns:
+            int: Number of matching vectors.
+        """
+        filter_conditions = []
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                filter_conditions.append("payload->>%s = %s")
+                filter_params.extend([k, str(v)])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        self.cur.execute(f"SELECT COUNT(*) FROM {self.collection_name} {filter_clause}", tuple(filter_params))
+        return self.cur.fetchone()[0]
+
+    def iter_all(self, filters=None, batch_size=100):
+        """
+        Iterate over every vector matching the filters using keyset pagination on the primary key.
+
+        Args:
+            filters (Dict, optional): Filters to apply.
+            batch_size (int, optional): Number of rows fetched per query. Defaults to 100.
+
+        Yields:
+            OutputData: Stored vectors with their payloads.
+        """
+        for r in self._iter_rows(filters, batch_size, with_vectors=False):
+            yield OutputData(id=str(r[0]), score=None, payload=r[1])
+
+    def iter_vectors(self, filters=None, batch_size=100):
+        """
+        Iterate over `(id, vector, payload)` for every row matching the filters.
+
+        Args:
+            filters (Dict, optional): Filters to apply.
+            batch_size (int, optional): Number of rows fetched per query. Defaults to 100.
+
+        Yields:
+            tuple: `(id, vector, payload)` for each row.
+        """
+        for r in self._iter_rows(filters, batch_size, with_vectors=True):
+            # Without the pgvector type adapter the vector column is returned as its text form "[x,y,...]"
+            vector = json.loads(r[2]) if isinstance(r[2], str) else list(r[2])
+            yield str(r[0]), vector, r[1]
+
+    def _iter_rows(self, filters, batch_size, with_vectors):
+        filter_conditions = []
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                filter_conditions.append("payload->>%s = %s")
+                filter_params.extend([k, str(v)])
+
+        columns = "id, payload, vector" if with_vectors else "id, payload"
+        last_id = None
+        while True:
+            conditions = list(filter_conditions)
+            params = list(filter_params)
+            if last_id is not None:
+                conditions.append("id > %s")
+                params.append(last_id)
+            filter_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+
+            self.cur.execute(
+                f"""
+                SELECT {columns}
+                FROM {self.collection_name}
+                {filter_clause}
+                ORDER BY id
+                LIMIT %s
+            """,
+                (*params, batch_size),
+            )
+            rows = self.cur.fetchall()
+            yield from rows
+            if len(rows) < batch_size:
+                break
+            last_id = rows[-1][0]
+
     def __del__(self):
         """
         Close the database connection when the object is deleted.
@@ -1,5 +1,6 @@
 import logging
 import os
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel
@@ -15,6 +16,9 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of ids whose namespace is remembered, least recently used first out
+ID_NAMESPACE_CACHE_SIZE = 100000
+
 
 class OutputData(BaseModel):
     id: Optional[str]  # memory id
@@ -37,6 +41,8 @@ class PineconeDB(VectorStoreBase):
         batch_size: int,
         extra_params: Optional[Dict[str, Any]],
         namespace: Optional[str] = None,
+        namespace_per_user: bool = False,
+        pool_threads: Optional[int] = None,
     ):
         """
         Initialize the Pinecone vector store.
@@ -54,6 +60,9 @@ class PineconeDB(VectorStoreBase):
             batch_size (int, optional): Batch size for operations. Defaults to 100.
             extra_params (Dict, optional): Additional parameters for Pinecone client. Defaults to None.
             namespace (str, optional): Namespace for the collection. Defaults to None.
+            namespace_per_user (bool, optional): Store each user_id in its own namespace, prefixed by
+                `namespace` when set. Defaults to False.
+            pool_threads (int, optional): Threads used for parallel upserts during bulk inserts. Defaults to None.
         """
         if client:
             self.client = client
@@ -76,6 +85,10 @@ class PineconeDB(VectorStoreBase):
         self.metric = metric
         self.batch_size = batch_size
         self.namespace = namespace
+        self.namespace_per_user = namespace_per_user
+        self.pool_threads = pool_threads
+        # Namespace of every id seen by this instance, so id-only calls avoid scanning tenant namespaces.
+        self._id_namespaces: "OrderedDict[str, Optional[str]]" = OrderedDict()
 
         self.sparse_encoder = None
         if self.hybrid_search:
@@ -99,10 +112,12 @@ class PineconeDB(VectorStoreBase):
             metric (str, optional): Distance metric for vector similarity. Defaults to "cosine".
         """
         existing_indexes = self.list_cols().names()
+        index_kwargs = {"pool_threads": self.pool_threads} if self.pool_threads else {}
 
         if self.collection_name in existing_indexes:
             logger.debug(f"Index {self.collection_name} already exists. Skipping creation.")
-            self.index = self.client.Index(self.collection_name)
+            self.index = self.client.Index(self.collection_name, **index_kwargs)
+            self.dimension = self.client.describe_index(self.collection_name).dimension
             return
 
         if self.serverless_config:
@@ -119,7 +134,58 @@ class PineconeDB(VectorStoreBase):
             spec=spec,
         )
 
-        self.index = self.client.Index(self.collection_name)
+        self.index = self.client.Index(self.collection_name, **index_kwargs)
+        self.dimension = vector_size
+
+    def _namespace_for(self, values: Optional[Dict]) -> Optional[str]:
+        """Return the namespace holding records with the given filters or payload."""
+        user_id = (values or {}).get("user_id")
+        if not self.namespace_per_user or not user_id:
+            return self.namespace
+        return f"{self.namespace}-{user_id}" if self.namespace else str(user_id)
+
+    def _tenant_filters(self, filters: Optional[Dict]) -> Optional[Dict]:
+        """Drop the user_id filter when it is already enforced by the namespace."""
+        if self.namespace_per_user and filters and filters.get("user_id"):
+            return {key: value for key, value in filters.items() if key != "user_id"}
+        return filters
+
+    def _namespaces_for(self, filters: Optional[Dict]) -> List[Optional[str]]:
+        """Return every namespace a read with the given filters must cover."""
+        if not self.namespace_per_user or (filters and filters.get("user_id")):
+            return [self._namespace_for(filters)]
+        # Without a user_id the read spans the base namespace and every per-user namespace
+        prefix = f"{self.namespace}-" if self.namespace else ""
+        stats = self.index.describe_index_stats()
+        tenants = sorted(
+            namespace for namespace in stats.namespaces or {} if namespace and namespace.startswith(prefix)
+        )
+        return [self.namespace] + tenants
+
+    def _remember(self, vector_ids, namespace: Optional[str]):
+        for vector_id in vector_ids:
+            self._id_namespaces[vector_id] = namespace
+            self._id_namespaces.move_to_end(vector_id)
+        while len(self._id_namespaces) > ID_NAMESPACE_CACHE_SIZE:
+            self._id_namespaces.popitem(last=False)
+
+    def _locate(self, vector_id: str) -> Optional[str]:
+        """Find the namespace of a vector addressed only by id."""
+        if not self.namespace_per_user:
+            return self.namespace
+        if vector_id in self._id_namespaces:
+            self._id_namespaces.move_to_end(vector_id)
+            return self._id_namespaces[vector_id]
+
+        prefix = f"{self.namespace}-" if self.namespace else ""
+        stats = self.index.describe_index_stats()
+        for namespace in stats.namespaces or {}:
+            if not namespace.startswith(prefix):
+                continue
+            if vector_id in self.index.fetch(ids=[vector_id], namespace=namespace).vectors:
+                self._remember([vector_id], namespace)
+                return namespace
+        return self.namespace
 
     def insert(
         self,
@@ -136,7 +202,14 @@ class PineconeDB(VectorStoreBase):
             ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
         """
         logger.info(f"Inserting {len(vectors)} vectors into index {self.collection_name}")
-        items = []
+        batches: Dict[Optional[str], List[Dict]] = {}
+        pending = []
+
+        def flush(namespace, items):
+            if self.pool_threads:
+                pending.append(self.index.upsert(vectors=items, namespace=namespace, async_req=True))
+            else:
+                self.index.upsert(vectors=items, namespace=namespace)
 
         for idx, vector in enumerate(vectors):
             item_id = str(ids[idx]) if ids is not None else str(idx)
@@ -148,14 +221,23 @@ class PineconeDB(VectorStoreBase):
                 sparse_vector = self.sparse_encoder.encode_documents(payload["text"])
                 vector_record["sparse_values"] = sparse_vector
 
+            namespace = self._namespace_for(payload)
+            if self.namespace_per_user:
+                self._remember([item_id], namespace)
+            items = batches.setdefault(namespace, [])
             items.append(vector_record)
 
             if len(items) >= self.batch_size:
-                self.index.upsert(vectors=items, namespace=self.namespace)
-                items = []
+                flush(namespace, items)
+                batches[namespace] = []
+
+        for namespace, items in batches.items():
+            if items:
+                flush(namespace, items)
 
-        if items:
-            self.index.upsert(vectors=items, namespace=self.namespace)
+        # Wait for the parallel upserts so errors surface here
+        for result in pending:
+            result.get()
 
     def _parse_output(self, data: Dict) -> List[OutputData]:
         """
@@ -215,10 +297,14 @@ class PineconeDB(VectorStoreBase):
             limit (int, optional): Number of results to return. Defaults to 5.
             filters (dict, optional): Filters to apply to the search. Defaults to None.
 
+        With `namespace_per_user` and no user_id filter, every per-user namespace is queried and the results are
+        merged by score.
+
         Returns:
             list: Search results.
         """
-        filter_dict = self._create_filter(filters) if filters else None
+        namespaces = self._namespaces_for(filters)
+        filter_dict = self._create_filter(self._tenant_filters(filters)) if filters else None
 
         query_params = {
             "vector": vectors,
@@ -236,9 +322,19 @@ class PineconeDB(VectorStoreBase):
                 sparse_vector = self.sparse_encoder.encode_queries(query_text)
                 query_params["sparse_vector"] = sparse_vector
 
-        response = self.index.query(**query_params, namespace=self.namespace)
-
-        results = self._parse_output(response.matches)
+        results = []
+        for namespace in namespaces:
+            response = self.index.query(**query_params, namespace=namespace)
+            matches = self._parse_output(response.matches)
+            if self.namespace_per_user:
+                self._remember([match.id for match in matches], namespace)
+            results.extend(matches)
+
+        if len(namespaces) > 1:
+            # Euclidean scores are distances, every other metric ranks higher scores first
+            reverse = self.metric != "euclidean"
+            results.sort(key=lambda result: result.score if result.score is not None else 0.0, reverse=reverse)
+            results = results[:limit]
         return results
 
     def delete(self, vector_id: Union[str, int]):
@@ -248,7 +344,9 @@ class PineconeDB(VectorStoreBase):
         Args:
             vector_id (Union[str, int]): ID of the vector to delete.
         """
-        self.index.delete(ids=[str(vector_id)], namespace=self.namespace)
+        vector_id = str(vector_id)
+        self.index.delete(ids=[vector_id], namespace=self._locate(vector_id))
+        self._id_namespaces.pop(vector_id, None)
 
     def update(self, vector_id: Union[str, int], vector: Optional[List[float]] = None, payload: Optional[Dict] = None):
         """
@@ -273,7 +371,11 @@ class PineconeDB(VectorStoreBase):
                 sparse_vector = self.sparse_encoder.encode_documents(payload["text"])
                 item["sparse_values"] = sparse_vector
 
-        self.index.upsert(vectors=[item], namespace=self.namespace)
+        if payload is not None and self.namespace_per_user and payload.get("user_id"):
+            namespace = self._namespace_for(payload)
+        else:
+            namespace = self._locate(str(vector_id))
+        self.index.upsert(vectors=[item], namespace=namespace)
 
     def get(self, vector_id: Union[str, int]) -> OutputData:
         """
@@ -286,7 +388,7 @@ class PineconeDB(VectorStoreBase):
             dict: Retrieved vector or None if not found.
         """
         try:
-            response = self.index.fetch(ids=[str(vector_id)], namespace=self.namespace)
+            response = self.index.fetch(ids=[str(vector_id)], namespace=self._locate(str(vector_id)))
             if str(vector_id) in response.vectors:
                 return self._parse_output(response.vectors[str(vector_id)])
             return None
@@ -320,51 +422,113 @@ class PineconeDB(VectorStoreBase):
         """
         return self.client.describe_index(self.collection_name)
 
-    def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
+    def _list_ids(self, namespace: Optional[str], limit: int) -> List[str]:
+        """Page through the ids of a namespace without transferring vectors."""
+        ids: List[str] = []
+        pagination_token = None
+        while len(ids) < limit:
+            page = self.index.list_paginated(
+                namespace=namespace, limit=min(100, limit - len(ids)), pagination_token=pagination_token
+            )
+            ids.extend(vector.id for vector in page.vectors)
+            pagination_token = page.pagination.next if page.pagination else None
+            if not pagination_token:
+                break
+        return ids
+
+    def list(
+        self, filters: Optional[Dict] = None, limit: int = 100, include_values: bool = False
+    ) -> List[OutputData]:
         """
         List vectors in an index with optional filtering.
 
+        Unfiltered listings (including a user_id filter served by a per-user namespace) page through ids and fetch
+        them in batches; other filters, and pod indexes that cannot list ids, use a zero-vector query. With
+        `namespace_per_user` and no user_id filter, the per-user namespaces are read in turn up to `limit`.
+
         Args:
             filters (dict, optional): Filters to apply to the list. Defaults to None.
             limit (int, optional): Number of vectors to return. Defaults to 100.
+            include_values (bool, optional): Request vector values from filtered queries. Defaults to False.
 
         Returns:
             dict: List of vectors with their metadata.
         """
-        filter_dict = self._create_filter(filters) if filters else None
-
-        stats = self.index.describe_index_stats()
-        dimension = stats.dimension
-
-        zero_vector = [0.0] * dimension
+        try:
+            namespaces = self._namespaces_for(filters)
+            filters = self._tenant_filters(filters)
+            results = []
+            for namespace in namespaces:
+                if len(results) >= limit:
+                    break
+                listed = self._list_namespace(namespace, filters, limit - len(results), include_values)
+                if self.namespace_per_user:
+                    self._remember([result.id for result in listed], namespace)
+                results.extend(listed)
+            return [results]
+        except Exception as e:
+            logger.error(f"Error listing vectors: {e}")
+            return [[]]
 
+    def _list_namespace(
+        self, namespace: Optional[str], filters: Optional[Dict], limit: int, include_values: bool
+    ) -> List[OutputData]:
+        """List up to `limit` vectors of a single namespace."""
+        if not filters:
+            try:
+                return self._fetch_listed(namespace, limit)
+            except Exception as e:
+                # list_paginated is only served by serverless indexes
+                logger.debug(f"Listing ids failed, falling back to a query: {e}")
         query_params = {
-            "vector": zero_vector,
+            "vector": [0.0] * self.dimension,
             "top_k": limit,
             "include_metadata": True,
-            "include_values": True,
+            "include_values": include_values,
         }
+        if filters:
+            query_params["filter"] = self._create_filter(filters)
+        response = self.index.query(**query_params, namespace=namespace)
+        return self._parse_output(response.to_dict()["matches"])
+
+    def _fetch_listed(self, namespace: Optional[str], limit: int) -> List[OutputData]:
+        """Page through the ids of a namespace, then fetch them in batches."""
+        results = []
+        ids = self._list_ids(namespace, limit)
+        for start in range(0, len(ids), self.batch_size):
+            batch = ids[start : start + self.batch_size]
+            response = self.index.fetch(ids=batch, namespace=namespace)
+            results.extend(
+                self._parse_output(response.vectors[vector_id]) for vector_id in batch if vector_id in response.vectors
+            )
+        return results
 
-        if filter_dict:
-            query_params["filter"] = filter_dict
+    def count(self, filters: Optional[Dict] = None) -> int:
+        """
+        Count the vectors matching the filters.
 
-        try:
-            response = self.index.query(**query_params, namespace=self.namespace)
-            response = response.to_dict()
-            results = self._parse_output(response["matches"])
-            return [results]
-        except Exception as e:
-            logger.error(f"Error listing vectors: {e}")
-            return {"points": [], "next_page_token": None}
+        Unfiltered counts, and user_id counts served by a per-user namespace, read the index statistics; other
+        filters count the records returned by `iter_all`.
 
-    def count(self) -> int:
-        """
-        Count number of vectors in the index.
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
 
         Returns:
-            int: Total number of vectors.
+            int: Number of matching vectors.
         """
+        if self._tenant_filters(filters):
+            return super().count(filters=filters)
         stats = self.index.describe_index_stats()
+        if self.namespace_per_user and filters and filters.get("user_id"):
+            summary = (stats.namespaces or {}).get(self._namespace_for(filters))
+            return (summary.vector_count or 0) if summary else 0
+        if self.namespace_per_user:
+            prefix = f"{self.namespace}-" if self.namespace else ""
+            return sum(
+                summary.vector_count or 0
+                for namespace, summary in (stats.namespaces or {}).items()
+                if namespace.startswith(prefix)
+            )
         if self.namespace:
             # Safely get the namespace stats and return vector_count, defaulting to 0 if not found
             namespace_summary = (stats.namespaces or {}).get(self.namespace)
@@ -379,4 +543,5 @@ class PineconeDB(VectorStoreBase):
         """
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
+        self._id_namespaces.clear()
         self.create_col(self.embedding_model_dims, self.metric)
@@ -1,23 +1,91 @@
+import asyncio
 import logging
 import os
 import shutil
+from collections import defaultdict
 
-from qdrant_client import QdrantClient
+import numpy as np
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
+    HnswConfigDiff,
+    KeywordIndexParams,
     MatchValue,
     PointIdsList,
     PointStruct,
     Range,
+    ScoredPoint,
     VectorParams,
 )
 
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import VectorStoreBase, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
+FILTER_INDEX_FIELDS = ["user_id", "agent_id", "run_id", "actor_id"]
+TENANT_FIELD = "user_id"
+
+
+class _LocalPayloadIndex:
+    """
+    In-process inverted index over the session id fields of an embedded (``path=``) Qdrant collection.
+
+    Local Qdrant has no payload indexes, so every filtered query evaluates the filter against every
+    point. This index maps ``field -> value -> point ids`` so filtered reads can be narrowed to the
+    matching tenant before any vector is touched.
+    """
+
+    def __init__(self, fields):
+        self.fields = list(fields)
+        self._index = {field: defaultdict(set) for field in self.fields}
+        self._payloads = {}
+
+    def add(self, point_id, payload):
+        self.remove(point_id)
+        payload = payload or {}
+        indexed = {}
+        for field in self.fields:
+            value = payload.get(field)
+            if isinstance(value, (str, int)):
+                self._index[field][value].add(point_id)
+                indexed[field] = value
+        self._payloads[point_id] = indexed
+
+    def remove(self, point_id):
+        indexed = self._payloads.pop(point_id, None)
+        if not indexed:
+            return
+        for field, value in indexed.items():
+            ids = self._index[field].get(value)
+            if ids is not None:
+                ids.discard(point_id)
+                if not ids:
+                    del self._index[field][value]
+
+    def clear(self):
+        for field in self.fields:
+            self._index[field].clear()
+        self._payloads.clear()
+
+    def candidates(self, filters: dict):
+        """
+        Resolve the indexed equality conditions of ``filters`` to a set of point ids.
+
+        Returns:
+            set or None: Matching point ids, or None when no condition can be answered by the index.
+        """
+        result = None
+        for key, value in (filters or {}).items():
+            if key not in self._index or not isinstance(value, (str, int)):
+                continue
+            ids = self._index[key].get(value, set())
+            result = set(ids) if result is None else result & ids
+            if not result:
+                return set()
+        return result
+
 
 class Qdrant(VectorStoreBase):
     def __init__(
@@ -31,6 +99,14 @@ class Qdrant(VectorStoreBase):
         url: str = None,
         api_key: str = None,
         on_disk: bool = False,
+        payload_m: int = None,
+        hnsw_m: int = None,
+        prefer_grpc: bool = False,
+        grpc_port: int = None,
+        async_client: AsyncQdrantClient = None,
+        wait: bool = True,
+        upload_batch_size: int = 256,
+        upload_parallel: int = 1,
     ):
         """
         Initialize the Qdrant vector store.
@@ -45,7 +121,20 @@ class Qdrant(VectorStoreBase):
             url (str, optional): Full URL for Qdrant server. Defaults to None.
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
+            payload_m (int, optional): HNSW `payload_m` used to build per-tenant graphs on the server. Defaults to None.
+            hnsw_m (int, optional): HNSW `m` of the global graph. Set to 0 together with `payload_m` to build
+                only per-tenant graphs. Defaults to None.
+            prefer_grpc (bool, optional): Talk to the Qdrant server over gRPC instead of REST. Defaults to False.
+            grpc_port (int, optional): gRPC port of the Qdrant server. Defaults to None (client default 6334).
+            async_client (AsyncQdrantClient, optional): Existing async client used by `AsyncMemory`. Defaults to None.
+            wait (bool, optional): Wait for upserts to be applied before returning. Set to False for
+                fire-and-forget ingestion. Defaults to True.
+            upload_batch_size (int, optional): Inserts larger than this go through batched `upload_points`.
+                Defaults to 256.
+            upload_parallel (int, optional): Number of parallel workers for batched uploads. Defaults to 1.
         """
+        self._client_params = None
+        self._async_client = async_client
         if client:
             self.client = client
             self.is_local = False
@@ -58,7 +147,7 @@ class Qdrant(VectorStoreBase):
             if host and port:
                 params["host"] = host
                 params["port"] = port
-            
+
             if not params:
                 params["path"] = path
                 self.is_local = True
@@ -67,14 +156,37 @@ class Qdrant(VectorStoreBase):
                         shutil.rmtree(path)
             else:
                 self.is_local = False
+                if prefer_grpc:
+                    params["prefer_grpc"] = True
+                    if grpc_port:
+                        params["grpc_port"] = grpc_port
+                self._client_params = params
 
             self.client = QdrantClient(**params)
 
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.on_disk = on_disk
+        self.payload_m = payload_m
+        self.hnsw_m = hnsw_m
+        self.wait = wait
+        self.upload_batch_size = upload_batch_size
+        self.upload_parallel = upload_parallel
+        self._local_index = _LocalPayloadIndex(FILTER_INDEX_FIELDS) if self.is_local else None
         self.create_col(embedding_model_dims, on_disk)
 
+    @property
+    def async_client(self):
+        """
+        Native async client for `AsyncMemory`, created lazily from the server connection parameters.
+
+        Returns None for embedded (`path=`) collections and for user supplied sync clients, in which case
+        the `async_*` methods run the sync implementation in a worker thread.
+        """
+        if self._async_client is None and self._client_params is not None:
+            self._async_client = AsyncQdrantClient(**self._client_params)
+        return self._async_client
+
     def create_col(self, vector_size: int, on_disk: bool, distance: Distance = Distance.COSINE):
         """
         Create a new collection.
@@ -92,32 +204,54 @@ class Qdrant(VectorStoreBase):
                 self._create_filter_indexes()
                 return
 
+        collection_params = {}
+        if self.payload_m is not None or self.hnsw_m is not None:
+            collection_params["hnsw_config"] = HnswConfigDiff(m=self.hnsw_m, payload_m=self.payload_m)
+
         self.client.create_collection(
             collection_name=self.collection_name,
             vectors_config=VectorParams(size=vector_size, distance=distance, on_disk=on_disk),
+            **collection_params,
         )
         self._create_filter_indexes()
 
     def _create_filter_indexes(self):
         """Create indexes for commonly used filter fields to enable filtering."""
-        # Only create payload indexes for remote Qdrant servers
+        # Local Qdrant does not support payload indexes, keep an in-process one instead
         if self.is_local:
-            logger.debug("Skipping payload index creation for local Qdrant (not supported)")
+            self._rebuild_local_index()
             return
-            
-        common_fields = ["user_id", "agent_id", "run_id", "actor_id"]
-        
-        for field in common_fields:
+
+        for field in FILTER_INDEX_FIELDS:
+            # The tenant field gets a tenant index so the server co-locates and builds HNSW per tenant
+            field_schema = KeywordIndexParams(type="keyword", is_tenant=True) if field == TENANT_FIELD else "keyword"
             try:
                 self.client.create_payload_index(
                     collection_name=self.collection_name,
                     field_name=field,
-                    field_schema="keyword"
+                    field_schema=field_schema,
                 )
                 logger.info(f"Created index for {field} in collection {self.collection_name}")
             except Exception as e:
                 logger.debug(f"Index for {field} might already exist: {e}")
 
+    def _rebuild_local_index(self):
+        """Populate the in-process payload index from the points already stored in the local collection."""
+        self._local_index.clear()
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=1000,
+                offset=offset,
+                with_payload=FILTER_INDEX_FIELDS,
+                with_vectors=False,
+            )
+            for point in points:
+                self._local_index.add(point.id, point.payload)
+            if offset is None:
+                break
+
     def insert(self, vectors: list, payloads: list = None, ids: list = None):
         """
         Insert vectors into a collection.
@@ -128,7 +262,24 @@ class Qdrant(VectorStoreBase):
             ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
         """
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
-        points = [
+        points = self._build_points(vectors, payloads, ids)
+        if len(points) > self.upload_batch_size:
+            self.client.upload_points(
+                collection_name=self.collection_name,
+                points=points,
+                batch_size=self.upload_batch_size,
+                parallel=self.upload_parallel,
+                wait=self.wait,
+            )
+        else:
+            self.client.upsert(collection_name=self.collection_name, points=points, wait=self.wait)
+        if self._local_index is not None:
+            for point in points:
+                self._local_index.add(point.id, point.payload)
+
+    @staticmethod
+    def _build_points(vectors: list, payloads: list = None, ids: list = None) -> list:
+        return [
             PointStruct(
                 id=idx if ids is None else ids[idx],
                 vector=vector,
@@ -136,7 +287,6 @@ class Qdrant(VectorStoreBase):
             )
             for idx, vector in enumerate(vectors)
         ]
-        self.client.upsert(collection_name=self.collection_name, points=points)
 
     def _create_filter(self, filters: dict) -> Filter:
         """
@@ -159,7 +309,59 @@ class Qdrant(VectorStoreBase):
                 conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
         return Filter(must=conditions) if conditions else None
 
-    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> list:
+    @staticmethod
+    def _matches_filters(payload: dict, filters: dict) -> bool:
+        """Evaluate `filters` against a payload with the same semantics as `_create_filter`."""
+        payload = payload or {}
+        for key, value in filters.items():
+            if isinstance(value, dict) and "gte" in value and "lte" in value:
+                field_value = payload.get(key)
+                if field_value is None or not value["gte"] <= field_value <= value["lte"]:
+                    return False
+            elif payload.get(key) != value:
+                return False
+        return True
+
+    def _local_candidates(self, filters: dict, with_vectors: bool = False):
+        """
+        Fetch the points matching `filters` through the in-process payload index.
+
+        Returns:
+            list or None: Matching records, or None when the index cannot narrow the query.
+        """
+        if self._local_index is None or not filters:
+            return None
+        candidate_ids = self._local_index.candidates(filters)
+        if candidate_ids is None:
+            return None
+        if not candidate_ids:
+            return []
+        records = self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=sorted(candidate_ids, key=str),
+            with_payload=True,
+            with_vectors=with_vectors,
+        )
+        return [record for record in records if self._matches_filters(record.payload, filters)]
+
+    def _local_search(self, vectors: list, records: list, limit: int, threshold: float = None) -> list:
+        """Score the candidate records exactly against the query vector (cosine similarity)."""
+        if not records:
+            return []
+        matrix = np.asarray([record.vector for record in records], dtype=np.float32)
+        query = np.asarray(vectors, dtype=np.float32)
+        matrix_norms = np.linalg.norm(matrix, axis=1)
+        matrix_norms[matrix_norms == 0] = 1.0
+        query_norm = np.linalg.norm(query) or 1.0
+        scores = (matrix @ query) / (matrix_norms * query_norm)
+        top = np.argsort(-scores)[:limit]
+        if threshold is not None:
+            top = [i for i in top if scores[i] >= threshold]
+        return [
+            ScoredPoint(id=records[i].id, version=0, score=float(scores[i]), payload=records[i].payload) for i in top
+        ]
+
+    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None, threshold: float = None) -> list:
         """
         Search for similar vectors.
 
@@ -168,16 +370,22 @@ class Qdrant(VectorStoreBase):
             vectors (list): Query vector.
             limit (int, optional): Number of results to return. Defaults to 5.
             filters (dict, optional): Filters to apply to the search. Defaults to None.
+            threshold (float, optional): Minimum score, applied by Qdrant as `score_threshold`. Defaults to None.
 
         Returns:
             list: Search results.
         """
+        records = self._local_candidates(filters, with_vectors=True)
+        if records is not None:
+            return self._local_search(vectors, records, limit, threshold)
+
         query_filter = self._create_filter(filters) if filters else None
         hits = self.client.query_points(
             collection_name=self.collection_name,
             query=vectors,
             query_filter=query_filter,
             limit=limit,
+            score_threshold=threshold,
         )
         return hits.points
 
@@ -194,6 +402,8 @@ class Qdrant(VectorStoreBase):
                 points=[vector_id],
             ),
         )
+        if self._local_index is not None:
+            self._local_index.remove(vector_id)
 
     def update(self, vector_id: int, vector: list = None, payload: dict = None):
         """
@@ -205,7 +415,9 @@ class Qdrant(VectorStoreBase):
             payload (dict, optional): Updated payload. Defaults to None.
         """
         point = PointStruct(id=vector_id, vector=vector, payload=payload)
-        self.client.upsert(collection_name=self.collection_name, points=[point])
+        self.client.upsert(collection_name=self.collection_name, points=[point], wait=self.wait)
+        if self._local_index is not None:
+            self._local_index.add(vector_id, payload)
 
     def get(self, vector_id: int) -> dict:
         """
@@ -232,6 +444,8 @@ class Qdrant(VectorStoreBase):
     def delete_col(self):
         """Delete a collection."""
         self.client.delete_collection(collection_name=self.collection_name)
+        if self._local_index is not None:
+            self._local_index.clear()
 
     def col_info(self) -> dict:
         """
@@ -253,6 +467,10 @@ class Qdrant(VectorStoreBase):
         Returns:
             list: List of vectors.
         """
+        records = self._local_candidates(filters)
+        if records is not None:
+            return records[:limit], None
+
         query_filter = self._create_filter(filters) if filters else None
         result = self.client.scroll(
             collection_name=self.collection_name,
@@ -263,6 +481,160 @@ class Qdrant(VectorStoreBase):
         )
         return result
 
+    def list_page(self, filters: dict = None, cursor: str = None, page_size: int = 100):
+        """
+        Return one page of points and the cursor of the next page, using scroll offsets.
+
+        Pages follow Qdrant's point id order; only the in-process payload index path orders by `created_at`.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            cursor (str, optional): `next_cursor` of the previous page. Defaults to None.
+            page_size (int, optional): Number of points per page. Defaults to 100.
+
+        Returns:
+            tuple: `(records, next_cursor)`, where `next_cursor` is None on the last page.
+        """
+        if self._local_index is not None and filters:
+            return super().list_page(filters=filters, cursor=cursor, page_size=page_size)
+
+        points, offset = self.client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=self._create_filter(filters) if filters else None,
+            limit=page_size,
+            offset=decode_cursor(cursor)["offset"] if cursor is not None else None,
+            with_payload=True,
+            with_vectors=False,
+        )
+        return points, encode_cursor({"offset": offset}) if offset is not None else None
+
+    def count(self, filters: dict = None) -> int:
+        """
+        Count the points matching the filters exactly.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+
+        Returns:
+            int: Number of matching points.
+        """
+        result = self.client.count(
+            collection_name=self.collection_name,
+            count_filter=self._create_filter(filters) if filters else None,
+            exact=True,
+        )
+        return result.count
+
+    def iter_all(self, filters: dict = None, batch_size: int = 100):
+        """
+        Iterate over every vector matching the filters using scroll offsets.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            batch_size (int, optional): Number of points fetched per scroll request. Defaults to 100.
+
+        Yields:
+            Record: Points with their payloads.
+        """
+        yield from self._scroll(filters, batch_size, with_vectors=False)
+
+    def iter_vectors(self, filters: dict = None, batch_size: int = 100):
+        """
+        Iterate over `(id, vector, payload)` for every point matching the filters.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            batch_size (int, optional): Number of points fetched per scroll request. Defaults to 100.
+
+        Yields:
+            tuple: `(id, vector, payload)` for each point.
+        """
+        for point in self._scroll(filters, batch_size, with_vectors=True):
+            yield str(point.id), point.vector, point.payload
+
+    def _scroll(self, filters: dict, batch_size: int, with_vectors: bool):
+        records = self._local_candidates(filters, with_vectors=with_vectors)
+        if records is not None:
+            yield from records
+            return
+
+        query_filter = self._create_filter(filters) if filters else None
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=query_filter,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=with_vectors,
+            )
+            yield from points
+            if offset is None:
+                break
+
+    async def async_insert(self, vectors: list, payloads: list = None, ids: list = None):
+        """Async variant of `insert` using the native async client when available."""
+        # Bulk uploads are driven by blocking worker processes, so they always run in a thread
+        if self.async_client is None or len(vectors) > self.upload_batch_size:
+            return await asyncio.to_thread(self.insert, vectors=vectors, payloads=payloads, ids=ids)
+        points = self._build_points(vectors, payloads, ids)
+        await self.async_client.upsert(collection_name=self.collection_name, points=points, wait=self.wait)
+
+    async def async_search(
+        self, query: str, vectors: list, limit: int = 5, filters: dict = None, threshold: float = None
+    ) -> list:
+        """Async variant of `search` using the native async client when available."""
+        if self.async_client is None:
+            return await asyncio.to_thread(
+                self.search, query=query, vectors=vectors, limit=limit, filters=filters, threshold=threshold
+            )
+        hits = await self.async_client.query_points(
+            collection_name=self.collection_name,
+            query=vectors,
+            query_filter=self._create_filter(filters) if filters else None,
+            limit=limit,
+            score_threshold=threshold,
+        )
+        return hits.points
+
+    async def async_delete(self, vector_id: int):
+        """Async variant of `delete` using the native async client when available."""
+        if self.async_client is None:
+            return await asyncio.to_thread(self.delete, vector_id=vector_id)
+        await self.async_client.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(points=[vector_id]),
+        )
+
+    async def async_update(self, vector_id: int, vector: list = None, payload: dict = None):
+        """Async variant of `update` using the native async client when available."""
+        if self.async_client is None:
+            return await asyncio.to_thread(self.update, vector_id=vector_id, vector=vector, payload=payload)
+        point = PointStruct(id=vector_id, vector=vector, payload=payload)
+        await self.async_client.upsert(collection_name=self.collection_name, points=[point], wait=self.wait)
+
+    async def async_get(self, vector_id: int) -> dict:
+        """Async variant of `get` using the native async client when available."""
+        if self.async_client is None:
+            return await asyncio.to_thread(self.get, vector_id=vector_id)
+        result = await self.async_client.retrieve(
+            collection_name=self.collection_name, ids=[vector_id], with_payload=True
+        )
+        return result[0] if result else None
+
+    async def async_list(self, filters: dict = None, limit: int = 100) -> list:
+        """Async variant of `list` using the native async client when available."""
+        if self.async_client is None:
+            return await asyncio.to_thread(self.list, filters=filters, limit=limit)
+        return await self.async_client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=self._create_filter(filters) if filters else None,
+            limit=limit,
+            with_payload=True,
+            with_vectors=False,
+        )
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
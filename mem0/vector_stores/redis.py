@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 from datetime import datetime
@@ -51,6 +52,12 @@ class RedisDB(VectorStoreBase):
         redis_url: str,
         collection_name: str,
         embedding_model_dims: int,
+        index_algorithm: str = "flat",
+        datatype: str = "float32",
+        hnsw_m: int = None,
+        ef_construction: int = None,
+        ef_runtime: int = None,
+        insert_batch_size: int = 500,
     ):
         """
         Initialize the Redis vector store.
@@ -59,22 +66,52 @@ class RedisDB(VectorStoreBase):
             redis_url (str): Redis URL.
             collection_name (str): Collection name.
             embedding_model_dims (int): Embedding model dimensions.
+            index_algorithm (str, optional): Vector index algorithm, "flat" or "hnsw". Defaults to "flat".
+            datatype (str, optional): Stored vector type, "float32" or "float16". Defaults to "float32".
+            hnsw_m (int, optional): HNSW M parameter. Defaults to None (server default).
+            ef_construction (int, optional): HNSW EF_CONSTRUCTION parameter. Defaults to None (server default).
+            ef_runtime (int, optional): HNSW EF_RUNTIME parameter. Defaults to None (server default).
+            insert_batch_size (int, optional): Records written per pipeline on insert. Defaults to 500.
         """
         self.embedding_model_dims = embedding_model_dims
+        self.index_algorithm = index_algorithm
+        self.datatype = datatype
+        self.hnsw_m = hnsw_m
+        self.ef_construction = ef_construction
+        self.ef_runtime = ef_runtime
+        self.insert_batch_size = insert_batch_size
+
+        self.schema = self._build_schema(collection_name, embedding_model_dims)
+
+        self.client = redis.Redis.from_url(redis_url)
+        self.index = SearchIndex.from_dict(self.schema)
+        self.index.set_client(self.client)
+        # Attach to an existing index instead of dropping it, which would re-index every stored hash.
+        if self.index.exists():
+            logger.info(f"Attaching to existing Redis index {collection_name}")
+        else:
+            self.index.create(overwrite=False)
+
+    def _build_schema(self, collection_name, embedding_dims, distance_metric="cosine"):
         index_schema = {
             "name": collection_name,
             "prefix": f"mem0:{collection_name}",
         }
 
-        fields = DEFAULT_FIELDS.copy()
-        fields[-1]["attrs"]["dims"] = embedding_model_dims
+        fields = copy.deepcopy(DEFAULT_FIELDS)
+        attrs = fields[-1]["attrs"]
+        attrs["dims"] = embedding_dims
+        attrs["distance_metric"] = distance_metric
+        attrs["algorithm"] = self.index_algorithm
+        attrs["datatype"] = self.datatype
+        if self.index_algorithm == "hnsw":
+            hnsw_params = {"m": self.hnsw_m, "ef_construction": self.ef_construction, "ef_runtime": self.ef_runtime}
+            attrs.update({name: value for name, value in hnsw_params.items() if value is not None})
 
-        self.schema = {"index": index_schema, "fields": fields}
+        return {"index": index_schema, "fields": fields}
 
-        self.client = redis.Redis.from_url(redis_url)
-        self.index = SearchIndex.from_dict(self.schema)
-        self.index.set_client(self.client)
-        self.index.create(overwrite=True)
+    def _vector_bytes(self, vector):
+        return np.array(vector, dtype=np.float16 if self.datatype == "float16" else np.float32).tobytes()
 
     def create_col(self, name=None, vector_size=None, distance=None):
         """
@@ -94,18 +131,7 @@ class RedisDB(VectorStoreBase):
         distance_metric = distance or "cosine"
 
         # Create a new schema with the specified parameters
-        index_schema = {
-            "name": collection_name,
-            "prefix": f"mem0:{collection_name}",
-        }
-
-        # Copy the default fields and update the vector field with the specified dimensions
-        fields = DEFAULT_FIELDS.copy()
-        fields[-1]["attrs"]["dims"] = embedding_dims
-        fields[-1]["attrs"]["distance_metric"] = distance_metric
-
-        # Create the schema
-        schema = {"index": index_schema, "fields": fields}
+        schema = self._build_schema(collection_name, embedding_dims, distance_metric)
 
         # Create the index
         index = SearchIndex.from_dict(schema)
@@ -128,7 +154,7 @@ class RedisDB(VectorStoreBase):
                 "hash": payload["hash"],
                 "memory": payload["data"],
                 "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                "embedding": np.array(vector, dtype=np.float32).tobytes(),
+                "embedding": self._vector_bytes(vector),
             }
 
             # Conditionally add optional fields
@@ -140,15 +166,17 @@ class RedisDB(VectorStoreBase):
             entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
 
             data.append(entry)
-        self.index.load(data, id_field="memory_id")
+        # redisvl writes the hashes through a pipeline, one round trip per batch
+        self.index.load(data, id_field="memory_id", batch_size=self.insert_batch_size)
 
     def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
         conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
         filter = reduce(lambda x, y: x & y, conditions)
 
         v = VectorQuery(
-            vector=np.array(vectors, dtype=np.float32).tobytes(),
+            vector=self._vector_bytes(vectors),
             vector_field_name="embedding",
+            dtype=self.datatype,
             return_fields=["memory_id", "hash", "agent_id", "run_id", "user_id", "memory", "metadata", "created_at"],
             filter_expression=filter,
             num_results=limit,
@@ -186,21 +214,26 @@ class RedisDB(VectorStoreBase):
         self.index.drop_keys(f"{self.schema['index']['prefix']}:{vector_id}")
 
     def update(self, vector_id=None, vector=None, payload=None):
-        data = {
-            "memory_id": vector_id,
-            "hash": payload["hash"],
-            "memory": payload["data"],
-            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-            "updated_at": int(datetime.fromisoformat(payload["updated_at"]).timestamp()),
-            "embedding": np.array(vector, dtype=np.float32).tobytes(),
-        }
-
-        for field in ["agent_id", "run_id", "user_id"]:
-            if field in payload:
-                data[field] = payload[field]
+        """Patch the changed fields of the stored hash in place."""
+        data = {}
+        if vector is not None:
+            data["embedding"] = self._vector_bytes(vector)
+
+        if payload is not None:
+            if "hash" in payload:
+                data["hash"] = payload["hash"]
+            if "data" in payload:
+                data["memory"] = payload["data"]
+            for field in ["created_at", "updated_at"]:
+                if payload.get(field):
+                    data[field] = int(datetime.fromisoformat(payload[field]).timestamp())
+            for field in ["agent_id", "run_id", "user_id"]:
+                if field in payload:
+                    data[field] = payload[field]
+            data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
 
-        data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-        self.index.load(data=[data], keys=[f"{self.schema['index']['prefix']}:{vector_id}"], id_field="memory_id")
+        if data:
+            self.client.hset(f"{self.schema['index']['prefix']}:{vector_id}", mapping=data)
 
     def get(self, vector_id):
         result = self.index.fetch(vector_id)
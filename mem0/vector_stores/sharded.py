@@ -0,0 +1,321 @@
+import bisect
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+# Number of memory id -> shard entries remembered to avoid probing every shard on `get`, `update` and `delete`
+LOCATION_CACHE_SIZE = 100000
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+
+class HashRing:
+    """Consistent hash ring mapping routing keys to shard names through virtual nodes."""
+
+    def __init__(self, names: List[str], virtual_nodes: int = 128):
+        points = sorted((_hash(f"{name}#{i}"), name) for name in names for i in range(virtual_nodes))
+        self._hashes = [point for point, _ in points]
+        self._names = [name for _, name in points]
+
+    def owner(self, key: str) -> str:
+        index = bisect.bisect_right(self._hashes, _hash(key)) % len(self._hashes)
+        return self._names[index]
+
+
+class ShardedVectorStore(VectorStoreBase):
+    def __init__(
+        self,
+        shards: List[Dict],
+        collection_name: Optional[str] = None,
+        embedding_model_dims: Optional[int] = None,
+        virtual_nodes: int = 128,
+        routing_fields: Optional[List[str]] = None,
+        score_mode: str = "similarity",
+    ):
+        """
+        Spread tenants over several vector stores.
+
+        Each record is placed on one shard chosen by consistent hashing of its first routing field that is set
+        (`user_id`, then `agent_id`, then `run_id` by default). Reads filtered on the first routing field go to a
+        single shard; other reads, `list_cols` and `reset` fan out to every shard and merge the results.
+
+        Args:
+            shards (List[Dict]): Backend stores, each a dict with `provider`, `config` and an optional unique `name`.
+            collection_name (str, optional): Collection name forwarded to every shard. Defaults to None.
+            embedding_model_dims (int, optional): Dimension of the embedding vector, forwarded to every shard.
+            virtual_nodes (int, optional): Points per shard on the hash ring. Defaults to 128.
+            routing_fields (List[str], optional): Payload fields used for routing, in order of preference.
+                Defaults to ["user_id", "agent_id", "run_id"].
+            score_mode (str, optional): "similarity" (higher is better) or "distance" (lower is better), used to
+                merge fanned-out search results. Defaults to "similarity".
+        """
+        from mem0.utils.factory import VectorStoreFactory
+        from mem0.vector_stores.configs import VectorStoreConfig
+
+        self.shards: "OrderedDict[str, VectorStoreBase]" = OrderedDict()
+        self.shard_providers: Dict[str, str] = {}
+        for index, shard in enumerate(shards):
+            name = shard.get("name") or f"shard-{index}"
+            inner_config = dict(shard.get("config") or {})
+            if collection_name:
+                inner_config["collection_name"] = collection_name
+            if embedding_model_dims:
+                inner_config["embedding_model_dims"] = embedding_model_dims
+            inner_config = VectorStoreConfig(provider=shard["provider"], config=inner_config).config
+            self.shards[name] = VectorStoreFactory.create(shard["provider"], inner_config)
+            self.shard_providers[name] = shard["provider"]
+
+        self.collection_name = collection_name
+        self.embedding_model_dims = embedding_model_dims
+        self.virtual_nodes = virtual_nodes
+        self.routing_fields = list(routing_fields or ["user_id", "agent_id", "run_id"])
+        self.score_mode = score_mode
+        self.ring = HashRing(list(self.shards), virtual_nodes)
+
+        self._lock = threading.Lock()
+        self._locations: "OrderedDict[str, str]" = OrderedDict()  # memory id -> shard name
+        self._executor = ThreadPoolExecutor(max_workers=len(self.shards), thread_name_prefix="mem0-shard")
+
+    def routing_key(self, payload: Optional[Dict]) -> str:
+        """Return the routing key of a record: its first routing field that is set."""
+        payload = payload or {}
+        for field in self.routing_fields:
+            value = payload.get(field)
+            if value is not None and not isinstance(value, list):
+                return f"{field}:{value}"
+        return ""
+
+    def shard_for(self, payload: Optional[Dict]) -> str:
+        """Return the name of the shard that owns a record with this payload."""
+        return self.ring.owner(self.routing_key(payload))
+
+    def _route(self, filters: Optional[Dict]) -> Optional[str]:
+        """Return the single shard holding every match, or None when the read has to fan out."""
+        value = (filters or {}).get(self.routing_fields[0])
+        if value is None or isinstance(value, list):
+            return None
+        return self.shard_for(filters)
+
+    def _remember(self, vector_id, shard: str):
+        with self._lock:
+            self._locations[str(vector_id)] = shard
+            self._locations.move_to_end(str(vector_id))
+            while len(self._locations) > LOCATION_CACHE_SIZE:
+                self._locations.popitem(last=False)
+
+    def _forget(self, vector_id):
+        with self._lock:
+            self._locations.pop(str(vector_id), None)
+
+    def _locate(self, vector_id):
+        """Return `(shard name, record)` for a memory id, probing every shard when its location is unknown."""
+        with self._lock:
+            known = self._locations.get(str(vector_id))
+        if known is not None:
+            record = self.shards[known].get(vector_id=vector_id)
+            if record is not None:
+                return known, record
+        for name, store in self.shards.items():
+            if name == known:
+                continue
+            record = store.get(vector_id=vector_id)
+            if record is not None:
+                self._remember(vector_id, name)
+                return name, record
+        return None, None
+
+    def _fan_out(self, method: str, **kwargs) -> Dict[str, object]:
+        futures = {
+            name: self._executor.submit(getattr(store, method), **kwargs) for name, store in self.shards.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+    def create_col(self, name, vector_size=None, distance=None):
+        return self._fan_out("create_col", name=name, vector_size=vector_size, distance=distance)
+
+    def insert(self, vectors, payloads=None, ids=None):
+        """Group the vectors by owning shard and insert each group."""
+        payloads = payloads or [{} for _ in vectors]
+        groups: Dict[str, Dict[str, list]] = {}
+        for index, (vector, payload) in enumerate(zip(vectors, payloads)):
+            group = groups.setdefault(self.shard_for(payload), {"vectors": [], "payloads": [], "ids": []})
+            group["vectors"].append(vector)
+            group["payloads"].append(payload)
+            if ids is not None:
+                group["ids"].append(ids[index])
+        for name, group in groups.items():
+            self.shards[name].insert(
+                vectors=group["vectors"], payloads=group["payloads"], ids=group["ids"] if ids is not None else None
+            )
+            for vector_id in group["ids"]:
+                self._remember(vector_id, name)
+
+    def search(self, query, vectors, limit=5, filters=None):
+        """Search the owning shard, or every shard merged by score when the tenant is not fixed."""
+        shard = self._route(filters)
+        if shard is not None:
+            results = self.shards[shard].search(query=query, vectors=vectors, limit=limit, filters=filters)
+            for result in results:
+                self._remember(result.id, shard)
+            return results
+
+        merged = []
+        fanned_out = self._fan_out("search", query=query, vectors=vectors, limit=limit, filters=filters)
+        for name, results in fanned_out.items():
+            for result in results:
+                self._remember(result.id, name)
+            merged.extend(results)
+        reverse = self.score_mode == "similarity"
+        merged.sort(key=lambda result: result.score if result.score is not None else 0.0, reverse=reverse)
+        return merged[:limit]
+
+    def delete(self, vector_id):
+        shard, record = self._locate(vector_id)
+        if shard is None:
+            logger.warning(f"Vector {vector_id} not found on any shard")
+            return
+        self.shards[shard].delete(vector_id=vector_id)
+        self._forget(vector_id)
+
+    def delete_many(self, filters):
+        """Delete every vector matching the filters on the owning shard, or on every shard."""
+        shard = self._route(filters)
+        names = [shard] if shard is not None else list(self.shards)
+        for name in names:
+            store = self.shards[name]
+            if hasattr(store, "delete_many"):
+                store.delete_many(filters=filters)
+            else:
+                for record in list(store.iter_all(filters=filters)):
+                    store.delete(vector_id=record.id)
+        with self._lock:
+            if shard is None:
+                self._locations.clear()
+            else:
+                for vector_id in [key for key, value in self._locations.items() if value == shard]:
+                    del self._locations[vector_id]
+
+    def update(self, vector_id, vector=None, payload=None):
+        shard, record = self._locate(vector_id)
+        if shard is None:
+            logger.warning(f"Vector {vector_id} not found on any shard")
+            return
+        return self.shards[shard].update(vector_id=vector_id, vector=vector, payload=payload)
+
+    def get(self, vector_id):
+        _, record = self._locate(vector_id)
+        return record
+
+    def list_cols(self):
+        """Return the collections of every shard, keyed by shard name."""
+        return self._fan_out("list_cols")
+
+    def delete_col(self):
+        with self._lock:
+            self._locations.clear()
+        return self._fan_out("delete_col")
+
+    def col_info(self):
+        return self._fan_out("col_info")
+
+    def list(self, filters=None, limit=None):
+        """List the owning shard, or concatenate every shard's records up to `limit`."""
+        shard = self._route(filters)
+        names = [shard] if shard is not None else list(self.shards)
+        records = []
+        for name in names:
+            shard_records = self._unwrap_list_result(self.shards[name].list(filters=filters, limit=limit))
+            for record in shard_records:
+                self._remember(record.id, name)
+            records.extend(shard_records)
+            if limit and len(records) >= limit:
+                break
+        return [records[:limit] if limit else records]
+
+    def list_page(self, filters=None, cursor=None, page_size=100):
+        """Page the owning shard natively; reads that fan out use the sorted merge of the base implementation."""
+        shard = self._route(filters)
+        if shard is None:
+            return super().list_page(filters=filters, cursor=cursor, page_size=page_size)
+        records, next_cursor = self.shards[shard].list_page(filters=filters, cursor=cursor, page_size=page_size)
+        for record in records:
+            self._remember(record.id, shard)
+        return records, next_cursor
+
+    def count(self, filters=None):
+        """Count on the owning shard, or sum the counts of every shard."""
+        shard = self._route(filters)
+        if shard is not None:
+            return self.shards[shard].count(filters=filters)
+        return sum(self._fan_out("count", filters=filters).values())
+
+    def iter_all(self, filters=None, batch_size=100):
+        shard = self._route(filters)
+        names = [shard] if shard is not None else list(self.shards)
+        for name in names:
+            yield from self.shards[name].iter_all(filters=filters, batch_size=batch_size)
+
+    def iter_vectors(self, filters=None, batch_size=100):
+        shard = self._route(filters)
+        names = [shard] if shard is not None else list(self.shards)
+        for name in names:
+            yield from self.shards[name].iter_vectors(filters=filters, batch_size=batch_size)
+
+    def reset(self):
+        """Reset every shard."""
+        with self._lock:
+            self._locations.clear()
+        self._fan_out("reset")
+
+    def rebalance(self, batch_size: int = 100, dry_run: bool = False) -> Dict:
+        """
+        Move every record that is not on the shard the ring assigns it to.
+
+        Run this after adding shards: consistent hashing reassigns only the tenants whose ring segment moved to a
+        new shard, and until they are moved, reads routed to the new owner do not see them. Each batch is
+        inserted on its new shard before it is deleted from the old one, so an interrupted run leaves duplicates
+        rather than losing data, and running it again completes the move. Shards must support `iter_vectors`.
+
+        Args:
+            batch_size (int, optional): Records read and moved per batch. Defaults to 100.
+            dry_run (bool, optional): Only count the records that would move. Defaults to False.
+
+        Returns:
+            Dict: `scanned` and `moved` record counts and `moves`, the number of records per "source->target".
+        """
+        stats = {"scanned": 0, "moved": 0, "moves": {}}
+        for source, store in self.shards.items():
+            pending: Dict[str, List] = {}
+            # Collect first: deleting while the source is being paged would shift its cursor.
+            for vector_id, vector, payload in store.iter_vectors(batch_size=batch_size):
+                stats["scanned"] += 1
+                target = self.shard_for(payload)
+                if target != source:
+                    pending.setdefault(target, []).append((vector_id, list(vector), payload))
+
+            for target, records in pending.items():
+                stats["moves"][f"{source}->{target}"] = len(records)
+                stats["moved"] += len(records)
+                if dry_run:
+                    continue
+                for start in range(0, len(records), batch_size):
+                    batch = records[start : start + batch_size]
+                    self.shards[target].insert(
+                        vectors=[vector for _, vector, _ in batch],
+                        payloads=[payload for _, _, payload in batch],
+                        ids=[vector_id for vector_id, _, _ in batch],
+                    )
+                    for vector_id, _, _ in batch:
+                        store.delete(vector_id=vector_id)
+                        self._remember(vector_id, target)
+                logger.info(f"Moved {len(records)} records from {source} to {target}")
+        return stats
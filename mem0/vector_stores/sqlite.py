@@ -0,0 +1,424 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from mem0.configs.base import mem0_dir
+from mem0.memory.storage import SQLiteManager
+from mem0.vector_stores.base import VectorStoreBase, decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+# Payload fields stored as indexed columns; other filter keys are matched with json_extract
+COLUMN_FIELDS = ("user_id", "agent_id", "run_id", "actor_id")
+RESERVED_TABLES = {"history"}
+# Ordering of `list_page`; created_at is an ISO 8601 string, so text order is time order within one UTC offset
+CREATED_AT = "COALESCE(json_extract(payload, '$.created_at'), '')"
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # cosine similarity
+    payload: Optional[Dict]  # metadata
+
+
+class SQLiteDB(VectorStoreBase):
+    def __init__(
+        self,
+        collection_name: str,
+        db_path: Optional[str] = None,
+        embedding_model_dims: int = 1536,
+        store_history: bool = True,
+    ):
+        """
+        Initialize the SQLite vector store.
+
+        Vectors are stored as normalized float32 blobs next to their payload, with the tenant fields in indexed
+        columns. Search loads the blobs matching the filters in one query and ranks them with a single matrix
+        product.
+
+        Args:
+            collection_name (str): Name of the table holding the vectors.
+            db_path (str, optional): Path of the database file. Defaults to `<mem0_dir>/mem0.db`.
+            embedding_model_dims (int, optional): Dimension of the embedding vector. Defaults to 1536.
+            store_history (bool, optional): Keep the history table in this database so that Memory commits a
+                memory write and its history row in one transaction. Defaults to True.
+        """
+        self.db_path = db_path or os.path.join(mem0_dir, "mem0.db")
+        self.embedding_model_dims = embedding_model_dims
+        self.store_history = store_history
+        if self.db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        # Autocommit mode: transactions are opened explicitly by `transaction`.
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.RLock()
+        self.create_col(collection_name)
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed writes in one transaction, joining one that is already open."""
+        with self._lock:
+            if self.connection.in_transaction:
+                yield
+                return
+            self.connection.execute("BEGIN")
+            try:
+                yield
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def history_db(self) -> SQLiteManager:
+        """Return a history manager that writes to this database over the same connection."""
+        return SQLiteManager(self.db_path, connection=self.connection, lock=self._lock)
+
+    def create_col(self, name: str, vector_size: Optional[int] = None, distance: Optional[str] = None):
+        """
+        Create the vector table and its tenant indexes if they do not exist.
+
+        Args:
+            name (str): Name of the collection.
+            vector_size (int, optional): Dimension of the vectors. Defaults to `embedding_model_dims`.
+            distance (str, optional): Unused, the store always ranks by cosine similarity.
+        """
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name) or name in RESERVED_TABLES:
+            raise ValueError(f"Invalid collection name for SQLite: {name}")
+        self.collection_name = name
+        if vector_size:
+            self.embedding_model_dims = vector_size
+        with self.transaction():
+            self.connection.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {name} (
+                    id        TEXT PRIMARY KEY,
+                    user_id   TEXT,
+                    agent_id  TEXT,
+                    run_id    TEXT,
+                    actor_id  TEXT,
+                    vector    BLOB NOT NULL,
+                    payload   TEXT NOT NULL
+                )
+                """
+            )
+            for field in COLUMN_FIELDS:
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS {name}_{field}_idx ON {name} ({field})")
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {name}_user_created_idx ON {name} (user_id, {CREATED_AT}, id)"
+            )
+
+    def _vector_blob(self, vector) -> bytes:
+        array = np.asarray(vector, dtype=np.float32).reshape(self.embedding_model_dims)
+        norm = np.linalg.norm(array)
+        return (array / norm if norm else array).tobytes()
+
+    @staticmethod
+    def _column_values(payload: Dict) -> List:
+        return [None if payload.get(field) is None else str(payload[field]) for field in COLUMN_FIELDS]
+
+    def _where(self, filters: Optional[Dict]):
+        """Translate equality / membership filters to a WHERE clause and its parameters."""
+        clauses, params = [], []
+        for key, value in (filters or {}).items():
+            if isinstance(value, list) and not value:
+                # Membership in an empty list matches nothing, and `IN ()` is a syntax error.
+                clauses.append("0")
+                continue
+            if key in COLUMN_FIELDS:
+                expression = key
+                values = [str(item) for item in value] if isinstance(value, list) else [str(value)]
+            else:
+                expression = "json_extract(payload, ?)"
+                params.append(f'$."{key}"')
+                values = value if isinstance(value, list) else [value]
+            clauses.append(f"{expression} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def insert(self, vectors: List[list], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None):
+        """
+        Insert vectors, replacing rows that already use the same IDs.
+
+        Args:
+            vectors (List[list]): List of vectors to insert.
+            payloads (List[Dict], optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (List[str], optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
+        if payloads is None:
+            payloads = [{} for _ in range(len(vectors))]
+        rows = [
+            (vector_id, *self._column_values(payload), self._vector_blob(vector), json.dumps(payload))
+            for vector_id, vector, payload in zip(ids, vectors, payloads)
+        ]
+        with self.transaction():
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {self.collection_name} "
+                f"(id, user_id, agent_id, run_id, actor_id, vector, payload) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        logger.info(f"Inserted {len(rows)} vectors into collection {self.collection_name}")
+
+    def search(
+        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """
+        Search for similar vectors with an exact scan over the rows matching the filters.
+
+        Args:
+            query (str): Query (not used, kept for API compatibility).
+            vectors (List[float]): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            List[OutputData]: Search results ordered by descending cosine similarity.
+        """
+        where, params = self._where(filters)
+        with self._lock:
+            rows = self.connection.execute(f"SELECT id, vector FROM {self.collection_name}{where}", params).fetchall()
+        if not rows:
+            return []
+
+        matrix = np.frombuffer(b"".join(row[1] for row in rows), dtype=np.float32)
+        matrix = matrix.reshape(len(rows), self.embedding_model_dims)
+        query_vector = np.frombuffer(self._vector_blob(vectors), dtype=np.float32)
+        scores = matrix @ query_vector
+        k = min(limit, len(rows))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        top_ids = [rows[i][0] for i in top]
+        with self._lock:
+            payloads = dict(
+                self.connection.execute(
+                    f"SELECT id, payload FROM {self.collection_name} WHERE id IN ({', '.join('?' * len(top_ids))})",
+                    top_ids,
+                ).fetchall()
+            )
+        return [
+            OutputData(id=rows[i][0], score=float(scores[i]), payload=json.loads(payloads[rows[i][0]]))
+            for i in top
+            if rows[i][0] in payloads
+        ]
+
+    def delete(self, vector_id: str):
+        """
+        Delete a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to delete.
+        """
+        with self.transaction():
+            self.connection.execute(f"DELETE FROM {self.collection_name} WHERE id = ?", (vector_id,))
+
+    def delete_many(self, filters: Dict):
+        """
+        Delete every vector matching the filters in one statement.
+
+        Args:
+            filters (Dict): Filters selecting the vectors to delete.
+        """
+        where, params = self._where(filters)
+        with self.transaction():
+            self.connection.execute(f"DELETE FROM {self.collection_name}{where}", params)
+
+    def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None):
+        """
+        Update a vector and its payload.
+
+        Args:
+            vector_id (str): ID of the vector to update.
+            vector (List[float], optional): Updated vector. Defaults to None.
+            payload (Dict, optional): Updated payload. Defaults to None.
+        """
+        with self.transaction():
+            if vector is not None:
+                self.connection.execute(
+                    f"UPDATE {self.collection_name} SET vector = ? WHERE id = ?",
+                    (self._vector_blob(vector), vector_id),
+                )
+            if payload is not None:
+                self.connection.execute(
+                    f"UPDATE {self.collection_name} "
+                    f"SET user_id = ?, agent_id = ?, run_id = ?, actor_id = ?, payload = ? WHERE id = ?",
+                    (*self._column_values(payload), json.dumps(payload), vector_id),
+                )
+
+    def get(self, vector_id: str) -> Optional[OutputData]:
+        """
+        Retrieve a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to retrieve.
+
+        Returns:
+            OutputData: Retrieved vector, or None if it does not exist.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT payload FROM {self.collection_name} WHERE id = ?", (vector_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return OutputData(id=vector_id, score=None, payload=json.loads(row[0]))
+
+    def list_cols(self) -> List[str]:
+        """
+        List all collections.
+
+        Returns:
+            List[str]: List of collection names.
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            ).fetchall()
+        return [row[0] for row in rows if row[0] not in RESERVED_TABLES]
+
+    def delete_col(self):
+        """Delete the collection table."""
+        with self.transaction():
+            self.connection.execute(f"DROP TABLE IF EXISTS {self.collection_name}")
+
+    def col_info(self) -> Dict:
+        """
+        Get information about the collection.
+
+        Returns:
+            Dict: Collection information.
+        """
+        with self._lock:
+            count = self.connection.execute(f"SELECT COUNT(*) FROM {self.collection_name}").fetchone()[0]
+        return {"name": self.collection_name, "count": count, "dimension": self.embedding_model_dims}
+
+    def list(self, filters: Optional[Dict] = None, limit: Optional[int] = 100) -> List[List[OutputData]]:
+        """
+        List vectors in the collection.
+
+        Args:
+            filters (Dict, optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            List[List[OutputData]]: List of vectors.
+        """
+        where, params = self._where(filters)
+        query = f"SELECT id, payload FROM {self.collection_name}{where} ORDER BY rowid"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self.connection.execute(query, params).fetchall()
+        return [[OutputData(id=row[0], score=None, payload=json.loads(row[1])) for row in rows]]
+
+    def list_page(self, filters: Optional[Dict] = None, cursor: Optional[str] = None, page_size: int = 100):
+        """
+        Return one page of vectors ordered by `created_at`, then id, with keyset pagination.
+
+        Args:
+            filters (Dict, optional): Filters to apply. Defaults to None.
+            cursor (str, optional): `next_cursor` of the previous page. Defaults to None.
+            page_size (int, optional): Number of vectors per page. Defaults to 100.
+
+        Returns:
+            tuple: `(records, next_cursor)`, where `next_cursor` is None on the last page.
+        """
+        where, params = self._where(filters)
+        if cursor is not None:
+            where = f"{where} AND " if where else " WHERE "
+            where += f"({CREATED_AT}, id) > (?, ?)"
+            params.extend(decode_cursor(cursor)["after"])
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT id, payload, {CREATED_AT} FROM {self.collection_name}{where} "
+                f"ORDER BY {CREATED_AT}, id LIMIT ?",
+                [*params, page_size + 1],
+            ).fetchall()
+        page = rows[:page_size]
+        next_cursor = encode_cursor({"after": [page[-1][2], page[-1][0]]}) if len(rows) > page_size else None
+        return [OutputData(id=row[0], score=None, payload=json.loads(row[1])) for row in page], next_cursor
+
+    def count(self, filters: Optional[Dict] = None) -> int:
+        """
+        Count the vectors matching the filters.
+
+        Args:
+            filters (Dict, optional): Filters to apply. Defaults to None.
+
+        Returns:
+            int: Number of matching vectors.
+        """
+        where, params = self._where(filters)
+        with self._lock:
+            return self.connection.execute(f"SELECT COUNT(*) FROM {self.collection_name}{where}", params).fetchone()[0]
+
+    def iter_all(self, filters: Optional[Dict] = None, batch_size: int = 100):
+        """
+        Iterate over every vector matching the filters with keyset pagination on rowid.
+
+        Args:
+            filters (Dict, optional): Filters to apply. Defaults to None.
+            batch_size (int, optional): Number of rows fetched per query. Defaults to 100.
+
+        Yields:
+            OutputData: Stored vectors with their payloads.
+        """
+        where, params = self._where(filters)
+        where = f"{where} AND rowid > ?" if where else " WHERE rowid > ?"
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self.connection.execute(
+                    f"SELECT rowid, id, payload FROM {self.collection_name}{where} ORDER BY rowid LIMIT ?",
+                    [*params, last_rowid, batch_size],
+                ).fetchall()
+            if not rows:
+                return
+            for _, vector_id, payload in rows:
+                yield OutputData(id=vector_id, score=None, payload=json.loads(payload))
+            last_rowid = rows[-1][0]
+
+    def iter_vectors(self, filters: Optional[Dict] = None, batch_size: int = 100):
+        """
+        Iterate over `(id, vector, payload)` for every vector matching the filters.
+
+        Args:
+            filters (Dict, optional): Filters to apply. Defaults to None.
+            batch_size (int, optional): Number of rows fetched per query. Defaults to 100.
+
+        Yields:
+            tuple: `(id, vector, payload)` with the stored (normalized) vector.
+        """
+        where, params = self._where(filters)
+        where = f"{where} AND rowid > ?" if where else " WHERE rowid > ?"
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self.connection.execute(
+                    f"SELECT rowid, id, vector, payload FROM {self.collection_name}{where} ORDER BY rowid LIMIT ?",
+                    [*params, last_rowid, batch_size],
+                ).fetchall()
+            if not rows:
+                return
+            for _, vector_id, vector, payload in rows:
+                yield vector_id, np.frombuffer(vector, dtype=np.float32).tolist(), json.loads(payload)
+            last_rowid = rows[-1][0]
+
+    def reset(self):
+        """Reset the collection by deleting and recreating it."""
+        logger.warning(f"Resetting collection {self.collection_name}...")
+        self.delete_col()
+        self.create_col(self.collection_name)
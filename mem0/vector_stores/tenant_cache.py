@@ -0,0 +1,432 @@
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # cosine similarity or distance, see `score_mode`
+    payload: Optional[Dict]  # metadata
+
+
+def _matches(payload: Dict, filters: Dict) -> bool:
+    for key, value in filters.items():
+        if key not in payload:
+            return False
+        if isinstance(value, list):
+            if payload[key] not in value:
+                return False
+        elif payload[key] != value:
+            return False
+    return True
+
+
+class _TenantVectors:
+    """A cached tenant: normalized vectors in a growable matrix plus their payloads."""
+
+    def __init__(self, dims: int, capacity: int = 16):
+        self.matrix = np.zeros((capacity, dims), dtype=np.float32)
+        self.ids: List[str] = []
+        self.payloads: List[Dict] = []
+        self.rows: Dict[str, int] = {}
+        self.payload_bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.matrix.nbytes + self.payload_bytes
+
+    def put(self, vector_id: str, vector: np.ndarray, payload: Dict):
+        row = self.rows.get(vector_id)
+        if row is None:
+            row = len(self.ids)
+            if row == self.matrix.shape[0]:
+                matrix = np.zeros((2 * row, self.matrix.shape[1]), dtype=np.float32)
+                matrix[:row] = self.matrix
+                self.matrix = matrix
+            self.ids.append(vector_id)
+            self.payloads.append(payload)
+            self.rows[vector_id] = row
+        else:
+            self.payload_bytes -= len(json.dumps(self.payloads[row], default=str))
+            self.payloads[row] = payload
+        self.matrix[row] = vector
+        self.payload_bytes += len(json.dumps(payload, default=str))
+
+    def remove(self, vector_id: str):
+        """Remove a row by moving the last row into its place."""
+        row = self.rows.pop(vector_id)
+        self.payload_bytes -= len(json.dumps(self.payloads[row], default=str))
+        last = len(self.ids) - 1
+        if row != last:
+            self.matrix[row] = self.matrix[last]
+            self.ids[row] = self.ids[last]
+            self.payloads[row] = self.payloads[last]
+            self.rows[self.ids[row]] = row
+        self.ids.pop()
+        self.payloads.pop()
+
+
+class _PendingLoad:
+    """A tenant load in progress; writes that reach the tenant meanwhile mark it stale."""
+
+    def __init__(self):
+        self.stale = False
+        self.done = threading.Event()
+
+
+class TenantCache(VectorStoreBase):
+    def __init__(
+        self,
+        provider: str,
+        config: Optional[Dict] = None,
+        collection_name: Optional[str] = None,
+        embedding_model_dims: Optional[int] = None,
+        memory_budget_mb: float = 256,
+        tenant_field: str = "user_id",
+        max_tenant_size: int = 200000,
+        score_mode: str = "similarity",
+    ):
+        """
+        Read-through cache of hot tenants in front of another vector store.
+
+        Searches filtered on a tenant load that tenant's vectors once through the wrapped store's `iter_vectors`
+        and then answer `search`, `get` and `list` for it in process. Writes go to the wrapped store first and are
+        applied to cached tenants (write-through). Tenants are evicted least recently used first once the cache
+        exceeds its memory budget.
+
+        Args:
+            provider (str): Provider of the wrapped vector store.
+            config (Dict, optional): Configuration of the wrapped vector store. Defaults to None.
+            collection_name (str, optional): Collection name forwarded to the wrapped store. Defaults to None.
+            embedding_model_dims (int, optional): Dimension of the embedding vector, forwarded to the wrapped store.
+            memory_budget_mb (float, optional): Memory budget of the cache in megabytes. Defaults to 256.
+            tenant_field (str, optional): Payload field identifying a tenant. Defaults to "user_id".
+            max_tenant_size (int, optional): Tenants with more memories are never cached. Defaults to 200000.
+            score_mode (str, optional): "similarity" (cosine) or "distance" (1 - cosine) for cached results.
+                Defaults to "similarity".
+        """
+        from mem0.utils.factory import VectorStoreFactory
+        from mem0.vector_stores.configs import VectorStoreConfig
+
+        inner_config = dict(config or {})
+        if collection_name:
+            inner_config["collection_name"] = collection_name
+        if embedding_model_dims:
+            inner_config["embedding_model_dims"] = embedding_model_dims
+        inner_config = VectorStoreConfig(provider=provider, config=inner_config).config
+
+        self.provider = provider
+        self.inner = VectorStoreFactory.create(provider, inner_config)
+        self.collection_name = inner_config.collection_name
+        self.embedding_model_dims = getattr(inner_config, "embedding_model_dims", embedding_model_dims)
+        self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
+        self.tenant_field = tenant_field
+        self.max_tenant_size = max_tenant_size
+        self.score_mode = score_mode
+
+        self._lock = threading.RLock()
+        self._tenants: "OrderedDict[str, _TenantVectors]" = OrderedDict()
+        self._locations: Dict[str, str] = {}  # memory id -> cached tenant
+        self._loading: Dict[str, _PendingLoad] = {}  # tenants being read from the wrapped store
+        self._supports_vectors = True
+        self.stats = {"hits": 0, "misses": 0, "bypasses": 0, "loads": 0, "evictions": 0}
+
+    def cache_stats(self) -> Dict:
+        """
+        Return cache counters and the hit rate of tenant-filtered reads.
+
+        Returns:
+            Dict: Counters plus `hit_rate`, `cached_tenants` and `cached_bytes`.
+        """
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+                "cached_tenants": len(self._tenants),
+                "cached_bytes": sum(tenant.nbytes for tenant in self._tenants.values()),
+            }
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def _tenant_of(self, filters: Optional[Dict]) -> Optional[str]:
+        value = (filters or {}).get(self.tenant_field)
+        return None if value is None or isinstance(value, list) else str(value)
+
+    def _cached(self, tenant: str) -> Optional[_TenantVectors]:
+        entry = self._tenants.get(tenant)
+        if entry is not None:
+            self._tenants.move_to_end(tenant)
+        return entry
+
+    def _read_tenant(self, tenant: str) -> Optional[_TenantVectors]:
+        """Read a tenant's vectors from the wrapped store, or return None if it cannot be cached."""
+        if not self._supports_vectors:
+            return None
+        entry = _TenantVectors(self.embedding_model_dims)
+        try:
+            for vector_id, vector, payload in self.inner.iter_vectors(filters={self.tenant_field: tenant}):
+                if len(entry.ids) >= self.max_tenant_size:
+                    logger.info(f"Tenant {tenant} exceeds max_tenant_size, serving it from {self.provider}")
+                    return None
+                entry.put(str(vector_id), self._normalize(vector), dict(payload or {}))
+        except NotImplementedError:
+            logger.warning(f"{self.provider} cannot return stored vectors, tenant caching is disabled")
+            self._supports_vectors = False
+            return None
+        if entry.nbytes > self.memory_budget_bytes:
+            return None
+        return entry
+
+    def _install(self, tenant: str, entry: _TenantVectors):
+        self._tenants[tenant] = entry
+        for vector_id in entry.ids:
+            self._locations[vector_id] = tenant
+        self.stats["loads"] += 1
+        self._evict()
+
+    def _mark_stale(self, tenant: Optional[str] = None):
+        """Invalidate in-flight loads of `tenant`, or of every tenant when it is unknown."""
+        for loading_tenant, pending in self._loading.items():
+            if tenant is None or loading_tenant == tenant:
+                pending.stale = True
+
+    def _evict(self):
+        total = sum(tenant.nbytes for tenant in self._tenants.values())
+        while total > self.memory_budget_bytes and len(self._tenants) > 1:
+            tenant, entry = self._tenants.popitem(last=False)
+            for vector_id in entry.ids:
+                self._locations.pop(vector_id, None)
+            total -= entry.nbytes
+            self.stats["evictions"] += 1
+
+    def _drop(self, tenant: str):
+        self._mark_stale(tenant)
+        entry = self._tenants.pop(tenant, None)
+        if entry is not None:
+            for vector_id in entry.ids:
+                self._locations.pop(vector_id, None)
+
+    def _clear(self):
+        self._mark_stale()
+        self._tenants.clear()
+        self._locations.clear()
+
+    def _search_local(self, entry: _TenantVectors, vectors, limit: int, filters: Dict) -> List[OutputData]:
+        remaining = {key: value for key, value in filters.items() if key != self.tenant_field}
+        candidates = np.arange(len(entry.ids))
+        if remaining:
+            candidates = np.array(
+                [row for row in candidates if _matches(entry.payloads[row], remaining)], dtype=np.int64
+            )
+        if len(candidates) == 0:
+            return []
+        scores = entry.matrix[candidates] @ self._normalize(vectors)
+        k = min(limit, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            OutputData(
+                id=entry.ids[candidates[i]],
+                score=float(scores[i]) if self.score_mode == "similarity" else float(1.0 - scores[i]),
+                payload=dict(entry.payloads[candidates[i]]),
+            )
+            for i in top
+        ]
+
+    def create_col(self, name, vector_size=None, distance=None):
+        with self._lock:
+            self._clear()
+        return self.inner.create_col(name, vector_size, distance)
+
+    def insert(self, vectors, payloads=None, ids=None):
+        """Insert into the wrapped store, then into cached tenants."""
+        result = self.inner.insert(vectors=vectors, payloads=payloads, ids=ids)
+        if ids is None or payloads is None:
+            # Generated ids are not visible here; rebuild affected tenants on their next search.
+            with self._lock:
+                self._clear()
+            return result
+        with self._lock:
+            for vector_id, vector, payload in zip(ids, vectors, payloads):
+                tenant = self._tenant_of(payload)
+                entry = self._tenants.get(tenant) if tenant is not None else None
+                if entry is not None:
+                    entry.put(vector_id, self._normalize(vector), dict(payload))
+                    self._locations[vector_id] = tenant
+                elif tenant is not None:
+                    self._mark_stale(tenant)
+            self._evict()
+        return result
+
+    def search(self, query, vectors, limit=5, filters=None):
+        """
+        Answer tenant-filtered searches from the cache, loading the tenant on a miss.
+
+        A miss reads and scores the tenant outside the cache lock, so other tenants keep being served meanwhile.
+        Concurrent misses on the same tenant wait for the one load instead of repeating it.
+        """
+        tenant = self._tenant_of(filters)
+        if tenant is None:
+            with self._lock:
+                self.stats["bypasses"] += 1
+            return self.inner.search(query=query, vectors=vectors, limit=limit, filters=filters)
+
+        with self._lock:
+            entry = self._cached(tenant)
+            if entry is not None:
+                self.stats["hits"] += 1
+                return self._search_local(entry, vectors, limit, filters)
+            self.stats["misses"] += 1
+            pending = self._loading.get(tenant)
+            loading = pending is None
+            if loading:
+                pending = self._loading[tenant] = _PendingLoad()
+
+        if not loading:
+            pending.done.wait()
+            with self._lock:
+                entry = self._cached(tenant)
+                if entry is not None:
+                    return self._search_local(entry, vectors, limit, filters)
+            return self.inner.search(query=query, vectors=vectors, limit=limit, filters=filters)
+
+        entry = None
+        try:
+            entry = self._read_tenant(tenant)
+            # Not yet shared, so it can be scored without the lock.
+            results = self._search_local(entry, vectors, limit, filters) if entry is not None else None
+        finally:
+            with self._lock:
+                del self._loading[tenant]
+                if entry is not None and not pending.stale:
+                    self._install(tenant, entry)
+            pending.done.set()
+        if entry is None or pending.stale:
+            return self.inner.search(query=query, vectors=vectors, limit=limit, filters=filters)
+        return results
+
+    def delete(self, vector_id):
+        """Delete from the wrapped store and the cache."""
+        result = self.inner.delete(vector_id=vector_id)
+        with self._lock:
+            tenant = self._locations.pop(vector_id, None)
+            if tenant is not None and tenant in self._tenants:
+                self._tenants[tenant].remove(vector_id)
+            else:
+                self._mark_stale()
+        return result
+
+    def delete_many(self, filters):
+        """Delete every vector matching the filters and invalidate the affected tenants."""
+        if hasattr(self.inner, "delete_many"):
+            self.inner.delete_many(filters=filters)
+        else:
+            for record in list(self.inner.iter_all(filters=filters)):
+                self.inner.delete(vector_id=record.id)
+        with self._lock:
+            tenant = self._tenant_of(filters)
+            if tenant is not None:
+                self._drop(tenant)
+            else:
+                self._clear()
+
+    def update(self, vector_id, vector=None, payload=None):
+        """Update the wrapped store, then the cached copy."""
+        result = self.inner.update(vector_id=vector_id, vector=vector, payload=payload)
+        with self._lock:
+            tenant = self._locations.get(vector_id)
+            entry = self._tenants.get(tenant) if tenant is not None else None
+            if entry is None:
+                self._mark_stale()
+                new_tenant = self._tenant_of(payload)
+                if new_tenant is not None and new_tenant in self._tenants:
+                    # Moved into a cached tenant from elsewhere: its vector is unknown here, reload on demand.
+                    self._drop(new_tenant)
+                return result
+            row = entry.rows[vector_id]
+            new_vector = self._normalize(vector) if vector is not None else entry.matrix[row].copy()
+            new_payload = dict(payload) if payload is not None else entry.payloads[row]
+            new_tenant = self._tenant_of(new_payload)
+            if new_tenant != tenant:
+                entry.remove(vector_id)
+                self._locations.pop(vector_id, None)
+                target = self._tenants.get(new_tenant) if new_tenant is not None else None
+                if target is not None:
+                    target.put(vector_id, new_vector, new_payload)
+                    self._locations[vector_id] = new_tenant
+                elif new_tenant is not None:
+                    self._mark_stale(new_tenant)
+            else:
+                entry.put(vector_id, new_vector, new_payload)
+        return result
+
+    def get(self, vector_id):
+        """Serve cached tenants' memories locally."""
+        with self._lock:
+            tenant = self._locations.get(vector_id)
+            if tenant is not None:
+                entry = self._cached(tenant)
+                self.stats["hits"] += 1
+                return OutputData(id=vector_id, score=None, payload=dict(entry.payloads[entry.rows[vector_id]]))
+            self.stats["misses"] += 1
+        return self.inner.get(vector_id=vector_id)
+
+    def list_cols(self):
+        return self.inner.list_cols()
+
+    def delete_col(self):
+        with self._lock:
+            self._clear()
+        return self.inner.delete_col()
+
+    def col_info(self):
+        return self.inner.col_info()
+
+    def list(self, filters=None, limit=None):
+        """List a cached tenant's memories locally; other listings go to the wrapped store."""
+        tenant = self._tenant_of(filters)
+        if tenant is not None:
+            with self._lock:
+                entry = self._cached(tenant)
+                if entry is not None:
+                    self.stats["hits"] += 1
+                    records = [
+                        OutputData(id=vector_id, score=None, payload=dict(payload))
+                        for vector_id, payload in zip(entry.ids, entry.payloads)
+                        if _matches(payload, filters)
+                    ]
+                    return [records[:limit] if limit else records]
+                self.stats["misses"] += 1
+        return self.inner.list(filters=filters, limit=limit)
+
+    def list_page(self, filters=None, cursor=None, page_size=100):
+        return self.inner.list_page(filters=filters, cursor=cursor, page_size=page_size)
+
+    def count(self, filters=None):
+        return self.inner.count(filters=filters)
+
+    def iter_all(self, filters=None, batch_size=100):
+        return self.inner.iter_all(filters=filters, batch_size=batch_size)
+
+    def iter_vectors(self, filters=None, batch_size=100):
+        return self.inner.iter_vectors(filters=filters, batch_size=batch_size)
+
+    def reset(self):
+        """Reset the wrapped store and empty the cache."""
+        with self._lock:
+            self._clear()
+        return self.inner.reset()
@@ -1,5 +1,8 @@
+import hashlib
 import logging
+import re
 import uuid
+from collections import OrderedDict
 from typing import Dict, List, Mapping, Optional
 
 from pydantic import BaseModel
@@ -14,12 +17,19 @@ except ImportError:
 import weaviate.classes.config as wvcc
 from weaviate.classes.init import Auth
 from weaviate.classes.query import Filter, MetadataQuery
+from weaviate.classes.tenants import Tenant
 from weaviate.util import get_valid_uuid
 
 from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+RETURN_PROPERTIES = ["hash", "created_at", "updated_at", "user_id", "agent_id", "run_id", "data", "category"]
+# Tenant for records without a user_id when multi-tenancy is enabled.
+SHARED_TENANT = "mem0-shared"
+# Maximum number of ids whose tenant is remembered, least recently used first out
+ID_TENANT_CACHE_SIZE = 100000
+
 
 class OutputData(BaseModel):
     id: str
@@ -35,6 +45,7 @@ class Weaviate(VectorStoreBase):
         cluster_url: str = None,
         auth_client_secret: str = None,
         additional_headers: dict = None,
+        multi_tenancy: bool = False,
     ):
         """
         Initialize the Weaviate vector store.
@@ -46,6 +57,7 @@ class Weaviate(VectorStoreBase):
             cluster_url (str, optional): URL for Weaviate server. Defaults to None.
             auth_config (dict, optional): Authentication configuration for Weaviate. Defaults to None.
             additional_headers (dict, optional): Additional headers for requests. Defaults to None.
+            multi_tenancy (bool, optional): Store each user_id in its own Weaviate tenant. Defaults to False.
         """
         if "localhost" in cluster_url:
             self.client = weaviate.connect_to_local(headers=additional_headers)
@@ -58,8 +70,76 @@ class Weaviate(VectorStoreBase):
 
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
+        self.multi_tenancy = multi_tenancy
+        # Tenants known to exist and the tenant of every id seen, to avoid repeated lookups.
+        self._tenants = set()
+        self._id_tenants: "OrderedDict[str, str]" = OrderedDict()
         self.create_col(embedding_model_dims)
 
+    @staticmethod
+    def _tenant_name(user_id: Optional[str]) -> str:
+        """Map a user_id to a valid tenant name (letters, digits, '-' and '_', at most 64 characters)."""
+        if not user_id:
+            return SHARED_TENANT
+        user_id = str(user_id)
+        name = re.sub(r"[^A-Za-z0-9_-]", "_", user_id)
+        if name != user_id or len(name) > 64:
+            name = f"{name[:47]}-{hashlib.sha1(user_id.encode()).hexdigest()[:16]}"
+        return name
+
+    def _collection(self, tenant: Optional[str] = None):
+        collection = self.client.collections.get(str(self.collection_name))
+        return collection.with_tenant(tenant) if tenant else collection
+
+    def _ensure_tenant(self, tenant: str) -> None:
+        """Create the tenant on first use."""
+        if tenant in self._tenants:
+            return
+        collection = self._collection()
+        if not collection.tenants.exists(tenant):
+            collection.tenants.create([Tenant(name=tenant)])
+        self._tenants.add(tenant)
+
+    def _tenants_for(self, filters: Optional[Dict]) -> List[Optional[str]]:
+        """Tenants a filtered read has to visit; [None] when multi-tenancy is disabled."""
+        if not self.multi_tenancy:
+            return [None]
+        if filters and filters.get("user_id"):
+            tenant = self._tenant_name(filters["user_id"])
+            if tenant in self._tenants or self._collection().tenants.exists(tenant):
+                self._tenants.add(tenant)
+                return [tenant]
+            return []
+        return list(self._collection().tenants.get().keys())
+
+    def _remember(self, vector_id: str, tenant: str):
+        self._id_tenants[vector_id] = tenant
+        self._id_tenants.move_to_end(vector_id)
+        while len(self._id_tenants) > ID_TENANT_CACHE_SIZE:
+            self._id_tenants.popitem(last=False)
+
+    def _locate(self, vector_id: str) -> Optional[str]:
+        """Find the tenant holding a vector addressed only by id."""
+        if not self.multi_tenancy:
+            return None
+        if vector_id in self._id_tenants:
+            self._id_tenants.move_to_end(vector_id)
+            return self._id_tenants[vector_id]
+        for tenant in self._collection().tenants.get().keys():
+            if self._collection(tenant).query.fetch_object_by_id(uuid=vector_id) is not None:
+                self._remember(vector_id, tenant)
+                return tenant
+        return None
+
+    @staticmethod
+    def _build_filter(filters: Optional[Dict]):
+        filter_conditions = []
+        if filters:
+            for key, value in filters.items():
+                if value and key in ["user_id", "agent_id", "run_id"]:
+                    filter_conditions.append(Filter.by_property(key).equal(value))
+        return Filter.all_of(filter_conditions) if filter_conditions else None
+
     def _parse_output(self, data: Dict) -> List[OutputData]:
         """
         Parse the output data.
@@ -124,11 +204,13 @@ class Weaviate(VectorStoreBase):
 
         vectorizer_config = wvcc.Configure.Vectorizer.none()
         vector_index_config = wvcc.Configure.VectorIndex.hnsw()
+        multi_tenancy_config = wvcc.Configure.multi_tenancy(enabled=True) if self.multi_tenancy else None
 
         self.client.collections.create(
             self.collection_name,
             vectorizer_config=vectorizer_config,
             vector_index_config=vector_index_config,
+            multi_tenancy_config=multi_tenancy_config,
             properties=properties,
         )
 
@@ -142,6 +224,11 @@ class Weaviate(VectorStoreBase):
             ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
         """
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        if self.multi_tenancy:
+            for idx in range(len(vectors)):
+                data_object = payloads[idx] if payloads and idx < len(payloads) else {}
+                self._ensure_tenant(self._tenant_name(data_object.get("user_id")))
+
         with self.client.batch.fixed_size(batch_size=100) as batch:
             for idx, vector in enumerate(vectors):
                 object_id = ids[idx] if ids and idx < len(ids) else str(uuid.uuid4())
@@ -153,47 +240,60 @@ class Weaviate(VectorStoreBase):
                 if "ids" in data_object:
                     del data_object["ids"]
 
-                batch.add_object(collection=self.collection_name, properties=data_object, uuid=object_id, vector=vector)
+                tenant = None
+                if self.multi_tenancy:
+                    tenant = self._tenant_name(data_object.get("user_id"))
+                    self._remember(object_id, tenant)
+
+                batch.add_object(
+                    collection=self.collection_name,
+                    properties=data_object,
+                    uuid=object_id,
+                    vector=vector,
+                    tenant=tenant,
+                )
 
     def search(
         self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
     ) -> List[OutputData]:
         """
         Search for similar vectors.
+
+        With multi-tenancy, a user_id filter restricts the search to that user's tenant; searches without one
+        visit every tenant and merge the results.
         """
-        collection = self.client.collections.get(str(self.collection_name))
-        filter_conditions = []
-        if filters:
-            for key, value in filters.items():
-                if value and key in ["user_id", "agent_id", "run_id"]:
-                    filter_conditions.append(Filter.by_property(key).equal(value))
-        combined_filter = Filter.all_of(filter_conditions) if filter_conditions else None
-        response = collection.query.hybrid(
-            query="",
-            vector=vectors,
-            limit=limit,
-            filters=combined_filter,
-            return_properties=["hash", "created_at", "updated_at", "user_id", "agent_id", "run_id", "data", "category"],
-            return_metadata=MetadataQuery(score=True),
-        )
+        combined_filter = self._build_filter(filters)
         results = []
-        for obj in response.objects:
-            payload = obj.properties.copy()
-
-            for id_field in ["run_id", "agent_id", "user_id"]:
-                if id_field in payload and payload[id_field] is None:
-                    del payload[id_field]
-
-            payload["id"] = str(obj.uuid).split("'")[0]  # Include the id in the payload
-            results.append(
-                OutputData(
-                    id=str(obj.uuid),
-                    score=1
-                    if obj.metadata.distance is None
-                    else 1 - obj.metadata.distance,  # Convert distance to score
-                    payload=payload,
-                )
+        for tenant in self._tenants_for(filters):
+            response = self._collection(tenant).query.hybrid(
+                query="",
+                vector=vectors,
+                limit=limit,
+                filters=combined_filter,
+                return_properties=RETURN_PROPERTIES,
+                return_metadata=MetadataQuery(score=True),
             )
+            for obj in response.objects:
+                payload = obj.properties.copy()
+
+                for id_field in ["run_id", "agent_id", "user_id"]:
+                    if id_field in payload and payload[id_field] is None:
+                        del payload[id_field]
+
+                payload["id"] = str(obj.uuid).split("'")[0]  # Include the id in the payload
+                if tenant:
+                    self._remember(payload["id"], tenant)
+                results.append(
+                    OutputData(
+                        id=str(obj.uuid),
+                        score=1
+                        if obj.metadata.distance is None
+                        else 1 - obj.metadata.distance,  # Convert distance to score
+                        payload=payload,
+                    )
+                )
+        if len(results) > limit:
+            results = sorted(results, key=lambda result: result.score, reverse=True)[:limit]
         return results
 
     def delete(self, vector_id):
@@ -203,8 +303,34 @@ class Weaviate(VectorStoreBase):
         Args:
             vector_id: ID of the vector to delete.
         """
-        collection = self.client.collections.get(str(self.collection_name))
+        collection = self._collection(self._locate(str(vector_id)))
         collection.data.delete_by_id(vector_id)
+        self._id_tenants.pop(str(vector_id), None)
+
+    def delete_many(self, filters: Dict) -> None:
+        """
+        Delete every vector matching the filters with a single `where` request per tenant.
+
+        With multi-tenancy, a user_id-only filter removes the user's tenant outright.
+
+        Args:
+            filters (dict): Filters on user_id, agent_id and/or run_id.
+        """
+        if self.multi_tenancy and set(k for k, v in filters.items() if v) == {"user_id"}:
+            tenant = self._tenant_name(filters["user_id"])
+            if tenant != SHARED_TENANT and tenant in self._tenants_for(filters):
+                self._collection().tenants.remove([tenant])
+                self._tenants.discard(tenant)
+                self._id_tenants = OrderedDict((k, v) for k, v in self._id_tenants.items() if v != tenant)
+                return
+
+        combined_filter = self._build_filter(filters)
+        if combined_filter is None:
+            raise ValueError("delete_many requires at least one of user_id, agent_id or run_id")
+
+        for tenant in self._tenants_for(filters):
+            result = self._collection(tenant).data.delete_many(where=combined_filter)
+            logger.info(f"Deleted {result.successful} objects from {self.collection_name} (tenant={tenant})")
 
     def update(self, vector_id, vector=None, payload=None):
         """
@@ -215,7 +341,11 @@ class Weaviate(VectorStoreBase):
             vector (list, optional): Updated vector. Defaults to None.
             payload (dict, optional): Updated payload. Defaults to None.
         """
-        collection = self.client.collections.get(str(self.collection_name))
+        if self.multi_tenancy and payload and payload.get("user_id"):
+            tenant = self._tenant_name(payload["user_id"])
+        else:
+            tenant = self._locate(str(vector_id))
+        collection = self._collection(tenant)
 
         if payload:
             collection.data.update(uuid=vector_id, properties=payload)
@@ -240,11 +370,14 @@ class Weaviate(VectorStoreBase):
             dict: Retrieved vector and metadata.
         """
         vector_id = get_valid_uuid(vector_id)
-        collection = self.client.collections.get(str(self.collection_name))
+        tenant = self._locate(vector_id)
+        if self.multi_tenancy and tenant is None:
+            return None
+        collection = self._collection(tenant)
 
         response = collection.query.fetch_object_by_id(
             uuid=vector_id,
-            return_properties=["hash", "created_at", "updated_at", "user_id", "agent_id", "run_id", "data", "category"],
+            return_properties=RETURN_PROPERTIES,
         )
         # results = {}
         # print("reponse",response)
@@ -290,27 +423,71 @@ class Weaviate(VectorStoreBase):
         """
         List all vectors in a collection.
         """
-        collection = self.client.collections.get(self.collection_name)
-        filter_conditions = []
-        if filters:
-            for key, value in filters.items():
-                if value and key in ["user_id", "agent_id", "run_id"]:
-                    filter_conditions.append(Filter.by_property(key).equal(value))
-        combined_filter = Filter.all_of(filter_conditions) if filter_conditions else None
-        response = collection.query.fetch_objects(
-            limit=limit,
-            filters=combined_filter,
-            return_properties=["hash", "created_at", "updated_at", "user_id", "agent_id", "run_id", "data", "category"],
-        )
+        combined_filter = self._build_filter(filters)
         results = []
-        for obj in response.objects:
-            payload = obj.properties.copy()
-            payload["id"] = str(obj.uuid).split("'")[0]
-            results.append(OutputData(id=str(obj.uuid).split("'")[0], score=1.0, payload=payload))
+        for tenant in self._tenants_for(filters):
+            if len(results) >= limit:
+                break
+            response = self._collection(tenant).query.fetch_objects(
+                limit=limit - len(results),
+                filters=combined_filter,
+                return_properties=RETURN_PROPERTIES,
+            )
+            for obj in response.objects:
+                payload = obj.properties.copy()
+                payload["id"] = str(obj.uuid).split("'")[0]
+                if tenant:
+                    self._remember(payload["id"], tenant)
+                results.append(OutputData(id=payload["id"], score=1.0, payload=payload))
         return [results]
 
+    def iter_all(self, filters=None, batch_size=100):
+        """
+        Iterate over every vector matching the filters, tenant by tenant.
+
+        Filtered reads page through `fetch_objects` with the filter applied by Weaviate, `batch_size` objects per
+        request. Weaviate's cursor cannot be combined with a filter, so it is only used when nothing is left to filter
+        on, such as a user's whole tenant with multi-tenancy, or an unfiltered read.
+
+        Args:
+            filters (dict, optional): Filters on user_id, agent_id and/or run_id.
+            batch_size (int, optional): Number of objects fetched per round-trip. Defaults to 100.
+
+        Yields:
+            OutputData: Stored vectors with their payloads.
+        """
+        for tenant in self._tenants_for(filters):
+            scoped = filters
+            if tenant is not None and filters and filters.get("user_id"):
+                # The tenant already holds only this user's objects
+                scoped = {key: value for key, value in filters.items() if key != "user_id"}
+            combined_filter = self._build_filter(scoped)
+            if combined_filter is None:
+                objects = self._collection(tenant).iterator(return_properties=RETURN_PROPERTIES, cache_size=batch_size)
+            else:
+                objects = self._fetch_pages(tenant, combined_filter, batch_size)
+            for obj in objects:
+                payload = obj.properties.copy()
+                payload["id"] = str(obj.uuid).split("'")[0]
+                if tenant:
+                    self._remember(payload["id"], tenant)
+                yield OutputData(id=payload["id"], score=1.0, payload=payload)
+
+    def _fetch_pages(self, tenant: Optional[str], combined_filter, batch_size: int):
+        offset = 0
+        while True:
+            response = self._collection(tenant).query.fetch_objects(
+                limit=batch_size, offset=offset, filters=combined_filter, return_properties=RETURN_PROPERTIES
+            )
+            yield from response.objects
+            if len(response.objects) < batch_size:
+                return
+            offset += batch_size
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
-        self.create_col()
+        self._tenants.clear()
+        self._id_tenants.clear()
+        self.create_col(self.embedding_model_dims)
@@ -1,9 +1,9 @@
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.responses import JSONResponse, RedirectResponse
 from pydantic import BaseModel, Field
 
@@ -76,6 +76,9 @@ class MemoryCreate(BaseModel):
     agent_id: Optional[str] = None
     run_id: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    mode: Optional[Literal["sync", "background"]] = Field(
+        None, description="Set to 'background' to enqueue the add and get a job id back."
+    )
 
 
 class SearchRequest(BaseModel):
@@ -90,6 +93,8 @@ class SearchRequest(BaseModel):
 def set_config(config: Dict[str, Any]):
     """Set memory configuration."""
     global MEMORY_INSTANCE
+    # Queued background adds are picked up by the workers of the new instance
+    MEMORY_INSTANCE.stop_background_workers(timeout=0)
     MEMORY_INSTANCE = Memory.from_config(config)
     return {"message": "Configuration set successfully"}
 
@@ -109,20 +114,53 @@ def add_memory(memory_create: MemoryCreate):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/jobs/{job_id}", summary="Get a background add job")
+def get_job(job_id: str, wait: Optional[float] = Query(None, ge=0, le=60)):
+    """Retrieve the status of an add made with `mode: background`. Pass `wait` to wait up to that many seconds."""
+    try:
+        job = MEMORY_INSTANCE.job_status(job_id)
+        if job is not None and wait and job["status"] in ("queued", "running"):
+            try:
+                job = MEMORY_INSTANCE.wait(job_id, timeout=wait)
+            except TimeoutError:
+                job = MEMORY_INSTANCE.job_status(job_id)
+    except Exception as e:
+        logging.exception("Error in get_job:")
+        raise HTTPException(status_code=500, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
+
+
 @app.get("/memories", summary="Get memories")
 def get_all_memories(
     user_id: Optional[str] = None,
     run_id: Optional[str] = None,
     agent_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = Query(None, ge=1, le=1000),
+    include_count: bool = False,
 ):
-    """Retrieve stored memories."""
+    """Retrieve stored memories. Pass `page_size` (and then each `next_cursor`) to page through them."""
     if not any([user_id, run_id, agent_id]):
         raise HTTPException(status_code=400, detail="At least one identifier is required.")
     try:
         params = {
-            k: v for k, v in {"user_id": user_id, "run_id": run_id, "agent_id": agent_id}.items() if v is not None
+            k: v
+            for k, v in {
+                "user_id": user_id,
+                "run_id": run_id,
+                "agent_id": agent_id,
+                "cursor": cursor,
+                "page_size": page_size,
+            }.items()
+            if v is not None
         }
+        if include_count:
+            params["include_count"] = True
         return MEMORY_INSTANCE.get_all(**params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logging.exception("Error in get_all_memories:")
         raise HTTPException(status_code=500, detail=str(e))
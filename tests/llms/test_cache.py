@@ -0,0 +1,67 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.llms.openai import OpenAIConfig
+from mem0.llms.cache import CachedLLM, LlmResponseCache
+from mem0.utils.factory import LlmFactory
+
+MESSAGES = [{"role": "system", "content": "Extract facts"}, {"role": "user", "content": "I like tea"}]
+
+
+@pytest.fixture
+def inner_llm():
+    llm = Mock()
+    llm.config = OpenAIConfig(model="gpt-4o-mini", temperature=0.1)
+    llm.generate_response.return_value = '{"facts": ["Likes tea"]}'
+    return llm
+
+
+def test_identical_requests_are_answered_from_cache(inner_llm):
+    llm = CachedLLM(inner_llm, "openai", LlmResponseCache())
+
+    first = llm.generate_response(messages=MESSAGES, response_format={"type": "json_object"})
+    second = llm.generate_response(messages=MESSAGES, response_format={"type": "json_object"})
+    llm.generate_response(messages=MESSAGES)
+
+    assert first == second == '{"facts": ["Likes tea"]}'
+    assert inner_llm.generate_response.call_count == 2
+    stats = llm.stats()
+    assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 2, 2)
+
+
+def test_sqlite_tier_survives_restarts(inner_llm, tmp_path):
+    db_path = str(tmp_path / "llm_cache.db")
+    CachedLLM(inner_llm, "openai", LlmResponseCache(db_path=db_path)).generate_response(messages=MESSAGES)
+
+    replay = CachedLLM(inner_llm, "openai", LlmResponseCache(db_path=db_path))
+    assert replay.generate_response(messages=MESSAGES) == '{"facts": ["Likes tea"]}'
+    assert inner_llm.generate_response.call_count == 1
+    assert replay.stats()["disk_hits"] == 1
+
+
+def test_expired_and_nondeterministic_requests_reach_the_llm(inner_llm):
+    cache = LlmResponseCache(ttl=60)
+    llm = CachedLLM(inner_llm, "openai", cache)
+    with patch("mem0.llms.cache.time.time", return_value=1000.0):
+        llm.generate_response(messages=MESSAGES)
+    with patch("mem0.llms.cache.time.time", return_value=1061.0):
+        llm.generate_response(messages=MESSAGES)
+    assert inner_llm.generate_response.call_count == 2
+
+    inner_llm.config.temperature = 0.9
+    llm.generate_response(messages=MESSAGES)
+    llm.generate_response(messages=MESSAGES)
+    assert inner_llm.generate_response.call_count == 4
+    assert cache.stats()["bypassed"] == 2
+
+
+def test_factory_wraps_only_when_enabled():
+    with patch("mem0.llms.openai.OpenAI"):
+        plain = LlmFactory.create("openai", {"model": "gpt-4o-mini"})
+        cached = LlmFactory.create("openai", {"model": "gpt-4o-mini"}, cache={"enabled": True})
+
+    assert not isinstance(plain, CachedLLM)
+    assert isinstance(cached, CachedLLM)
+    assert cached.config.model == "gpt-4o-mini"
+    assert cached.client is cached.llm.client
@@ -207,3 +207,19 @@ def test_callback_with_tools(mock_openai_client):
     mock_callback.assert_called_once()
     # Check that tool_calls exists in the message
     assert hasattr(mock_callback.call_args[0][1].choices[0].message, 'tool_calls')
+
+
+def test_generate_response_stream(mock_openai_client):
+    config = OpenAIConfig(model="gpt-4o", temperature=0.1, max_tokens=100, top_p=1.0)
+    llm = OpenAILLM(config)
+    messages = [{"role": "user", "content": "Extract facts"}]
+    mock_openai_client.chat.completions.create.return_value = iter(
+        [Mock(choices=[Mock(delta=Mock(content=piece))]) for piece in ('{"facts": ["Likes', ' tea"]}', None)]
+    )
+
+    assert llm.supports_streaming is True
+    assert "".join(llm.generate_response_stream(messages, response_format={"type": "json_object"})) == (
+        '{"facts": ["Likes tea"]}'
+    )
+    call = mock_openai_client.chat.completions.create.call_args.kwargs
+    assert call["stream"] is True and call["response_format"] == {"type": "json_object"}
@@ -0,0 +1,122 @@
+import time
+
+import pytest
+
+from mem0.configs.base import MemoryConfig
+from mem0.memory.ingest_queue import (
+    COMPLETED,
+    DEAD,
+    InMemoryIngestQueue,
+    IngestWorkerPool,
+    SQLiteIngestQueue,
+    ingest_queue_owner,
+)
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def queue(request, tmp_path):
+    if request.param == "sqlite":
+        queue = SQLiteIngestQueue(str(tmp_path / "ingest_queue.db"))
+        yield queue
+        queue.close()
+    else:
+        yield InMemoryIngestQueue()
+
+
+def test_claims_jobs_of_a_key_in_order_and_reclaims_expired_leases(queue):
+    first = queue.enqueue({"n": 1}, "user_id:alice")
+    second = queue.enqueue({"n": 2}, "user_id:alice")
+    other = queue.enqueue({"n": 3}, "user_id:bob")
+
+    assert queue.claim(lease=60)["id"] == first
+    # alice's second job waits for the first one to finish
+    assert queue.claim(lease=60)["id"] == other
+    assert queue.claim(lease=60) is None
+
+    assert queue.fail(first, "RuntimeError: boom", retry_at=time.time() - 1, attempts=1)
+    retried = queue.claim(lease=-1)  # leased, then immediately expired as if its worker died
+    assert (retried["id"], retried["attempts"], retried["payload"]) == (first, 2, {"n": 1})
+    assert queue.claim(lease=60)["id"] == first
+
+    # The worker of the expired claim can no longer renew or record the job
+    assert not queue.renew(first, 2, lease=60)
+    assert not queue.complete(first, {"stale": True}, attempts=2)
+    assert queue.complete(first, {"results": []}, attempts=3)
+    assert queue.claim(lease=60)["id"] == second
+    assert queue.get(first)["status"] == COMPLETED and queue.get(first)["result"] == {"results": []}
+
+
+def test_sqlite_queue_survives_restart(tmp_path):
+    path = str(tmp_path / "ingest_queue.db")
+    queue = SQLiteIngestQueue(path)
+    job_id = queue.enqueue({"messages": [{"role": "user", "content": "hi"}]}, "user_id:alice")
+    queue.close()
+
+    reopened = SQLiteIngestQueue(path)
+    assert reopened.claim(lease=60)["payload"] == {"messages": [{"role": "user", "content": "hi"}]}
+    assert reopened.get(job_id)["status"] == "running"
+    reopened.close()
+
+
+def test_pool_retries_then_dead_letters(queue):
+    calls = []
+
+    def handler(payload):
+        calls.append(payload["n"])
+        if payload["n"] == 1 and calls.count(1) < 2:
+            raise RuntimeError("transient")
+        if payload["n"] == 2:
+            raise RuntimeError("permanent")
+        return {"n": payload["n"]}
+
+    pool = IngestWorkerPool(queue, handler, concurrency=2, max_retries=2, base_delay=0.01, poll_interval=0.05)
+    flaky = queue.enqueue({"n": 1}, "user_id:alice")
+    broken = queue.enqueue({"n": 2}, "user_id:bob")
+    pool.start()
+    try:
+        assert pool.wait(flaky, timeout=10)["result"] == {"n": 1}
+        dead = pool.wait(broken, timeout=10)
+    finally:
+        pool.stop(timeout=5)
+
+    assert (dead["status"], dead["attempts"], dead["error"]) == (DEAD, 3, "RuntimeError: permanent")
+    assert [job["id"] for job in queue.list(DEAD)] == [broken]
+    assert queue.requeue(broken) and not queue.requeue(flaky)
+    assert queue.counts() == {"queued": 1, "running": 0, "completed": 1, "dead": 0}
+
+
+def test_sqlite_queue_only_runs_jobs_of_its_owner(tmp_path):
+    path = str(tmp_path / "ingest_queue.db")
+    mine = SQLiteIngestQueue(path, owner="store-a")
+    theirs = SQLiteIngestQueue(path, owner="store-b")
+    job_id = theirs.enqueue({"n": 1}, "user_id:alice")
+
+    assert mine.claim(lease=60) is None
+    assert mine.counts()["queued"] == 0 and mine.list("queued") == []
+    assert theirs.claim(lease=60)["id"] == job_id
+    mine.close()
+    theirs.close()
+
+
+def test_owner_fingerprints_the_vector_store():
+    def owner(**config):
+        return ingest_queue_owner(MemoryConfig(vector_store={"provider": "qdrant", "config": config}))
+
+    assert owner(collection_name="a", path="/tmp/a") == owner(collection_name="a", path="/tmp/a")
+    assert owner(collection_name="a", path="/tmp/a") != owner(collection_name="b", path="/tmp/a")
+    assert owner(collection_name="a", path="/tmp/a", api_key="one") == owner(
+        collection_name="a", path="/tmp/a", api_key="two"
+    )
+
+
+def test_pool_renews_the_lease_of_a_long_job(queue):
+    pool = IngestWorkerPool(queue, lambda payload: time.sleep(0.5) or {}, concurrency=2, lease=0.15, poll_interval=0.05)
+    job_id = queue.enqueue({"n": 1}, "user_id:alice")
+    pool.start()
+    try:
+        job = pool.wait(job_id, timeout=10)
+    finally:
+        pool.stop(timeout=5)
+
+    # Without renewal the job would have been claimed again once its 0.15s lease ran out
+    assert (job["status"], job["attempts"]) == (COMPLETED, 1)
@@ -1,9 +1,16 @@
+import asyncio
+import concurrent.futures
 import logging
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
-from mem0.memory.main import AsyncMemory, Memory
+from mem0.configs.base import BackgroundAddConfig, MemoryConfig, MemoryItem
+from mem0.memory.ingest_queue import IngestWorkerPool, SQLiteIngestQueue, ingest_queue_owner
+from mem0.memory.main import SINGLE_CALL_CANDIDATES, AsyncMemory, Memory, _format_search_result
+from mem0.memory.utils import FactStreamParser
 
 
 def _setup_mocks(mocker):
@@ -125,3 +132,324 @@ class TestAsyncAddToVectorStoreErrors:
         assert result == []
         assert "Invalid JSON response" in caplog.text
         assert mock_capture_event.call_count == 1
+
+
+class TestSingleCallAddMode:
+    RESPONSE = (
+        '{"facts": ["Likes green tea", "Name is John"], "memory": ['
+        '{"id": "0", "text": "Likes green tea", "event": "UPDATE", "old_memory": "Likes tea"}, '
+        '{"id": "1", "text": "Name is John", "event": "ADD"}]}'
+    )
+
+    @staticmethod
+    def _configure(memory, mocker):
+        memory.config.add_mode = "single_call"
+        memory.config.custom_extract_and_update_prompt = None
+        memory.vector_store.search.return_value = [MagicMock(id="existing-id", payload={"data": "Likes tea"})]
+        memory.llm.generate_response.return_value = TestSingleCallAddMode.RESPONSE
+        mocker.patch("mem0.memory.main.capture_event")
+
+    def test_one_llm_call_reconciles_candidates_of_the_turn(self, mocker):
+        _setup_mocks(mocker)
+        memory = Memory()
+        self._configure(memory, mocker)
+        mocker.patch.object(memory, "_update_memory")
+        mocker.patch.object(memory, "_create_memory", return_value="new-id")
+
+        result = memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "I'm John, I like green tea"}],
+            metadata={},
+            filters={"user_id": "john"},
+            infer=True,
+        )
+
+        assert memory.llm.generate_response.call_count == 1
+        memory.embedding_model.embed.assert_called_once_with("user: I'm John, I like green tea\n", "search")
+        assert memory.vector_store.search.call_args.kwargs["limit"] == SINGLE_CALL_CANDIDATES
+        assert memory._update_memory.call_args.kwargs["memory_id"] == "existing-id"
+        assert [(item["id"], item["event"]) for item in result] == [("existing-id", "UPDATE"), ("new-id", "ADD")]
+
+    @pytest.mark.asyncio
+    async def test_async_one_llm_call_reconciles_candidates_of_the_turn(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        self._configure(memory, mocker)
+        mocker.patch.object(memory, "_update_memory")
+        mocker.patch.object(memory, "_create_memory", return_value="new-id")
+
+        result = await memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "I'm John, I like green tea"}],
+            metadata={},
+            effective_filters={"user_id": "john"},
+            infer=True,
+        )
+
+        assert memory.llm.generate_response.call_count == 1
+        assert memory._update_memory.call_args.kwargs["memory_id"] == "existing-id"
+        assert sorted(item["event"] for item in result) == ["ADD", "UPDATE"]
+
+
+class TestStreamingFactExtraction:
+    CHUNKS = ['```json\n{"facts": ["Likes gre', 'en tea", "Name is', ' \\"John\\""', "]}\n```"]
+    FACTS = ["Likes green tea", 'Name is "John"']
+
+    def test_parser_returns_each_fact_once_complete(self):
+        parser = FactStreamParser()
+        completed = [parser.feed(chunk) for chunk in self.CHUNKS]
+
+        assert completed == [[], ["Likes green tea"], ['Name is "John"'], []]
+        assert parser.text == "".join(self.CHUNKS)
+
+        fallback = FactStreamParser()
+        assert fallback.feed('{"facts": [{"text": "Likes tea"}]}') == []
+        assert fallback.feed('"ignored"') == []
+
+    @staticmethod
+    def _configure(memory, mocker):
+        memory.config.add_mode = "two_step"
+        memory.config.stream_fact_extraction = True
+        memory.config.custom_fact_extraction_prompt = None
+        memory.config.custom_update_memory_prompt = None
+        memory.llm.supports_streaming = True
+        memory.llm.generate_response_stream.return_value = iter(TestStreamingFactExtraction.CHUNKS)
+        memory.llm.generate_response.return_value = '{"memory": []}'
+        mocker.patch("mem0.memory.main.capture_event")
+
+    def test_searches_facts_while_streaming(self, mocker):
+        _setup_mocks(mocker)
+        memory = Memory()
+        self._configure(memory, mocker)
+        searches_during_stream = []
+
+        def stream(**kwargs):
+            for chunk, started in zip(self.CHUNKS, [0, 1, 2, 2]):
+                yield chunk
+                deadline = time.monotonic() + 5
+                while memory.vector_store.search.call_count < started and time.monotonic() < deadline:
+                    time.sleep(0.01)  # let the search started by this chunk finish
+                searches_during_stream.append(memory.vector_store.search.call_count)
+
+        memory.llm.generate_response_stream.side_effect = stream
+
+        facts, _, _, embeddings = memory._plan_actions_two_step("user: I'm John", {"user_id": "john"})
+
+        assert facts == self.FACTS
+        assert set(embeddings) == set(self.FACTS)
+        assert memory.embedding_model.embed.call_count == 2
+        assert memory.llm.generate_response.call_count == 1
+        # Each fact was searched before the rest of the response arrived
+        assert searches_during_stream == [0, 1, 2, 2]
+
+    def test_cancels_searches_of_facts_dropped_from_the_final_parse(self, mocker):
+        _setup_mocks(mocker)
+        memory = Memory()
+        self._configure(memory, mocker)
+        release = threading.Event()
+        memory.vector_store.search.side_effect = lambda **kwargs: release.wait(5) and []
+        # Both facts stream in complete, but the truncated response does not parse
+        memory.llm.generate_response_stream.return_value = iter(['{"facts": ["Likes tea", "Lives in Paris", '])
+        futures = []
+        submit = concurrent.futures.ThreadPoolExecutor.submit
+
+        def recording_submit(executor, *args, **kwargs):
+            futures.append(submit(executor, *args, **kwargs))
+            return futures[-1]
+
+        mocker.patch.object(concurrent.futures.ThreadPoolExecutor, "submit", recording_submit)
+        try:
+            facts, _, _, _ = memory._plan_actions_two_step("user: I'm John", {"user_id": "john"})
+        finally:
+            release.set()
+
+        assert facts == []
+        assert len(futures) == 2
+        assert futures[1].cancelled()
+
+    @pytest.mark.asyncio
+    async def test_async_searches_facts_while_streaming(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        self._configure(memory, mocker)
+
+        facts, _, _, embeddings = await memory._plan_actions_two_step("user: I'm John", {"user_id": "john"})
+
+        assert facts == self.FACTS
+        assert set(embeddings) == set(self.FACTS)
+        assert memory.embedding_model.embed.call_count == 2
+        memory.llm.generate_response_stream.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_stream_error_cancels_started_searches(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        self._configure(memory, mocker)
+        embedding_started = threading.Event()
+        release = threading.Event()
+        memory.embedding_model.embed.side_effect = lambda *args: embedding_started.set() or release.wait(5) and []
+
+        def stream(**kwargs):
+            yield '{"facts": ["Likes tea", '
+            embedding_started.wait(5)
+            raise RuntimeError("stream dropped")
+
+        memory.llm.generate_response_stream.side_effect = stream
+        tasks = []
+        ensure_future = asyncio.ensure_future
+
+        def recording_ensure_future(*args, **kwargs):
+            tasks.append(ensure_future(*args, **kwargs))
+            return tasks[-1]
+
+        mocker.patch("asyncio.ensure_future", recording_ensure_future)
+        try:
+            with pytest.raises(RuntimeError, match="stream dropped"):
+                await memory._plan_actions_two_step("user: I like tea", {"user_id": "john"})
+            await asyncio.sleep(0)
+        finally:
+            release.set()
+
+        assert len(tasks) == 1
+        assert tasks[0].cancelled()
+
+
+class TestBackgroundAdd:
+    def test_background_add_returns_job_id_and_runs_in_worker(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = Memory()
+        memory.config.background_add = BackgroundAddConfig(backend="memory", concurrency=1)
+        mocker.patch.object(memory, "_add_to_vector_store", return_value=[{"id": "m1", "event": "ADD"}])
+        mocker.patch.object(memory, "_add_to_graph", return_value=[])
+
+        try:
+            queued = memory.add("I like tea", user_id="alice", mode="background")
+            job = memory.wait(queued["job_id"], timeout=10)
+        finally:
+            memory.stop_background_workers(timeout=5)
+
+        assert queued["status"] == "queued"
+        assert (job["status"], job["attempts"]) == ("completed", 1)
+        assert job["result"] == {"results": [{"id": "m1", "event": "ADD"}]}
+        assert memory.job_status(queued["job_id"]) == job
+        messages, metadata, filters, infer = memory._add_to_vector_store.call_args.args
+        assert messages == [{"role": "user", "content": "I like tea"}] and filters == {"user_id": "alice"}
+
+    def test_resumes_only_the_jobs_queued_for_its_own_vector_store(self, mocker, tmp_path):
+        path = str(tmp_path / "ingest_queue.db")
+        start = mocker.patch.object(IngestWorkerPool, "start")
+
+        def config(collection_name):
+            return MemoryConfig(
+                vector_store={"provider": "qdrant", "config": {"collection_name": collection_name}},
+                background_add=BackgroundAddConfig(db_path=path),
+            )
+
+        other = SQLiteIngestQueue(path, owner=ingest_queue_owner(config("other")))
+        other.enqueue({"messages": "hi", "user_id": "bob"}, "user_id:bob")
+        other.close()
+        _setup_mocks(mocker)
+        Memory(config("mine"))
+        start.assert_not_called()
+
+        mine = SQLiteIngestQueue(path, owner=ingest_queue_owner(config("mine")))
+        mine.enqueue({"messages": "hi", "user_id": "alice"}, "user_id:alice")
+        mine.close()
+        _setup_mocks(mocker)
+        Memory(config("mine"))
+        start.assert_called_once()
+
+    def test_background_add_validates_before_enqueueing(self, mocker):
+        _setup_mocks(mocker)
+        memory = Memory()
+        memory.config.background_add = BackgroundAddConfig(backend="memory")
+
+        with pytest.raises(ValueError):
+            memory.add("I like tea", mode="background")
+        with pytest.raises(ValueError):
+            memory.add("I like tea", user_id="alice", mode="later")
+        with pytest.raises(ValueError):
+            memory.add("I like tea", user_id="alice", metadata={"seen": object()}, mode="background")
+        assert memory._ingest_queue is None
+
+
+class TestSearchVectorStore:
+    @pytest.fixture
+    def memory(self, mocker):
+        _setup_mocks(mocker)
+        return Memory()
+
+    def test_format_search_result_matches_memory_item(self):
+        hit = MagicMock(
+            id="m1",
+            score=0.8,
+            payload={"data": "likes tea", "hash": "h", "created_at": "t0", "user_id": "alice", "topic": "food"},
+        )
+
+        expected = MemoryItem(
+            id="m1", memory="likes tea", hash="h", created_at="t0", updated_at=None, score=0.8
+        ).model_dump()
+        expected.update({"user_id": "alice", "metadata": {"topic": "food"}})
+
+        assert _format_search_result(hit) == expected
+
+    def test_threshold_filters_results_of_stores_without_pushdown(self, memory):
+        memory.vector_store.search.return_value = [
+            MagicMock(id="m1", score=0.9, payload={"data": "a"}),
+            MagicMock(id="m2", score=0.3, payload={"data": "b"}),
+        ]
+
+        results = memory._search_vector_store("query", {"user_id": "alice"}, 10, threshold=0.5)
+
+        assert [result["id"] for result in results] == ["m1"]
+        assert "threshold" not in memory.vector_store.search.call_args.kwargs
+
+    def test_threshold_fallback_reads_distance_scores_as_one_minus_score(self, memory):
+        memory.vector_store.score_mode = "distance"
+        memory.vector_store.search.return_value = [
+            MagicMock(id="m1", score=0.1, payload={"data": "a"}),
+            MagicMock(id="m2", score=0.7, payload={"data": "b"}),
+        ]
+
+        results = memory._search_vector_store("query", {"user_id": "alice"}, 10, threshold=0.5)
+
+        assert [result["id"] for result in results] == ["m1"]
+
+    def test_threshold_is_pushed_to_stores_that_accept_it(self, memory, mocker):
+        class ThresholdStore:
+            def search(self, query, vectors, limit=5, filters=None, threshold=None):
+                pass
+
+        store = ThresholdStore()
+        store.search = MagicMock(return_value=[MagicMock(id="m1", score=0.1, payload={"data": "a"})])
+        memory.vector_store = store
+
+        results = memory._search_vector_store("query", {"user_id": "alice"}, 10, threshold=0.5)
+
+        assert store.search.call_args.kwargs["threshold"] == 0.5
+        assert [result["id"] for result in results] == ["m1"]
+
+
+def test_get_all_pages_with_cursor(mocker):
+    mocker.patch("mem0.utils.factory.EmbedderFactory.create")
+    mocker.patch("mem0.utils.factory.LlmFactory.create")
+    mocker.patch("mem0.memory.main.capture_event")
+    memory = Memory(
+        MemoryConfig(
+            vector_store={"provider": "numpy", "config": {"path": None, "embedding_model_dims": 3}},
+            history_db_path=":memory:",
+        )
+    )
+    memory.vector_store.insert(
+        vectors=[[1, 0, 0]] * 3,
+        payloads=[{"user_id": "alice", "data": f"fact {i}", "created_at": f"2025-01-0{i}"} for i in (2, 1, 3)],
+        ids=["m2", "m1", "m3"],
+    )
+
+    first = memory.get_all(user_id="alice", page_size=2, include_count=True)
+    second = memory.get_all(user_id="alice", cursor=first["next_cursor"], page_size=2)
+
+    assert [item["id"] for item in first["results"]] == ["m1", "m2"]
+    assert first["count"] == 3
+    assert [item["id"] for item in second["results"]] == ["m3"]
+    assert second["next_cursor"] is None
+    assert len(memory.get_all(user_id="alice")["results"]) == 3
@@ -0,0 +1,98 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from mem0.configs.base import MemoryConfig
+from mem0.memory.main import Memory
+from mem0.memory.search_cache import InMemorySearchCache, RedisSearchCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        pass
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [key for key in list(self.data) if key.startswith(prefix)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+@pytest.mark.parametrize("make_cache", [InMemorySearchCache, lambda: RedisSearchCache(client=FakeRedis())])
+def test_writes_invalidate_only_their_tenants(make_cache):
+    cache = make_cache()
+    alice = cache.key("tea?", {"user_id": "alice"}, 5, None)
+    bot = cache.key("tea?", {"agent_id": "bot"}, 5, None)
+    cache.set(alice, [{"id": "m1"}])
+    cache.set(bot, [{"id": "m2"}])
+
+    assert cache.get(cache.key("tea?", {"user_id": "alice"}, 5, None)) == [{"id": "m1"}]
+    assert cache.get(cache.key("tea?", {"user_id": "alice"}, 10, None)) is None
+
+    cache.invalidate([{"user_id": "bob", "agent_id": "bot"}])
+
+    assert cache.get(cache.key("tea?", {"user_id": "alice"}, 5, None)) == [{"id": "m1"}]
+    assert cache.get(cache.key("tea?", {"agent_id": "bot"}, 5, None)) is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_in_memory_cache_expires_and_evicts():
+    cache = InMemorySearchCache(ttl=0.05, max_entries=2)
+    for query in ("a", "b", "c"):
+        cache.set(cache.key(query, {"user_id": "alice"}, 5, None), [])
+
+    assert cache.size() == 2
+    assert cache.stats()["evictions"] == 1
+    assert cache.get(cache.key("a", {"user_id": "alice"}, 5, None)) is None
+    time.sleep(0.06)
+    assert cache.get(cache.key("c", {"user_id": "alice"}, 5, None)) is None
+
+
+def test_memory_search_is_cached_until_tenant_write(mocker):
+    embedder = MagicMock()
+    embedder.embed.return_value = [0.1, 0.2, 0.3]
+    mocker.patch("mem0.utils.factory.EmbedderFactory.create", return_value=embedder)
+    mocker.patch("mem0.utils.factory.LlmFactory.create")
+    mocker.patch("mem0.memory.main.capture_event")
+    config = MemoryConfig(
+        vector_store={"provider": "numpy", "config": {"path": None, "embedding_model_dims": 3}},
+        history_db_path=":memory:",
+        search_cache={"enabled": True},
+    )
+    memory = Memory(config)
+
+    memory._create_memory("likes tea", {}, metadata={"user_id": "alice"})
+    first = memory.search("drinks", user_id="alice")
+    embedder.embed.reset_mock()
+    second = memory.search("drinks", user_id="alice")
+
+    assert second == first
+    embedder.embed.assert_not_called()
+
+    memory_id = memory._create_memory("likes coffee", {}, metadata={"user_id": "alice"})
+    assert len(memory.search("drinks", user_id="alice")["results"]) == 2
+    memory._delete_memory(memory_id)
+    assert len(memory.search("drinks", user_id="alice")["results"]) == 1
+    assert memory.search_cache.stats()["hits"] == 1
@@ -195,7 +195,8 @@ def test_delete_all(memory_instance, version, enable_graph):
     memory_instance.config.version = version
     memory_instance.enable_graph = enable_graph
     mock_memories = [Mock(id="1"), Mock(id="2")]
-    memory_instance.vector_store.list = Mock(return_value=(mock_memories, None))
+    memory_instance.vector_store.iter_all = Mock(return_value=iter(mock_memories))
+    del memory_instance.vector_store.delete_many  # store without filtered bulk deletes
     memory_instance._delete_memory = Mock()
     memory_instance.graph.delete_all = Mock()
 
@@ -211,6 +212,40 @@ def test_delete_all(memory_instance, version, enable_graph):
     assert result["message"] == "Memories deleted successfully!"
 
 
+def test_delete_all_uses_delete_many(memory_instance):
+    memory_instance.enable_graph = False
+    mock_memories = [
+        Mock(id="1", payload={"data": "likes tea", "actor_id": None, "role": None}),
+        Mock(id="2", payload={"data": "lives in Paris"}),
+    ]
+    memory_instance.vector_store.iter_all = Mock(return_value=iter(mock_memories))
+    memory_instance.db = Mock()
+
+    memory_instance.delete_all(user_id="test_user")
+
+    memory_instance.vector_store.delete_many.assert_called_once_with(filters={"user_id": "test_user"})
+    memory_instance.vector_store.delete.assert_not_called()
+    assert [c.args[:4] for c in memory_instance.db.add_history.call_args_list] == [
+        ("1", "likes tea", None, "DELETE"),
+        ("2", "lives in Paris", None, "DELETE"),
+    ]
+
+
+def test_iter_memories(memory_instance):
+    mock_memories = [
+        Mock(id="1", payload={"data": "Memory 1", "user_id": "test_user"}),
+        Mock(id="2", payload={"data": "Memory 2", "user_id": "test_user", "category": "hobby"}),
+    ]
+    memory_instance.vector_store.iter_all = Mock(return_value=iter(mock_memories))
+
+    result = list(memory_instance.iter_memories(user_id="test_user", batch_size=50))
+
+    assert [item["id"] for item in result] == ["1", "2"]
+    assert result[1]["memory"] == "Memory 2"
+    assert result[1]["metadata"] == {"category": "hobby"}
+    memory_instance.vector_store.iter_all.assert_called_once_with(filters={"user_id": "test_user"}, batch_size=50)
+
+
 @pytest.mark.parametrize(
     "version, enable_graph, expected_result",
     [
@@ -98,3 +98,15 @@ def test_completions_create_with_system_message(mock_memory_client, mock_litellm
     call_args = mock_litellm.completion.call_args[1]
     assert call_args["messages"][0]["role"] == "system"
     assert call_args["messages"][0]["content"] == "You are a helpful assistant."
+
+
+def test_completions_enqueue_memory_adds_in_background(mock_litellm):
+    memory = Mock(spec=Memory)
+    memory.search.return_value = {"results": []}
+    mock_litellm.supports_function_calling.return_value = True
+
+    with patch("mem0.proxy.main.capture_event"):
+        Completions(memory).create(model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}], user_id="alice")
+
+    assert memory.add.call_args.kwargs["mode"] == "background"
+    assert "filters" not in memory.add.call_args.kwargs
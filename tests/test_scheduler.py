@@ -0,0 +1,89 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.rate_limit import RateLimitConfig
+from mem0.utils.factory import EmbedderFactory, LlmFactory
+from mem0.utils.scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    RequestScheduler,
+    ScheduledEmbedding,
+    ScheduledLLM,
+    get_scheduler,
+    request_priority,
+)
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = Mock(headers={"retry-after": retry_after} if retry_after else {})
+
+
+def test_retries_rate_limited_requests_after_retry_after():
+    sleeps = []
+    scheduler = RequestScheduler(sleep=sleeps.append)
+    fn = Mock(side_effect=[ProviderError(429, retry_after="2"), ProviderError(503), "ok"])
+
+    assert scheduler.call(fn) == "ok"
+    assert sleeps[0] == 2.0
+    assert 0.5 <= sleeps[1] <= 1.0
+    metrics = scheduler.metrics()
+    assert (metrics["throttled"], metrics["server_errors"], metrics["retries"]) == (1, 1, 2)
+    assert metrics["requests"][BACKGROUND] == 3
+
+
+def test_gives_up_after_max_retries_and_never_retries_client_errors():
+    scheduler = RequestScheduler(max_retries=2, sleep=lambda delay: None)
+
+    with pytest.raises(ProviderError):
+        scheduler.call(Mock(side_effect=ProviderError(500)))
+    assert scheduler.metrics()["failures"] == 1
+
+    client_error = Mock(side_effect=ProviderError(400))
+    with pytest.raises(ProviderError):
+        scheduler.call(client_error)
+    assert client_error.call_count == 1
+
+
+def test_interactive_requests_overtake_queued_background_requests():
+    scheduler = RequestScheduler(requests_per_minute=120)
+    scheduler.requests.level = 0
+    admitted = []
+
+    def request(priority):
+        scheduler.acquire(priority)
+        admitted.append(priority)
+
+    background = threading.Thread(target=request, args=(BACKGROUND,))
+    background.start()
+    while scheduler.metrics()["queue_depth"][BACKGROUND] == 0:
+        time.sleep(0.001)
+    interactive = threading.Thread(target=request, args=(INTERACTIVE,))
+    interactive.start()
+    background.join()
+    interactive.join()
+
+    assert admitted == [INTERACTIVE, BACKGROUND]
+    assert scheduler.metrics()["max_wait_seconds"][BACKGROUND] > scheduler.metrics()["max_wait_seconds"][INTERACTIVE]
+
+
+def test_factories_share_one_scheduler_per_scope():
+    rate_limit = {"enabled": True, "scope": "test-openai", "requests_per_minute": 1000}
+    with patch("mem0.llms.openai.OpenAI"), patch("mem0.embeddings.openai.OpenAI"):
+        llm = LlmFactory.create("openai", {"model": "gpt-4o-mini"}, rate_limit=rate_limit)
+        embedder = EmbedderFactory.create("openai", {}, None, rate_limit=rate_limit)
+
+    assert isinstance(llm, ScheduledLLM) and isinstance(embedder, ScheduledEmbedding)
+    assert llm.scheduler is embedder.scheduler is get_scheduler("test-openai", RateLimitConfig())
+
+    embedder.embedder.client.embeddings.create.return_value = Mock(data=[Mock(embedding=[0.1])])
+    embedder.embed("query", "search")
+    with request_priority(INTERACTIVE):
+        embedder.embed("memory", "add")
+    embedder.embed("memory", "add")
+    assert embedder.metrics()["requests"] == {INTERACTIVE: 2, BACKGROUND: 1}
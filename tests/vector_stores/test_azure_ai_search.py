@@ -1,5 +1,5 @@
 import json
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from azure.core.exceptions import HttpResponseError
@@ -553,3 +553,148 @@ def test_search_basic(azure_ai_search_instance):
     assert results[0].id == "doc1"
     assert results[0].score == 0.95
     assert results[0].payload == {"content": "Test content"}
+
+
+# --- Tests for batching, retries and the async client ---
+
+
+def _make_instance(**kwargs):
+    return AzureAISearch(
+        service_name="test-service",
+        collection_name="test-index",
+        api_key="test-api-key",
+        embedding_model_dims=3,
+        **kwargs,
+    )
+
+
+def test_insert_chunks_by_batch_size(mock_clients):
+    mock_search_client, _, _ = mock_clients
+    instance = _make_instance(batch_size=2)
+    mock_search_client.upload_documents.side_effect = lambda docs: [
+        {"id": doc["id"], "status_code": 201} for doc in docs
+    ]
+
+    instance.insert([[0.1, 0.2, 0.3]] * 5, [{"user_id": "user1"}] * 5, [f"doc{i}" for i in range(5)])
+
+    batch_sizes = [len(call.args[0]) for call in mock_search_client.upload_documents.call_args_list]
+    assert batch_sizes == [2, 2, 1]
+
+
+def test_insert_retries_throttled_documents(mock_clients):
+    mock_search_client, _, _ = mock_clients
+    instance = _make_instance(retry_backoff=0)
+    mock_search_client.upload_documents.side_effect = [
+        [{"id": "doc1", "status_code": 201}, {"id": "doc2", "status_code": 503}],
+        [{"id": "doc2", "status_code": 201}],
+    ]
+
+    instance.insert([[0.1, 0.2, 0.3]] * 2, [{"user_id": "user1"}] * 2, ["doc1", "doc2"])
+
+    retried = mock_search_client.upload_documents.call_args_list[1].args[0]
+    assert [doc["id"] for doc in retried] == ["doc2"]
+
+
+def test_insert_raises_after_max_retries(mock_clients):
+    mock_search_client, _, _ = mock_clients
+    instance = _make_instance(max_retries=1, retry_backoff=0)
+    mock_search_client.upload_documents.return_value = [{"id": "doc1", "status_code": 503}]
+
+    with pytest.raises(Exception, match="Insert failed for document doc1"):
+        instance.insert([[0.1, 0.2, 0.3]], [{"user_id": "user1"}], ["doc1"])
+    assert mock_search_client.upload_documents.call_count == 2
+
+
+def test_delete_many_batches_deletes(azure_ai_search_instance):
+    instance, mock_search_client, _ = azure_ai_search_instance
+    mock_search_client.search.return_value = [{"id": "doc1"}, {"id": "doc2"}]
+    mock_search_client.delete_documents.return_value = [
+        {"id": "doc1", "status_code": 200},
+        {"id": "doc2", "status_code": 200},
+    ]
+
+    instance.delete_many({"user_id": "user1"})
+
+    _, kwargs = mock_search_client.search.call_args
+    assert kwargs["filter"] == "user_id eq 'user1'"
+    assert kwargs["select"] == ["id"]
+    mock_search_client.delete_documents.assert_called_once_with([{"id": "doc1"}, {"id": "doc2"}])
+
+
+def test_delete_many_rejects_empty_filters(azure_ai_search_instance):
+    instance, mock_search_client, _ = azure_ai_search_instance
+
+    with pytest.raises(ValueError):
+        instance.delete_many({})
+    mock_search_client.search.assert_not_called()
+    mock_search_client.delete_documents.assert_not_called()
+
+
+def test_buffered_sender_queues_writes(mock_clients):
+    mock_search_client, _, _ = mock_clients
+    with patch("mem0.vector_stores.azure_ai_search.SearchIndexingBufferedSender") as MockSender:
+        instance = _make_instance(use_buffered_sender=True, batch_size=500, flush_interval=5)
+        sender = MockSender.return_value
+
+        instance.insert([[0.1, 0.2, 0.3]], [{"user_id": "user1"}], ["doc1"])
+        instance.delete("doc1")
+
+    kwargs = MockSender.call_args.kwargs
+    assert kwargs["initial_batch_action_count"] == 500
+    assert kwargs["auto_flush_interval"] == 5
+    sender.upload_documents.assert_called_once()
+    sender.delete_documents.assert_called_once_with([{"id": "doc1"}])
+    mock_search_client.upload_documents.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_insert_uses_aio_client(azure_ai_search_instance):
+    instance, mock_search_client, _ = azure_ai_search_instance
+    async_client = MagicMock()
+    async_client.upload_documents = AsyncMock(return_value=[{"id": "doc1", "status_code": 201}])
+    instance._async_search_client = async_client
+
+    await instance.async_insert([[0.1, 0.2, 0.3]], [{"user_id": "user1"}], ["doc1"])
+
+    async_client.upload_documents.assert_awaited_once()
+    mock_search_client.upload_documents.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_close_closes_aio_client(azure_ai_search_instance):
+    instance, _, _ = azure_ai_search_instance
+    async_client = MagicMock()
+    async_client.close = AsyncMock()
+    instance._async_search_client = async_client
+
+    await instance.async_close()
+    await instance.async_close()
+
+    async_client.close.assert_awaited_once()
+    assert instance._async_search_client is None
+
+
+def test_reset_closes_aio_client(azure_ai_search_instance):
+    instance, _, _ = azure_ai_search_instance
+    async_client = MagicMock()
+    async_client.close = AsyncMock()
+    instance._async_search_client = async_client
+
+    with patch.object(instance, "create_col"):
+        instance.reset()
+
+    async_client.close.assert_awaited_once()
+    assert instance._async_search_client is None
+
+
+def test_iter_all_follows_every_result_page(azure_ai_search_instance):
+    instance, mock_search_client, _ = azure_ai_search_instance
+    mock_search_client.search.return_value = iter(
+        [{"id": f"doc{n}", "payload": json.dumps({"user_id": "user1", "data": f"m{n}"})} for n in range(3)]
+    )
+
+    records = list(instance.iter_all(filters={"user_id": "user1"}))
+
+    assert [record.payload["data"] for record in records] == ["m0", "m1", "m2"]
+    _, kwargs = mock_search_client.search.call_args
+    assert kwargs["filter"] == "user_id eq 'user1'" and "top" not in kwargs
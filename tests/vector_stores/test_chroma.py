@@ -169,6 +169,23 @@ def test_list_vectors(chromadb_instance):
     assert results[0][1].id == "id2"
 
 
+def test_iter_all_pages_with_offset(chromadb_instance):
+    chromadb_instance.collection.get.side_effect = [
+        {"ids": ["id1", "id2"], "metadatas": [{"user_id": "alice"}, {"user_id": "alice"}]},
+        {"ids": ["id3"], "metadatas": [{"user_id": "alice"}]},
+    ]
+
+    results = list(chromadb_instance.iter_all(filters={"user_id": "alice"}, batch_size=2))
+
+    assert [r.id for r in results] == ["id1", "id2", "id3"]
+    assert chromadb_instance.collection.get.call_args_list[0][1] == {
+        "where": {"user_id": "alice"},
+        "limit": 2,
+        "offset": 0,
+    }
+    assert chromadb_instance.collection.get.call_args_list[1][1]["offset"] == 2
+
+
 def test_list_vectors_with_filters(chromadb_instance):
     """Test list with agent_id and run_id filters."""
     mock_result = {
@@ -1,3 +1,4 @@
+import json
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from databricks.sdk.service.vectorsearch import VectorIndexType
@@ -131,8 +132,7 @@ def test_create_col_invalid_type(mock_workspace_client):
 # ---------------------- Insert Tests ---------------------- #
 
 
-def test_insert_generates_sql(db_instance_direct, mock_workspace_client):
-    vectors = [[0.1, 0.2, 0.3, 0.4]]
+def test_insert_generates_parameterized_sql(db_instance_delta, mock_workspace_client):
     payloads = [
         {
             "data": "hello world",
@@ -141,17 +141,68 @@ def test_insert_generates_sql(db_instance_direct, mock_workspace_client):
             "run_id": "r1",
             "metadata": '{"topic":"greeting"}',
             "hash": "h1",
-        }
+            "created_at": "2024-01-01T00:00:00",
+        },
+        {"data": "it's sunny", "user_id": "u1", "hash": "h2"},
     ]
-    ids = ["id1"]
-    db_instance_direct.insert(vectors=vectors, payloads=payloads, ids=ids)
-    args, kwargs = mock_workspace_client.statement_execution.execute_statement.call_args
-    sql = kwargs["statement"] if "statement" in kwargs else args[0]
-    assert "INSERT INTO" in sql
-    assert "catalog.schema.table" in sql
-    assert "id1" in sql
-    # Embedding list rendered
-    assert "array(0.1, 0.2, 0.3, 0.4)" in sql
+    db_instance_delta.insert(vectors=[[0.1] * 4, [0.2] * 4], payloads=payloads, ids=["id1", "id2"])
+
+    kwargs = mock_workspace_client.statement_execution.execute_statement.call_args.kwargs
+    sql = kwargs["statement"]
+    assert sql.startswith("INSERT INTO catalog.schema.table (memory_id, hash")
+    assert ":p0_0" in sql and ":p1_0" in sql
+    # Values are bound as parameters, never inlined into the statement
+    assert "it's sunny" not in sql
+    params = {p.name: p for p in kwargs["parameters"]}
+    assert params["p0_0"].value == "id1"
+    assert params["p1_5"].value == "it's sunny"
+    assert params["p0_7"].type == "TIMESTAMP"
+    assert params["p1_2"].value is None
+
+
+def test_insert_chunks_and_merges(db_instance_delta, mock_workspace_client):
+    db_instance_delta.insert_batch_size = 2
+    db_instance_delta.write_mode = "merge"
+    mock_workspace_client.statement_execution.execute_statement.reset_mock()
+
+    payloads = [{"data": f"memory {i}", "user_id": "u1"} for i in range(5)]
+    db_instance_delta.insert(vectors=[[0.1] * 4] * 5, payloads=payloads, ids=[f"id{i}" for i in range(5)])
+
+    calls = mock_workspace_client.statement_execution.execute_statement.call_args_list
+    assert len(calls) == 3
+    assert all(call.kwargs["statement"].startswith("MERGE INTO catalog.schema.table") for call in calls)
+    assert "ON target.memory_id = source.memory_id" in calls[0].kwargs["statement"]
+
+
+def test_insert_direct_access_uses_upsert_data(db_instance_direct, mock_workspace_client):
+    db_instance_direct.insert_batch_size = 2
+    mock_workspace_client.statement_execution.execute_statement.reset_mock()
+    mock_workspace_client.vector_search_indexes.upsert_data_vector_index.return_value = SimpleNamespace(
+        result=SimpleNamespace(failed_primary_keys=[])
+    )
+
+    payloads = [{"data": f"memory {i}", "user_id": "u1", "hash": f"h{i}"} for i in range(3)]
+    db_instance_direct.insert(
+        vectors=[[0.1, 0.2, 0.3, 0.4]] * 3, payloads=payloads, ids=["id0", "id1", "id2"]
+    )
+
+    upsert = mock_workspace_client.vector_search_indexes.upsert_data_vector_index
+    assert upsert.call_count == 2
+    assert upsert.call_args_list[0].kwargs["index_name"] == "catalog.schema.mem0"
+    rows = json.loads(upsert.call_args_list[0].kwargs["inputs_json"])
+    assert [row["memory_id"] for row in rows] == ["id0", "id1"]
+    assert rows[0]["embedding"] == [0.1, 0.2, 0.3, 0.4]
+    assert rows[0]["memory"] == "memory 0"
+    mock_workspace_client.statement_execution.execute_statement.assert_not_called()
+
+
+def test_insert_direct_access_reports_failed_rows(db_instance_direct, mock_workspace_client):
+    mock_workspace_client.vector_search_indexes.upsert_data_vector_index.return_value = SimpleNamespace(
+        result=SimpleNamespace(failed_primary_keys=["id0"])
+    )
+
+    with pytest.raises(Exception, match="Upsert failed"):
+        db_instance_direct.insert(vectors=[[0.1] * 4], payloads=[{"data": "x"}], ids=["id0"])
 
 
 # ---------------------- Search Tests ---------------------- #
@@ -220,11 +271,25 @@ def test_delete_vector(db_instance_delta, mock_workspace_client):
     assert "DELETE FROM" in sql and "id-delete" in sql
 
 
+def test_delete_direct_access_uses_delete_data(db_instance_direct, mock_workspace_client):
+    mock_workspace_client.statement_execution.execute_statement.reset_mock()
+    mock_workspace_client.vector_search_indexes.delete_data_vector_index.return_value = SimpleNamespace(
+        result=SimpleNamespace(failed_primary_keys=[])
+    )
+
+    db_instance_direct.delete("id-delete")
+
+    mock_workspace_client.vector_search_indexes.delete_data_vector_index.assert_called_once_with(
+        index_name="catalog.schema.mem0", primary_keys=["id-delete"]
+    )
+    mock_workspace_client.statement_execution.execute_statement.assert_not_called()
+
+
 # ---------------------- Update Tests ---------------------- #
 
 
-def test_update_vector(db_instance_direct, mock_workspace_client):
-    db_instance_direct.update(
+def test_update_vector(db_instance_delta, mock_workspace_client):
+    db_instance_delta.update(
         vector_id="id-upd",
         vector=[0.4, 0.5, 0.6, 0.7],
         payload={"custom": "val", "user_id": "skip"},  # user_id should be excluded
@@ -237,6 +302,23 @@ def test_update_vector(db_instance_direct, mock_workspace_client):
     assert "user_id" not in sql  # excluded
 
 
+def test_update_direct_access_upserts_the_row(db_instance_direct, mock_workspace_client):
+    mock_workspace_client.statement_execution.execute_statement.reset_mock()
+    mock_workspace_client.vector_search_indexes.upsert_data_vector_index.return_value = SimpleNamespace(
+        result=SimpleNamespace(failed_primary_keys=[])
+    )
+
+    db_instance_direct.update(
+        vector_id="id-upd", vector=[0.4, 0.5, 0.6, 0.7], payload={"data": "new text", "user_id": "u1", "hash": "h"}
+    )
+
+    upsert = mock_workspace_client.vector_search_indexes.upsert_data_vector_index
+    rows = json.loads(upsert.call_args.kwargs["inputs_json"])
+    assert rows[0]["memory_id"] == "id-upd" and rows[0]["memory"] == "new text"
+    assert rows[0]["embedding"] == [0.4, 0.5, 0.6, 0.7]
+    mock_workspace_client.statement_execution.execute_statement.assert_not_called()
+
+
 # ---------------------- Get Tests ---------------------- #
 
 
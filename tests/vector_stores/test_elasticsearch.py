@@ -96,6 +96,7 @@ class TestElasticsearchDB(unittest.TestCase):
         self.assertEqual(mappings["vector"]["index"], True)
         self.assertEqual(mappings["vector"]["similarity"], "cosine")
         self.assertEqual(mappings["metadata"]["type"], "object")
+        self.assertEqual(mappings["id"]["type"], "keyword")
 
         # Reset mocks for next test
         self.client_mock.reset_mock()
@@ -106,6 +107,9 @@ class TestElasticsearchDB(unittest.TestCase):
 
         # Verify create was not called when index exists
         self.client_mock.indices.create.assert_not_called()
+        self.client_mock.indices.put_mapping.assert_called_once_with(
+            index="test_collection", body={"properties": {"id": {"type": "keyword"}}}
+        )
 
     def test_auto_create_index(self):
         # Reset mock
@@ -169,6 +173,7 @@ class TestElasticsearchDB(unittest.TestCase):
             self.assertEqual(actions[0]["_id"], "id1")
             self.assertEqual(actions[0]["_source"]["vector"], vectors[0])
             self.assertEqual(actions[0]["_source"]["metadata"], payloads[0])
+            self.assertEqual(actions[0]["_source"]["id"], "id1")
 
             # Verify returned objects
             self.assertEqual(len(results), 2)
@@ -212,6 +217,17 @@ class TestElasticsearchDB(unittest.TestCase):
         self.assertEqual(results[0].score, 0.8)
         self.assertEqual(results[0].payload, {"key1": "value1"})
 
+    def test_search_threshold_sets_knn_similarity(self):
+        self.client_mock.search.return_value = {
+            "hits": {"hits": [{"_id": "id1", "_score": 0.9, "_source": {"metadata": {}}}]}
+        }
+
+        results = self.es_db.search(query="", vectors=[0.1] * 1536, limit=5, threshold=0.8)
+
+        body = self.client_mock.search.call_args[1]["body"]
+        self.assertAlmostEqual(body["knn"]["similarity"], 0.6)
+        self.assertEqual([result.id for result in results], ["id1"])
+
     def test_custom_search_query(self):
         # Mock custom search query
         self.es_db.custom_search_query = Mock()
@@ -287,12 +303,48 @@ class TestElasticsearchDB(unittest.TestCase):
         self.assertEqual(results[0][1].payload, {"key2": "value2"})
 
     def test_delete(self):
-        # Perform delete
         self.es_db.delete(vector_id="id1")
 
-        # Verify delete call
         self.client_mock.delete.assert_called_once_with(index="test_collection", id="id1")
 
+    def test_update(self):
+        self.es_db.update(vector_id="id1", vector=[0.3] * 1536, payload={"data": "new"})
+
+        self.client_mock.update.assert_called_once_with(
+            index="test_collection", id="id1", body={"doc": {"vector": [0.3] * 1536, "metadata": {"data": "new"}}}
+        )
+
+    def test_create_index_with_quantization(self):
+        es_db = ElasticsearchDB(
+            host=os.getenv("ES_URL"),
+            port=9200,
+            collection_name="test_collection",
+            embedding_model_dims=1536,
+            user=os.getenv("ES_USERNAME"),
+            password=os.getenv("ES_PASSWORD"),
+            auto_create_index=False,
+            index_type="int8_hnsw",
+            hnsw_m=32,
+            ef_construction=200,
+        )
+        self.client_mock.indices.exists.return_value = False
+        es_db.create_index()
+
+        mappings = self.client_mock.indices.create.call_args[1]["body"]["mappings"]["properties"]
+        self.assertEqual(mappings["vector"]["index_options"], {"type": "int8_hnsw", "m": 32, "ef_construction": 200})
+        for field in ("user_id", "agent_id", "run_id", "actor_id"):
+            self.assertEqual(mappings["metadata"]["properties"][field], {"type": "keyword"})
+
+    def test_search_num_candidates_multiplier(self):
+        self.client_mock.search.return_value = {"hits": {"hits": []}}
+        self.es_db.num_candidates_multiplier = 20
+
+        self.es_db.search(query="", vectors=[0.1] * 1536, limit=5, filters={"user_id": "alice"})
+
+        knn = self.client_mock.search.call_args[1]["body"]["knn"]
+        self.assertEqual(knn["num_candidates"], 100)
+        self.assertEqual(knn["filter"], {"bool": {"must": [{"term": {"metadata.user_id": "alice"}}]}})
+
     def test_list_cols(self):
         # Mock indices response
         mock_indices = {"index1": {}, "index2": {}}
@@ -356,3 +408,77 @@ class TestElasticsearchDB(unittest.TestCase):
             with self.assertRaises(ValueError):
                 config = {**base_config, "headers": headers}
                 ElasticsearchConfig(**config)
+
+    def test_iter_all_uses_point_in_time(self):
+        self.client_mock.open_point_in_time.return_value = {"id": "pit-1"}
+        self.client_mock.search.side_effect = [
+            {
+                "pit_id": "pit-2",
+                "hits": {
+                    "hits": [
+                        {"_id": "id1", "_source": {"metadata": {"user_id": "alice"}}, "sort": [1]},
+                        {"_id": "id2", "_source": {"metadata": {"user_id": "alice"}}, "sort": [2]},
+                    ]
+                },
+            },
+            {"pit_id": "pit-2", "hits": {"hits": [{"_id": "id3", "_source": {"metadata": {}}, "sort": [3]}]}},
+        ]
+
+        results = list(self.es_db.iter_all(filters={"user_id": "alice"}, batch_size=2))
+
+        self.assertEqual([r.id for r in results], ["id1", "id2", "id3"])
+        second_body = self.client_mock.search.call_args_list[1][1]["body"]
+        self.assertEqual(second_body["search_after"], [2])
+        self.assertEqual(second_body["pit"]["id"], "pit-2")
+        self.assertEqual(second_body["query"], {"bool": {"must": [{"term": {"metadata.user_id": "alice"}}]}})
+        self.client_mock.close_point_in_time.assert_called_once_with(id="pit-2")
+
+    def test_delete_many_bulk_deletes_matching_ids(self):
+        self.client_mock.open_point_in_time.return_value = {"id": "pit-1"}
+        self.client_mock.search.return_value = {
+            "hits": {"hits": [{"_id": "id1", "_source": {"metadata": {"user_id": "alice"}}, "sort": [1]}]}
+        }
+        deleted = []
+
+        def fake_bulk(client, actions):
+            deleted.extend(actions)
+            return len(deleted), []
+
+        with patch("mem0.vector_stores.elasticsearch.bulk", side_effect=fake_bulk):
+            self.es_db.delete_many({"user_id": "alice"})
+
+        self.assertEqual(deleted, [{"_op_type": "delete", "_index": "test_collection", "_id": "id1"}])
+        body = self.client_mock.search.call_args[1]["body"]
+        self.assertEqual(body["query"], {"bool": {"must": [{"term": {"metadata.user_id": "alice"}}]}})
+        self.client_mock.close_point_in_time.assert_called_once_with(id="pit-1")
+
+        with self.assertRaises(ValueError):
+            self.es_db.delete_many({})
+
+    def test_list_page_uses_search_after_on_created_at_and_id(self):
+        self.client_mock.search.side_effect = [
+            {
+                "hits": {
+                    "hits": [
+                        {"_id": "id1", "_source": {"metadata": {"created_at": "2024-01-01"}}, "sort": [1, "id1"]},
+                        {"_id": "id2", "_source": {"metadata": {"created_at": "2024-01-02"}}, "sort": [2, "id2"]},
+                        {"_id": "id3", "_source": {"metadata": {"created_at": "2024-01-03"}}, "sort": [3, "id3"]},
+                    ]
+                }
+            },
+            {"hits": {"hits": [{"_id": "id3", "_source": {"metadata": {}}, "sort": [3, "id3"]}]}},
+        ]
+
+        records, cursor = self.es_db.list_page(filters={"user_id": "alice"}, page_size=2)
+        last_page, last_cursor = self.es_db.list_page(filters={"user_id": "alice"}, cursor=cursor, page_size=2)
+
+        self.assertEqual([r.id for r in records], ["id1", "id2"])
+        self.assertEqual([r.id for r in last_page], ["id3"])
+        self.assertIsNone(last_cursor)
+        first_body, second_body = [call[1]["body"] for call in self.client_mock.search.call_args_list]
+        self.assertEqual(first_body["size"], 3)
+        self.assertEqual(list(first_body["sort"][0]), ["metadata.created_at"])
+        self.assertEqual(list(first_body["sort"][1]), ["id"])
+        self.assertNotIn("search_after", first_body)
+        self.assertEqual(second_body["search_after"], [2, "id2"])
+        self.assertEqual(second_body["query"], {"bool": {"must": [{"term": {"metadata.user_id": "alice"}}]}})
@@ -241,6 +241,15 @@ def test_list(faiss_instance):
         assert result.payload["category"] == "A"
 
 
+def test_iter_all(faiss_instance):
+    faiss_instance.docstore = {f"id{i}": {"category": "A" if i % 2 else "B"} for i in range(150)}
+
+    assert len(list(faiss_instance.iter_all())) == 150
+    results = list(faiss_instance.iter_all(filters={"category": "A"}))
+    assert len(results) == 75
+    assert all(result.payload["category"] == "A" for result in results)
+
+
 def test_col_info(faiss_instance, mock_faiss_index):
     # Mock index attributes
     mock_faiss_index.ntotal = 5
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from mem0.configs.vector_stores.matryoshka import MatryoshkaConfig
+from mem0.vector_stores.matryoshka import FULL_VECTOR_FIELD, Matryoshka
+
+
+def _make_store(**kwargs):
+    params = dict(
+        provider="numpy",
+        config={"path": None},
+        collection_name="test",
+        embedding_model_dims=4,
+        truncate_dims=2,
+        oversample=3,
+    )
+    params.update(kwargs)
+    return Matryoshka(**params)
+
+
+def _seed(store):
+    # m1 and m2 share their first two dimensions; only the full vector tells them apart.
+    store.insert(
+        vectors=[[1, 0, 0, 1], [1, 0, 1, 0], [0, 1, 0, 0]],
+        payloads=[{"user_id": "alice", "data": "a"}, {"user_id": "alice", "data": "b"}, {"user_id": "alice"}],
+        ids=["m1", "m2", "m3"],
+    )
+
+
+def test_inner_store_indexes_truncated_normalized_vectors():
+    store = _make_store()
+    _seed(store)
+
+    vector_id, vector, payload = next(store.inner.iter_vectors(filters={"user_id": "alice"}))
+
+    assert len(vector) == 2
+    assert np.linalg.norm(vector) == pytest.approx(1.0)
+    assert FULL_VECTOR_FIELD in payload
+    assert FULL_VECTOR_FIELD not in store.get(vector_id).payload
+
+
+def test_search_reranks_candidates_on_full_vector():
+    store = _make_store()
+    _seed(store)
+
+    results = store.search("query", [1, 0, 0.9, 0.1], limit=2, filters={"user_id": "alice"})
+
+    assert [result.id for result in results] == ["m2", "m1"]
+    expected = np.dot([1, 0, 1, 0], [1, 0, 0.9, 0.1]) / (np.sqrt(2) * np.linalg.norm([1, 0, 0.9, 0.1]))
+    assert results[0].score == pytest.approx(expected, rel=1e-5)
+    assert all(FULL_VECTOR_FIELD not in result.payload for result in results)
+
+
+def test_payload_update_keeps_full_vector():
+    store = _make_store(full_vector_dtype="float16")
+    _seed(store)
+
+    store.update("m1", payload={"user_id": "alice", "data": "renamed"})
+    store.update("m2", vector=[0, 1, 0, 0])
+
+    assert store.get("m1").payload["data"] == "renamed"
+    assert store.get("m2").payload["data"] == "b"
+    vectors = {vector_id: vector for vector_id, vector, _ in store.iter_vectors(filters={"user_id": "alice"})}
+    assert vectors["m1"] == pytest.approx([2**-0.5, 0, 0, 2**-0.5], abs=1e-3)
+    assert vectors["m2"] == pytest.approx([0, 1, 0, 0])
+
+
+def test_config_validates_dims():
+    with pytest.raises(ValueError, match="truncate_dims"):
+        MatryoshkaConfig(provider="qdrant", embedding_model_dims=256, truncate_dims=512)
+    with pytest.raises(ValueError, match="itself"):
+        MatryoshkaConfig(provider="matryoshka")
+
+
+def test_rejects_stores_that_drop_payload_fields():
+    with pytest.raises(ValueError, match="weaviate"):
+        Matryoshka(provider="weaviate", config={"cluster_url": "http://localhost:8080"})
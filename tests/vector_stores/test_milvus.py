@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+import pytest
+
+from mem0.vector_stores.milvus import MilvusDB
+
+
+def _make_db(**kwargs):
+    params = dict(
+        url="http://localhost:19530",
+        token=None,
+        collection_name="test_collection",
+        embedding_model_dims=4,
+        metric_type="COSINE",
+        db_name="",
+    )
+    params.update(kwargs)
+    return MilvusDB(**params)
+
+
+@pytest.fixture
+def mock_client():
+    with patch("mem0.vector_stores.milvus.MilvusClient") as mock_milvus_client:
+        client = mock_milvus_client.return_value
+        client.has_collection.return_value = False
+        client.search.return_value = [[]]
+        yield client
+
+
+def test_create_col_with_partition_key_and_hnsw(mock_client):
+    _make_db(
+        partition_key=True,
+        num_partitions=16,
+        index_type="HNSW",
+        index_params={"M": 16, "efConstruction": 200},
+        consistency_level="Bounded",
+    )
+
+    index_kwargs = mock_client.prepare_index_params.call_args.kwargs
+    assert index_kwargs["index_type"] == "HNSW"
+    assert index_kwargs["params"] == {"M": 16, "efConstruction": 200}
+
+    create_kwargs = mock_client.create_collection.call_args.kwargs
+    assert create_kwargs["num_partitions"] == 16
+    assert create_kwargs["consistency_level"] == "Bounded"
+    partition_fields = [field.name for field in create_kwargs["schema"].fields if field.is_partition_key]
+    assert partition_fields == ["user_id"]
+
+
+def test_default_collection_is_unchanged(mock_client):
+    _make_db()
+
+    assert mock_client.prepare_index_params.call_args.kwargs["index_type"] == "AUTOINDEX"
+    create_kwargs = mock_client.create_collection.call_args.kwargs
+    assert "num_partitions" not in create_kwargs
+    assert "consistency_level" not in create_kwargs
+    assert not any(field.is_partition_key for field in create_kwargs["schema"].fields)
+
+
+def test_insert_sets_partition_key(mock_client):
+    db = _make_db(partition_key=True)
+
+    db.insert(["id1"], [[0.1] * 4], [{"user_id": "alice", "data": "likes tea"}])
+
+    data = mock_client.insert.call_args.kwargs["data"]
+    assert data["user_id"] == "alice"
+    assert data["metadata"] == {"user_id": "alice", "data": "likes tea"}
+
+
+def test_search_filters_on_partition_key(mock_client):
+    db = _make_db(partition_key=True, search_params={"ef": 64}, consistency_level="Eventually")
+
+    db.search("query", [0.1] * 4, limit=5, filters={"user_id": "alice", "agent_id": "a1"})
+
+    kwargs = mock_client.search.call_args.kwargs
+    assert kwargs["filter"] == '(user_id == "alice") and (metadata["agent_id"] == "a1")'
+    assert kwargs["search_params"] == {"metric_type": "COSINE", "params": {"ef": 64}}
+    assert kwargs["consistency_level"] == "Eventually"
+
+
+def test_search_params_per_call(mock_client):
+    db = _make_db(search_params={"ef": 64})
+
+    db.search("query", [0.1] * 4, limit=5, search_params={"ef": 256})
+
+    kwargs = mock_client.search.call_args.kwargs
+    assert kwargs["search_params"]["params"] == {"ef": 256}
+    assert kwargs["filter"] is None
+    assert "consistency_level" not in kwargs
@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+
+from mem0.vector_stores.numpy import NumpyDB
+
+
+@pytest.fixture
+def numpy_db(tmp_path):
+    return NumpyDB(collection_name="test", path=str(tmp_path), embedding_model_dims=4, initial_capacity=2)
+
+
+def _seed(db):
+    db.insert(
+        vectors=[[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]],
+        payloads=[
+            {"user_id": "alice", "agent_id": "a1", "data": "likes tea"},
+            {"user_id": "alice", "data": "lives in Paris"},
+            {"user_id": "bob", "data": "likes coffee"},
+        ],
+        ids=["m1", "m2", "m3"],
+    )
+
+
+def test_search_is_scoped_to_tenant_shard(numpy_db):
+    _seed(numpy_db)
+
+    results = numpy_db.search("query", [1, 0.1, 0, 0], limit=5, filters={"user_id": "alice"})
+
+    assert [result.id for result in results] == ["m1", "m2"]
+    assert results[0].score == pytest.approx(1 / np.sqrt(1.01))
+    assert numpy_db.search("query", [1, 0, 0, 0], limit=5, filters={"user_id": "carol"}) == []
+
+
+def test_search_applies_column_filters(numpy_db):
+    _seed(numpy_db)
+
+    results = numpy_db.search("query", [0, 1, 0, 0], limit=5, filters={"user_id": "alice", "agent_id": "a1"})
+
+    assert [result.id for result in results] == ["m1"]
+
+
+def test_search_batch_ranks_each_query(numpy_db):
+    _seed(numpy_db)
+
+    results = numpy_db.search_batch(["q1", "q2"], [[0, 0, 1, 0], [0, 1, 0, 0]], limit=1)
+
+    assert [hits[0].id for hits in results] == ["m3", "m2"]
+
+
+def test_float16_storage(tmp_path):
+    db = NumpyDB(collection_name="test", path=str(tmp_path), embedding_model_dims=4, dtype="float16")
+    _seed(db)
+
+    results = db.search("query", [0, 0, 2, 0], limit=1)
+
+    assert results[0].id == "m3"
+    assert results[0].score == pytest.approx(1.0, abs=1e-3)
+
+
+def test_update_moves_memory_between_tenants(numpy_db):
+    _seed(numpy_db)
+
+    numpy_db.update("m2", payload={"user_id": "bob", "data": "moved to Berlin"})
+    numpy_db.update("m3", vector=[0, 0, 0, 1])
+
+    assert numpy_db.get("m2").payload["data"] == "moved to Berlin"
+    bob_results = numpy_db.search("query", [0, 0, 0, 1], limit=5, filters={"user_id": "bob"})
+    assert [result.id for result in bob_results] == ["m3", "m2"]
+    assert bob_results[0].score == pytest.approx(1.0)
+
+
+def test_persists_and_reloads(tmp_path, numpy_db):
+    _seed(numpy_db)
+    numpy_db.delete("m2")
+    numpy_db.update("m1", payload={"user_id": "alice", "data": "likes green tea"})
+
+    reloaded = NumpyDB(collection_name="test", path=str(tmp_path), embedding_model_dims=4)
+
+    assert reloaded.get("m2") is None
+    assert reloaded.get("m1").payload["data"] == "likes green tea"
+    assert reloaded.search("query", [0, 0, 1, 0], limit=1)[0].id == "m3"
+    assert reloaded.col_info()["count"] == 2
+
+
+def test_reload_drops_torn_final_log_entry(tmp_path, numpy_db):
+    _seed(numpy_db)
+    log_path = next(tmp_path.rglob("*.log"))
+    with open(log_path, "a") as f:
+        f.write('{"op": "put", "id": "m9", "ro')
+
+    reloaded = NumpyDB(collection_name="test", path=str(tmp_path), embedding_model_dims=4)
+    reloaded.insert(vectors=[[0, 0, 0, 1]], payloads=[{"user_id": "alice", "data": "new"}], ids=["m4"])
+
+    assert reloaded.get("m9") is None
+    again = NumpyDB(collection_name="test", path=str(tmp_path), embedding_model_dims=4)
+    assert again.get("m4").payload["data"] == "new"
+
+
+def test_reload_rejects_corruption_before_last_entry(tmp_path, numpy_db):
+    _seed(numpy_db)
+    log_path = max(tmp_path.rglob("*.log"), key=lambda path: len(path.read_text().splitlines()))
+    lines = log_path.read_text().splitlines(keepends=True)
+    lines[1] = "not json\n"
+    log_path.write_text("".join(lines))
+
+    with pytest.raises(ValueError):
+        NumpyDB(collection_name="test", path=str(tmp_path), embedding_model_dims=4)
+
+
+def test_compaction_reclaims_deleted_rows(tmp_path):
+    db = NumpyDB(
+        collection_name="test", path=str(tmp_path), embedding_model_dims=4, initial_capacity=2, compaction_threshold=0.5
+    )
+    vectors = np.eye(4).tolist()
+    db.insert(vectors, [{"user_id": "alice", "n": i} for i in range(4)], [f"m{i}" for i in range(4)])
+
+    db.delete("m0")
+    assert db.col_info()["deleted_rows"] == 1
+    db.delete("m1")
+    db.delete("m2")
+
+    assert db.col_info()["deleted_rows"] == 0
+    assert db.search("query", [0, 0, 0, 1], limit=5)[0].id == "m3"
+    reloaded = NumpyDB(collection_name="test", path=str(tmp_path), embedding_model_dims=4)
+    assert [record.id for record in reloaded.list()[0]] == ["m3"]
+
+
+def test_delete_many_drops_tenant_shard(numpy_db):
+    _seed(numpy_db)
+
+    numpy_db.delete_many({"user_id": "alice"})
+
+    assert numpy_db.get("m1") is None
+    assert [record.id for record in numpy_db.list()[0]] == ["m3"]
+    assert numpy_db.col_info()["tenants"] == 1
+
+
+def test_in_memory_store_and_reset():
+    db = NumpyDB(collection_name="test", path=None, embedding_model_dims=4)
+    _seed(db)
+    assert db.list_cols() == ["test"]
+    assert len(list(db.iter_all(filters={"user_id": "alice"}))) == 2
+
+    db.reset()
+
+    assert db.list()[0] == []
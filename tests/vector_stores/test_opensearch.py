@@ -79,40 +79,23 @@ class TestOpenSearchDB(unittest.TestCase):
         self.os_db.create_index()
         self.client_mock.indices.create.assert_not_called()
 
-    @pytest.mark.skip(reason="This test is not working as expected")
     def test_insert(self):
         vectors = [[0.1] * 1536, [0.2] * 1536]
         payloads = [{"key1": "value1"}, {"key2": "value2"}]
         ids = ["id1", "id2"]
 
-        # Mock the index method
-        self.client_mock.index = MagicMock()
-
-        results = self.os_db.insert(vectors=vectors, payloads=payloads, ids=ids)
-
-        # Verify index was called twice (once for each vector)
-        self.assertEqual(self.client_mock.index.call_count, 2)
-
-        # Check first call
-        first_call = self.client_mock.index.call_args_list[0]
-        self.assertEqual(first_call[1]["index"], "test_collection")
-        self.assertEqual(first_call[1]["body"]["vector_field"], vectors[0])
-        self.assertEqual(first_call[1]["body"]["payload"], payloads[0])
-        self.assertEqual(first_call[1]["body"]["id"], ids[0])
+        with patch("mem0.vector_stores.opensearch.bulk") as mock_bulk:
+            self.os_db.insert(vectors=vectors, payloads=payloads, ids=ids)
 
-        # Check second call
-        second_call = self.client_mock.index.call_args_list[1]
-        self.assertEqual(second_call[1]["index"], "test_collection")
-        self.assertEqual(second_call[1]["body"]["vector_field"], vectors[1])
-        self.assertEqual(second_call[1]["body"]["payload"], payloads[1])
-        self.assertEqual(second_call[1]["body"]["id"], ids[1])
-
-        # Check results
-        self.assertEqual(len(results), 2)
-        self.assertEqual(results[0].id, "id1")
-        self.assertEqual(results[0].payload, payloads[0])
-        self.assertEqual(results[1].id, "id2")
-        self.assertEqual(results[1].payload, payloads[1])
+        mock_bulk.assert_called_once()
+        actions = mock_bulk.call_args[0][1]
+        self.assertEqual(mock_bulk.call_args[1]["chunk_size"], 500)
+        self.assertEqual(len(actions), 2)
+        self.assertEqual(actions[0]["_op_type"], "index")
+        self.assertEqual(actions[0]["_index"], "test_collection")
+        self.assertNotIn("_id", actions[0])
+        self.assertEqual(actions[0]["_source"], {"vector_field": vectors[0], "payload": payloads[0], "id": "id1"})
+        self.assertEqual(actions[1]["_source"]["id"], "id2")
 
     @pytest.mark.skip(reason="This test is not working as expected")
     def test_get(self):
@@ -136,12 +119,14 @@ class TestOpenSearchDB(unittest.TestCase):
         payload = {"key3": "value3"}
         mock_search_response = {"hits": {"hits": [{"_id": "doc1", "_source": {"id": "id1"}}]}}
         self.client_mock.search.return_value = mock_search_response
-        self.os_db.update("id1", vector=vector, payload=payload)
-        self.client_mock.update.assert_called_once()
-        update_args = self.client_mock.update.call_args[1]
-        self.assertEqual(update_args["index"], "test_collection")
-        self.assertEqual(update_args["id"], "doc1")
-        self.assertEqual(update_args["body"], {"doc": {"vector_field": vector, "payload": payload}})
+        with patch("mem0.vector_stores.opensearch.bulk") as mock_bulk:
+            self.os_db.update("id1", vector=vector, payload=payload)
+        mock_bulk.assert_called_once()
+        action = mock_bulk.call_args[0][1][0]
+        self.assertEqual(action["_op_type"], "update")
+        self.assertEqual(action["_index"], "test_collection")
+        self.assertEqual(action["_id"], "doc1")
+        self.assertEqual(action["doc"], {"vector_field": vector, "payload": payload})
 
     def test_list_cols(self):
         self.client_mock.indices.get_alias.return_value = {"test_collection": {}}
@@ -180,8 +165,123 @@ class TestOpenSearchDB(unittest.TestCase):
     def test_delete(self):
         mock_search_response = {"hits": {"hits": [{"_id": "doc1", "_source": {"id": "id1"}}]}}
         self.client_mock.search.return_value = mock_search_response
-        self.os_db.delete(vector_id="id1")
-        self.client_mock.delete.assert_called_once_with(index="test_collection", id="doc1")
+        with patch("mem0.vector_stores.opensearch.bulk") as mock_bulk:
+            self.os_db.delete(vector_id="id1")
+        mock_bulk.assert_called_once_with(
+            self.client_mock, [{"_op_type": "delete", "_index": "test_collection", "_id": "doc1"}]
+        )
+
+    def test_delete_many(self):
+        self.client_mock.search.side_effect = [
+            {"hits": {"hits": [{"_id": "doc1", "sort": ["id1"]}, {"_id": "doc2", "sort": ["id2"]}]}},
+            {"hits": {"hits": []}},
+        ]
+        with patch("mem0.vector_stores.opensearch.bulk") as mock_bulk:
+            self.os_db.delete_many({"user_id": "alice"})
+
+        second_body = self.client_mock.search.call_args_list[1][1]["body"]
+        self.assertEqual(second_body["search_after"], ["id2"])
+        self.assertEqual(second_body["query"], {"bool": {"filter": [{"term": {"payload.user_id.keyword": "alice"}}]}})
+        actions = mock_bulk.call_args[0][1]
+        self.assertEqual([action["_id"] for action in actions], ["doc1", "doc2"])
+        self.assertTrue(all(action["_op_type"] == "delete" for action in actions))
+
+    def test_iter_all_pages_with_search_after(self):
+        self.client_mock.search.side_effect = [
+            {"hits": {"hits": [{"_source": {"id": "id1", "payload": {"data": "a"}}, "sort": ["id1"]}]}},
+            {"hits": {"hits": [{"_source": {"id": "id2", "payload": {"data": "b"}}, "sort": ["id2"]}]}},
+            {"hits": {"hits": []}},
+        ]
+
+        records = list(self.os_db.iter_all(filters={"user_id": "alice"}, batch_size=1))
+
+        self.assertEqual([record.id for record in records], ["id1", "id2"])
+        bodies = [call[1]["body"] for call in self.client_mock.search.call_args_list]
+        self.assertEqual([body.get("search_after") for body in bodies], [None, ["id1"], ["id2"]])
+        self.assertEqual(bodies[0]["size"], 1)
+
+    def test_list_page_uses_search_after_on_created_at_and_id(self):
+        self.client_mock.search.side_effect = [
+            {
+                "hits": {
+                    "hits": [
+                        {"_source": {"id": "id1", "payload": {"data": "a"}}, "sort": [1, "id1"]},
+                        {"_source": {"id": "id2", "payload": {"data": "b"}}, "sort": [2, "id2"]},
+                    ]
+                }
+            },
+            {"hits": {"hits": [{"_source": {"id": "id2", "payload": {"data": "b"}}, "sort": [2, "id2"]}]}},
+        ]
+
+        records, cursor = self.os_db.list_page(filters={"user_id": "alice"}, page_size=1)
+        last_page, last_cursor = self.os_db.list_page(filters={"user_id": "alice"}, cursor=cursor, page_size=1)
+
+        self.assertEqual([record.id for record in records + last_page], ["id1", "id2"])
+        self.assertIsNone(last_cursor)
+        first_body, second_body = [call[1]["body"] for call in self.client_mock.search.call_args_list]
+        self.assertEqual(first_body["size"], 2)
+        self.assertEqual([list(key) for key in first_body["sort"]], [["payload.created_at"], ["id"]])
+        self.assertEqual(second_body["search_after"], [1, "id1"])
+        self.assertEqual(second_body["query"], {"bool": {"filter": [{"term": {"payload.user_id.keyword": "alice"}}]}})
+
+    def test_delete_many_requires_a_tenant_filter(self):
+        for filters in ({}, {"topic": "food"}):
+            with self.assertRaises(ValueError):
+                self.os_db.delete_many(filters)
+        self.client_mock.search.assert_not_called()
+
+    def test_faiss_engine_mapping_and_efficient_filter(self):
+        with patch("mem0.vector_stores.opensearch.OpenSearch", return_value=self.client_mock):
+            db = OpenSearchDB(
+                host="localhost",
+                collection_name="faiss_collection",
+                embedding_model_dims=4,
+                engine="faiss",
+                hnsw_m=32,
+                ef_construction=256,
+                ef_search=128,
+                encoder="fp16",
+            )
+        create_body = self.client_mock.indices.create.call_args[1]["body"]
+        self.assertEqual(create_body["settings"], {"index.knn": True, "index.knn.algo_param.ef_search": 128})
+        method = create_body["mappings"]["properties"]["vector_field"]["method"]
+        self.assertEqual(method["engine"], "faiss")
+        self.assertEqual(
+            method["parameters"],
+            {"m": 32, "ef_construction": 256, "encoder": {"name": "sq", "parameters": {"type": "fp16"}}},
+        )
+
+        self.client_mock.search.side_effect = None
+        self.client_mock.search.return_value = {"hits": {"hits": []}}
+        db.search(query="", vectors=[0.1] * 4, limit=5, filters={"user_id": "alice"})
+        knn = self.client_mock.search.call_args[1]["body"]["query"]["knn"]["vector_field"]
+        self.assertEqual(knn["filter"], {"bool": {"filter": [{"term": {"payload.user_id.keyword": "alice"}}]}})
+
+    def test_lucene_ef_search_is_a_query_parameter(self):
+        with patch("mem0.vector_stores.opensearch.OpenSearch", return_value=self.client_mock):
+            db = OpenSearchDB(
+                host="localhost",
+                collection_name="lucene_collection",
+                embedding_model_dims=4,
+                engine="lucene",
+                ef_search=64,
+                encoder="byte",
+            )
+        create_body = self.client_mock.indices.create.call_args[1]["body"]
+        self.assertEqual(create_body["settings"], {"index.knn": True})
+        self.assertEqual(
+            create_body["mappings"]["properties"]["vector_field"]["method"]["parameters"], {"encoder": {"name": "sq"}}
+        )
+
+        self.client_mock.search.side_effect = None
+        self.client_mock.search.return_value = {"hits": {"hits": []}}
+        db.search(query="", vectors=[0.1] * 4, limit=5)
+        knn = self.client_mock.search.call_args[1]["body"]["query"]["knn"]["vector_field"]
+        self.assertEqual(knn["method_parameters"], {"ef_search": 64})
+
+    def test_encoder_requires_matching_engine(self):
+        with self.assertRaises(ValueError):
+            OpenSearchDB(host="localhost", embedding_model_dims=4, encoder="fp16")
 
     def test_delete_col(self):
         self.os_db.delete_col()
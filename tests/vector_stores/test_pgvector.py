@@ -285,6 +285,31 @@ class TestPGVector(unittest.TestCase):
         self.assertEqual(results[1].id, self.test_ids[1])
         self.assertEqual(results[1].score, 0.2)
 
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 2)
+    @patch('mem0.vector_stores.pgvector.psycopg2.connect')
+    def test_search_threshold_filters_by_distance(self, mock_connect):
+        """Test that a similarity threshold becomes a maximum cosine distance in SQL."""
+        mock_connect.return_value = self.mock_conn
+        self.mock_cursor.fetchall.return_value = []
+
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=False
+        )
+
+        pgvector.search("test query", [0.1, 0.2, 0.3], limit=2, filters={"user_id": "alice"}, threshold=0.75)
+
+        sql, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("vector <=> %s::vector <= %s", sql)
+        self.assertEqual(params[-2:], (0.25, 2))
+
     @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
     @patch('mem0.vector_stores.pgvector.psycopg.connect')
     @patch('mem0.vector_stores.pgvector.psycopg2.connect')
@@ -706,6 +731,41 @@ class TestPGVector(unittest.TestCase):
         self.assertEqual(results[0][0].id, self.test_ids[0])
         self.assertEqual(results[0][1].id, self.test_ids[1])
 
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.psycopg.connect')
+    @patch('mem0.vector_stores.pgvector.psycopg2.connect')
+    def test_iter_all_keyset_pagination(self, mock_psycopg2_connect, mock_psycopg_connect):
+        """Test iter_all pages with keyset pagination on id."""
+        mock_psycopg_connect.return_value = self.mock_conn
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=False
+        )
+        ids = sorted(self.test_ids + [str(uuid.uuid4())])
+        self.mock_cursor.fetchall.side_effect = [
+            [(ids[0], {"user_id": "alice"}), (ids[1], {"user_id": "alice"})],
+            [(ids[2], {"user_id": "alice"})],
+        ]
+        self.mock_cursor.execute.reset_mock()
+
+        results = list(pgvector.iter_all(filters={"user_id": "alice"}, batch_size=2))
+
+        self.assertEqual([r.id for r in results], ids)
+        first_query, first_params = self.mock_cursor.execute.call_args_list[0][0]
+        second_query, second_params = self.mock_cursor.execute.call_args_list[1][0]
+        self.assertIn("ORDER BY id", first_query)
+        self.assertNotIn("id > %s", first_query)
+        self.assertEqual(first_params, ("user_id", "alice", 2))
+        self.assertIn("id > %s", second_query)
+        self.assertEqual(second_params, ("user_id", "alice", ids[1], 2))
+
     @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
     @patch('mem0.vector_stores.pgvector.psycopg.connect')
     @patch('mem0.vector_stores.pgvector.psycopg2.connect')
@@ -188,3 +188,190 @@ def test_count_with_none_vector_count(pinecone_db):
     count = pinecone_db.count()
     assert count == 0
     pinecone_db.index.describe_index_stats.assert_called_once()
+
+
+def test_count_with_filters(pinecone_db):
+    pinecone_db.index.query.return_value.to_dict.return_value = {
+        "matches": [{"id": "id1", "score": 0.0, "metadata": {"user_id": "alice"}}]
+    }
+
+    assert pinecone_db.count(filters={"user_id": "alice"}) == 1
+    assert pinecone_db.index.query.call_args.kwargs["filter"] == {"user_id": {"$eq": "alice"}}
+    pinecone_db.index.describe_index_stats.assert_not_called()
+
+    pinecone_db.namespace_per_user = True
+    pinecone_db.index.describe_index_stats.return_value.namespaces = {
+        "test_namespace-alice": MagicMock(vector_count=7),
+        "test_namespace-bob": MagicMock(vector_count=3),
+    }
+    assert pinecone_db.count(filters={"user_id": "alice"}) == 7
+
+
+def test_list_pages_ids_and_fetches_without_query(pinecone_db):
+    from pinecone import Vector
+
+    first_page = MagicMock(vectors=[MagicMock(id="id1")], pagination=MagicMock(next="token"))
+    second_page = MagicMock(vectors=[MagicMock(id="id2")], pagination=None)
+    pinecone_db.index.list_paginated.side_effect = [first_page, second_page]
+    pinecone_db.index.fetch.return_value.vectors = {
+        "id1": Vector(id="id1", values=[0.1] * 128, metadata={"name": "vector1"}),
+        "id2": Vector(id="id2", values=[0.2] * 128, metadata={"name": "vector2"}),
+    }
+
+    results = pinecone_db.list(limit=10)
+
+    assert [r.id for r in results[0]] == ["id1", "id2"]
+    pinecone_db.index.list_paginated.assert_called_with(
+        namespace="test_namespace", limit=9, pagination_token="token"
+    )
+    pinecone_db.index.fetch.assert_called_once_with(ids=["id1", "id2"], namespace="test_namespace")
+    pinecone_db.index.query.assert_not_called()
+    pinecone_db.index.describe_index_stats.assert_not_called()
+
+
+def test_list_falls_back_to_query_on_pod_indexes(pinecone_db):
+    pinecone_db.index.list_paginated.side_effect = Exception("list is only supported on serverless indexes")
+    pinecone_db.index.query.return_value.to_dict.return_value = {"matches": [{"id": "id1", "score": 0.0}]}
+
+    results = pinecone_db.list(limit=5)
+
+    assert [r.id for r in results[0]] == ["id1"]
+    assert "filter" not in pinecone_db.index.query.call_args.kwargs
+
+    pinecone_db.index.query.side_effect = Exception("unavailable")
+    assert pinecone_db.list(limit=5) == [[]]
+
+
+def test_id_namespace_cache_is_bounded(pinecone_db, monkeypatch):
+    monkeypatch.setattr("mem0.vector_stores.pinecone.ID_NAMESPACE_CACHE_SIZE", 2)
+    pinecone_db.namespace_per_user = True
+
+    pinecone_db.insert([[0.1] * 128] * 3, [{"user_id": "alice"}] * 3, ["id1", "id2", "id3"])
+
+    assert list(pinecone_db._id_namespaces) == ["id2", "id3"]
+
+
+def test_list_with_filters_uses_cached_dimension(pinecone_db):
+    pinecone_db.index.query.return_value.to_dict.return_value = {
+        "matches": [{"id": "id1", "score": 0.0, "metadata": {"user_id": "alice"}}]
+    }
+
+    results = pinecone_db.list(filters={"user_id": "alice"}, limit=5)
+
+    assert results[0][0].id == "id1"
+    pinecone_db.index.query.assert_called_once_with(
+        vector=[0.0] * 128,
+        top_k=5,
+        include_metadata=True,
+        include_values=False,
+        filter={"user_id": {"$eq": "alice"}},
+        namespace="test_namespace",
+    )
+    pinecone_db.index.describe_index_stats.assert_not_called()
+
+
+def test_namespace_per_user(pinecone_db):
+    pinecone_db.namespace_per_user = True
+
+    pinecone_db.insert(
+        [[0.1] * 128, [0.2] * 128],
+        [{"user_id": "alice"}, {"user_id": "bob"}],
+        ["id1", "id2"],
+    )
+    namespaces = sorted(call.kwargs["namespace"] for call in pinecone_db.index.upsert.call_args_list)
+    assert namespaces == ["test_namespace-alice", "test_namespace-bob"]
+
+    pinecone_db.index.query.return_value.matches = []
+    pinecone_db.search("query", [0.1] * 128, limit=3, filters={"user_id": "alice", "agent_id": "a1"})
+    query_kwargs = pinecone_db.index.query.call_args.kwargs
+    assert query_kwargs["namespace"] == "test_namespace-alice"
+    assert query_kwargs["filter"] == {"agent_id": {"$eq": "a1"}}
+
+    pinecone_db.delete("id2")
+    pinecone_db.index.delete.assert_called_with(ids=["id2"], namespace="test_namespace-bob")
+
+
+def test_namespace_per_user_locates_unknown_id(pinecone_db):
+    pinecone_db.namespace_per_user = True
+    pinecone_db.index.describe_index_stats.return_value.namespaces = {
+        "test_namespace-alice": MagicMock(vector_count=1),
+        "test_namespace-bob": MagicMock(vector_count=1),
+    }
+    pinecone_db.index.fetch.side_effect = lambda ids, namespace: MagicMock(
+        vectors={"id9": MagicMock()} if namespace == "test_namespace-bob" else {}
+    )
+
+    pinecone_db.delete("id9")
+
+    pinecone_db.index.delete.assert_called_with(ids=["id9"], namespace="test_namespace-bob")
+
+
+def test_parallel_upserts_with_pool_threads(mock_pinecone_client):
+    db = PineconeDB(
+        collection_name="test_index",
+        embedding_model_dims=128,
+        client=mock_pinecone_client,
+        api_key="fake_api_key",
+        environment=None,
+        serverless_config=None,
+        pod_config=None,
+        hybrid_search=False,
+        metric="cosine",
+        batch_size=2,
+        extra_params=None,
+        pool_threads=4,
+    )
+    mock_pinecone_client.Index.assert_called_with("test_index", pool_threads=4)
+
+    db.insert([[0.1] * 128] * 5, [{}] * 5, [f"id{i}" for i in range(5)])
+
+    assert db.index.upsert.call_count == 3
+    assert all(call.kwargs["async_req"] for call in db.index.upsert.call_args_list)
+    assert db.index.upsert.return_value.get.call_count == 3
+
+
+def test_namespace_per_user_search_without_user_merges_namespaces(pinecone_db):
+    pinecone_db.namespace_per_user = True
+    pinecone_db.index.describe_index_stats.return_value.namespaces = {
+        "test_namespace-alice": MagicMock(vector_count=2),
+        "test_namespace-bob": MagicMock(vector_count=1),
+        "other": MagicMock(vector_count=1),
+    }
+    matches = {
+        "test_namespace": [],
+        "test_namespace-alice": [
+            {"id": "a1", "score": 0.9, "metadata": {"agent_id": "x"}},
+            {"id": "a2", "score": 0.2, "metadata": {"agent_id": "x"}},
+        ],
+        "test_namespace-bob": [{"id": "b1", "score": 0.5, "metadata": {"agent_id": "x"}}],
+    }
+    pinecone_db.index.query.side_effect = lambda namespace, **kwargs: MagicMock(matches=matches[namespace])
+
+    results = pinecone_db.search("query", [0.1] * 128, limit=2, filters={"agent_id": "x"})
+
+    assert [result.id for result in results] == ["a1", "b1"]
+    queried = [call.kwargs["namespace"] for call in pinecone_db.index.query.call_args_list]
+    assert queried == ["test_namespace", "test_namespace-alice", "test_namespace-bob"]
+    assert pinecone_db._id_namespaces["b1"] == "test_namespace-bob"
+
+
+def test_namespace_per_user_list_without_user_reads_each_namespace(pinecone_db):
+    pinecone_db.namespace_per_user = True
+    pinecone_db.index.describe_index_stats.return_value.namespaces = {
+        "test_namespace-alice": MagicMock(vector_count=2),
+        "test_namespace-bob": MagicMock(vector_count=1),
+    }
+    matches = {
+        "test_namespace": [],
+        "test_namespace-alice": [{"id": "a1", "score": 0.0, "metadata": {"run_id": "r"}}],
+        "test_namespace-bob": [{"id": "b1", "score": 0.0, "metadata": {"run_id": "r"}}],
+    }
+    pinecone_db.index.query.side_effect = lambda namespace, top_k, **kwargs: MagicMock(
+        to_dict=MagicMock(return_value={"matches": matches[namespace][:top_k]})
+    )
+
+    results = pinecone_db.list(filters={"run_id": "r"}, limit=10)
+
+    assert [result.id for result in results[0]] == ["a1", "b1"]
+    assert pinecone_db.index.query.call_args.kwargs["filter"] == {"run_id": {"$eq": "r"}}
+    assert pinecone_db.count(filters={"run_id": "r"}) == 2
@@ -1,11 +1,16 @@
+import asyncio
+import shutil
+import tempfile
 import unittest
 import uuid
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     Distance,
     Filter,
+    HnswConfigDiff,
+    KeywordIndexParams,
     PointIdsList,
     PointStruct,
     VectorParams,
@@ -36,6 +41,30 @@ class TestQdrant(unittest.TestCase):
             collection_name="test_collection", vectors_config=expected_config
         )
 
+    def test_create_col_with_payload_m(self):
+        self.client_mock.get_collections.return_value = MagicMock(collections=[])
+        self.qdrant.payload_m = 16
+        self.qdrant.hnsw_m = 0
+
+        self.qdrant.create_col(vector_size=128, on_disk=True)
+
+        call_args = self.client_mock.create_collection.call_args[1]
+        self.assertEqual(call_args["hnsw_config"], HnswConfigDiff(m=0, payload_m=16))
+
+    def test_tenant_index_on_user_id(self):
+        self.client_mock.create_payload_index.reset_mock()
+
+        self.qdrant._create_filter_indexes()
+
+        schemas = {
+            call[1]["field_name"]: call[1]["field_schema"]
+            for call in self.client_mock.create_payload_index.call_args_list
+        }
+        self.assertEqual(schemas["user_id"], KeywordIndexParams(type="keyword", is_tenant=True))
+        self.assertEqual(schemas["agent_id"], "keyword")
+        self.assertEqual(schemas["run_id"], "keyword")
+        self.assertEqual(schemas["actor_id"], "keyword")
+
     def test_insert(self):
         vectors = [[0.1, 0.2], [0.3, 0.4]]
         payloads = [{"key": "value1"}, {"key": "value2"}]
@@ -52,6 +81,27 @@ class TestQdrant(unittest.TestCase):
 
         self.assertEqual(points[0].payload, payloads[0])
 
+    def test_insert_non_blocking(self):
+        self.qdrant.wait = False
+
+        self.qdrant.insert(vectors=[[0.1, 0.2]], payloads=[{"key": "value"}], ids=[str(uuid.uuid4())])
+
+        self.assertFalse(self.client_mock.upsert.call_args[1]["wait"])
+
+    def test_bulk_insert_uses_upload_points(self):
+        self.qdrant.upload_batch_size = 2
+        self.qdrant.upload_parallel = 4
+        vectors = [[0.1, 0.2]] * 3
+        ids = [str(uuid.uuid4()) for _ in vectors]
+
+        self.qdrant.insert(vectors=vectors, payloads=[{"key": "value"}] * 3, ids=ids)
+
+        self.client_mock.upsert.assert_not_called()
+        call_args = self.client_mock.upload_points.call_args[1]
+        self.assertEqual(len(call_args["points"]), 3)
+        self.assertEqual(call_args["batch_size"], 2)
+        self.assertEqual(call_args["parallel"], 4)
+
     def test_search(self):
         vectors = [[0.1, 0.2]]
         mock_point = MagicMock(id=str(uuid.uuid4()), score=0.95, payload={"key": "value"})
@@ -64,12 +114,33 @@ class TestQdrant(unittest.TestCase):
             query=vectors,
             query_filter=None,
             limit=1,
+            score_threshold=None,
         )
 
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].payload, {"key": "value"})
         self.assertEqual(results[0].score, 0.95)
 
+    def test_list_page_resumes_from_scroll_offset(self):
+        self.client_mock.scroll.side_effect = [([MagicMock(id="p1")], "p2"), ([MagicMock(id="p2")], None)]
+
+        first, cursor = self.qdrant.list_page(filters=None, page_size=1)
+        second, last_cursor = self.qdrant.list_page(filters=None, cursor=cursor, page_size=1)
+
+        self.assertEqual([point.id for point in first + second], ["p1", "p2"])
+        self.assertEqual(self.client_mock.scroll.call_args_list[1][1]["offset"], "p2")
+        self.assertIsNone(last_cursor)
+
+        self.client_mock.count.return_value = MagicMock(count=42)
+        self.assertEqual(self.qdrant.count(), 42)
+
+    def test_search_passes_threshold_to_qdrant(self):
+        self.client_mock.query_points.return_value = MagicMock(points=[])
+
+        self.qdrant.search(query="", vectors=[[0.1, 0.2]], limit=5, threshold=0.7)
+
+        self.assertEqual(self.client_mock.query_points.call_args[1]["score_threshold"], 0.7)
+
     def test_search_with_filters(self):
         """Test search with agent_id and run_id filters."""
         vectors = [[0.1, 0.2]]
@@ -288,6 +359,19 @@ class TestQdrant(unittest.TestCase):
         # The list method returns the result directly
         self.assertEqual(len(results), 1)
 
+    def test_iter_all_follows_scroll_offsets(self):
+        first_page = [MagicMock(id="1"), MagicMock(id="2")]
+        second_page = [MagicMock(id="3")]
+        self.client_mock.scroll.side_effect = [(first_page, "3"), (second_page, None)]
+
+        results = list(self.qdrant.iter_all(filters={"user_id": "alice"}, batch_size=2))
+
+        self.assertEqual([r.id for r in results], ["1", "2", "3"])
+        self.assertEqual(self.client_mock.scroll.call_count, 2)
+        self.assertIsNone(self.client_mock.scroll.call_args_list[0][1]["offset"])
+        self.assertEqual(self.client_mock.scroll.call_args_list[1][1]["offset"], "3")
+        self.assertEqual(self.client_mock.scroll.call_args_list[1][1]["limit"], 2)
+
     def test_delete_col(self):
         self.qdrant.delete_col()
         self.client_mock.delete_collection.assert_called_once_with(collection_name="test_collection")
@@ -298,3 +382,106 @@ class TestQdrant(unittest.TestCase):
 
     def tearDown(self):
         del self.qdrant
+
+
+class TestQdrantTransport(unittest.TestCase):
+    @patch("mem0.vector_stores.qdrant.QdrantClient")
+    def test_prefer_grpc(self, client_cls):
+        client_cls.return_value.get_collections.return_value = MagicMock(collections=[])
+
+        Qdrant(
+            collection_name="test_collection",
+            embedding_model_dims=128,
+            host="localhost",
+            port=6333,
+            prefer_grpc=True,
+            grpc_port=6334,
+        )
+
+        client_cls.assert_called_once_with(host="localhost", port=6333, prefer_grpc=True, grpc_port=6334)
+
+    @patch("mem0.vector_stores.qdrant.AsyncQdrantClient")
+    @patch("mem0.vector_stores.qdrant.QdrantClient")
+    def test_async_methods_use_async_client(self, client_cls, async_client_cls):
+        client_cls.return_value.get_collections.return_value = MagicMock(collections=[])
+        async_client = async_client_cls.return_value
+        async_client.query_points = AsyncMock(return_value=MagicMock(points=["hit"]))
+        async_client.upsert = AsyncMock()
+        qdrant = Qdrant(collection_name="test_collection", embedding_model_dims=2, url="http://qdrant", api_key="key")
+
+        hits = asyncio.run(qdrant.async_search(query="", vectors=[0.1, 0.2], limit=3, filters={"user_id": "alice"}))
+        asyncio.run(qdrant.async_insert(vectors=[[0.1, 0.2]], payloads=[{}], ids=[str(uuid.uuid4())]))
+
+        self.assertEqual(hits, ["hit"])
+        async_client_cls.assert_called_once_with(api_key="key", url="http://qdrant")
+        self.assertEqual(async_client.query_points.call_args[1]["limit"], 3)
+        async_client.upsert.assert_awaited_once()
+        client_cls.return_value.upsert.assert_not_called()
+
+    def test_async_methods_fall_back_to_sync_client(self):
+        client = MagicMock(spec=QdrantClient)
+        client.query_points.return_value = MagicMock(points=["hit"])
+        qdrant = Qdrant(collection_name="test_collection", embedding_model_dims=2, client=client)
+
+        hits = asyncio.run(qdrant.async_search(query="", vectors=[0.1, 0.2]))
+
+        self.assertIsNone(qdrant.async_client)
+        self.assertEqual(hits, ["hit"])
+
+
+class TestQdrantLocal(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.qdrant = Qdrant(collection_name="test_local", embedding_model_dims=2, path=self.path, on_disk=True)
+        self.ids = [str(uuid.uuid4()) for _ in range(4)]
+        self.qdrant.insert(
+            vectors=[[1.0, 0.0], [0.0, 1.0], [1.0, 0.1], [0.7, 0.7]],
+            payloads=[
+                {"user_id": "alice", "data": "a"},
+                {"user_id": "alice", "agent_id": "agent1", "data": "b"},
+                {"user_id": "bob", "data": "c"},
+                {"user_id": "bob", "agent_id": "agent1", "data": "d"},
+            ],
+            ids=self.ids,
+        )
+
+    def tearDown(self):
+        self.qdrant.client.close()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_search_uses_tenant_index(self):
+        results = self.qdrant.search(query="", vectors=[1.0, 0.0], limit=5, filters={"user_id": "alice"})
+
+        self.assertEqual([r.id for r in results], [self.ids[0], self.ids[1]])
+        self.assertAlmostEqual(results[0].score, 1.0, places=5)
+
+    def test_search_combines_indexed_filters(self):
+        results = self.qdrant.search(
+            query="", vectors=[1.0, 0.0], limit=5, filters={"user_id": "bob", "agent_id": "agent1"}
+        )
+        self.assertEqual([r.id for r in results], [self.ids[3]])
+
+    def test_search_unknown_tenant_returns_nothing(self):
+        self.assertEqual(self.qdrant.search(query="", vectors=[1.0, 0.0], filters={"user_id": "carol"}), [])
+
+    def test_list_tracks_updates_and_deletes(self):
+        self.qdrant.update(self.ids[2], vector=[1.0, 0.1], payload={"user_id": "alice", "data": "c"})
+        self.qdrant.delete(self.ids[0])
+
+        records, offset = self.qdrant.list(filters={"user_id": "alice"})
+
+        self.assertIsNone(offset)
+        self.assertEqual({r.id for r in records}, {self.ids[1], self.ids[2]})
+
+    def test_iter_all_uses_tenant_index(self):
+        records = list(self.qdrant.iter_all(filters={"user_id": "alice"}))
+        self.assertEqual({r.id for r in records}, {self.ids[0], self.ids[1]})
+
+    def test_index_rebuilt_on_reopen(self):
+        self.qdrant.client.close()
+        reopened = Qdrant(collection_name="test_local", embedding_model_dims=2, path=self.path, on_disk=True)
+
+        records, _ = reopened.list(filters={"user_id": "bob"})
+
+        self.assertEqual({r.id for r in records}, {self.ids[2], self.ids[3]})
+        self.qdrant = reopened
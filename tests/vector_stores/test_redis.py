@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from mem0.vector_stores.redis import RedisDB
+
+
+@pytest.fixture
+def mock_index():
+    with patch("mem0.vector_stores.redis.redis.Redis.from_url") as mock_from_url, patch(
+        "mem0.vector_stores.redis.SearchIndex"
+    ) as mock_search_index:
+        index = MagicMock()
+        mock_search_index.from_dict.return_value = index
+        index.client = mock_from_url.return_value
+        yield mock_search_index, index
+
+
+def test_attaches_to_existing_index(mock_index):
+    _, index = mock_index
+    index.exists.return_value = True
+
+    RedisDB(redis_url="redis://localhost:6379", collection_name="test", embedding_model_dims=4)
+
+    index.create.assert_not_called()
+
+
+def test_creates_missing_index_without_overwrite(mock_index):
+    _, index = mock_index
+    index.exists.return_value = False
+
+    RedisDB(redis_url="redis://localhost:6379", collection_name="test", embedding_model_dims=4)
+
+    index.create.assert_called_once_with(overwrite=False)
+
+
+def test_hnsw_float16_schema(mock_index):
+    mock_search_index, _ = mock_index
+
+    db = RedisDB(
+        redis_url="redis://localhost:6379",
+        collection_name="test",
+        embedding_model_dims=4,
+        index_algorithm="hnsw",
+        datatype="float16",
+        hnsw_m=32,
+        ef_runtime=50,
+    )
+
+    attrs = mock_search_index.from_dict.call_args[0][0]["fields"][-1]["attrs"]
+    assert attrs == {
+        "distance_metric": "cosine",
+        "algorithm": "hnsw",
+        "datatype": "float16",
+        "dims": 4,
+        "m": 32,
+        "ef_runtime": 50,
+    }
+    assert db._vector_bytes([0.1, 0.2, 0.3, 0.4]) == np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float16).tobytes()
+
+
+def test_insert_uses_batched_load(mock_index):
+    _, index = mock_index
+    db = RedisDB(
+        redis_url="redis://localhost:6379", collection_name="test", embedding_model_dims=4, insert_batch_size=100
+    )
+    payload = {"hash": "h", "data": "likes tea", "created_at": "2024-01-01T00:00:00+00:00", "user_id": "alice"}
+
+    db.insert([[0.1] * 4], [payload], ["id1"])
+
+    args, kwargs = index.load.call_args
+    assert kwargs == {"id_field": "memory_id", "batch_size": 100}
+    assert args[0][0]["user_id"] == "alice"
+
+
+def test_update_patches_fields_in_place(mock_index):
+    _, index = mock_index
+    db = RedisDB(redis_url="redis://localhost:6379", collection_name="test", embedding_model_dims=4)
+
+    db.update("id1", payload={"data": "likes coffee", "updated_at": "2024-01-02T00:00:00+00:00", "user_id": "alice"})
+
+    db.client.hset.assert_called_once()
+    key = db.client.hset.call_args[0][0]
+    mapping = db.client.hset.call_args[1]["mapping"]
+    assert key == "mem0:test:id1"
+    assert mapping["memory"] == "likes coffee"
+    assert "embedding" not in mapping
+    assert "created_at" not in mapping
+    index.load.assert_not_called()
@@ -0,0 +1,115 @@
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from mem0.configs.vector_stores.sharded import ShardedConfig
+from mem0.vector_stores.sharded import HashRing, ShardedVectorStore
+
+
+def _shard(name):
+    return {"name": name, "provider": "numpy", "config": {"path": None}}
+
+
+def _make_store(names=("a", "b", "c"), **kwargs):
+    return ShardedVectorStore(
+        shards=[_shard(name) for name in names], collection_name="test", embedding_model_dims=3, **kwargs
+    )
+
+
+def _insert_users(store, count=30):
+    store.insert(
+        vectors=[[1, i / count, 0] for i in range(count)],
+        payloads=[{"user_id": f"user-{i}", "data": f"memory {i}"} for i in range(count)],
+        ids=[f"m{i}" for i in range(count)],
+    )
+
+
+def test_hash_ring_moves_only_keys_owned_by_new_shard():
+    keys = [f"user_id:user-{i}" for i in range(2000)]
+    before = HashRing(["a", "b", "c"])
+    after = HashRing(["a", "b", "c", "d"])
+
+    moved = [key for key in keys if before.owner(key) != after.owner(key)]
+
+    assert all(after.owner(key) == "d" for key in moved)
+    assert 0.15 < len(moved) / len(keys) < 0.35
+    assert min(Counter(before.owner(key) for key in keys).values()) > 400
+
+
+def test_tenant_reads_go_to_one_shard():
+    store = _make_store()
+    store.insert(
+        vectors=[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+        payloads=[{"user_id": "alice", "data": "tea"}, {"user_id": "alice", "data": "Paris"}, {"agent_id": "bot"}],
+        ids=["m1", "m2", "m3"],
+    )
+    owner = store.shard_for({"user_id": "alice"})
+    others = [name for name in store.shards if name != owner]
+
+    with patch.object(store.shards[others[0]], "search") as other_search:
+        results = store.search("query", [1, 0.1, 0], limit=5, filters={"user_id": "alice"})
+
+    assert [result.id for result in results] == ["m1", "m2"]
+    other_search.assert_not_called()
+    assert store.shards[store.shard_for({"agent_id": "bot"})].get("m3") is not None
+    assert [r.id for r in store.list(filters={"user_id": "alice"})[0]] == ["m1", "m2"]
+
+    with patch.object(store.shards[others[0]], "count") as other_count:
+        assert store.count(filters={"user_id": "alice"}) == 2
+    other_count.assert_not_called()
+
+
+def test_unscoped_reads_fan_out_and_merge_by_score():
+    store = _make_store()
+    _insert_users(store)
+
+    results = store.search("query", [1, 0, 0], limit=3)
+
+    assert [result.id for result in results] == ["m0", "m1", "m2"]
+    assert len(store.list()[0]) == 30
+    assert set(store.list_cols()) == {"a", "b", "c"}
+
+
+def test_get_update_delete_locate_records_across_shards():
+    store = _make_store()
+    _insert_users(store, count=10)
+    store._locations.clear()
+
+    assert store.get("m4").payload["data"] == "memory 4"
+    store.update("m4", payload={"user_id": "user-4", "data": "updated"})
+    assert store.get("m4").payload["data"] == "updated"
+    store.delete("m4")
+    assert store.get("m4") is None
+
+    store.delete_many({"user_id": "user-5"})
+    assert store.get("m5") is None
+    assert store.get("m6") is not None
+
+
+def test_rebalance_moves_tenants_to_added_shard():
+    old = _make_store()
+    _insert_users(old, count=60)
+
+    grown = _make_store(names=("a", "b", "c", "d"))
+    for name in ("a", "b", "c"):
+        grown.shards[name] = old.shards[name]
+
+    plan = grown.rebalance(dry_run=True)
+    assert plan["scanned"] == 60 and plan["moved"] > 0
+    assert set(target.split("->")[1] for target in plan["moves"]) == {"d"}
+
+    stats = grown.rebalance(batch_size=7)
+    assert stats["moved"] == plan["moved"]
+    assert grown.rebalance()["moved"] == 0
+    for i in range(60):
+        results = grown.search("query", [1, i / 60, 0], limit=1, filters={"user_id": f"user-{i}"})
+        assert [result.id for result in results] == [f"m{i}"]
+
+
+def test_config_rejects_invalid_shards():
+    with pytest.raises(ValueError, match="unique"):
+        ShardedConfig(shards=[_shard("a"), _shard("a")])
+    with pytest.raises(ValueError, match="itself"):
+        ShardedConfig(shards=[{"provider": "sharded", "config": {}}])
+    assert ShardedConfig(shards=[_shard("a")]).virtual_nodes == 128
@@ -0,0 +1,114 @@
+import pytest
+
+from mem0.configs.base import MemoryConfig
+from mem0.memory.main import Memory
+from mem0.vector_stores.sqlite import SQLiteDB
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    return SQLiteDB(collection_name="memories", db_path=str(tmp_path / "mem0.db"), embedding_model_dims=3)
+
+
+def _seed(db):
+    db.insert(
+        vectors=[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+        payloads=[
+            {"user_id": "alice", "agent_id": "a1", "data": "likes tea", "category": "food"},
+            {"user_id": "alice", "data": "lives in Paris"},
+            {"user_id": "bob", "data": "likes coffee", "category": "food"},
+        ],
+        ids=["m1", "m2", "m3"],
+    )
+
+
+def test_search_ranks_tenant_rows(sqlite_db):
+    _seed(sqlite_db)
+
+    results = sqlite_db.search("query", [1, 0.1, 0], limit=5, filters={"user_id": "alice"})
+
+    assert [result.id for result in results] == ["m1", "m2"]
+    assert results[0].score == pytest.approx(1 / 1.01**0.5)
+    assert results[0].payload["data"] == "likes tea"
+
+
+def test_filters_on_columns_and_payload(sqlite_db):
+    _seed(sqlite_db)
+
+    assert [r.id for r in sqlite_db.list(filters={"category": "food"})[0]] == ["m1", "m3"]
+    assert [r.id for r in sqlite_db.list(filters={"user_id": ["alice", "bob"], "agent_id": "a1"})[0]] == ["m1"]
+    assert sqlite_db.search("query", [0, 0, 1], limit=5, filters={"user_id": "carol"}) == []
+    assert sqlite_db.list(filters={"user_id": []})[0] == []
+    assert sqlite_db.list(filters={"category": [], "user_id": "alice"})[0] == []
+
+
+def test_update_and_delete_many(sqlite_db):
+    _seed(sqlite_db)
+
+    sqlite_db.update("m2", vector=[0, 1, 1], payload={"user_id": "bob", "data": "moved to Berlin"})
+    sqlite_db.delete_many({"user_id": "alice"})
+
+    assert sqlite_db.get("m1") is None
+    assert [r.id for r in sqlite_db.search("query", [0, 1, 0], limit=5, filters={"user_id": "bob"})] == ["m2", "m3"]
+    assert sqlite_db.col_info()["count"] == 2
+
+
+def test_iter_all_pages_by_rowid(sqlite_db):
+    _seed(sqlite_db)
+
+    assert [record.id for record in sqlite_db.iter_all(batch_size=2)] == ["m1", "m2", "m3"]
+
+
+def test_history_shares_transaction(sqlite_db):
+    _seed(sqlite_db)
+    history = sqlite_db.history_db()
+
+    with pytest.raises(RuntimeError):
+        with sqlite_db.transaction():
+            sqlite_db.delete("m1")
+            history.add_history("m1", "likes tea", None, "DELETE", is_deleted=1)
+            raise RuntimeError("crash before commit")
+
+    assert sqlite_db.get("m1") is not None
+    assert history.get_history("m1") == []
+    assert sqlite_db.list_cols() == ["memories"]
+
+
+def test_memory_writes_history_to_the_same_file(tmp_path, mocker):
+    mocker.patch("mem0.utils.factory.EmbedderFactory.create").return_value.embed.return_value = [0.1, 0.2, 0.3]
+    mocker.patch("mem0.utils.factory.LlmFactory.create")
+    mocker.patch("mem0.memory.main.capture_event")
+    config = MemoryConfig(
+        vector_store={
+            "provider": "sqlite",
+            "config": {"db_path": str(tmp_path / "mem0.db"), "embedding_model_dims": 3},
+        },
+        history_db_path=str(tmp_path / "history.db"),
+    )
+    memory = Memory(config)
+
+    memory_id = memory._create_memory("likes tea", {}, metadata={"user_id": "alice"})
+    memory._delete_memory(memory_id)
+
+    assert memory.db.connection is memory.vector_store.connection
+    assert sorted(event["event"] for event in memory.history(memory_id)) == ["ADD", "DELETE"]
+    assert not (tmp_path / "history.db").exists()
+
+
+def test_list_page_orders_by_created_at(sqlite_db):
+    sqlite_db.insert(
+        vectors=[[1, 0, 0]] * 5,
+        payloads=[{"user_id": "alice", "created_at": f"2025-01-0{day}T00:00:00"} for day in (3, 1, 5, 2, 4)],
+        ids=["c", "a", "e", "b", "d"],
+    )
+
+    pages, cursor = [], None
+    while True:
+        records, cursor = sqlite_db.list_page(filters={"user_id": "alice"}, cursor=cursor, page_size=2)
+        pages.append([record.id for record in records])
+        if cursor is None:
+            break
+
+    assert pages == [["a", "b"], ["c", "d"], ["e"]]
+    assert sqlite_db.count(filters={"user_id": "alice"}) == 5
+    assert sqlite_db.count(filters={"user_id": "bob"}) == 0
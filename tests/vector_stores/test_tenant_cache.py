@@ -0,0 +1,134 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from mem0.vector_stores.tenant_cache import TenantCache
+
+
+def _make_cache(**kwargs):
+    params = dict(provider="numpy", config={"path": None, "embedding_model_dims": 3}, collection_name="test")
+    params.update(kwargs)
+    cache = TenantCache(**params)
+    cache.insert(
+        vectors=[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+        payloads=[
+            {"user_id": "alice", "agent_id": "a1", "data": "likes tea"},
+            {"user_id": "alice", "data": "lives in Paris"},
+            {"user_id": "bob", "data": "likes coffee"},
+        ],
+        ids=["m1", "m2", "m3"],
+    )
+    return cache
+
+
+def test_search_loads_tenant_then_serves_locally():
+    cache = _make_cache()
+
+    with patch.object(cache.inner, "search", wraps=cache.inner.search) as inner_search:
+        first = cache.search("query", [1, 0.1, 0], limit=5, filters={"user_id": "alice"})
+        second = cache.search("query", [0, 1, 0], limit=1, filters={"user_id": "alice", "agent_id": "a1"})
+
+    inner_search.assert_not_called()
+    assert [result.id for result in first] == ["m1", "m2"]
+    assert first[0].score == pytest.approx(1 / 1.01**0.5)
+    assert [result.id for result in second] == ["m1"]
+    stats = cache.cache_stats()
+    assert (stats["misses"], stats["hits"], stats["loads"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_writes_go_through_to_cached_tenants():
+    cache = _make_cache()
+    cache.search("query", [1, 0, 0], filters={"user_id": "alice"})
+
+    cache.insert([[0, 0, 1]], [{"user_id": "alice", "data": "has a cat"}], ["m4"])
+    cache.update("m2", vector=[0, 0, 1], payload={"user_id": "alice", "data": "lives in Berlin"})
+    cache.delete("m1")
+
+    results = cache.search("query", [0, 0, 1], limit=5, filters={"user_id": "alice"})
+    assert sorted(result.id for result in results) == ["m2", "m4"]
+    assert cache.get("m2").payload["data"] == "lives in Berlin"
+    assert cache.inner.get("m2").payload["data"] == "lives in Berlin"
+    assert cache.inner.get("m1") is None
+    assert cache.cache_stats()["loads"] == 1
+
+
+def test_evicts_least_recently_used_tenant():
+    cache = _make_cache(memory_budget_mb=0.0003)  # about one small tenant
+
+    cache.search("query", [1, 0, 0], filters={"user_id": "alice"})
+    cache.search("query", [0, 0, 1], filters={"user_id": "bob"})
+
+    stats = cache.cache_stats()
+    assert stats["evictions"] == 1
+    assert stats["cached_tenants"] == 1
+    assert cache.get("m3").payload["data"] == "likes coffee"
+
+
+def test_untenanted_and_unsupported_reads_pass_through():
+    cache = _make_cache()
+
+    assert len(cache.search("query", [0, 0, 1], limit=5)) == 3
+    with patch.object(cache.inner, "iter_vectors", side_effect=NotImplementedError):
+        results = cache.search("query", [0, 0, 1], limit=1, filters={"user_id": "bob"})
+
+    assert [result.id for result in results] == ["m3"]
+    assert cache.cache_stats()["bypasses"] == 1
+    assert cache.cache_stats()["cached_tenants"] == 0
+
+
+def test_distance_score_mode():
+    cache = _make_cache(score_mode="distance")
+
+    results = cache.search("query", [0, 0, 1], limit=1, filters={"user_id": "bob"})
+
+    assert results[0].score == pytest.approx(0.0, abs=1e-6)
+
+
+def test_miss_loads_outside_the_cache_lock():
+    cache = _make_cache()
+    cache.search("query", [0, 0, 1], filters={"user_id": "bob"})
+    read_vectors = cache.inner.iter_vectors
+    served = []
+
+    def slow_iter_vectors(filters=None, batch_size=100):
+        # Another tenant is served from the cache while alice is being read.
+        reader = threading.Thread(
+            target=lambda: served.append(cache.search("query", [0, 0, 1], filters={"user_id": "bob"}))
+        )
+        reader.start()
+        reader.join(timeout=5)
+        yield from read_vectors(filters=filters, batch_size=batch_size)
+
+    with patch.object(cache.inner, "iter_vectors", side_effect=slow_iter_vectors):
+        results = cache.search("query", [1, 0, 0], limit=1, filters={"user_id": "alice"})
+
+    assert [result.id for result in served[0]] == ["m3"]
+    assert [result.id for result in results] == ["m1"]
+    assert cache.cache_stats()["cached_tenants"] == 2
+
+
+def test_write_during_load_discards_the_stale_tenant():
+    cache = _make_cache()
+    read_vectors = cache.inner.iter_vectors
+
+    def racing_iter_vectors(filters=None, batch_size=100):
+        records = list(read_vectors(filters=filters, batch_size=batch_size))
+        cache.insert([[0, 0, 1]], [{"user_id": "alice", "data": "has a cat"}], ["m4"])
+        yield from records
+
+    with patch.object(cache.inner, "iter_vectors", side_effect=racing_iter_vectors):
+        results = cache.search("query", [0, 0, 1], limit=1, filters={"user_id": "alice"})
+
+    assert [result.id for result in results] == ["m4"]
+    assert cache.cache_stats()["cached_tenants"] == 0
+
+
+def test_uncached_gets_count_as_misses():
+    cache = _make_cache()
+
+    assert cache.get("m3").payload["data"] == "likes coffee"
+
+    stats = cache.cache_stats()
+    assert (stats["misses"], stats["hits"]) == (1, 0)
@@ -218,3 +218,153 @@
 
 # if __name__ == '__main__':
 #     unittest.main()
+
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mem0.vector_stores.weaviate import SHARED_TENANT, Weaviate
+
+
+@pytest.fixture
+def multi_tenant_db():
+    client = MagicMock()
+    client.collections.exists.return_value = False
+    with patch("mem0.vector_stores.weaviate.weaviate.connect_to_local", return_value=client):
+        db = Weaviate(
+            collection_name="test_collection",
+            embedding_model_dims=4,
+            cluster_url="http://localhost:8080",
+            multi_tenancy=True,
+        )
+    collection = client.collections.get.return_value
+    collection.tenants.exists.return_value = False
+    return db, client, collection
+
+
+def test_multi_tenancy_enabled_on_create(multi_tenant_db):
+    _, client, _ = multi_tenant_db
+    assert client.collections.create.call_args.kwargs["multi_tenancy_config"] is not None
+
+
+def test_insert_creates_tenants_lazily(multi_tenant_db):
+    db, client, collection = multi_tenant_db
+    batch = client.batch.fixed_size.return_value.__enter__.return_value
+
+    db.insert([[0.1] * 4] * 3, [{"user_id": "alice"}, {"user_id": "alice"}, {"agent_id": "a1"}])
+    db.insert([[0.1] * 4], [{"user_id": "alice"}])
+
+    created = [call.args[0][0].name for call in collection.tenants.create.call_args_list]
+    assert created == ["alice", SHARED_TENANT]
+    tenants = [call.kwargs["tenant"] for call in batch.add_object.call_args_list]
+    assert tenants == ["alice", "alice", SHARED_TENANT, "alice"]
+
+
+def test_tenant_name_is_sanitized():
+    assert Weaviate._tenant_name("alice_1") == "alice_1"
+    name = Weaviate._tenant_name("alice@example.com")
+    assert name.startswith("alice_example_com-") and len(name) <= 64
+    assert name != Weaviate._tenant_name("alice#example.com")
+
+
+def test_search_targets_user_tenant(multi_tenant_db):
+    db, _, collection = multi_tenant_db
+    collection.tenants.exists.return_value = True
+    tenant_collection = collection.with_tenant.return_value
+    tenant_collection.query.hybrid.return_value.objects = []
+
+    db.search("query", [0.1] * 4, limit=5, filters={"user_id": "alice"})
+
+    collection.with_tenant.assert_called_once_with("alice")
+    tenant_collection.query.hybrid.assert_called_once()
+
+
+def test_search_unknown_tenant_returns_nothing(multi_tenant_db):
+    db, _, collection = multi_tenant_db
+
+    assert db.search("query", [0.1] * 4, limit=5, filters={"user_id": "bob"}) == []
+    collection.with_tenant.assert_not_called()
+
+
+def test_delete_many_removes_user_tenant(multi_tenant_db):
+    db, _, collection = multi_tenant_db
+    collection.tenants.exists.return_value = True
+
+    db.delete_many({"user_id": "alice"})
+
+    collection.tenants.remove.assert_called_once_with(["alice"])
+    collection.with_tenant.return_value.data.delete_many.assert_not_called()
+
+
+def test_delete_many_with_where_filter(multi_tenant_db):
+    db, _, collection = multi_tenant_db
+    collection.tenants.exists.return_value = True
+
+    db.delete_many({"user_id": "alice", "agent_id": "a1"})
+
+    collection.tenants.remove.assert_not_called()
+    collection.with_tenant.return_value.data.delete_many.assert_called_once()
+    assert "where" in collection.with_tenant.return_value.data.delete_many.call_args.kwargs
+
+
+def test_iter_all_reads_user_tenant_with_cursor(multi_tenant_db):
+    db, _, collection = multi_tenant_db
+    collection.tenants.exists.return_value = True
+    tenant_collection = collection.with_tenant.return_value
+    tenant_collection.iterator.return_value = iter(
+        [MagicMock(uuid=f"id{n}", properties={"user_id": "alice", "data": f"m{n}"}) for n in range(3)]
+    )
+
+    records = list(db.iter_all(filters={"user_id": "alice"}, batch_size=50))
+
+    assert [record.id for record in records] == ["id0", "id1", "id2"]
+    collection.with_tenant.assert_called_once_with("alice")
+    assert tenant_collection.iterator.call_args.kwargs["cache_size"] == 50
+    tenant_collection.query.fetch_objects.assert_not_called()
+
+
+def test_iter_all_pages_filtered_tenant_reads_with_fetch_objects(multi_tenant_db):
+    db, _, collection = multi_tenant_db
+    collection.tenants.exists.return_value = True
+    tenant_collection = collection.with_tenant.return_value
+    objects = [MagicMock(uuid="id0", properties={"user_id": "alice", "agent_id": "a1", "data": "m0"})]
+    tenant_collection.query.fetch_objects.return_value = MagicMock(objects=objects)
+
+    records = list(db.iter_all(filters={"user_id": "alice", "agent_id": "a1"}, batch_size=50))
+
+    assert [record.id for record in records] == ["id0"]
+    fetch_kwargs = tenant_collection.query.fetch_objects.call_args.kwargs
+    assert fetch_kwargs["filters"] is not None and fetch_kwargs["offset"] == 0
+    tenant_collection.iterator.assert_not_called()
+
+
+def test_iter_all_pages_filtered_reads_with_fetch_objects():
+    client = MagicMock()
+    client.collections.exists.return_value = False
+    with patch("mem0.vector_stores.weaviate.weaviate.connect_to_local", return_value=client):
+        db = Weaviate(collection_name="test_collection", embedding_model_dims=4, cluster_url="http://localhost:8080")
+    collection = client.collections.get.return_value
+    pages = [
+        [MagicMock(uuid=f"id{n}", properties={"user_id": "alice", "data": f"m{n}"}) for n in range(start, stop)]
+        for start, stop in [(0, 2), (2, 3)]
+    ]
+    collection.query.fetch_objects.side_effect = [MagicMock(objects=page) for page in pages]
+
+    records = list(db.iter_all(filters={"user_id": "alice"}, batch_size=2))
+
+    assert [record.id for record in records] == ["id0", "id1", "id2"]
+    calls = collection.query.fetch_objects.call_args_list
+    assert [call.kwargs["offset"] for call in calls] == [0, 2]
+    assert all(call.kwargs["filters"] is not None for call in calls)
+    collection.iterator.assert_not_called()
+
+
+def test_id_tenant_cache_is_bounded(multi_tenant_db, monkeypatch):
+    db, client, _ = multi_tenant_db
+    monkeypatch.setattr("mem0.vector_stores.weaviate.ID_TENANT_CACHE_SIZE", 2)
+
+    ids = [f"0000000{n}-0000-0000-0000-000000000000" for n in range(3)]
+    db.insert([[0.1] * 4] * 3, [{"user_id": "alice"}] * 3, ids=ids)
+
+    assert list(db._id_tenants) == ids[1:]